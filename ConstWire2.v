@@ -0,0 +1,41 @@
+// File: ConstWire2.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ConstWire2 (
+    p,
+    q
+);
+
+
+input p;
+output q;
+reg q;
+
+reg r;
+wire s;
+wire my_bundle0_0_r;
+
+assign s = 1'd1;
+assign my_bundle0_0_r = 1'd0;
+
+
+initial begin: my_bundle0_0_or_gate0_0_comb
+    while (1) begin
+        r <= (p | my_bundle0_0_r);
+        @(p, my_bundle0_0_r);
+    end
+end
+
+
+initial begin: or_gate1_0_comb
+    while (1) begin
+        q <= (r | s);
+        @(r, s);
+    end
+end
+
+endmodule
@@ -0,0 +1,27 @@
+// File: ConstWire3.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ConstWire3 (
+    p,
+    q
+);
+
+
+input [7:0] p;
+output [7:0] q;
+reg [7:0] q;
+
+wire [4:0] t;
+
+assign t = 5'd17;
+
+
+always @(p, t) begin: adder0_comb
+    q <= (p + t);
+end
+
+endmodule
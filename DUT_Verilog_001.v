@@ -0,0 +1,47 @@
+// File: DUT_Verilog_001.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:08 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module DUT_Verilog_001 (
+    x,
+    a,
+    b,
+    c,
+    d,
+    e
+);
+
+
+output signed [7:0] x;
+wire signed [7:0] x;
+input signed [7:0] a;
+input signed [7:0] b;
+input signed [7:0] c;
+input signed [7:0] d;
+input signed [7:0] e;
+
+wire signed [7:0] x0;
+wire signed [7:0] add30_x0;
+wire signed [7:0] add31_x0;
+
+
+
+
+assign add30_x0 = (a + b);
+
+
+
+assign x0 = (add30_x0 + c);
+
+
+
+assign add31_x0 = (x0 + d);
+
+
+
+assign x = (add31_x0 + e);
+
+endmodule
@@ -0,0 +1,57 @@
+// File: DUT_Verilog_002.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:08 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module DUT_Verilog_002 (
+    x,
+    a,
+    b,
+    c,
+    d,
+    e
+);
+
+
+output signed [7:0] x;
+wire signed [7:0] x;
+input signed [7:0] a;
+input signed [7:0] b;
+input signed [7:0] c;
+input signed [7:0] d;
+input signed [7:0] e;
+
+wire signed [10:0] x0;
+wire signed [10:0] add40_add0_0_x;
+wire signed [10:0] add40_add1_0_x;
+wire signed [10:0] add41_add3_0_x;
+wire signed [10:0] add41_add4_0_x;
+
+
+
+
+assign add40_add0_0_x = (a + b);
+
+
+
+assign add40_add1_0_x = (add40_add0_0_x + c);
+
+
+
+assign x0 = (add40_add1_0_x + d);
+
+
+
+assign add41_add3_0_x = (x0 + e);
+
+
+
+assign add41_add4_0_x = (add41_add3_0_x + a);
+
+
+
+assign x = (add41_add4_0_x + b);
+
+endmodule
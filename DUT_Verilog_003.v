@@ -0,0 +1,68 @@
+// File: DUT_Verilog_003.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:08 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module DUT_Verilog_003 (
+    SOF,
+    clk,
+    reset_n
+);
+
+
+output SOF;
+reg SOF;
+input clk;
+input reset_n;
+
+wire mid0_syncFlag;
+reg [1:0] mid0_state;
+reg [7:0] mid0_FramerCtrl0_index;
+
+assign mid0_syncFlag = 1'd0;
+
+
+always @(posedge clk, negedge reset_n) begin: mid0_framerctrl0_fsm
+    if ((reset_n == 0)) begin
+        SOF <= 0;
+        mid0_FramerCtrl0_index <= 0;
+        mid0_state <= 2'b00;
+    end
+    else begin
+        mid0_FramerCtrl0_index <= ((mid0_FramerCtrl0_index + 1) % 8);
+        SOF <= 0;
+        case (mid0_state)
+            2'b00: begin
+                mid0_FramerCtrl0_index <= 1;
+                if (mid0_syncFlag) begin
+                    mid0_state <= 2'b01;
+                end
+            end
+            2'b01: begin
+                if ((mid0_FramerCtrl0_index == 0)) begin
+                    if (mid0_syncFlag) begin
+                        mid0_state <= 2'b10;
+                    end
+                    else begin
+                        mid0_state <= 2'b00;
+                    end
+                end
+            end
+            2'b10: begin
+                if ((mid0_FramerCtrl0_index == 0)) begin
+                    if ((!mid0_syncFlag)) begin
+                        mid0_state <= 2'b00;
+                    end
+                end
+                SOF <= ($signed({1'b0, mid0_FramerCtrl0_index}) == (8 - 1));
+            end
+            default: begin
+                $finish;
+            end
+        endcase
+    end
+end
+
+endmodule
@@ -0,0 +1,1104 @@
+-- File: DecBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity DecBench is
+end entity DecBench;
+
+
+architecture MyHDL of DecBench is
+
+
+
+signal clock: std_logic;
+signal count: signed (7 downto 0);
+signal enable: std_logic;
+signal reset: std_logic;
+
+procedure MYHDL1293_decTaskFunc(
+    cnt: inout signed;
+    signal enable: in std_logic;
+    n: in natural) is
+begin
+    if (enable = '1') then
+        if (cnt = (-n)) then
+            cnt := to_signed(n - 1, 8);
+        else
+            cnt := (cnt - 1);
+        end if;
+    end if;
+end procedure MYHDL1293_decTaskFunc;
+
+begin
+
+
+
+
+dectask0_dectaskgen: process (clock, reset) is
+    variable cnt: signed(7 downto 0);
+begin
+    if (reset = '0') then
+        cnt := to_signed(0, 8);
+        count <= to_signed(0, 8);
+    elsif rising_edge(clock) then
+        MYHDL1293_decTaskFunc(cnt, enable, 128);
+        count <= cnt;
+    end if;
+end process dectask0_dectaskgen;
+
+clockgen: process is
+begin
+    wait for 10 * 1 ns;
+    clock <= '0';
+    while True loop
+        wait for 10 * 1 ns;
+        clock <= stdl((not bool(clock)));
+    end loop;
+    wait;
+end process clockgen;
+
+stimulus: process is
+begin
+    reset <= '1';
+    wait until falling_edge(clock);
+    reset <= '0';
+    wait until falling_edge(clock);
+    reset <= '1';
+    for i in 0 to 1000-1 loop
+        enable <= '1';
+        wait until falling_edge(clock);
+    end loop;
+    for i in 0 to 1000-1 loop
+        case i is
+            when 0 => enable <= '1';
+            when 1 => enable <= '1';
+            when 2 => enable <= '1';
+            when 3 => enable <= '0';
+            when 4 => enable <= '1';
+            when 5 => enable <= '1';
+            when 6 => enable <= '1';
+            when 7 => enable <= '1';
+            when 8 => enable <= '1';
+            when 9 => enable <= '1';
+            when 10 => enable <= '1';
+            when 11 => enable <= '1';
+            when 12 => enable <= '1';
+            when 13 => enable <= '1';
+            when 14 => enable <= '1';
+            when 15 => enable <= '1';
+            when 16 => enable <= '1';
+            when 17 => enable <= '1';
+            when 18 => enable <= '1';
+            when 19 => enable <= '1';
+            when 20 => enable <= '1';
+            when 21 => enable <= '1';
+            when 22 => enable <= '1';
+            when 23 => enable <= '1';
+            when 24 => enable <= '1';
+            when 25 => enable <= '0';
+            when 26 => enable <= '0';
+            when 27 => enable <= '1';
+            when 28 => enable <= '1';
+            when 29 => enable <= '1';
+            when 30 => enable <= '0';
+            when 31 => enable <= '1';
+            when 32 => enable <= '1';
+            when 33 => enable <= '1';
+            when 34 => enable <= '1';
+            when 35 => enable <= '0';
+            when 36 => enable <= '1';
+            when 37 => enable <= '1';
+            when 38 => enable <= '1';
+            when 39 => enable <= '1';
+            when 40 => enable <= '1';
+            when 41 => enable <= '1';
+            when 42 => enable <= '1';
+            when 43 => enable <= '1';
+            when 44 => enable <= '1';
+            when 45 => enable <= '1';
+            when 46 => enable <= '1';
+            when 47 => enable <= '1';
+            when 48 => enable <= '1';
+            when 49 => enable <= '1';
+            when 50 => enable <= '1';
+            when 51 => enable <= '1';
+            when 52 => enable <= '0';
+            when 53 => enable <= '1';
+            when 54 => enable <= '1';
+            when 55 => enable <= '1';
+            when 56 => enable <= '0';
+            when 57 => enable <= '1';
+            when 58 => enable <= '1';
+            when 59 => enable <= '1';
+            when 60 => enable <= '1';
+            when 61 => enable <= '1';
+            when 62 => enable <= '0';
+            when 63 => enable <= '1';
+            when 64 => enable <= '1';
+            when 65 => enable <= '1';
+            when 66 => enable <= '0';
+            when 67 => enable <= '1';
+            when 68 => enable <= '1';
+            when 69 => enable <= '1';
+            when 70 => enable <= '1';
+            when 71 => enable <= '1';
+            when 72 => enable <= '1';
+            when 73 => enable <= '1';
+            when 74 => enable <= '0';
+            when 75 => enable <= '1';
+            when 76 => enable <= '1';
+            when 77 => enable <= '1';
+            when 78 => enable <= '1';
+            when 79 => enable <= '1';
+            when 80 => enable <= '0';
+            when 81 => enable <= '1';
+            when 82 => enable <= '1';
+            when 83 => enable <= '1';
+            when 84 => enable <= '1';
+            when 85 => enable <= '1';
+            when 86 => enable <= '1';
+            when 87 => enable <= '1';
+            when 88 => enable <= '1';
+            when 89 => enable <= '0';
+            when 90 => enable <= '1';
+            when 91 => enable <= '0';
+            when 92 => enable <= '1';
+            when 93 => enable <= '1';
+            when 94 => enable <= '1';
+            when 95 => enable <= '1';
+            when 96 => enable <= '0';
+            when 97 => enable <= '1';
+            when 98 => enable <= '0';
+            when 99 => enable <= '1';
+            when 100 => enable <= '1';
+            when 101 => enable <= '1';
+            when 102 => enable <= '1';
+            when 103 => enable <= '1';
+            when 104 => enable <= '1';
+            when 105 => enable <= '1';
+            when 106 => enable <= '1';
+            when 107 => enable <= '1';
+            when 108 => enable <= '1';
+            when 109 => enable <= '1';
+            when 110 => enable <= '1';
+            when 111 => enable <= '1';
+            when 112 => enable <= '0';
+            when 113 => enable <= '0';
+            when 114 => enable <= '1';
+            when 115 => enable <= '1';
+            when 116 => enable <= '1';
+            when 117 => enable <= '1';
+            when 118 => enable <= '1';
+            when 119 => enable <= '1';
+            when 120 => enable <= '1';
+            when 121 => enable <= '0';
+            when 122 => enable <= '0';
+            when 123 => enable <= '0';
+            when 124 => enable <= '1';
+            when 125 => enable <= '0';
+            when 126 => enable <= '1';
+            when 127 => enable <= '1';
+            when 128 => enable <= '1';
+            when 129 => enable <= '1';
+            when 130 => enable <= '1';
+            when 131 => enable <= '0';
+            when 132 => enable <= '0';
+            when 133 => enable <= '1';
+            when 134 => enable <= '1';
+            when 135 => enable <= '1';
+            when 136 => enable <= '1';
+            when 137 => enable <= '1';
+            when 138 => enable <= '1';
+            when 139 => enable <= '0';
+            when 140 => enable <= '0';
+            when 141 => enable <= '1';
+            when 142 => enable <= '1';
+            when 143 => enable <= '1';
+            when 144 => enable <= '1';
+            when 145 => enable <= '1';
+            when 146 => enable <= '1';
+            when 147 => enable <= '1';
+            when 148 => enable <= '1';
+            when 149 => enable <= '1';
+            when 150 => enable <= '1';
+            when 151 => enable <= '1';
+            when 152 => enable <= '1';
+            when 153 => enable <= '1';
+            when 154 => enable <= '1';
+            when 155 => enable <= '1';
+            when 156 => enable <= '1';
+            when 157 => enable <= '0';
+            when 158 => enable <= '1';
+            when 159 => enable <= '0';
+            when 160 => enable <= '1';
+            when 161 => enable <= '1';
+            when 162 => enable <= '1';
+            when 163 => enable <= '1';
+            when 164 => enable <= '1';
+            when 165 => enable <= '1';
+            when 166 => enable <= '1';
+            when 167 => enable <= '0';
+            when 168 => enable <= '1';
+            when 169 => enable <= '0';
+            when 170 => enable <= '0';
+            when 171 => enable <= '1';
+            when 172 => enable <= '0';
+            when 173 => enable <= '1';
+            when 174 => enable <= '1';
+            when 175 => enable <= '1';
+            when 176 => enable <= '1';
+            when 177 => enable <= '1';
+            when 178 => enable <= '1';
+            when 179 => enable <= '1';
+            when 180 => enable <= '1';
+            when 181 => enable <= '1';
+            when 182 => enable <= '1';
+            when 183 => enable <= '1';
+            when 184 => enable <= '1';
+            when 185 => enable <= '1';
+            when 186 => enable <= '1';
+            when 187 => enable <= '1';
+            when 188 => enable <= '1';
+            when 189 => enable <= '1';
+            when 190 => enable <= '1';
+            when 191 => enable <= '1';
+            when 192 => enable <= '1';
+            when 193 => enable <= '0';
+            when 194 => enable <= '0';
+            when 195 => enable <= '1';
+            when 196 => enable <= '0';
+            when 197 => enable <= '1';
+            when 198 => enable <= '1';
+            when 199 => enable <= '1';
+            when 200 => enable <= '1';
+            when 201 => enable <= '1';
+            when 202 => enable <= '1';
+            when 203 => enable <= '1';
+            when 204 => enable <= '1';
+            when 205 => enable <= '0';
+            when 206 => enable <= '0';
+            when 207 => enable <= '1';
+            when 208 => enable <= '1';
+            when 209 => enable <= '1';
+            when 210 => enable <= '0';
+            when 211 => enable <= '1';
+            when 212 => enable <= '1';
+            when 213 => enable <= '1';
+            when 214 => enable <= '1';
+            when 215 => enable <= '1';
+            when 216 => enable <= '1';
+            when 217 => enable <= '0';
+            when 218 => enable <= '0';
+            when 219 => enable <= '1';
+            when 220 => enable <= '1';
+            when 221 => enable <= '0';
+            when 222 => enable <= '1';
+            when 223 => enable <= '1';
+            when 224 => enable <= '1';
+            when 225 => enable <= '1';
+            when 226 => enable <= '1';
+            when 227 => enable <= '0';
+            when 228 => enable <= '1';
+            when 229 => enable <= '0';
+            when 230 => enable <= '1';
+            when 231 => enable <= '1';
+            when 232 => enable <= '1';
+            when 233 => enable <= '1';
+            when 234 => enable <= '1';
+            when 235 => enable <= '1';
+            when 236 => enable <= '1';
+            when 237 => enable <= '0';
+            when 238 => enable <= '1';
+            when 239 => enable <= '1';
+            when 240 => enable <= '0';
+            when 241 => enable <= '1';
+            when 242 => enable <= '1';
+            when 243 => enable <= '1';
+            when 244 => enable <= '0';
+            when 245 => enable <= '1';
+            when 246 => enable <= '1';
+            when 247 => enable <= '0';
+            when 248 => enable <= '1';
+            when 249 => enable <= '1';
+            when 250 => enable <= '1';
+            when 251 => enable <= '1';
+            when 252 => enable <= '1';
+            when 253 => enable <= '1';
+            when 254 => enable <= '1';
+            when 255 => enable <= '0';
+            when 256 => enable <= '1';
+            when 257 => enable <= '1';
+            when 258 => enable <= '1';
+            when 259 => enable <= '1';
+            when 260 => enable <= '1';
+            when 261 => enable <= '1';
+            when 262 => enable <= '1';
+            when 263 => enable <= '1';
+            when 264 => enable <= '1';
+            when 265 => enable <= '1';
+            when 266 => enable <= '1';
+            when 267 => enable <= '1';
+            when 268 => enable <= '1';
+            when 269 => enable <= '1';
+            when 270 => enable <= '1';
+            when 271 => enable <= '1';
+            when 272 => enable <= '1';
+            when 273 => enable <= '1';
+            when 274 => enable <= '0';
+            when 275 => enable <= '0';
+            when 276 => enable <= '1';
+            when 277 => enable <= '1';
+            when 278 => enable <= '1';
+            when 279 => enable <= '1';
+            when 280 => enable <= '1';
+            when 281 => enable <= '1';
+            when 282 => enable <= '0';
+            when 283 => enable <= '1';
+            when 284 => enable <= '1';
+            when 285 => enable <= '1';
+            when 286 => enable <= '1';
+            when 287 => enable <= '1';
+            when 288 => enable <= '1';
+            when 289 => enable <= '1';
+            when 290 => enable <= '1';
+            when 291 => enable <= '1';
+            when 292 => enable <= '0';
+            when 293 => enable <= '0';
+            when 294 => enable <= '1';
+            when 295 => enable <= '1';
+            when 296 => enable <= '1';
+            when 297 => enable <= '1';
+            when 298 => enable <= '1';
+            when 299 => enable <= '1';
+            when 300 => enable <= '1';
+            when 301 => enable <= '1';
+            when 302 => enable <= '1';
+            when 303 => enable <= '1';
+            when 304 => enable <= '0';
+            when 305 => enable <= '0';
+            when 306 => enable <= '1';
+            when 307 => enable <= '1';
+            when 308 => enable <= '1';
+            when 309 => enable <= '0';
+            when 310 => enable <= '1';
+            when 311 => enable <= '1';
+            when 312 => enable <= '1';
+            when 313 => enable <= '1';
+            when 314 => enable <= '1';
+            when 315 => enable <= '1';
+            when 316 => enable <= '1';
+            when 317 => enable <= '1';
+            when 318 => enable <= '0';
+            when 319 => enable <= '1';
+            when 320 => enable <= '1';
+            when 321 => enable <= '1';
+            when 322 => enable <= '1';
+            when 323 => enable <= '0';
+            when 324 => enable <= '0';
+            when 325 => enable <= '0';
+            when 326 => enable <= '1';
+            when 327 => enable <= '0';
+            when 328 => enable <= '1';
+            when 329 => enable <= '1';
+            when 330 => enable <= '1';
+            when 331 => enable <= '1';
+            when 332 => enable <= '0';
+            when 333 => enable <= '0';
+            when 334 => enable <= '1';
+            when 335 => enable <= '1';
+            when 336 => enable <= '1';
+            when 337 => enable <= '1';
+            when 338 => enable <= '1';
+            when 339 => enable <= '1';
+            when 340 => enable <= '1';
+            when 341 => enable <= '1';
+            when 342 => enable <= '1';
+            when 343 => enable <= '1';
+            when 344 => enable <= '1';
+            when 345 => enable <= '1';
+            when 346 => enable <= '1';
+            when 347 => enable <= '1';
+            when 348 => enable <= '1';
+            when 349 => enable <= '1';
+            when 350 => enable <= '1';
+            when 351 => enable <= '1';
+            when 352 => enable <= '1';
+            when 353 => enable <= '1';
+            when 354 => enable <= '1';
+            when 355 => enable <= '1';
+            when 356 => enable <= '1';
+            when 357 => enable <= '1';
+            when 358 => enable <= '1';
+            when 359 => enable <= '0';
+            when 360 => enable <= '1';
+            when 361 => enable <= '1';
+            when 362 => enable <= '1';
+            when 363 => enable <= '1';
+            when 364 => enable <= '0';
+            when 365 => enable <= '1';
+            when 366 => enable <= '1';
+            when 367 => enable <= '1';
+            when 368 => enable <= '1';
+            when 369 => enable <= '1';
+            when 370 => enable <= '0';
+            when 371 => enable <= '1';
+            when 372 => enable <= '0';
+            when 373 => enable <= '1';
+            when 374 => enable <= '1';
+            when 375 => enable <= '1';
+            when 376 => enable <= '1';
+            when 377 => enable <= '1';
+            when 378 => enable <= '1';
+            when 379 => enable <= '1';
+            when 380 => enable <= '1';
+            when 381 => enable <= '1';
+            when 382 => enable <= '1';
+            when 383 => enable <= '1';
+            when 384 => enable <= '1';
+            when 385 => enable <= '1';
+            when 386 => enable <= '1';
+            when 387 => enable <= '1';
+            when 388 => enable <= '1';
+            when 389 => enable <= '1';
+            when 390 => enable <= '1';
+            when 391 => enable <= '0';
+            when 392 => enable <= '0';
+            when 393 => enable <= '0';
+            when 394 => enable <= '1';
+            when 395 => enable <= '1';
+            when 396 => enable <= '1';
+            when 397 => enable <= '1';
+            when 398 => enable <= '1';
+            when 399 => enable <= '0';
+            when 400 => enable <= '1';
+            when 401 => enable <= '1';
+            when 402 => enable <= '1';
+            when 403 => enable <= '1';
+            when 404 => enable <= '1';
+            when 405 => enable <= '1';
+            when 406 => enable <= '1';
+            when 407 => enable <= '1';
+            when 408 => enable <= '1';
+            when 409 => enable <= '1';
+            when 410 => enable <= '0';
+            when 411 => enable <= '0';
+            when 412 => enable <= '1';
+            when 413 => enable <= '0';
+            when 414 => enable <= '1';
+            when 415 => enable <= '1';
+            when 416 => enable <= '0';
+            when 417 => enable <= '1';
+            when 418 => enable <= '1';
+            when 419 => enable <= '1';
+            when 420 => enable <= '0';
+            when 421 => enable <= '1';
+            when 422 => enable <= '1';
+            when 423 => enable <= '0';
+            when 424 => enable <= '1';
+            when 425 => enable <= '1';
+            when 426 => enable <= '1';
+            when 427 => enable <= '0';
+            when 428 => enable <= '1';
+            when 429 => enable <= '1';
+            when 430 => enable <= '1';
+            when 431 => enable <= '1';
+            when 432 => enable <= '0';
+            when 433 => enable <= '1';
+            when 434 => enable <= '1';
+            when 435 => enable <= '1';
+            when 436 => enable <= '1';
+            when 437 => enable <= '1';
+            when 438 => enable <= '1';
+            when 439 => enable <= '1';
+            when 440 => enable <= '1';
+            when 441 => enable <= '1';
+            when 442 => enable <= '0';
+            when 443 => enable <= '1';
+            when 444 => enable <= '0';
+            when 445 => enable <= '0';
+            when 446 => enable <= '1';
+            when 447 => enable <= '1';
+            when 448 => enable <= '1';
+            when 449 => enable <= '1';
+            when 450 => enable <= '1';
+            when 451 => enable <= '1';
+            when 452 => enable <= '1';
+            when 453 => enable <= '1';
+            when 454 => enable <= '1';
+            when 455 => enable <= '1';
+            when 456 => enable <= '1';
+            when 457 => enable <= '1';
+            when 458 => enable <= '1';
+            when 459 => enable <= '1';
+            when 460 => enable <= '1';
+            when 461 => enable <= '1';
+            when 462 => enable <= '1';
+            when 463 => enable <= '1';
+            when 464 => enable <= '1';
+            when 465 => enable <= '1';
+            when 466 => enable <= '1';
+            when 467 => enable <= '0';
+            when 468 => enable <= '1';
+            when 469 => enable <= '1';
+            when 470 => enable <= '1';
+            when 471 => enable <= '1';
+            when 472 => enable <= '1';
+            when 473 => enable <= '1';
+            when 474 => enable <= '1';
+            when 475 => enable <= '1';
+            when 476 => enable <= '1';
+            when 477 => enable <= '1';
+            when 478 => enable <= '1';
+            when 479 => enable <= '1';
+            when 480 => enable <= '1';
+            when 481 => enable <= '1';
+            when 482 => enable <= '1';
+            when 483 => enable <= '1';
+            when 484 => enable <= '0';
+            when 485 => enable <= '1';
+            when 486 => enable <= '1';
+            when 487 => enable <= '1';
+            when 488 => enable <= '1';
+            when 489 => enable <= '1';
+            when 490 => enable <= '0';
+            when 491 => enable <= '0';
+            when 492 => enable <= '1';
+            when 493 => enable <= '1';
+            when 494 => enable <= '1';
+            when 495 => enable <= '1';
+            when 496 => enable <= '1';
+            when 497 => enable <= '0';
+            when 498 => enable <= '0';
+            when 499 => enable <= '1';
+            when 500 => enable <= '1';
+            when 501 => enable <= '1';
+            when 502 => enable <= '1';
+            when 503 => enable <= '1';
+            when 504 => enable <= '1';
+            when 505 => enable <= '1';
+            when 506 => enable <= '0';
+            when 507 => enable <= '0';
+            when 508 => enable <= '1';
+            when 509 => enable <= '1';
+            when 510 => enable <= '1';
+            when 511 => enable <= '1';
+            when 512 => enable <= '0';
+            when 513 => enable <= '0';
+            when 514 => enable <= '1';
+            when 515 => enable <= '1';
+            when 516 => enable <= '0';
+            when 517 => enable <= '1';
+            when 518 => enable <= '0';
+            when 519 => enable <= '0';
+            when 520 => enable <= '1';
+            when 521 => enable <= '1';
+            when 522 => enable <= '0';
+            when 523 => enable <= '1';
+            when 524 => enable <= '0';
+            when 525 => enable <= '1';
+            when 526 => enable <= '0';
+            when 527 => enable <= '0';
+            when 528 => enable <= '0';
+            when 529 => enable <= '1';
+            when 530 => enable <= '1';
+            when 531 => enable <= '0';
+            when 532 => enable <= '1';
+            when 533 => enable <= '1';
+            when 534 => enable <= '1';
+            when 535 => enable <= '1';
+            when 536 => enable <= '1';
+            when 537 => enable <= '1';
+            when 538 => enable <= '1';
+            when 539 => enable <= '0';
+            when 540 => enable <= '1';
+            when 541 => enable <= '1';
+            when 542 => enable <= '1';
+            when 543 => enable <= '1';
+            when 544 => enable <= '0';
+            when 545 => enable <= '1';
+            when 546 => enable <= '1';
+            when 547 => enable <= '0';
+            when 548 => enable <= '0';
+            when 549 => enable <= '1';
+            when 550 => enable <= '1';
+            when 551 => enable <= '0';
+            when 552 => enable <= '0';
+            when 553 => enable <= '0';
+            when 554 => enable <= '1';
+            when 555 => enable <= '1';
+            when 556 => enable <= '1';
+            when 557 => enable <= '1';
+            when 558 => enable <= '1';
+            when 559 => enable <= '1';
+            when 560 => enable <= '0';
+            when 561 => enable <= '1';
+            when 562 => enable <= '1';
+            when 563 => enable <= '1';
+            when 564 => enable <= '1';
+            when 565 => enable <= '1';
+            when 566 => enable <= '0';
+            when 567 => enable <= '1';
+            when 568 => enable <= '1';
+            when 569 => enable <= '1';
+            when 570 => enable <= '1';
+            when 571 => enable <= '1';
+            when 572 => enable <= '1';
+            when 573 => enable <= '1';
+            when 574 => enable <= '0';
+            when 575 => enable <= '1';
+            when 576 => enable <= '0';
+            when 577 => enable <= '1';
+            when 578 => enable <= '1';
+            when 579 => enable <= '0';
+            when 580 => enable <= '0';
+            when 581 => enable <= '0';
+            when 582 => enable <= '1';
+            when 583 => enable <= '1';
+            when 584 => enable <= '1';
+            when 585 => enable <= '1';
+            when 586 => enable <= '1';
+            when 587 => enable <= '1';
+            when 588 => enable <= '1';
+            when 589 => enable <= '0';
+            when 590 => enable <= '1';
+            when 591 => enable <= '0';
+            when 592 => enable <= '1';
+            when 593 => enable <= '1';
+            when 594 => enable <= '1';
+            when 595 => enable <= '1';
+            when 596 => enable <= '1';
+            when 597 => enable <= '1';
+            when 598 => enable <= '1';
+            when 599 => enable <= '1';
+            when 600 => enable <= '1';
+            when 601 => enable <= '0';
+            when 602 => enable <= '1';
+            when 603 => enable <= '1';
+            when 604 => enable <= '1';
+            when 605 => enable <= '1';
+            when 606 => enable <= '1';
+            when 607 => enable <= '1';
+            when 608 => enable <= '1';
+            when 609 => enable <= '1';
+            when 610 => enable <= '1';
+            when 611 => enable <= '0';
+            when 612 => enable <= '1';
+            when 613 => enable <= '1';
+            when 614 => enable <= '1';
+            when 615 => enable <= '1';
+            when 616 => enable <= '1';
+            when 617 => enable <= '1';
+            when 618 => enable <= '0';
+            when 619 => enable <= '1';
+            when 620 => enable <= '1';
+            when 621 => enable <= '0';
+            when 622 => enable <= '1';
+            when 623 => enable <= '1';
+            when 624 => enable <= '1';
+            when 625 => enable <= '1';
+            when 626 => enable <= '1';
+            when 627 => enable <= '1';
+            when 628 => enable <= '1';
+            when 629 => enable <= '1';
+            when 630 => enable <= '0';
+            when 631 => enable <= '1';
+            when 632 => enable <= '1';
+            when 633 => enable <= '1';
+            when 634 => enable <= '1';
+            when 635 => enable <= '1';
+            when 636 => enable <= '1';
+            when 637 => enable <= '1';
+            when 638 => enable <= '1';
+            when 639 => enable <= '1';
+            when 640 => enable <= '1';
+            when 641 => enable <= '0';
+            when 642 => enable <= '1';
+            when 643 => enable <= '1';
+            when 644 => enable <= '1';
+            when 645 => enable <= '1';
+            when 646 => enable <= '1';
+            when 647 => enable <= '1';
+            when 648 => enable <= '1';
+            when 649 => enable <= '1';
+            when 650 => enable <= '1';
+            when 651 => enable <= '0';
+            when 652 => enable <= '1';
+            when 653 => enable <= '1';
+            when 654 => enable <= '1';
+            when 655 => enable <= '1';
+            when 656 => enable <= '1';
+            when 657 => enable <= '1';
+            when 658 => enable <= '1';
+            when 659 => enable <= '1';
+            when 660 => enable <= '1';
+            when 661 => enable <= '1';
+            when 662 => enable <= '1';
+            when 663 => enable <= '0';
+            when 664 => enable <= '1';
+            when 665 => enable <= '1';
+            when 666 => enable <= '1';
+            when 667 => enable <= '1';
+            when 668 => enable <= '0';
+            when 669 => enable <= '0';
+            when 670 => enable <= '1';
+            when 671 => enable <= '0';
+            when 672 => enable <= '1';
+            when 673 => enable <= '1';
+            when 674 => enable <= '1';
+            when 675 => enable <= '1';
+            when 676 => enable <= '1';
+            when 677 => enable <= '0';
+            when 678 => enable <= '1';
+            when 679 => enable <= '0';
+            when 680 => enable <= '0';
+            when 681 => enable <= '1';
+            when 682 => enable <= '1';
+            when 683 => enable <= '1';
+            when 684 => enable <= '1';
+            when 685 => enable <= '1';
+            when 686 => enable <= '1';
+            when 687 => enable <= '1';
+            when 688 => enable <= '0';
+            when 689 => enable <= '1';
+            when 690 => enable <= '1';
+            when 691 => enable <= '1';
+            when 692 => enable <= '1';
+            when 693 => enable <= '1';
+            when 694 => enable <= '1';
+            when 695 => enable <= '1';
+            when 696 => enable <= '1';
+            when 697 => enable <= '1';
+            when 698 => enable <= '1';
+            when 699 => enable <= '1';
+            when 700 => enable <= '0';
+            when 701 => enable <= '1';
+            when 702 => enable <= '1';
+            when 703 => enable <= '1';
+            when 704 => enable <= '0';
+            when 705 => enable <= '1';
+            when 706 => enable <= '1';
+            when 707 => enable <= '1';
+            when 708 => enable <= '1';
+            when 709 => enable <= '0';
+            when 710 => enable <= '0';
+            when 711 => enable <= '1';
+            when 712 => enable <= '0';
+            when 713 => enable <= '1';
+            when 714 => enable <= '1';
+            when 715 => enable <= '1';
+            when 716 => enable <= '1';
+            when 717 => enable <= '1';
+            when 718 => enable <= '0';
+            when 719 => enable <= '0';
+            when 720 => enable <= '1';
+            when 721 => enable <= '1';
+            when 722 => enable <= '1';
+            when 723 => enable <= '1';
+            when 724 => enable <= '1';
+            when 725 => enable <= '1';
+            when 726 => enable <= '1';
+            when 727 => enable <= '1';
+            when 728 => enable <= '1';
+            when 729 => enable <= '1';
+            when 730 => enable <= '0';
+            when 731 => enable <= '1';
+            when 732 => enable <= '1';
+            when 733 => enable <= '1';
+            when 734 => enable <= '0';
+            when 735 => enable <= '1';
+            when 736 => enable <= '1';
+            when 737 => enable <= '1';
+            when 738 => enable <= '1';
+            when 739 => enable <= '1';
+            when 740 => enable <= '0';
+            when 741 => enable <= '0';
+            when 742 => enable <= '1';
+            when 743 => enable <= '0';
+            when 744 => enable <= '1';
+            when 745 => enable <= '0';
+            when 746 => enable <= '1';
+            when 747 => enable <= '1';
+            when 748 => enable <= '1';
+            when 749 => enable <= '0';
+            when 750 => enable <= '1';
+            when 751 => enable <= '1';
+            when 752 => enable <= '1';
+            when 753 => enable <= '1';
+            when 754 => enable <= '1';
+            when 755 => enable <= '1';
+            when 756 => enable <= '1';
+            when 757 => enable <= '1';
+            when 758 => enable <= '0';
+            when 759 => enable <= '1';
+            when 760 => enable <= '1';
+            when 761 => enable <= '1';
+            when 762 => enable <= '1';
+            when 763 => enable <= '1';
+            when 764 => enable <= '1';
+            when 765 => enable <= '1';
+            when 766 => enable <= '1';
+            when 767 => enable <= '0';
+            when 768 => enable <= '1';
+            when 769 => enable <= '1';
+            when 770 => enable <= '1';
+            when 771 => enable <= '0';
+            when 772 => enable <= '1';
+            when 773 => enable <= '1';
+            when 774 => enable <= '1';
+            when 775 => enable <= '1';
+            when 776 => enable <= '1';
+            when 777 => enable <= '0';
+            when 778 => enable <= '1';
+            when 779 => enable <= '0';
+            when 780 => enable <= '1';
+            when 781 => enable <= '1';
+            when 782 => enable <= '1';
+            when 783 => enable <= '1';
+            when 784 => enable <= '0';
+            when 785 => enable <= '0';
+            when 786 => enable <= '1';
+            when 787 => enable <= '0';
+            when 788 => enable <= '1';
+            when 789 => enable <= '0';
+            when 790 => enable <= '0';
+            when 791 => enable <= '1';
+            when 792 => enable <= '1';
+            when 793 => enable <= '1';
+            when 794 => enable <= '0';
+            when 795 => enable <= '1';
+            when 796 => enable <= '1';
+            when 797 => enable <= '0';
+            when 798 => enable <= '1';
+            when 799 => enable <= '0';
+            when 800 => enable <= '1';
+            when 801 => enable <= '1';
+            when 802 => enable <= '0';
+            when 803 => enable <= '0';
+            when 804 => enable <= '1';
+            when 805 => enable <= '1';
+            when 806 => enable <= '1';
+            when 807 => enable <= '1';
+            when 808 => enable <= '1';
+            when 809 => enable <= '1';
+            when 810 => enable <= '0';
+            when 811 => enable <= '1';
+            when 812 => enable <= '1';
+            when 813 => enable <= '0';
+            when 814 => enable <= '1';
+            when 815 => enable <= '0';
+            when 816 => enable <= '1';
+            when 817 => enable <= '1';
+            when 818 => enable <= '1';
+            when 819 => enable <= '1';
+            when 820 => enable <= '1';
+            when 821 => enable <= '1';
+            when 822 => enable <= '0';
+            when 823 => enable <= '1';
+            when 824 => enable <= '1';
+            when 825 => enable <= '1';
+            when 826 => enable <= '1';
+            when 827 => enable <= '1';
+            when 828 => enable <= '1';
+            when 829 => enable <= '1';
+            when 830 => enable <= '1';
+            when 831 => enable <= '0';
+            when 832 => enable <= '1';
+            when 833 => enable <= '1';
+            when 834 => enable <= '1';
+            when 835 => enable <= '1';
+            when 836 => enable <= '1';
+            when 837 => enable <= '1';
+            when 838 => enable <= '1';
+            when 839 => enable <= '1';
+            when 840 => enable <= '1';
+            when 841 => enable <= '0';
+            when 842 => enable <= '1';
+            when 843 => enable <= '0';
+            when 844 => enable <= '1';
+            when 845 => enable <= '1';
+            when 846 => enable <= '1';
+            when 847 => enable <= '1';
+            when 848 => enable <= '1';
+            when 849 => enable <= '1';
+            when 850 => enable <= '1';
+            when 851 => enable <= '1';
+            when 852 => enable <= '0';
+            when 853 => enable <= '1';
+            when 854 => enable <= '0';
+            when 855 => enable <= '1';
+            when 856 => enable <= '1';
+            when 857 => enable <= '1';
+            when 858 => enable <= '1';
+            when 859 => enable <= '1';
+            when 860 => enable <= '1';
+            when 861 => enable <= '1';
+            when 862 => enable <= '1';
+            when 863 => enable <= '1';
+            when 864 => enable <= '1';
+            when 865 => enable <= '1';
+            when 866 => enable <= '1';
+            when 867 => enable <= '1';
+            when 868 => enable <= '1';
+            when 869 => enable <= '1';
+            when 870 => enable <= '0';
+            when 871 => enable <= '1';
+            when 872 => enable <= '1';
+            when 873 => enable <= '1';
+            when 874 => enable <= '1';
+            when 875 => enable <= '1';
+            when 876 => enable <= '1';
+            when 877 => enable <= '1';
+            when 878 => enable <= '1';
+            when 879 => enable <= '1';
+            when 880 => enable <= '1';
+            when 881 => enable <= '0';
+            when 882 => enable <= '1';
+            when 883 => enable <= '0';
+            when 884 => enable <= '1';
+            when 885 => enable <= '0';
+            when 886 => enable <= '0';
+            when 887 => enable <= '1';
+            when 888 => enable <= '1';
+            when 889 => enable <= '1';
+            when 890 => enable <= '1';
+            when 891 => enable <= '1';
+            when 892 => enable <= '1';
+            when 893 => enable <= '1';
+            when 894 => enable <= '1';
+            when 895 => enable <= '1';
+            when 896 => enable <= '1';
+            when 897 => enable <= '1';
+            when 898 => enable <= '1';
+            when 899 => enable <= '0';
+            when 900 => enable <= '1';
+            when 901 => enable <= '1';
+            when 902 => enable <= '1';
+            when 903 => enable <= '1';
+            when 904 => enable <= '1';
+            when 905 => enable <= '0';
+            when 906 => enable <= '1';
+            when 907 => enable <= '0';
+            when 908 => enable <= '1';
+            when 909 => enable <= '1';
+            when 910 => enable <= '1';
+            when 911 => enable <= '1';
+            when 912 => enable <= '1';
+            when 913 => enable <= '1';
+            when 914 => enable <= '1';
+            when 915 => enable <= '1';
+            when 916 => enable <= '0';
+            when 917 => enable <= '1';
+            when 918 => enable <= '0';
+            when 919 => enable <= '0';
+            when 920 => enable <= '1';
+            when 921 => enable <= '1';
+            when 922 => enable <= '1';
+            when 923 => enable <= '1';
+            when 924 => enable <= '1';
+            when 925 => enable <= '1';
+            when 926 => enable <= '1';
+            when 927 => enable <= '0';
+            when 928 => enable <= '1';
+            when 929 => enable <= '1';
+            when 930 => enable <= '1';
+            when 931 => enable <= '1';
+            when 932 => enable <= '1';
+            when 933 => enable <= '0';
+            when 934 => enable <= '1';
+            when 935 => enable <= '1';
+            when 936 => enable <= '1';
+            when 937 => enable <= '0';
+            when 938 => enable <= '1';
+            when 939 => enable <= '0';
+            when 940 => enable <= '1';
+            when 941 => enable <= '1';
+            when 942 => enable <= '1';
+            when 943 => enable <= '1';
+            when 944 => enable <= '1';
+            when 945 => enable <= '1';
+            when 946 => enable <= '1';
+            when 947 => enable <= '0';
+            when 948 => enable <= '1';
+            when 949 => enable <= '1';
+            when 950 => enable <= '1';
+            when 951 => enable <= '1';
+            when 952 => enable <= '0';
+            when 953 => enable <= '0';
+            when 954 => enable <= '0';
+            when 955 => enable <= '1';
+            when 956 => enable <= '1';
+            when 957 => enable <= '1';
+            when 958 => enable <= '1';
+            when 959 => enable <= '0';
+            when 960 => enable <= '1';
+            when 961 => enable <= '1';
+            when 962 => enable <= '1';
+            when 963 => enable <= '1';
+            when 964 => enable <= '1';
+            when 965 => enable <= '1';
+            when 966 => enable <= '1';
+            when 967 => enable <= '1';
+            when 968 => enable <= '1';
+            when 969 => enable <= '1';
+            when 970 => enable <= '0';
+            when 971 => enable <= '1';
+            when 972 => enable <= '1';
+            when 973 => enable <= '1';
+            when 974 => enable <= '1';
+            when 975 => enable <= '1';
+            when 976 => enable <= '0';
+            when 977 => enable <= '1';
+            when 978 => enable <= '1';
+            when 979 => enable <= '1';
+            when 980 => enable <= '1';
+            when 981 => enable <= '1';
+            when 982 => enable <= '1';
+            when 983 => enable <= '1';
+            when 984 => enable <= '1';
+            when 985 => enable <= '1';
+            when 986 => enable <= '0';
+            when 987 => enable <= '1';
+            when 988 => enable <= '1';
+            when 989 => enable <= '1';
+            when 990 => enable <= '1';
+            when 991 => enable <= '1';
+            when 992 => enable <= '1';
+            when 993 => enable <= '0';
+            when 994 => enable <= '0';
+            when 995 => enable <= '1';
+            when 996 => enable <= '1';
+            when 997 => enable <= '1';
+            when 998 => enable <= '1';
+            when others => enable <= '1';
+        end case;
+        wait until falling_edge(clock);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+check: process is
+    variable L: line;
+begin
+    wait until falling_edge(reset);
+    wait until rising_edge(reset);
+    write(L, to_hstring(unsigned(count)));
+    writeline(output, L);
+    while True loop
+        wait until rising_edge(clock);
+        wait for 1 * 1 ns;
+        write(L, to_hstring(unsigned(count)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
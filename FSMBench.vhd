@@ -0,0 +1,133 @@
+-- File: FSMBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity FSMBench is
+end entity FSMBench;
+
+
+architecture MyHDL of FSMBench is
+
+
+type t_enum_t_State_1 is (
+	SEARCH,
+	CONFIRM,
+	SYNC
+	);
+
+signal SOF: std_logic;
+signal state: t_enum_t_State_1;
+signal clk: std_logic;
+signal reset_n: std_logic;
+signal syncFlag: std_logic;
+signal FramerCtrl0_0_1_index: unsigned(7 downto 0);
+
+begin
+
+
+
+
+framerctrl0_0_1_fsm: process (clk, reset_n) is
+begin
+    if (reset_n = '0') then
+        SOF <= '0';
+        FramerCtrl0_0_1_index <= to_unsigned(0, 8);
+        state <= SEARCH;
+    elsif rising_edge(clk) then
+        FramerCtrl0_0_1_index <= ((FramerCtrl0_0_1_index + 1) mod 8);
+        SOF <= '0';
+        case state is
+            when SEARCH =>
+                FramerCtrl0_0_1_index <= to_unsigned(1, 8);
+                if bool(syncFlag) then
+                    state <= CONFIRM;
+                end if;
+            when CONFIRM =>
+                if (FramerCtrl0_0_1_index = 0) then
+                    if bool(syncFlag) then
+                        state <= SYNC;
+                    else
+                        state <= SEARCH;
+                    end if;
+                end if;
+            when SYNC =>
+                if (FramerCtrl0_0_1_index = 0) then
+                    if (not bool(syncFlag)) then
+                        state <= SEARCH;
+                    end if;
+                end if;
+                SOF <= stdl(signed(resize(FramerCtrl0_0_1_index, 9)) = (8 - 1));
+            when others =>
+                assert False report "End of Simulation" severity Failure;
+        end case;
+    end if;
+end process framerctrl0_0_1_fsm;
+
+clkgen: process is
+begin
+    clk <= '0';
+    reset_n <= '1';
+    wait for 10 * 1 ns;
+    reset_n <= '0';
+    wait for 10 * 1 ns;
+    reset_n <= '1';
+    wait for 10 * 1 ns;
+    for dummy in 0 to 1000-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process clkgen;
+
+stimulus: process is
+    variable n: integer;
+begin
+    for i in 0 to 3-1 loop
+        wait until rising_edge(clk);
+    end loop;
+    for i in 0 to 11-1 loop
+        case i is
+            when 0 => n := 12;
+            when 1 => n := 8;
+            when 2 => n := 8;
+            when 3 => n := 4;
+            when 4 => n := 11;
+            when 5 => n := 8;
+            when 6 => n := 8;
+            when 7 => n := 7;
+            when 8 => n := 6;
+            when 9 => n := 8;
+            when others => n := 8;
+        end case;
+        syncFlag <= '1';
+        wait until rising_edge(clk);
+        syncFlag <= '0';
+        for dummy in 0 to (n - 1)-1 loop
+            wait until rising_edge(clk);
+        end loop;
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+check: process is
+    variable L: line;
+begin
+    wait until rising_edge(clk);
+    while True loop
+        wait until falling_edge(clk);
+        write(L, string'("negedge"));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
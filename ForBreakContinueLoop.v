@@ -0,0 +1,35 @@
+// File: ForBreakContinueLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:12 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ForBreakContinueLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer i;
+    out <= 0;
+    begin: MYHDL911_BREAK
+    for (i=16-1; i>=0; i=i-1) begin: MYHDL912_LOOP
+        if ((a[i] == 0)) begin
+            disable MYHDL912_LOOP;
+        end
+        out <= i;
+        disable MYHDL911_BREAK;
+    end
+    end
+end
+
+endmodule
@@ -0,0 +1,34 @@
+// File: ForBreakLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:12 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ForBreakLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer i;
+    out <= 0;
+    begin: MYHDL916_BREAK
+    for (i=16-1; i>=0; i=i-1) begin
+        if ((a[i] == 1)) begin
+            out <= i;
+            disable MYHDL916_BREAK;
+        end
+    end
+    end
+end
+
+endmodule
@@ -0,0 +1,34 @@
+// File: ForContinueLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:12 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ForContinueLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer var;
+    integer i;
+    var = 0;
+    for (i=16-1; i>=0; i=i-1) begin: MYHDL922_LOOP
+        if ((a[i] == 0)) begin
+            disable MYHDL922_LOOP;
+        end
+        var = var + 1;
+    end
+    out <= var;
+end
+
+endmodule
@@ -0,0 +1,33 @@
+// File: ForLoop5.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:13 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ForLoop5 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer var;
+    integer i;
+    var = 0;
+    for (i=6; i<16; i=i+1) begin
+        if ((a[i] == 1)) begin
+            var = var + 1;
+        end
+    end
+    out <= var;
+end
+
+endmodule
@@ -0,0 +1,76 @@
+// File: FramerCtrl.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:10 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module FramerCtrl (
+    SOF,
+    state,
+    syncFlag,
+    clk,
+    reset_n
+);
+// Framing control FSM.
+// 
+// SOF -- start-of-frame output bit
+// state -- FramerState output
+// syncFlag -- sync pattern found indication input
+// clk -- clock input
+// reset_n -- active low reset
+
+output SOF;
+reg SOF;
+output [2:0] state;
+reg [2:0] state;
+input syncFlag;
+input clk;
+input reset_n;
+
+reg [7:0] index;
+
+
+
+always @(posedge clk, negedge reset_n) begin: fsm
+    if ((reset_n == 0)) begin
+        SOF <= 0;
+        index <= 0;
+        state <= 3'b001;
+    end
+    else begin
+        index <= ((index + 1) % 8);
+        SOF <= 0;
+        case (state)
+            3'b001: begin
+                index <= 1;
+                if (syncFlag) begin
+                    state <= 3'b010;
+                end
+            end
+            3'b010: begin
+                if ((index == 0)) begin
+                    if (syncFlag) begin
+                        state <= 3'b100;
+                    end
+                    else begin
+                        state <= 3'b001;
+                    end
+                end
+            end
+            3'b100: begin
+                if ((index == 0)) begin
+                    if ((!syncFlag)) begin
+                        state <= 3'b001;
+                    end
+                end
+                SOF <= ($signed({1'b0, index}) == (8 - 1));
+            end
+            default: begin
+                $finish;
+            end
+        endcase
+    end
+end
+
+endmodule
@@ -0,0 +1,76 @@
+// File: FramerCtrl_ref.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:10 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module FramerCtrl_ref (
+    SOF,
+    state,
+    syncFlag,
+    clk,
+    reset_n
+);
+// Framing control FSM.
+// 
+// SOF -- start-of-frame output bit
+// state -- FramerState output
+// syncFlag -- sync pattern found indication input
+// clk -- clock input
+// reset_n -- active low reset
+
+output SOF;
+reg SOF;
+output [1:0] state;
+reg [1:0] state;
+input syncFlag;
+input clk;
+input reset_n;
+
+
+
+
+always @(posedge clk, negedge reset_n) begin: comb
+    reg [3-1:0] index;
+    if ((reset_n == 0)) begin
+        SOF <= 0;
+        index = 0;
+        state <= 2'b00;
+    end
+    else begin
+        SOF <= 0;
+        case (state)
+            2'b00: begin
+                index = 0;
+                if (syncFlag) begin
+                    state <= 2'b01;
+                end
+            end
+            2'b01: begin
+                if ((index == 0)) begin
+                    if (syncFlag) begin
+                        state <= 2'b10;
+                    end
+                    else begin
+                        state <= 2'b00;
+                    end
+                end
+            end
+            2'b10: begin
+                if ((index == 0)) begin
+                    if ((!syncFlag)) begin
+                        state <= 2'b00;
+                    end
+                end
+                SOF <= ($signed({1'b0, index}) == (8 - 1));
+            end
+            default: begin
+                $finish;
+            end
+        endcase
+        index = ((index + 1) % 8);
+    end
+end
+
+endmodule
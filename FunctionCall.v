@@ -0,0 +1,40 @@
+// File: FunctionCall.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:13 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module FunctionCall (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+function integer MYHDL956_ReturnFromFunction;
+    input [16-1:0] a;
+    integer i;
+begin: MYHDL959_RETURN
+    for (i=16-1; i>=0; i=i-1) begin
+        if ((a[i] == 1)) begin
+            MYHDL956_ReturnFromFunction = i;
+            disable MYHDL959_RETURN;
+        end
+    end
+    MYHDL956_ReturnFromFunction = 0;
+    disable MYHDL959_RETURN;
+end
+endfunction
+
+
+always @(a) begin: comb
+    out <= MYHDL956_ReturnFromFunction(a);
+end
+
+endmodule
@@ -0,0 +1,54 @@
+// File: GrayIncReg_0.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module GrayIncReg_0 (
+    graycnt,
+    enable,
+    clock,
+    reset
+);
+
+
+output [7:0] graycnt;
+reg [7:0] graycnt;
+input enable;
+input clock;
+input reset;
+
+reg [7:0] graycnt_comb;
+reg [7:0] GrayInc_00_bincnt;
+
+
+
+always @(posedge clock, negedge reset) begin: grayinc_00_inc0_0_1_2_incprocess
+    if ((reset == 0)) begin
+        GrayInc_00_bincnt <= 0;
+    end
+    else begin
+        if (enable) begin
+            GrayInc_00_bincnt <= ((GrayInc_00_bincnt + 1) % 256);
+        end
+    end
+end
+
+
+always @(GrayInc_00_bincnt) begin: grayinc_00_bin2gray0_comb
+    reg [9-1:0] Bext;
+    integer i;
+    Bext = 9'h0;
+    Bext = GrayInc_00_bincnt;
+    for (i=0; i<8; i=i+1) begin
+        graycnt_comb[i] = (Bext[(i + 1)] ^ Bext[i]);
+    end
+end
+
+
+always @(posedge clock) begin: reg_1
+    graycnt <= graycnt_comb;
+end
+
+endmodule
@@ -0,0 +1,67 @@
+-- File: HecBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity HecBench is
+end entity HecBench;
+
+
+architecture MyHDL of HecBench is
+
+
+
+signal header: unsigned(31 downto 0);
+signal hec: unsigned(7 downto 0);
+
+begin
+
+
+
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 13-1 loop
+        case i is
+            when 0 => header <= "00000000000000000000000000000000";
+            when 1 => header <= "00000001001000110100010101100111";
+            when 2 => header <= "10111010110001101111010011001010";
+            when 3 => header <= "11110100101111101010100101110011";
+            when 4 => header <= "11011100111101001011101110011001";
+            when 5 => header <= "11110010101001001101001001111011";
+            when 6 => header <= "11011001010110111010111111001000";
+            when 7 => header <= "00001110011110100010011010011111";
+            when 8 => header <= "00010111011100100001100111010011";
+            when 9 => header <= "00010101101110100010101111011101";
+            when 10 => header <= "01011100011011100100001100110111";
+            when 11 => header <= "11010101111000110100000100100100";
+            when others => header <= "00101011010010010001000001000100";
+        end case;
+        wait for 10 * 1 ns;
+        write(L, to_hstring(hec));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+heccalculatorplain0_0_comb: process (header) is
+    variable h: unsigned(7 downto 0);
+    variable bit: std_logic;
+begin
+    h := to_unsigned(0, 8);
+    for i in 32-1 downto 0 loop
+        bit := header(i);
+        h := unsigned'(h(7-1 downto 2) & ((bit xor h(1)) xor h(7)) & ((bit xor h(0)) xor h(7)) & (bit xor h(7)));
+    end loop;
+    hec <= (h xor to_unsigned(85, 8));
+end process heccalculatorplain0_0_comb;
+
+end architecture MyHDL;
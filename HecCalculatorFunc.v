@@ -0,0 +1,44 @@
+// File: HecCalculatorFunc.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:10 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module HecCalculatorFunc (
+    hec,
+    header
+);
+// Hec calculation module.
+// 
+// Version with function call.
+
+output [7:0] hec;
+reg [7:0] hec;
+input [31:0] header;
+
+
+
+function [8-1:0] MYHDL822_calculateHecFunc;
+    input [32-1:0] header;
+    reg [8-1:0] h;
+    integer i;
+    reg bit;
+begin: MYHDL825_RETURN
+    h = 8'h0;
+    for (i=32-1; i>=0; i=i-1) begin
+        bit = header[i];
+        h = {h[7-1:2], ((bit ^ h[1]) ^ h[7]), ((bit ^ h[0]) ^ h[7]), (bit ^ h[7])};
+    end
+    h = h ^ 85;
+    MYHDL822_calculateHecFunc = h;
+    disable MYHDL825_RETURN;
+end
+endfunction
+
+
+always @(header) begin: comb
+    hec <= MYHDL822_calculateHecFunc(header);
+end
+
+endmodule
@@ -0,0 +1,35 @@
+// File: HecCalculatorPlain.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:10 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module HecCalculatorPlain (
+    hec,
+    header
+);
+// Hec calculation module.
+// 
+// Plain version.
+
+output [7:0] hec;
+reg [7:0] hec;
+input [31:0] header;
+
+
+
+
+always @(header) begin: comb
+    reg [8-1:0] h;
+    integer i;
+    reg bit;
+    h = 0;
+    for (i=32-1; i>=0; i=i-1) begin
+        bit = header[i];
+        h = {h[7-1:2], ((bit ^ h[1]) ^ h[7]), ((bit ^ h[0]) ^ h[7]), (bit ^ h[7])};
+    end
+    hec <= (h ^ 85);
+end
+
+endmodule
@@ -0,0 +1,80 @@
+-- File: IncBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity IncBench is
+end entity IncBench;
+
+
+architecture MyHDL of IncBench is
+
+
+
+signal clock: std_logic;
+signal count: unsigned(7 downto 0);
+signal enable: std_logic;
+signal reset: std_logic;
+
+function MYHDL1366_incFuncFunc(
+    cnt: in unsigned;
+    enable: in std_logic
+    ) return unsigned is
+    variable count_next: unsigned(7 downto 0);
+begin
+    count_next := to_unsigned(0, 8);
+    count_next := cnt;
+    if (enable = '1') then
+        count_next := (cnt + 1);
+    end if;
+    return count_next;
+end function MYHDL1366_incFuncFunc;
+
+begin
+
+
+
+
+incfunc0_incfuncgen: process (clock, reset) is
+begin
+    if (reset = '0') then
+        count <= to_unsigned(0, 8);
+    elsif rising_edge(clock) then
+        count <= MYHDL1366_incFuncFunc(count, enable);
+    end if;
+end process incfunc0_incfuncgen;
+
+clockgen: process is
+begin
+    clock <= '1';
+    for dummy in 0 to 201-1 loop
+        wait for 10 * 1 ns;
+        clock <= stdl((not bool(clock)));
+    end loop;
+    wait;
+end process clockgen;
+
+monitor: process is
+    variable L: line;
+begin
+    reset <= '0';
+    enable <= '1';
+    wait until falling_edge(clock);
+    reset <= '1';
+    wait until falling_edge(clock);
+    while True loop
+        wait until falling_edge(clock);
+        write(L, to_hstring(count));
+        writeline(output, L);
+    end loop;
+    wait;
+end process monitor;
+
+end architecture MyHDL;
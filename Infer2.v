@@ -0,0 +1,32 @@
+// File: Infer2.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:11 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module Infer2 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer c;
+    c = (a < 4);
+    c = (0 != 0);
+    c = 1'b0;
+    c = (!a);
+    c = 1'b1;
+    c = 5;
+    out <= c;
+end
+
+endmodule
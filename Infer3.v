@@ -0,0 +1,39 @@
+// File: Infer3.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:12 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module Infer3 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+function integer MYHDL896_Infer3Func;
+    input [16-1:0] a;
+begin: MYHDL897_RETURN
+    if (1'b1) begin
+        MYHDL896_Infer3Func = (a > 0);
+        disable MYHDL897_RETURN;
+    end
+    else begin
+        MYHDL896_Infer3Func = 5;
+        disable MYHDL897_RETURN;
+    end
+end
+endfunction
+
+
+always @(a) begin: comb
+    out <= MYHDL896_Infer3Func(a);
+end
+
+endmodule
@@ -0,0 +1,41 @@
+// File: Infer4.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:12 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module Infer4 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+function integer MYHDL901_Infer4Func;
+    input [16-1:0] a;
+begin: MYHDL904_RETURN
+    while (1) begin
+        if (1'b1) begin
+            MYHDL901_Infer4Func = 6;
+            disable MYHDL904_RETURN;
+        end
+        else begin
+            MYHDL901_Infer4Func = (a < 3);
+            disable MYHDL904_RETURN;
+        end
+    end
+end
+endfunction
+
+
+always @(a) begin: comb
+    out <= MYHDL901_Infer4Func(a);
+end
+
+endmodule
@@ -0,0 +1,41 @@
+// File: Infer5.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:12 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module Infer5 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer c;
+    c = (a + 1);
+    c = (a - 1);
+    c = (a * 3);
+    c = (a / 2);
+    c = (a << 2);
+    c = (a >>> 2);
+    c = (a % 16);
+    c = (+a);
+    c = (-(-a));
+    c = (~(-3));
+    c = (!a);
+    c = (5 & 4);
+    c = (5 | 2);
+    c = (6 ^ 3);
+    c = ((a != 0) && 1);
+    out <= c;
+end
+
+endmodule
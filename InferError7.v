@@ -0,0 +1,40 @@
+// File: InferError7.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:11 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module InferError7 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+function [5-1:0] MYHDL873_InferError7Func;
+    input [16-1:0] a;
+begin: MYHDL874_RETURN
+    if (a) begin
+        MYHDL873_InferError7Func = 5'h0;
+        disable MYHDL874_RETURN;
+    end
+    else begin
+        MYHDL873_InferError7Func = 5'h1f;
+        disable MYHDL874_RETURN;
+    end
+end
+endfunction
+
+
+initial begin: comb
+    @(a);
+    out <= MYHDL873_InferError7Func(a);
+end
+
+endmodule
@@ -0,0 +1,45 @@
+-- File: Logic.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity Logic is
+    port (
+        flags: out unsigned(3 downto 0);
+        position: out signed (27 downto 0)
+    );
+end entity Logic;
+
+
+architecture MyHDL of Logic is
+
+
+
+signal conc: unsigned(31 downto 0) := 32X"00000000";
+
+begin
+
+
+
+
+doit: process is
+    variable L: line;
+begin
+    flags <= to_unsigned(4, 4);
+    position <= to_signed(28, 28);
+    wait for 10 * 1 ns;
+    conc <= unsigned'(flags & unsigned(position));
+    wait for 10 * 1 ns;
+    write(L, to_hstring(conc));
+    writeline(output, L);
+    wait;
+end process doit;
+
+end architecture MyHDL;
@@ -0,0 +1,157 @@
+-- File: LoopBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity LoopBench is
+end entity LoopBench;
+
+
+architecture MyHDL of LoopBench is
+
+
+
+signal a: unsigned(15 downto 0) := 16X"ffff";
+signal z: unsigned(15 downto 0) := 16X"0000";
+
+begin
+
+
+
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 100-1 loop
+        case i is
+            when 0 => a <= "0000000000000000";
+            when 1 => a <= "0000000000000000";
+            when 2 => a <= "0000000000000010";
+            when 3 => a <= "0000000000000010";
+            when 4 => a <= "0000000000001111";
+            when 5 => a <= "0000000000011101";
+            when 6 => a <= "0000000000111011";
+            when 7 => a <= "0000000000010111";
+            when 8 => a <= "0000000011010111";
+            when 9 => a <= "0000000011001011";
+            when 10 => a <= "0000001000110111";
+            when 11 => a <= "0000000111111000";
+            when 12 => a <= "0000000111111010";
+            when 13 => a <= "0000001100001001";
+            when 14 => a <= "0001111110101011";
+            when 15 => a <= "0110001111011000";
+            when 16 => a <= "0000010010011110";
+            when 17 => a <= "0111011000010001";
+            when 18 => a <= "0011111011001001";
+            when 19 => a <= "0100000000111000";
+            when 20 => a <= "1001100010010101";
+            when 21 => a <= "0011011000000010";
+            when 22 => a <= "1001000011110111";
+            when 23 => a <= "1100110110010101";
+            when 24 => a <= "1000001000001000";
+            when 25 => a <= "1000110110101101";
+            when 26 => a <= "1101011001011101";
+            when 27 => a <= "1101100111001010";
+            when 28 => a <= "1110011001011001";
+            when 29 => a <= "1010110011011011";
+            when 30 => a <= "1110000101001111";
+            when 31 => a <= "1100000111101001";
+            when 32 => a <= "1011111001101000";
+            when 33 => a <= "1010001111000011";
+            when 34 => a <= "0010011000111101";
+            when 35 => a <= "0010010011010001";
+            when 36 => a <= "0011001001101000";
+            when 37 => a <= "1100001011000100";
+            when 38 => a <= "0010010111101111";
+            when 39 => a <= "1101101010001011";
+            when 40 => a <= "0111101100101110";
+            when 41 => a <= "0011110100111011";
+            when 42 => a <= "0010111001100110";
+            when 43 => a <= "1101000111101010";
+            when 44 => a <= "1001111011101010";
+            when 45 => a <= "0011111000100100";
+            when 46 => a <= "0110000101100101";
+            when 47 => a <= "0011001110110001";
+            when 48 => a <= "0110101101111001";
+            when 49 => a <= "1101110001011101";
+            when 50 => a <= "0000011110110111";
+            when 51 => a <= "1111111000011100";
+            when 52 => a <= "1011100001101101";
+            when 53 => a <= "1010000001111100";
+            when 54 => a <= "1011010101000110";
+            when 55 => a <= "0111101111110111";
+            when 56 => a <= "0111101000000101";
+            when 57 => a <= "1011111000110001";
+            when 58 => a <= "1101000001000000";
+            when 59 => a <= "0100100101111001";
+            when 60 => a <= "0100111010101001";
+            when 61 => a <= "1001101001000110";
+            when 62 => a <= "1011111001111110";
+            when 63 => a <= "1010111011111110";
+            when 64 => a <= "0100001011011000";
+            when 65 => a <= "0000100001010100";
+            when 66 => a <= "1001010110000001";
+            when 67 => a <= "1100010110111000";
+            when 68 => a <= "0000011110000101";
+            when 69 => a <= "1000110001010001";
+            when 70 => a <= "1000000111100010";
+            when 71 => a <= "0010010100010001";
+            when 72 => a <= "1100111100001001";
+            when 73 => a <= "0100110000001000";
+            when 74 => a <= "0000000001100010";
+            when 75 => a <= "1111100101100101";
+            when 76 => a <= "1011101111111101";
+            when 77 => a <= "1000101001110000";
+            when 78 => a <= "0000010011011010";
+            when 79 => a <= "1010111111011010";
+            when 80 => a <= "1011111010100001";
+            when 81 => a <= "1100101101111011";
+            when 82 => a <= "0100011111001001";
+            when 83 => a <= "0010010001010011";
+            when 84 => a <= "0100000000100111";
+            when 85 => a <= "0110011110010001";
+            when 86 => a <= "1100111011111110";
+            when 87 => a <= "0000011101100010";
+            when 88 => a <= "0101010110010100";
+            when 89 => a <= "0100110010000001";
+            when 90 => a <= "0001101101110010";
+            when 91 => a <= "1010001011010110";
+            when 92 => a <= "0110100110001110";
+            when 93 => a <= "1001101011110010";
+            when 94 => a <= "1100100100111000";
+            when 95 => a <= "0101010111010111";
+            when 96 => a <= "1111011111100010";
+            when 97 => a <= "1100000101001001";
+            when 98 => a <= "0001100010111111";
+            when others => a <= "0101111011011100";
+        end case;
+        wait for 10 * 1 ns;
+        write(L, to_hstring(z));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+whilebreakcontinueloop0_0_comb: process (a) is
+    variable i: integer;
+begin
+    i := (16 - 1);
+    z <= to_unsigned(0, 16);
+    while (i >= 0) loop
+        if (a(i) = '0') then
+            i := (i - 1);
+            next;
+        end if;
+        z <= to_unsigned(i, 16);
+        exit;
+    end loop;
+end process whilebreakcontinueloop0_0_comb;
+
+end architecture MyHDL;
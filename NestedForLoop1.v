@@ -0,0 +1,44 @@
+// File: NestedForLoop1.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:13 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module NestedForLoop1 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer var;
+    integer i;
+    integer j;
+    var = 0;
+    begin: MYHDL963_BREAK
+    for (i=16-1; i>=0; i=i-1) begin: MYHDL964_LOOP
+        if ((a[i] == 0)) begin
+            disable MYHDL964_LOOP;
+        end
+        else begin
+            for (j=i-1; j>=0; j=j-1) begin
+                if ((a[j] == 0)) begin
+                    var = var + 1;
+                end
+            end
+            disable MYHDL963_BREAK;
+        end
+    end
+    end
+    out <= var;
+end
+
+endmodule
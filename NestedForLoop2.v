@@ -0,0 +1,48 @@
+// File: NestedForLoop2.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:13 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module NestedForLoop2 (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer i;
+    integer j;
+    out <= 0;
+    begin: MYHDL970_BREAK
+    for (i=16-1; i>=0; i=i-1) begin: MYHDL971_LOOP
+        if ((a[i] == 0)) begin
+            disable MYHDL971_LOOP;
+        end
+        else begin
+            begin: MYHDL972_BREAK
+            for (j=(i - 1)-1; j>=0; j=j-1) begin
+                if ((a[j] == 0)) begin
+                    // pass
+                end
+                else begin
+                    out <= j;
+                    disable MYHDL972_BREAK;
+                end
+            end
+            end
+            disable MYHDL970_BREAK;
+        end
+    end
+    end
+end
+
+endmodule
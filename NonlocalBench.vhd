@@ -0,0 +1,93 @@
+-- File: NonlocalBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity NonlocalBench is
+end entity NonlocalBench;
+
+
+architecture MyHDL of NonlocalBench is
+
+
+
+signal clk: std_logic := '0';
+signal init: std_logic := '0';
+signal qout: unsigned(7 downto 0) := 8X"01";
+signal reset: std_logic := '0';
+
+begin
+
+
+
+
+scrambler: process (clk, reset) is
+    variable q: unsigned(7 downto 0);
+begin
+    if (reset = '1') then
+        qout <= to_unsigned(1, 8);
+        q := to_unsigned(1, 8);
+    elsif rising_edge(clk) then
+        if bool(init) then
+            q(8-1 downto 1) := to_unsigned(127, 7);
+        else
+            q(0) := (q(7) xor q(6));
+            q(8-1 downto 1) := q(7-1 downto 0);
+        end if;
+        qout <= resize(q(8-1 downto 1), 8);
+    end if;
+end process scrambler;
+
+clkgen: process is
+begin
+    clk <= '1';
+    while True loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process clkgen;
+
+stimulus: process is
+    variable L: line;
+begin
+    reset <= '0';
+    init <= '0';
+    wait until falling_edge(clk);
+    reset <= '1';
+    wait until falling_edge(clk);
+    write(L, to_hstring(qout));
+    writeline(output, L);
+    assert (qout = 1)
+        report "*** AssertionError ***"
+        severity error;
+    reset <= '0';
+    for dummy in 0 to 100-1 loop
+        wait until falling_edge(clk);
+        write(L, to_hstring(qout));
+        writeline(output, L);
+    end loop;
+    init <= '1';
+    wait until falling_edge(clk);
+    assert (qout = 127)
+        report "*** AssertionError ***"
+        severity error;
+    write(L, to_hstring(qout));
+    writeline(output, L);
+    init <= '0';
+    for dummy in 0 to 300-1 loop
+        write(L, to_hstring(qout));
+        writeline(output, L);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,110 @@
+-- File: NumassBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity NumassBench is
+end entity NumassBench;
+
+
+architecture MyHDL of NumassBench is
+
+
+
+signal p: unsigned(7 downto 0) := 8X"01";
+signal q: unsigned(39 downto 0) := 40X"0000000001";
+signal r: signed (8 downto 0) := 9X"001";
+signal s: signed (40 downto 0) := 41X"00000000001";
+
+begin
+
+
+
+
+check: process is
+    variable L: line;
+begin
+    p <= to_unsigned(0, 8);
+    q <= to_unsigned(0, 40);
+    r <= to_signed(0, 9);
+    s <= to_signed(0, 41);
+    wait for 10 * 1 ns;
+    write(L, to_string(to_integer(p)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(r)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(s)));
+    writeline(output, L);
+    p <= to_unsigned(1, 8);
+    q <= to_unsigned(1, 40);
+    r <= to_signed(1, 9);
+    s <= to_signed(1, 41);
+    wait for 10 * 1 ns;
+    write(L, to_string(to_integer(p)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(r)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(s)));
+    writeline(output, L);
+    p <= to_unsigned(2, 8);
+    q <= to_unsigned(2, 40);
+    r <= to_signed(-2, 9);
+    s <= to_signed(-2, 41);
+    wait for 10 * 1 ns;
+    write(L, to_string(to_integer(p)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(r)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(s)));
+    writeline(output, L);
+    p <= to_unsigned(255, 8);
+    q <= unsigned'("0011100101111000100101110011010111011101");
+    r <= to_signed(255, 9);
+    s <= signed'("11100011010000111011010001100101000100011");
+    wait for 10 * 1 ns;
+    write(L, to_string(to_integer(p)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q(40-1 downto 20))));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q(20-1 downto 0))));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(r)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(unsigned(s(41-1 downto 20)))));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(unsigned(s(20-1 downto 0)))));
+    writeline(output, L);
+    p <= to_unsigned(254, 8);
+    q <= unsigned'("1100000111111110001011001110000011111011");
+    r <= to_signed(-256, 9);
+    s <= signed'("10100101001110001111110000111011000111010");
+    wait for 10 * 1 ns;
+    write(L, to_string(to_integer(p)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q(40-1 downto 20))));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(q(20-1 downto 0))));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(r)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(unsigned(s(41-1 downto 20)))));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(unsigned(s(20-1 downto 0)))));
+    writeline(output, L);
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,105 @@
+-- File: ObjBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity ObjBench is
+end entity ObjBench;
+
+
+architecture MyHDL of ObjBench is
+
+
+
+signal clk: std_logic := '0';
+signal srst: std_logic := '0';
+signal x: unsigned(3 downto 0) := 4X"0";
+signal y: unsigned(3 downto 0) := 4X"0";
+
+begin
+
+
+
+
+hdlobjattrsimple0_method_func0_hdl: process (clk) is
+begin
+    if rising_edge(clk) then
+        if bool(srst) then
+            y <= to_unsigned(0, 4);
+        else
+            y <= (((x + (x + 1)) + 3) - 3);
+        end if;
+    end if;
+end process hdlobjattrsimple0_method_func0_hdl;
+
+tb_clkgen: process is
+begin
+    clk <= '0';
+    srst <= '0';
+    wait for 10 * 1 ns;
+    srst <= '1';
+    wait for 10 * 1 ns;
+    srst <= '0';
+    wait for 10 * 1 ns;
+    for dummy in 0 to 1000-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process tb_clkgen;
+
+tb_stimulus: process is
+    variable L: line;
+    variable nx: integer;
+    variable ny: integer;
+begin
+    for ii in 0 to 30-1 loop
+        wait until rising_edge(clk);
+    end loop;
+    assert (6 = 6)
+        report "*** AssertionError ***"
+        severity error;
+    for ii in 0 to 6-1 loop
+        case ii is
+            when 0 => nx := 1;
+            when 1 => nx := 2;
+            when 2 => nx := 3;
+            when 3 => nx := 4;
+            when 4 => nx := 5;
+            when others => nx := 6;
+        end case;
+        case ii is
+            when 0 => ny := 3;
+            when 1 => ny := 5;
+            when 2 => ny := 7;
+            when 3 => ny := 9;
+            when 4 => ny := 11;
+            when others => ny := 13;
+        end case;
+        x <= to_unsigned(nx, 4);
+        wait until rising_edge(clk);
+        wait until rising_edge(clk);
+        write(L, string'("x "));
+        write(L, to_string(to_integer(x)));
+        write(L, string'(" y "));
+        write(L, to_string(to_integer(y)));
+        writeline(output, L);
+        assert (signed(resize(x, 5)) = nx)
+            report "*** AssertionError ***"
+            severity error;
+        assert (signed(resize(y, 5)) = ny)
+            report "*** AssertionError ***"
+            severity error;
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process tb_stimulus;
+
+end architecture MyHDL;
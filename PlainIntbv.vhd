@@ -0,0 +1,225 @@
+-- File: PlainIntbv.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity PlainIntbv is
+end entity PlainIntbv;
+-- Test a plain intbv instance with .signed() 
+-- 
+-- ----+----+----+----+----+----+----+----
+--    -3   -2   -1    0    1    2    3
+-- 
+--                   min  max
+--                        min  max
+--              min       max
+--              min            max
+--         min            max
+--         min       max
+--         min  max
+--       neither min nor max is set
+--       only max is set
+--       only min is set
+
+architecture MyHDL of PlainIntbv is
+
+
+
+
+begin
+
+
+
+
+comb: process is
+    variable L: line;
+    variable a1: unsigned(6 downto 0);
+    variable b1: signed(6 downto 0);
+    variable a2: unsigned(2 downto 0);
+    variable b2: signed(2 downto 0);
+    variable a3: unsigned(2 downto 0);
+    variable b3: signed(2 downto 0);
+    variable a4: unsigned(2 downto 0);
+    variable b4: signed(2 downto 0);
+    variable a5: unsigned(2 downto 0);
+    variable b5: signed(2 downto 0);
+    variable a6: unsigned(2 downto 0);
+    variable b6: signed(2 downto 0);
+    variable a7: unsigned(2 downto 0);
+    variable b7: signed(2 downto 0);
+    variable a8: unsigned(2 downto 0);
+    variable b8: signed(2 downto 0);
+    variable a9: unsigned(3 downto 0);
+    variable b9: signed(3 downto 0);
+    variable a10: unsigned(2 downto 0);
+    variable b10: signed(2 downto 0);
+    variable a11: unsigned(2 downto 0);
+    variable b11: signed(2 downto 0);
+    variable a12: unsigned(2 downto 0);
+    variable b12: signed(2 downto 0);
+    variable a13: unsigned(2 downto 0);
+    variable b13: signed(2 downto 0);
+    variable a14: unsigned(3 downto 0);
+    variable b14: signed(3 downto 0);
+    variable a15: unsigned(2 downto 0);
+    variable b15: signed(2 downto 0);
+    variable a20: signed(3 downto 0);
+    variable b20: signed(3 downto 0);
+    variable a21: signed(3 downto 0);
+    variable b21: signed(3 downto 0);
+    variable a22: signed(3 downto 0);
+    variable b22: signed(3 downto 0);
+    variable a23: signed(3 downto 0);
+    variable b23: signed(3 downto 0);
+    variable a24: signed(3 downto 0);
+    variable b24: signed(3 downto 0);
+    variable a25: signed(3 downto 0);
+    variable b25: signed(3 downto 0);
+    variable a26: signed(3 downto 0);
+    variable b26: signed(3 downto 0);
+    variable a27: signed(3 downto 0);
+    variable b27: signed(3 downto 0);
+    variable a28: signed(3 downto 0);
+    variable b28: signed(3 downto 0);
+    variable a29: signed(3 downto 0);
+    variable b29: signed(3 downto 0);
+begin
+    write(L, string'("Plain Instance Test"));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    a1 := to_unsigned(59, 7);
+    b1 := signed(a1);
+    assert (b1 = 59)
+        report "*** AssertionError ***"
+        severity error;
+    a2 := to_unsigned(7, 3);
+    b2 := signed(a2);
+    assert (b2 = (-1))
+        report "*** AssertionError ***"
+        severity error;
+    a3 := to_unsigned(6, 3);
+    b3 := signed(a3);
+    assert (b3 = (-2))
+        report "*** AssertionError ***"
+        severity error;
+    a4 := to_unsigned(5, 3);
+    b4 := signed(a4);
+    assert (b4 = (-3))
+        report "*** AssertionError ***"
+        severity error;
+    a5 := to_unsigned(4, 3);
+    b5 := signed(a5);
+    assert (b5 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a6 := to_unsigned(4, 3);
+    b6 := signed(a6);
+    assert (b6 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a7 := to_unsigned(4, 3);
+    b7 := signed(a7);
+    assert (b7 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a8 := to_unsigned(4, 3);
+    b8 := signed(a8);
+    assert (b8 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a9 := to_unsigned(4, 4);
+    b9 := signed(a9);
+    assert (b9 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a10 := to_unsigned(4, 3);
+    b10 := signed(a10);
+    assert (b10 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a11 := to_unsigned(4, 3);
+    b11 := signed(a11);
+    assert (b11 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a12 := to_unsigned(4, 3);
+    b12 := signed(a12);
+    assert (b12 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a13 := to_unsigned(4, 3);
+    b13 := signed(a13);
+    assert (b13 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a14 := to_unsigned(4, 4);
+    b14 := signed(a14);
+    assert (b14 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a15 := to_unsigned(0, 3);
+    b15 := signed(a15);
+    assert (b15 = 0)
+        report "*** AssertionError ***"
+        severity error;
+    a20 := to_signed(4, 4);
+    b20 := a20;
+    assert (b20 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a21 := to_signed(4, 4);
+    b21 := a21;
+    assert (b21 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a22 := to_signed(4, 4);
+    b22 := a22;
+    assert (b22 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a23 := to_signed(4, 4);
+    b23 := a23;
+    assert (b23 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a24 := to_signed(7, 4);
+    b24 := a24;
+    assert (b24 = 7)
+        report "*** AssertionError ***"
+        severity error;
+    a25 := to_signed(6, 4);
+    b25 := a25;
+    assert (b25 = 6)
+        report "*** AssertionError ***"
+        severity error;
+    a26 := to_signed(5, 4);
+    b26 := a26;
+    assert (b26 = 5)
+        report "*** AssertionError ***"
+        severity error;
+    a27 := to_signed(4, 4);
+    b27 := a27;
+    assert (b27 = 4)
+        report "*** AssertionError ***"
+        severity error;
+    a28 := to_signed((-4), 4);
+    b28 := a28;
+    assert (b28 = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    a29 := to_signed(0, 4);
+    b29 := a29;
+    assert (b29 = 0)
+        report "*** AssertionError ***"
+        severity error;
+    wait;
+end process comb;
+
+end architecture MyHDL;
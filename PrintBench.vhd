@@ -0,0 +1,139 @@
+-- File: PrintBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity PrintBench is
+end entity PrintBench;
+
+
+architecture MyHDL of PrintBench is
+
+
+type t_enum_t_State_1 is (
+	START,
+	RUN,
+	STOP
+	);
+
+signal sb: std_logic;
+signal si1: unsigned(7 downto 0) := 8X"00";
+signal si2: signed (4 downto 0) := 5X"00";
+
+begin
+
+
+sb <= '0';
+
+
+comb: process is
+    variable L: line;
+    variable i1: unsigned(7 downto 0);
+    variable i2: signed(4 downto 0);
+    variable b: std_logic;
+    variable state: t_enum_t_State_1;
+begin
+    i1 := to_unsigned(0, 8);
+    i2 := to_signed(0, 5);
+    b := '1';
+    state := START;
+    i1 := to_unsigned(10, 8);
+    si1 <= to_unsigned(11, 8);
+    i2 := to_signed(-7, 5);
+    si2 <= to_signed(-5, 5);
+    wait for 10 * 1 ns;
+    write(L, string'(""));
+    writeline(output, L);
+    write(L, to_hstring(i1));
+    writeline(output, L);
+    write(L, to_hstring(unsigned(i2)));
+    writeline(output, L);
+    write(L, to_string(to_integer(i1)));
+    write(L, string'(" "));
+    write(L, to_string(to_integer(i2)));
+    writeline(output, L);
+    write(L, to_hstring(si1));
+    writeline(output, L);
+    write(L, to_hstring(unsigned(si2)));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, string'("This is a test"));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, to_string(to_integer(b)));
+    writeline(output, L);
+    write(L, to_string(to_integer(sb)));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, string'("i1 is "));
+    write(L, to_hstring(i1));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, string'("i1 is "));
+    write(L, to_hstring(i1));
+    write(L, string'(", i2 is "));
+    write(L, to_hstring(unsigned(i2)));
+    writeline(output, L);
+    write(L, string'("i1 "));
+    write(L, to_hstring(i1));
+    write(L, string'(" i2 "));
+    write(L, to_hstring(unsigned(i2)));
+    write(L, string'(" b "));
+    write(L, to_string(bool(b)));
+    write(L, string'(" si1 "));
+    write(L, to_hstring(si1));
+    write(L, string'(" si2 "));
+    write(L, to_hstring(unsigned(si2)));
+    writeline(output, L);
+    write(L, string'("i1 "));
+    write(L, to_string(to_integer(i1)));
+    write(L, string'(" i2 "));
+    write(L, to_string(to_integer(i2)));
+    write(L, string'(" b "));
+    write(L, to_string(to_integer(b)));
+    write(L, string'(" si1 "));
+    write(L, to_string(to_integer(si1)));
+    write(L, string'(" si2 "));
+    write(L, to_string(to_integer(si2)));
+    writeline(output, L);
+    write(L, to_string(bool(b)));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, to_string(state));
+    writeline(output, L);
+    write(L, string'("the state is "));
+    write(L, to_string(state));
+    writeline(output, L);
+    write(L, string'("the state is "));
+    write(L, to_string(state));
+    writeline(output, L);
+    write(L, string'("i1 is "));
+    write(L, to_hstring(i1));
+    write(L, string'(" and the state is "));
+    write(L, to_string(state));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, to_string(121));
+    writeline(output, L);
+    write(L, to_string(50));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(unsigned(signed(i1))));
+    writeline(output, L);
+    write(L, to_hstring(unsigned(i2)));
+    writeline(output, L);
+    write(L, to_hstring(unsigned(signed(si1))));
+    writeline(output, L);
+    write(L, to_hstring(unsigned(si2)));
+    writeline(output, L);
+    wait;
+end process comb;
+
+end architecture MyHDL;
@@ -0,0 +1,76 @@
+-- File: PrintLongVectorsBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity PrintLongVectorsBench is
+end entity PrintLongVectorsBench;
+
+
+architecture MyHDL of PrintLongVectorsBench is
+
+
+
+signal si1: unsigned(86 downto 0) := 87X"0000000000000000000000";
+signal si2: signed (86 downto 0) := 87X"0000000000000000000000";
+
+begin
+
+
+
+
+comb: process is
+    variable L: line;
+    variable i1: unsigned(84 downto 0);
+    variable i2: signed(86 downto 0);
+begin
+    i1 := unsigned'("0000000000000000000000000000000000000000000000000000000000000000000000000000000000000");
+    i2 := to_signed(0, 87);
+    si1 <= to_unsigned(0, 87);
+    si2 <= to_signed(0, 87);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(i1));
+    write(L, string'(" "));
+    write(L, to_hstring(unsigned(i2)));
+    write(L, string'(" "));
+    write(L, to_hstring(si1));
+    write(L, string'(" "));
+    write(L, to_hstring(unsigned(si2)));
+    writeline(output, L);
+    i1 := unsigned'("0111111111111111111111111111111111111111111111111111111111111111111111111111111111111");
+    i2 := to_signed(-1, 87);
+    si1 <= unsigned'("001111111111111111111111111111111111111111111111111111111111111111111111111111111111111");
+    si2 <= to_signed(-1, 87);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(i1));
+    write(L, string'(" "));
+    write(L, to_hstring(unsigned(i2)));
+    write(L, string'(" "));
+    write(L, to_hstring(si1));
+    write(L, string'(" "));
+    write(L, to_hstring(unsigned(si2)));
+    writeline(output, L);
+    i1 := to_unsigned(596854, 85);
+    i2 := to_signed(-4954502, 87);
+    si1 <= to_unsigned(232434, 87);
+    si2 <= to_signed(-3434355, 87);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(i1));
+    write(L, string'(" "));
+    write(L, to_hstring(unsigned(i2)));
+    write(L, string'(" "));
+    write(L, to_hstring(si1));
+    write(L, string'(" "));
+    write(L, to_hstring(unsigned(si2)));
+    writeline(output, L);
+    wait;
+end process comb;
+
+end architecture MyHDL;
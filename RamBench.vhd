@@ -0,0 +1,79 @@
+-- File: RamBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity RamBench is
+end entity RamBench;
+
+
+architecture MyHDL of RamBench is
+
+
+
+signal addr: unsigned(6 downto 0) := 7X"00";
+signal clk: std_logic := '0';
+signal din: unsigned(7 downto 0) := 8X"00";
+signal dout: unsigned(7 downto 0) := 8X"00";
+signal we: std_logic := '0';
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '1';
+    while True loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process clkgen;
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 128-1 loop
+        wait until falling_edge(clk);
+        din <= to_unsigned(i, 8);
+        addr <= to_unsigned(i, 7);
+        we <= '1';
+        wait until falling_edge(clk);
+    end loop;
+    we <= '0';
+    for i in 0 to 128-1 loop
+        addr <= to_unsigned(i, 7);
+        wait until rising_edge(clk);
+        wait for 1 * 1 ns;
+        assert (signed(resize(dout, 9)) = i)
+            report "*** AssertionError ***"
+            severity error;
+        write(L, to_hstring(dout));
+        writeline(output, L);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+ram10_comb: process (clk) is
+    type t_array_mem is array(0 to 128-1) of unsigned(7 downto 0);
+    variable mem: t_array_mem;
+begin
+    if rising_edge(clk) then
+        if bool(we) then
+            mem(to_integer(addr)) := din;
+        end if;
+        dout <= mem(to_integer(addr));
+    end if;
+end process ram10_comb;
+
+end architecture MyHDL;
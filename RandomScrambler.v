@@ -0,0 +1,575 @@
+// File: RandomScrambler.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module RandomScrambler (
+    o7,
+    o6,
+    o5,
+    o4,
+    o3,
+    o2,
+    o1,
+    o0,
+    i7,
+    i6,
+    i5,
+    i4,
+    i3,
+    i2,
+    i1,
+    i0
+);
+
+
+output o7;
+reg o7;
+output o6;
+reg o6;
+output o5;
+reg o5;
+output o4;
+reg o4;
+output o3;
+reg o3;
+output o2;
+reg o2;
+output o1;
+reg o1;
+output o0;
+reg o0;
+input i7;
+input i6;
+input i5;
+input i4;
+input i3;
+input i2;
+input i1;
+input i0;
+
+reg RandomScramblerModule0_XorGate0_z;
+reg RandomScramblerModule0_XorGate1_z;
+reg RandomScramblerModule0_XorGate2_z;
+reg RandomScramblerModule0_XorGate3_z;
+reg RandomScramblerModule0_XorGate4_z;
+reg RandomScramblerModule0_XorGate5_z;
+reg RandomScramblerModule0_XorGate6_z;
+reg RandomScramblerModule0_XorGate7_z;
+reg RandomScramblerModule0_XorGate80_a;
+reg RandomScramblerModule0_XorGate80_b;
+reg RandomScramblerModule0_XorGate80_c;
+reg RandomScramblerModule0_XorGate81_b;
+reg RandomScramblerModule0_XorGate81_c;
+reg RandomScramblerModule0_XorGate82_a;
+reg RandomScramblerModule0_XorGate83_a;
+reg RandomScramblerModule0_XorGate84_b;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate8_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate9_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate10_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate11_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate12_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate13_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate14_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate15_z;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate72_a;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate72_b;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate72_c;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate73_a;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate73_b;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate74_a;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate74_b;
+reg RandomScramblerModule0_RandomScramblerModule1_XorGate77_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate16_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate17_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate19_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate66_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate25_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate30_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate31_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate35_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate36_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate38_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate39_z;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c;
+reg RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate53_a;
+
+
+
+always @(i7, i6, i2) begin: randomscramblermodule0_xorgate0_comb
+    RandomScramblerModule0_XorGate0_z <= ((i7 ^ i6) ^ i2);
+end
+
+
+always @(i6, i4, i7) begin: randomscramblermodule0_xorgate1_comb
+    RandomScramblerModule0_XorGate1_z <= ((i6 ^ i4) ^ i7);
+end
+
+
+always @(i5, i1, i7) begin: randomscramblermodule0_xorgate2_comb
+    RandomScramblerModule0_XorGate2_z <= ((i5 ^ i1) ^ i7);
+end
+
+
+always @(i4, i0, i1) begin: randomscramblermodule0_xorgate3_comb
+    RandomScramblerModule0_XorGate3_z <= ((i4 ^ i0) ^ i1);
+end
+
+
+always @(i3, i2, i4) begin: randomscramblermodule0_xorgate4_comb
+    RandomScramblerModule0_XorGate4_z <= ((i3 ^ i2) ^ i4);
+end
+
+
+always @(i2, i4, i3) begin: randomscramblermodule0_xorgate5_comb
+    RandomScramblerModule0_XorGate5_z <= ((i2 ^ i4) ^ i3);
+end
+
+
+always @(i1, i0, i6) begin: randomscramblermodule0_xorgate6_comb
+    RandomScramblerModule0_XorGate6_z <= ((i1 ^ i0) ^ i6);
+end
+
+
+always @(i0, i6, i3) begin: randomscramblermodule0_xorgate7_comb
+    RandomScramblerModule0_XorGate7_z <= ((i0 ^ i6) ^ i3);
+end
+
+
+always @(RandomScramblerModule0_XorGate80_a, RandomScramblerModule0_XorGate80_b, RandomScramblerModule0_XorGate80_c) begin: randomscramblermodule0_xorgate80_comb
+    o7 <= ((RandomScramblerModule0_XorGate80_a ^ RandomScramblerModule0_XorGate80_b) ^ RandomScramblerModule0_XorGate80_c);
+end
+
+
+always @(RandomScramblerModule0_XorGate80_c, RandomScramblerModule0_XorGate81_b, RandomScramblerModule0_XorGate81_c) begin: randomscramblermodule0_xorgate81_comb
+    o6 <= ((RandomScramblerModule0_XorGate80_c ^ RandomScramblerModule0_XorGate81_b) ^ RandomScramblerModule0_XorGate81_c);
+end
+
+
+always @(RandomScramblerModule0_XorGate82_a, RandomScramblerModule0_XorGate81_c, RandomScramblerModule0_XorGate81_b) begin: randomscramblermodule0_xorgate82_comb
+    o5 <= ((RandomScramblerModule0_XorGate82_a ^ RandomScramblerModule0_XorGate81_c) ^ RandomScramblerModule0_XorGate81_b);
+end
+
+
+always @(RandomScramblerModule0_XorGate83_a, RandomScramblerModule0_XorGate80_a, RandomScramblerModule0_XorGate80_c) begin: randomscramblermodule0_xorgate83_comb
+    o4 <= ((RandomScramblerModule0_XorGate83_a ^ RandomScramblerModule0_XorGate80_a) ^ RandomScramblerModule0_XorGate80_c);
+end
+
+
+always @(RandomScramblerModule0_XorGate81_b, RandomScramblerModule0_XorGate84_b, RandomScramblerModule0_XorGate80_b) begin: randomscramblermodule0_xorgate84_comb
+    o3 <= ((RandomScramblerModule0_XorGate81_b ^ RandomScramblerModule0_XorGate84_b) ^ RandomScramblerModule0_XorGate80_b);
+end
+
+
+always @(RandomScramblerModule0_XorGate84_b, RandomScramblerModule0_XorGate81_b, RandomScramblerModule0_XorGate80_a) begin: randomscramblermodule0_xorgate85_comb
+    o2 <= ((RandomScramblerModule0_XorGate84_b ^ RandomScramblerModule0_XorGate81_b) ^ RandomScramblerModule0_XorGate80_a);
+end
+
+
+always @(RandomScramblerModule0_XorGate81_c, RandomScramblerModule0_XorGate82_a, RandomScramblerModule0_XorGate80_b) begin: randomscramblermodule0_xorgate86_comb
+    o1 <= ((RandomScramblerModule0_XorGate81_c ^ RandomScramblerModule0_XorGate82_a) ^ RandomScramblerModule0_XorGate80_b);
+end
+
+
+always @(RandomScramblerModule0_XorGate80_b, RandomScramblerModule0_XorGate82_a, RandomScramblerModule0_XorGate80_a) begin: randomscramblermodule0_xorgate87_comb
+    o0 <= ((RandomScramblerModule0_XorGate80_b ^ RandomScramblerModule0_XorGate82_a) ^ RandomScramblerModule0_XorGate80_a);
+end
+
+
+always @(RandomScramblerModule0_XorGate0_z, RandomScramblerModule0_XorGate5_z, RandomScramblerModule0_XorGate1_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate8_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate8_z <= ((RandomScramblerModule0_XorGate0_z ^ RandomScramblerModule0_XorGate5_z) ^ RandomScramblerModule0_XorGate1_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate1_z, RandomScramblerModule0_XorGate2_z, RandomScramblerModule0_XorGate0_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate9_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate9_z <= ((RandomScramblerModule0_XorGate1_z ^ RandomScramblerModule0_XorGate2_z) ^ RandomScramblerModule0_XorGate0_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate2_z, RandomScramblerModule0_XorGate0_z, RandomScramblerModule0_XorGate6_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate10_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate10_z <= ((RandomScramblerModule0_XorGate2_z ^ RandomScramblerModule0_XorGate0_z) ^ RandomScramblerModule0_XorGate6_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate3_z, RandomScramblerModule0_XorGate0_z, RandomScramblerModule0_XorGate5_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate11_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate11_z <= ((RandomScramblerModule0_XorGate3_z ^ RandomScramblerModule0_XorGate0_z) ^ RandomScramblerModule0_XorGate5_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate4_z, RandomScramblerModule0_XorGate6_z, RandomScramblerModule0_XorGate0_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate12_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate12_z <= ((RandomScramblerModule0_XorGate4_z ^ RandomScramblerModule0_XorGate6_z) ^ RandomScramblerModule0_XorGate0_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate5_z, RandomScramblerModule0_XorGate0_z, RandomScramblerModule0_XorGate3_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate13_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate13_z <= ((RandomScramblerModule0_XorGate5_z ^ RandomScramblerModule0_XorGate0_z) ^ RandomScramblerModule0_XorGate3_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate6_z, RandomScramblerModule0_XorGate4_z, RandomScramblerModule0_XorGate2_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate14_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate14_z <= ((RandomScramblerModule0_XorGate6_z ^ RandomScramblerModule0_XorGate4_z) ^ RandomScramblerModule0_XorGate2_z);
+end
+
+
+always @(RandomScramblerModule0_XorGate7_z, RandomScramblerModule0_XorGate5_z, RandomScramblerModule0_XorGate4_z) begin: randomscramblermodule0_randomscramblermodule1_xorgate15_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate15_z <= ((RandomScramblerModule0_XorGate7_z ^ RandomScramblerModule0_XorGate5_z) ^ RandomScramblerModule0_XorGate4_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate72_a, RandomScramblerModule0_RandomScramblerModule1_XorGate72_b, RandomScramblerModule0_RandomScramblerModule1_XorGate72_c) begin: randomscramblermodule0_randomscramblermodule1_xorgate72_comb
+    RandomScramblerModule0_XorGate80_a <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate72_a ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_b) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate73_a, RandomScramblerModule0_RandomScramblerModule1_XorGate73_b, RandomScramblerModule0_RandomScramblerModule1_XorGate72_b) begin: randomscramblermodule0_randomscramblermodule1_xorgate73_comb
+    RandomScramblerModule0_XorGate80_c <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate73_a ^ RandomScramblerModule0_RandomScramblerModule1_XorGate73_b) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate74_a, RandomScramblerModule0_RandomScramblerModule1_XorGate74_b, RandomScramblerModule0_RandomScramblerModule1_XorGate73_b) begin: randomscramblermodule0_randomscramblermodule1_xorgate74_comb
+    RandomScramblerModule0_XorGate82_a <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate74_a ^ RandomScramblerModule0_RandomScramblerModule1_XorGate74_b) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate73_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate74_b, RandomScramblerModule0_RandomScramblerModule1_XorGate72_c, RandomScramblerModule0_RandomScramblerModule1_XorGate72_b) begin: randomscramblermodule0_randomscramblermodule1_xorgate75_comb
+    RandomScramblerModule0_XorGate83_a <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate74_b ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_c) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate73_b, RandomScramblerModule0_RandomScramblerModule1_XorGate73_a, RandomScramblerModule0_RandomScramblerModule1_XorGate72_c) begin: randomscramblermodule0_randomscramblermodule1_xorgate76_comb
+    RandomScramblerModule0_XorGate81_b <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate73_b ^ RandomScramblerModule0_RandomScramblerModule1_XorGate73_a) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate77_a, RandomScramblerModule0_RandomScramblerModule1_XorGate73_a, RandomScramblerModule0_RandomScramblerModule1_XorGate72_a) begin: randomscramblermodule0_randomscramblermodule1_xorgate77_comb
+    RandomScramblerModule0_XorGate84_b <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate77_a ^ RandomScramblerModule0_RandomScramblerModule1_XorGate73_a) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate72_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate72_b, RandomScramblerModule0_RandomScramblerModule1_XorGate74_a, RandomScramblerModule0_RandomScramblerModule1_XorGate74_b) begin: randomscramblermodule0_randomscramblermodule1_xorgate78_comb
+    RandomScramblerModule0_XorGate81_c <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate72_b ^ RandomScramblerModule0_RandomScramblerModule1_XorGate74_a) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate74_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate72_c, RandomScramblerModule0_RandomScramblerModule1_XorGate73_a, RandomScramblerModule0_RandomScramblerModule1_XorGate74_b) begin: randomscramblermodule0_randomscramblermodule1_xorgate79_comb
+    RandomScramblerModule0_XorGate80_b <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate72_c ^ RandomScramblerModule0_RandomScramblerModule1_XorGate73_a) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate74_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate8_z, RandomScramblerModule0_RandomScramblerModule1_XorGate10_z, RandomScramblerModule0_RandomScramblerModule1_XorGate12_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate16_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate16_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate8_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate10_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate12_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate9_z, RandomScramblerModule0_RandomScramblerModule1_XorGate11_z, RandomScramblerModule0_RandomScramblerModule1_XorGate10_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate17_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate17_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate9_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate11_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate10_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate10_z, RandomScramblerModule0_RandomScramblerModule1_XorGate15_z, RandomScramblerModule0_RandomScramblerModule1_XorGate9_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate18_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate10_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate15_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate9_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate11_z, RandomScramblerModule0_RandomScramblerModule1_XorGate10_z, RandomScramblerModule0_RandomScramblerModule1_XorGate14_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate19_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate19_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate11_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate10_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate14_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate12_z, RandomScramblerModule0_RandomScramblerModule1_XorGate14_z, RandomScramblerModule0_RandomScramblerModule1_XorGate13_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate20_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate12_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate14_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate13_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate13_z, RandomScramblerModule0_RandomScramblerModule1_XorGate12_z, RandomScramblerModule0_RandomScramblerModule1_XorGate11_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate21_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate13_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate12_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate11_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate14_z, RandomScramblerModule0_RandomScramblerModule1_XorGate9_z, RandomScramblerModule0_RandomScramblerModule1_XorGate11_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate22_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate14_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate9_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate11_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_XorGate15_z, RandomScramblerModule0_RandomScramblerModule1_XorGate14_z, RandomScramblerModule0_RandomScramblerModule1_XorGate10_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate23_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z <= ((RandomScramblerModule0_RandomScramblerModule1_XorGate15_z ^ RandomScramblerModule0_RandomScramblerModule1_XorGate14_z) ^ RandomScramblerModule0_RandomScramblerModule1_XorGate10_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate64_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate72_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate65_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate73_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate66_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate66_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate74_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate66_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate67_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate74_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate68_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate73_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate69_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate77_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate70_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate72_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate66_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_xorgate71_comb
+    RandomScramblerModule0_RandomScramblerModule1_XorGate72_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate66_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate16_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate24_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate16_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate17_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate25_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate25_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate17_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate26_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate19_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate17_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate27_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate19_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate17_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate28_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate29_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate21_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate30_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate30_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate20_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate31_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate31_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate23_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate18_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate22_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate56_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate57_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate58_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate66_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate59_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate60_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate64_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate61_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate62_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate65_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_xorgate63_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_XorGate69_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate30_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate32_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate30_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate25_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate33_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate25_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate31_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate34_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate31_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate35_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate35_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate36_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate36_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate37_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate26_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate30_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate38_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate38_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate30_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate29_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate27_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate31_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate39_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate39_z <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate31_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate24_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate28_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate48_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate49_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate50_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate51_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate52_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate60_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate53_a, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate53_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate57_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate53_a ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate54_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate56_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_b, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_xorgate55_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_XorGate58_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_b ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate35_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate40_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate35_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate41_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate42_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate35_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate43_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate50_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate35_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate36_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate44_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate36_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate45_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate53_a <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate32_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate34_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate38_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate39_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate46_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate49_c <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate38_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate37_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate39_z);
+end
+
+
+always @(RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate39_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate38_z, RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z) begin: randomscramblermodule0_randomscramblermodule1_randomscramblermodule2_randomscramblermodule3_randomscramblermodule4_randomscramblermodule5_xorgate47_comb
+    RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate48_b <= ((RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate39_z ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate38_z) ^ RandomScramblerModule0_RandomScramblerModule1_RandomScramblerModule2_RandomScramblerModule3_RandomScramblerModule4_XorGate33_z);
+end
+
+endmodule
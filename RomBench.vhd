@@ -0,0 +1,318 @@
+-- File: RomBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity RomBench is
+end entity RomBench;
+
+
+architecture MyHDL of RomBench is
+
+
+
+signal addr: unsigned(7 downto 0) := 8X"01";
+signal clk: std_logic := '0';
+signal dout: unsigned(7 downto 0) := 8X"00";
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '1';
+    while True loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process clkgen;
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 256-1 loop
+        addr <= to_unsigned(i, 8);
+        wait until falling_edge(clk);
+        wait until rising_edge(clk);
+        wait for 1 * 1 ns;
+        
+        write(L, to_hstring(dout));
+        writeline(output, L);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+rom40_0_read: process (addr) is
+begin
+    case to_integer(addr) is
+        when 0 => dout <= "10011010";
+        when 1 => dout <= "00001111";
+        when 2 => dout <= "00100100";
+        when 3 => dout <= "11001011";
+        when 4 => dout <= "10110100";
+        when 5 => dout <= "01110000";
+        when 6 => dout <= "11110100";
+        when 7 => dout <= "11010011";
+        when 8 => dout <= "01000001";
+        when 9 => dout <= "00110110";
+        when 10 => dout <= "00010101";
+        when 11 => dout <= "10011011";
+        when 12 => dout <= "01110101";
+        when 13 => dout <= "00000000";
+        when 14 => dout <= "01010100";
+        when 15 => dout <= "11110100";
+        when 16 => dout <= "10101110";
+        when 17 => dout <= "10111011";
+        when 18 => dout <= "01100111";
+        when 19 => dout <= "01011110";
+        when 20 => dout <= "11111001";
+        when 21 => dout <= "01111100";
+        when 22 => dout <= "11001110";
+        when 23 => dout <= "00000011";
+        when 24 => dout <= "00000010";
+        when 25 => dout <= "01101101";
+        when 26 => dout <= "11111100";
+        when 27 => dout <= "01110110";
+        when 28 => dout <= "11111011";
+        when 29 => dout <= "11001101";
+        when 30 => dout <= "01001010";
+        when 31 => dout <= "01111000";
+        when 32 => dout <= "01100011";
+        when 33 => dout <= "00110010";
+        when 34 => dout <= "11000000";
+        when 35 => dout <= "00100011";
+        when 36 => dout <= "10101111";
+        when 37 => dout <= "01111110";
+        when 38 => dout <= "01011101";
+        when 39 => dout <= "10010100";
+        when 40 => dout <= "11000010";
+        when 41 => dout <= "00001100";
+        when 42 => dout <= "11011110";
+        when 43 => dout <= "01011001";
+        when 44 => dout <= "01111101";
+        when 45 => dout <= "00011110";
+        when 46 => dout <= "01001010";
+        when 47 => dout <= "00111110";
+        when 48 => dout <= "00000100";
+        when 49 => dout <= "11100111";
+        when 50 => dout <= "11100111";
+        when 51 => dout <= "01101001";
+        when 52 => dout <= "00011010";
+        when 53 => dout <= "11011011";
+        when 54 => dout <= "10100001";
+        when 55 => dout <= "01010010";
+        when 56 => dout <= "10010111";
+        when 57 => dout <= "10001111";
+        when 58 => dout <= "01010100";
+        when 59 => dout <= "11000010";
+        when 60 => dout <= "01100101";
+        when 61 => dout <= "10100101";
+        when 62 => dout <= "11001001";
+        when 63 => dout <= "01011011";
+        when 64 => dout <= "11000111";
+        when 65 => dout <= "11011000";
+        when 66 => dout <= "00000000";
+        when 67 => dout <= "01100110";
+        when 68 => dout <= "01010010";
+        when 69 => dout <= "00110001";
+        when 70 => dout <= "01111100";
+        when 71 => dout <= "11001101";
+        when 72 => dout <= "00111110";
+        when 73 => dout <= "11110001";
+        when 74 => dout <= "00001101";
+        when 75 => dout <= "00101101";
+        when 76 => dout <= "01100011";
+        when 77 => dout <= "10101011";
+        when 78 => dout <= "11010101";
+        when 79 => dout <= "10011001";
+        when 80 => dout <= "11010010";
+        when 81 => dout <= "00000111";
+        when 82 => dout <= "10111110";
+        when 83 => dout <= "11001001";
+        when 84 => dout <= "10110011";
+        when 85 => dout <= "11000000";
+        when 86 => dout <= "01001110";
+        when 87 => dout <= "01111000";
+        when 88 => dout <= "10010100";
+        when 89 => dout <= "00000010";
+        when 90 => dout <= "11010110";
+        when 91 => dout <= "01000000";
+        when 92 => dout <= "11001100";
+        when 93 => dout <= "01111110";
+        when 94 => dout <= "01100101";
+        when 95 => dout <= "10111010";
+        when 96 => dout <= "10000001";
+        when 97 => dout <= "00100011";
+        when 98 => dout <= "01010111";
+        when 99 => dout <= "11010100";
+        when 100 => dout <= "01000000";
+        when 101 => dout <= "10000001";
+        when 102 => dout <= "10001101";
+        when 103 => dout <= "11001010";
+        when 104 => dout <= "00100111";
+        when 105 => dout <= "00100110";
+        when 106 => dout <= "10100100";
+        when 107 => dout <= "11100000";
+        when 108 => dout <= "00101100";
+        when 109 => dout <= "01000110";
+        when 110 => dout <= "10111110";
+        when 111 => dout <= "10100000";
+        when 112 => dout <= "00101000";
+        when 113 => dout <= "00100110";
+        when 114 => dout <= "01110110";
+        when 115 => dout <= "00110110";
+        when 116 => dout <= "11011011";
+        when 117 => dout <= "11110100";
+        when 118 => dout <= "10100100";
+        when 119 => dout <= "11110101";
+        when 120 => dout <= "00110111";
+        when 121 => dout <= "10101101";
+        when 122 => dout <= "10001101";
+        when 123 => dout <= "00001110";
+        when 124 => dout <= "00100000";
+        when 125 => dout <= "11011010";
+        when 126 => dout <= "11100100";
+        when 127 => dout <= "00010101";
+        when 128 => dout <= "00010101";
+        when 129 => dout <= "01110001";
+        when 130 => dout <= "10001100";
+        when 131 => dout <= "10110100";
+        when 132 => dout <= "11000000";
+        when 133 => dout <= "11001110";
+        when 134 => dout <= "00101000";
+        when 135 => dout <= "10111101";
+        when 136 => dout <= "00110111";
+        when 137 => dout <= "11100100";
+        when 138 => dout <= "00101010";
+        when 139 => dout <= "01101010";
+        when 140 => dout <= "01110111";
+        when 141 => dout <= "11110011";
+        when 142 => dout <= "01111100";
+        when 143 => dout <= "00010110";
+        when 144 => dout <= "10011001";
+        when 145 => dout <= "11011001";
+        when 146 => dout <= "11100000";
+        when 147 => dout <= "11010000";
+        when 148 => dout <= "00000110";
+        when 149 => dout <= "11001001";
+        when 150 => dout <= "11111000";
+        when 151 => dout <= "01100101";
+        when 152 => dout <= "10101001";
+        when 153 => dout <= "10110010";
+        when 154 => dout <= "10100100";
+        when 155 => dout <= "11100100";
+        when 156 => dout <= "01011010";
+        when 157 => dout <= "10111110";
+        when 158 => dout <= "00011001";
+        when 159 => dout <= "10001111";
+        when 160 => dout <= "11100111";
+        when 161 => dout <= "01110001";
+        when 162 => dout <= "10001111";
+        when 163 => dout <= "11000100";
+        when 164 => dout <= "01010100";
+        when 165 => dout <= "00011001";
+        when 166 => dout <= "01110000";
+        when 167 => dout <= "00001011";
+        when 168 => dout <= "01001000";
+        when 169 => dout <= "10011011";
+        when 170 => dout <= "00110111";
+        when 171 => dout <= "11111101";
+        when 172 => dout <= "11100010";
+        when 173 => dout <= "01010011";
+        when 174 => dout <= "11101101";
+        when 175 => dout <= "00100000";
+        when 176 => dout <= "00010111";
+        when 177 => dout <= "10000101";
+        when 178 => dout <= "01010000";
+        when 179 => dout <= "11100001";
+        when 180 => dout <= "00011101";
+        when 181 => dout <= "10011101";
+        when 182 => dout <= "10011100";
+        when 183 => dout <= "10101010";
+        when 184 => dout <= "11110011";
+        when 185 => dout <= "10000000";
+        when 186 => dout <= "11110110";
+        when 187 => dout <= "11011010";
+        when 188 => dout <= "00000100";
+        when 189 => dout <= "00011101";
+        when 190 => dout <= "11111010";
+        when 191 => dout <= "10100011";
+        when 192 => dout <= "01001000";
+        when 193 => dout <= "00100100";
+        when 194 => dout <= "00011100";
+        when 195 => dout <= "10001100";
+        when 196 => dout <= "00010011";
+        when 197 => dout <= "11111000";
+        when 198 => dout <= "01011111";
+        when 199 => dout <= "10101111";
+        when 200 => dout <= "11010011";
+        when 201 => dout <= "00010001";
+        when 202 => dout <= "10110000";
+        when 203 => dout <= "11111000";
+        when 204 => dout <= "11100010";
+        when 205 => dout <= "01101000";
+        when 206 => dout <= "11001011";
+        when 207 => dout <= "00000011";
+        when 208 => dout <= "01000110";
+        when 209 => dout <= "00111111";
+        when 210 => dout <= "10010010";
+        when 211 => dout <= "00011110";
+        when 212 => dout <= "11111111";
+        when 213 => dout <= "01010010";
+        when 214 => dout <= "00111010";
+        when 215 => dout <= "11010101";
+        when 216 => dout <= "11110101";
+        when 217 => dout <= "01101100";
+        when 218 => dout <= "01100100";
+        when 219 => dout <= "11100110";
+        when 220 => dout <= "01001111";
+        when 221 => dout <= "11100111";
+        when 222 => dout <= "01110101";
+        when 223 => dout <= "10011010";
+        when 224 => dout <= "01000000";
+        when 225 => dout <= "00110010";
+        when 226 => dout <= "10110100";
+        when 227 => dout <= "01011010";
+        when 228 => dout <= "10110001";
+        when 229 => dout <= "00110101";
+        when 230 => dout <= "10111001";
+        when 231 => dout <= "11001111";
+        when 232 => dout <= "11001111";
+        when 233 => dout <= "00001010";
+        when 234 => dout <= "01101001";
+        when 235 => dout <= "00010100";
+        when 236 => dout <= "01011101";
+        when 237 => dout <= "10110010";
+        when 238 => dout <= "10100111";
+        when 239 => dout <= "00100011";
+        when 240 => dout <= "11000011";
+        when 241 => dout <= "10001000";
+        when 242 => dout <= "11101100";
+        when 243 => dout <= "00101000";
+        when 244 => dout <= "11000011";
+        when 245 => dout <= "11011110";
+        when 246 => dout <= "01011111";
+        when 247 => dout <= "10011010";
+        when 248 => dout <= "00011001";
+        when 249 => dout <= "11111000";
+        when 250 => dout <= "10010000";
+        when 251 => dout <= "00100100";
+        when 252 => dout <= "10101100";
+        when 253 => dout <= "01111101";
+        when 254 => dout <= "00110011";
+        when others => dout <= "10101100";
+    end case;
+end process rom40_0_read;
+
+end architecture MyHDL;
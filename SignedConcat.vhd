@@ -0,0 +1,53 @@
+-- File: SignedConcat.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity SignedConcat is
+end entity SignedConcat;
+-- Test the .signed() function with the concatenate function
+
+architecture MyHDL of SignedConcat is
+
+
+
+
+begin
+
+
+
+
+comb: process is
+    variable L: line;
+    variable a: unsigned(2 downto 0);
+    variable b: unsigned(2 downto 0);
+begin
+    write(L, string'("Signed Concat test"));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    a := to_unsigned(0, 3);
+    a := unsigned'('1' & '1' & '1');
+    assert (a = 7)
+        report "*** AssertionError ***"
+        severity error;
+    assert (signed(a) = (-1))
+        report "*** AssertionError ***"
+        severity error;
+    assert (signed(unsigned'('1' & '1' & '1')) = (-1))
+        report "*** AssertionError ***"
+        severity error;
+    b := to_unsigned(5, 3);
+    assert (signed(unsigned'(b & '1' & '1')) = (-9))
+        report "*** AssertionError ***"
+        severity error;
+    wait;
+end process comb;
+
+end architecture MyHDL;
@@ -0,0 +1,60 @@
+-- File: SlicedSigned.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity SlicedSigned is
+end entity SlicedSigned;
+-- Test a slice with .signed()
+-- 
+-- This test can actually be simplified, as a slice will always have
+-- min=0 and max > min, which will result in an intbv instance that
+-- will be considered unsigned by the intbv.signed() function.
+
+architecture MyHDL of SlicedSigned is
+
+
+
+
+begin
+
+
+
+
+comb: process is
+    variable L: line;
+    variable b: signed(3 downto 0);
+    variable a: signed(3 downto 0);
+begin
+    b := to_signed(4, 4);
+    a := to_signed(4, 4);
+    write(L, string'("SLicedSigned test"));
+    writeline(output, L);
+    wait for 10 * 1 ns;
+    b := signed(unsigned(a(4-1 downto 0)));
+    assert (b = 4)
+        report "*** AssertionError ***"
+        severity error;
+    b := signed(unsigned(a(4-1 downto 0)));
+    assert (b = 4)
+        report "*** AssertionError ***"
+        severity error;
+    b := signed(resize(unsigned(a(3-1 downto 0)), 4));
+    assert (b = 4)
+        report "*** AssertionError ***"
+        severity error;
+    b := resize(signed(unsigned(a(3-1 downto 0))), 4);
+    assert (b = (-4))
+        report "*** AssertionError ***"
+        severity error;
+    wait;
+end process comb;
+
+end architecture MyHDL;
@@ -0,0 +1,42 @@
+// File: TaskCall.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:13 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module TaskCall (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+task MYHDL977_ReturnFromTask;
+    input [16-1:0] a;
+    output [8-1:0] out;
+    integer i;
+begin: MYHDL980_RETURN
+    for (i=16-1; i>=0; i=i-1) begin
+        if ((a[i] == 1)) begin
+            out = i;
+            disable MYHDL980_RETURN;
+        end
+    end
+    out = 23;
+end
+endtask
+
+
+always @(a) begin: comb
+    reg [8-1:0] var;
+    MYHDL977_ReturnFromTask(a, var);
+    out <= var;
+end
+
+endmodule
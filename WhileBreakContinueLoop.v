@@ -0,0 +1,37 @@
+// File: WhileBreakContinueLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module WhileBreakContinueLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer i;
+    i = (16 - 1);
+    out <= 0;
+    begin: MYHDL984_BREAK
+    while ((i >= 0)) begin: MYHDL985_LOOP
+        if ((a[i] == 0)) begin
+            i = i - 1;
+            disable MYHDL985_LOOP;
+        end
+        out <= i;
+        disable MYHDL984_BREAK;
+    end
+    end
+end
+
+endmodule
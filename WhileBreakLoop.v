@@ -0,0 +1,36 @@
+// File: WhileBreakLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module WhileBreakLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer i;
+    i = (16 - 1);
+    out <= 0;
+    begin: MYHDL989_BREAK
+    while ((i >= 0)) begin
+        if ((a[i] == 1)) begin
+            out <= i;
+            disable MYHDL989_BREAK;
+        end
+        i = i - 1;
+    end
+    end
+end
+
+endmodule
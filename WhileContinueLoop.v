@@ -0,0 +1,37 @@
+// File: WhileContinueLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module WhileContinueLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer var;
+    integer i;
+    var = 0;
+    i = (16 - 1);
+    while ((i >= 0)) begin: MYHDL995_LOOP
+        if ((a[i] == 0)) begin
+            i = i - 1;
+            disable MYHDL995_LOOP;
+        end
+        var = var + 1;
+        i = i - 1;
+    end
+    out <= var;
+end
+
+endmodule
@@ -0,0 +1,35 @@
+// File: WhileLoop.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module WhileLoop (
+    a,
+    out
+);
+
+
+input [15:0] a;
+output [15:0] out;
+reg [15:0] out;
+
+
+
+
+always @(a) begin: comb
+    integer var;
+    integer i;
+    var = 0;
+    i = (16 - 1);
+    while ((i >= 0)) begin
+        if ((a[i] == 1)) begin
+            var = var + 1;
+        end
+        i = i - 1;
+    end
+    out <= var;
+end
+
+endmodule
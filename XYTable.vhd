@@ -0,0 +1,94 @@
+-- File: XYTable.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity XYTable is
+    port (
+        Clk: in std_logic;
+        Reset: in std_logic;
+        Table_x_up: in std_logic;
+        Table_x_down: in std_logic;
+        Table_x_zero: in std_logic;
+        Table_y_up: in std_logic;
+        Table_y_down: in std_logic;
+        Table_y_zero: in std_logic;
+        Position_x: out signed (15 downto 0);
+        Position_y: out signed (15 downto 0)
+    );
+end entity XYTable;
+-- Encoding the X,Y position of an XY Table using two Encoders
+-- Clk, Reset: as usual
+-- Table: an TableXY() object giving us the input
+-- Position: an Cartesian2D() object telling us the position    
+
+architecture MyHDL of XYTable is
+
+
+
+signal pos_x: signed (15 downto 0) := 16X"0000";
+signal pos_y: signed (15 downto 0) := 16X"0000";
+signal Table_X_lpos: signed (15 downto 0) := 16X"0000";
+signal Table_Y_lpos: signed (15 downto 0) := 16X"0000";
+
+begin
+
+
+
+
+table_x_synch: process (Clk, Reset) is
+begin
+    if (Reset = '1') then
+        Table_X_lpos <= to_signed(0, 16);
+    elsif rising_edge(Clk) then
+        if bool(Table_x_zero) then
+            Table_X_lpos <= to_signed(0, 16);
+        elsif (bool(Table_x_up) and (not bool(Table_x_down))) then
+            if (Table_X_lpos < (2 ** 15)) then
+                Table_X_lpos <= (Table_X_lpos + 1);
+            end if;
+        elsif ((not bool(Table_x_up)) and bool(Table_x_down)) then
+            if (Table_X_lpos > (-(2 ** 15))) then
+                Table_X_lpos <= (Table_X_lpos - 1);
+            end if;
+        end if;
+    end if;
+end process table_x_synch;
+
+
+pos_x <= Table_X_lpos;
+
+table_y_synch: process (Clk, Reset) is
+begin
+    if (Reset = '1') then
+        Table_Y_lpos <= to_signed(0, 16);
+    elsif rising_edge(Clk) then
+        if bool(Table_y_zero) then
+            Table_Y_lpos <= to_signed(0, 16);
+        elsif (bool(Table_y_up) and (not bool(Table_y_down))) then
+            if (Table_Y_lpos < (2 ** 15)) then
+                Table_Y_lpos <= (Table_Y_lpos + 1);
+            end if;
+        elsif ((not bool(Table_y_up)) and bool(Table_y_down)) then
+            if (Table_Y_lpos > (-(2 ** 15))) then
+                Table_Y_lpos <= (Table_Y_lpos - 1);
+            end if;
+        end if;
+    end if;
+end process table_y_synch;
+
+
+pos_y <= Table_Y_lpos;
+
+
+Position_x <= pos_x;
+Position_y <= pos_y;
+
+end architecture MyHDL;
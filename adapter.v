@@ -0,0 +1,38 @@
+// File: adapter.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:05 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module adapter (
+    o_err,
+    i_err
+);
+
+
+output [3:0] o_err;
+wire [3:0] o_err;
+input [5:0] i_err;
+
+wire nomatch;
+wire [3:0] o_err_vec;
+wire other;
+wire [3:0] other_vec;
+
+assign o_err_vec[3] = i_err[0];
+assign o_err_vec[2] = i_err[1];
+assign o_err_vec[1] = other;
+assign o_err_vec[0] = nomatch;
+assign other_vec[3] = i_err[2];
+assign other_vec[2] = i_err[3];
+assign other_vec[1] = i_err[4];
+assign other_vec[0] = i_err[5];
+
+
+
+assign nomatch = 0;
+assign other = (other_vec != 0);
+assign o_err = o_err_vec;
+
+endmodule
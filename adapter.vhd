@@ -0,0 +1,48 @@
+-- File: adapter.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:05 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity adapter is
+    port (
+        o_err: out unsigned(3 downto 0);
+        i_err: in unsigned(5 downto 0)
+    );
+end entity adapter;
+
+
+architecture MyHDL of adapter is
+
+
+
+signal nomatch: std_logic;
+signal o_err_vec: unsigned(3 downto 0);
+signal other: std_logic;
+signal other_vec: unsigned(3 downto 0);
+
+begin
+
+
+
+o_err_vec(3) <= i_err(0);
+o_err_vec(2) <= i_err(1);
+o_err_vec(1) <= other;
+o_err_vec(0) <= nomatch;
+other_vec(3) <= i_err(2);
+other_vec(2) <= i_err(3);
+other_vec(1) <= i_err(4);
+other_vec(0) <= i_err(5);
+
+
+nomatch <= '0';
+other <= stdl(other_vec /= 0);
+o_err <= o_err_vec;
+
+end architecture MyHDL;
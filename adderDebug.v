@@ -0,0 +1,28 @@
+// File: adderDebug.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module adderDebug (
+    a,
+    b,
+    c
+);
+
+
+input [7:0] a;
+input [7:0] b;
+output [8:0] c;
+reg [8:0] c;
+
+
+
+
+always @(a, b) begin: comb
+    
+    c <= (a + b);
+end
+
+endmodule
@@ -0,0 +1,533 @@
+-- File: array8sorter.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity array8sorter is
+    port (
+        a_0: in unsigned(3 downto 0);
+        a_1: in unsigned(3 downto 0);
+        a_2: in unsigned(3 downto 0);
+        a_3: in unsigned(3 downto 0);
+        a_4: in unsigned(3 downto 0);
+        a_5: in unsigned(3 downto 0);
+        a_6: in unsigned(3 downto 0);
+        a_7: in unsigned(3 downto 0);
+        z_0: out unsigned(3 downto 0);
+        z_1: out unsigned(3 downto 0);
+        z_2: out unsigned(3 downto 0);
+        z_3: out unsigned(3 downto 0);
+        z_4: out unsigned(3 downto 0);
+        z_5: out unsigned(3 downto 0);
+        z_6: out unsigned(3 downto 0);
+        z_7: out unsigned(3 downto 0)
+    );
+end entity array8sorter;
+-- Sort Array with 8 values 
+
+architecture MyHDL of array8sorter is
+
+
+
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort18_0_feedthru32_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort19_0_feedthru33_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge42_0_feedthru34_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge43_0_feedthru35_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort21_0_feedthru36_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort22_0_feedthru37_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge45_0_feedthru38_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge46_0_feedthru39_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge49_0_feedthru40_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge50_0_feedthru41_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge52_0_feedthru42_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge53_0_feedthru43_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort25_0_feedthru44_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort26_0_feedthru45_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge55_0_feedthru46_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge56_0_feedthru47_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort28_0_feedthru48_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort29_0_feedthru49_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge58_0_feedthru50_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge59_0_feedthru51_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge62_0_feedthru52_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge63_0_feedthru53_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge65_0_feedthru54_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge66_0_feedthru55_0_out_z: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_2: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_1: unsigned(3 downto 0) := 4X"0";
+signal bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_2: unsigned(3 downto 0) := 4X"0";
+
+begin
+
+
+
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort18_0_feedthru32_0_out_z <= a_0;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort19_0_feedthru33_0_out_z <= a_1;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort18_0_feedthru32_0_out_z, bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort19_0_feedthru33_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort18_0_feedthru32_0_out_z > bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort19_0_feedthru33_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort19_0_feedthru33_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort18_0_feedthru32_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort18_0_feedthru32_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_sort19_0_feedthru33_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge42_0_feedthru34_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge43_0_feedthru35_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_compare24_0_z_2;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort21_0_feedthru36_0_out_z <= a_2;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort22_0_feedthru37_0_out_z <= a_3;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort21_0_feedthru36_0_out_z, bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort22_0_feedthru37_0_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort21_0_feedthru36_0_out_z > bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort22_0_feedthru37_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort22_0_feedthru37_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort21_0_feedthru36_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort21_0_feedthru36_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_sort22_0_feedthru37_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge45_0_feedthru38_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge46_0_feedthru39_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_compare25_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge42_0_feedthru34_0_out_z, bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge45_0_feedthru38_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge42_0_feedthru34_0_out_z > bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge45_0_feedthru38_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge45_0_feedthru38_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge42_0_feedthru34_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge42_0_feedthru34_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge45_0_feedthru38_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge43_0_feedthru35_0_out_z, bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge46_0_feedthru39_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge43_0_feedthru35_0_out_z > bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge46_0_feedthru39_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge46_0_feedthru39_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge43_0_feedthru35_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort17_0_bitonic_merge41_0_bitonic_merge43_0_feedthru35_0_out_z;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_sort20_0_bitonic_merge44_0_bitonic_merge46_0_feedthru39_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1, bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1 > bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1)) then
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1;
+    else
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_1;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_1;
+    end if;
+end process bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge49_0_feedthru40_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge50_0_feedthru41_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_compare28_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2, bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2 > bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2)) then
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2;
+    else
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare26_0_z_2;
+        bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_compare27_0_z_2;
+    end if;
+end process bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge52_0_feedthru42_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge53_0_feedthru43_0_out_z <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_compare29_0_z_2;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort25_0_feedthru44_0_out_z <= a_4;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort26_0_feedthru45_0_out_z <= a_5;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_comb: process (bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort25_0_feedthru44_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort26_0_feedthru45_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort25_0_feedthru44_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort26_0_feedthru45_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort26_0_feedthru45_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort25_0_feedthru44_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort25_0_feedthru44_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_sort26_0_feedthru45_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge55_0_feedthru46_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge56_0_feedthru47_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_compare30_0_z_2;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort28_0_feedthru48_0_out_z <= a_6;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort29_0_feedthru49_0_out_z <= a_7;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_comb: process (bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort28_0_feedthru48_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort29_0_feedthru49_0_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort28_0_feedthru48_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort29_0_feedthru49_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort29_0_feedthru49_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort28_0_feedthru48_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort28_0_feedthru48_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_sort29_0_feedthru49_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge58_0_feedthru50_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge59_0_feedthru51_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_compare31_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_comb: process (bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge55_0_feedthru46_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge58_0_feedthru50_0_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge55_0_feedthru46_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge58_0_feedthru50_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge58_0_feedthru50_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge55_0_feedthru46_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge55_0_feedthru46_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge58_0_feedthru50_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_comb: process (bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge56_0_feedthru47_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge59_0_feedthru51_0_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge56_0_feedthru47_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge59_0_feedthru51_0_out_z)) then
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge59_0_feedthru51_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge56_0_feedthru47_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort24_0_bitonic_merge54_0_bitonic_merge56_0_feedthru47_0_out_z;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_sort27_0_bitonic_merge57_0_bitonic_merge59_0_feedthru51_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_comb: process (bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1, bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1) is
+begin
+    if ('0' = stdl(bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1 > bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1)) then
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1;
+    else
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_1;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_1;
+    end if;
+end process bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge62_0_feedthru52_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge63_0_feedthru53_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_compare34_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_comb: process (bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2, bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2) is
+begin
+    if ('0' = stdl(bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2 > bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2)) then
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2;
+    else
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare32_0_z_2;
+        bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_compare33_0_z_2;
+    end if;
+end process bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_comb;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge65_0_feedthru54_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_1;
+
+-- Combinatorial comb 
+
+bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge66_0_feedthru55_0_out_z <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_compare35_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_compare36_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge49_0_feedthru40_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge62_0_feedthru52_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge49_0_feedthru40_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge62_0_feedthru52_0_out_z)) then
+        bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge62_0_feedthru52_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge49_0_feedthru40_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge49_0_feedthru40_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge62_0_feedthru52_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_compare36_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_compare37_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge50_0_feedthru41_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge63_0_feedthru53_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge50_0_feedthru41_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge63_0_feedthru53_0_out_z)) then
+        bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge63_0_feedthru53_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge50_0_feedthru41_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge48_0_bitonic_merge50_0_feedthru41_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge61_0_bitonic_merge63_0_feedthru53_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_compare37_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_compare38_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge52_0_feedthru42_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge65_0_feedthru54_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge52_0_feedthru42_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge65_0_feedthru54_0_out_z)) then
+        bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge65_0_feedthru54_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge52_0_feedthru42_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge52_0_feedthru42_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge65_0_feedthru54_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_compare38_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_compare39_0_comb: process (bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge53_0_feedthru43_0_out_z, bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge66_0_feedthru55_0_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge53_0_feedthru43_0_out_z > bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge66_0_feedthru55_0_out_z)) then
+        bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge66_0_feedthru55_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge53_0_feedthru43_0_out_z;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1 <= bitonic_sort15_0_bitonic_sort16_0_bitonic_merge47_0_bitonic_merge51_0_bitonic_merge53_0_feedthru43_0_out_z;
+        bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2 <= bitonic_sort15_0_bitonic_sort23_0_bitonic_merge60_0_bitonic_merge64_0_bitonic_merge66_0_feedthru55_0_out_z;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_compare39_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1, bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1 > bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_1;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1, bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1 > bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_1;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1, bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1 > bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_1;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_comb;
+
+-- Combinatorial comb 
+
+z_0 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_1;
+
+-- Combinatorial comb 
+
+z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge69_0_compare42_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2, bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2 > bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare40_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_compare41_0_z_2;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_comb;
+
+-- Combinatorial comb 
+
+z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_1;
+
+-- Combinatorial comb 
+
+z_3 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge68_0_bitonic_merge72_0_compare43_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2, bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2 > bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare36_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare38_0_z_2;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2, bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2 > bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_compare37_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_compare39_0_z_2;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_comb;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1, bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1 > bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_1;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_1;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_comb;
+
+-- Combinatorial comb 
+
+z_4 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_1;
+
+-- Combinatorial comb 
+
+z_5 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge76_0_compare46_0_z_2;
+
+-- Combinatorial comb 
+bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_comb: process (bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2, bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2 > bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2)) then
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2;
+    else
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_1 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare44_0_z_2;
+        bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_2 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_compare45_0_z_2;
+    end if;
+end process bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_comb;
+
+-- Combinatorial comb 
+
+z_6 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_1;
+
+-- Combinatorial comb 
+
+z_7 <= bitonic_sort15_0_bitonic_merge67_0_bitonic_merge75_0_bitonic_merge79_0_compare47_0_z_2;
+
+end architecture MyHDL;
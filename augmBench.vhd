@@ -0,0 +1,121 @@
+-- File: augmBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity augmBench is
+end entity augmBench;
+
+
+architecture MyHDL of augmBench is
+
+
+
+signal LeftShift: signed (64 downto 0);
+signal Mul: signed (17 downto 0);
+signal RightShift: signed (17 downto 0);
+signal Sub: signed (17 downto 0);
+signal Sum: signed (17 downto 0);
+signal left: signed (8 downto 0);
+signal right: unsigned(1 downto 0);
+
+begin
+
+
+
+
+augmops0_0_1_comb: process (left, right) is
+    variable var: signed(17 downto 0);
+    variable var2: signed(64 downto 0);
+begin
+    LeftShift <= to_signed(0, 65);
+    if ((left < 256) and (right < 22) and (right >= 0)) then
+        var2 := resize(left, 65);
+        var2 := shift_left(var2, to_integer(right));
+        LeftShift <= var2;
+    end if;
+    var := resize(left, 18);
+    var := resize(var * signed(resize(right, 3)), 18);
+    Mul <= var;
+    var := resize(left, 18);
+    RightShift <= to_signed(0, 18);
+    if (right >= 0) then
+        var := shift_right(var, to_integer(right));
+        RightShift <= var;
+    end if;
+    var := resize(left, 18);
+    var := (var - signed(resize(right, 3)));
+    Sub <= var;
+    var := resize(left, 18);
+    var := (var + signed(resize(right, 3)));
+    Sum <= var;
+end process augmops0_0_1_comb;
+
+stimulus: process is
+begin
+    for i in 0 to 14-1 loop
+        case i is
+            when 0 => left <= "001000010";
+            when 1 => left <= "001111110";
+            when 2 => left <= "001101001";
+            when 3 => left <= "000010110";
+            when 4 => left <= "001111011";
+            when 5 => left <= "010101101";
+            when 6 => left <= "000110100";
+            when 7 => left <= "100010101";
+            when 8 => left <= "100111001";
+            when 9 => left <= "001000111";
+            when 10 => left <= "100000010";
+            when 11 => left <= "011101011";
+            when 12 => left <= "100000010";
+            when others => left <= "011101011";
+        end case;
+        case i is
+            when 0 => right <= "00";
+            when 1 => right <= "10";
+            when 2 => right <= "11";
+            when 3 => right <= "00";
+            when 4 => right <= "01";
+            when 5 => right <= "01";
+            when 6 => right <= "10";
+            when 7 => right <= "01";
+            when 8 => right <= "01";
+            when 9 => right <= "01";
+            when 10 => right <= "00";
+            when 11 => right <= "11";
+            when 12 => right <= "11";
+            when others => right <= "00";
+        end case;
+        wait for 10 * 1 ns;
+    end loop;
+    wait;
+end process stimulus;
+
+check: process is
+    variable L: line;
+begin
+    while True loop
+        wait on left, right;
+        wait for 1 * 1 ns;
+        write(L, to_hstring(unsigned(LeftShift)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Mul)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(RightShift)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sub)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sum)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
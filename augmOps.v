@@ -0,0 +1,59 @@
+// File: augmOps.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module augmOps (
+    LeftShift,
+    Mul,
+    RightShift,
+    Sub,
+    Sum,
+    left,
+    right
+);
+
+
+output signed [64:0] LeftShift;
+reg signed [64:0] LeftShift;
+output signed [17:0] Mul;
+reg signed [17:0] Mul;
+output signed [17:0] RightShift;
+reg signed [17:0] RightShift;
+output signed [17:0] Sub;
+reg signed [17:0] Sub;
+output signed [17:0] Sum;
+reg signed [17:0] Sum;
+input signed [8:0] left;
+input [1:0] right;
+
+
+
+
+always @(left, right) begin: comb
+    reg signed [18-1:0] var;
+    reg signed [65-1:0] var2;
+    if (((left < 256) && (right < 40) && (right >= 0))) begin
+        var2 = left;
+        var2 = var2 << right;
+        LeftShift <= var2;
+    end
+    var = left;
+    var = var * right;
+    Mul <= var;
+    var = left;
+    if ((right >= 0)) begin
+        var = var >>> right;
+        RightShift <= var;
+    end
+    var = left;
+    var = var - right;
+    Sub <= var;
+    var = left;
+    var = var + right;
+    Sum <= var;
+end
+
+endmodule
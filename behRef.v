@@ -0,0 +1,50 @@
+// File: behRef.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:08 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module behRef (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
+output [7:0] count;
+reg [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+
+initial begin: comb
+    integer i;
+    integer j;
+    while (1) begin
+        if ((reset == 0)) begin
+            @(posedge reset);
+        end
+        for (i=0; i<20; i=i+1) begin
+            @(posedge clock);
+            if (enable) begin
+                count <= i;
+            end
+        end
+        j = 1;
+        while ((j < 25)) begin
+            if (enable) begin
+                @(posedge clock);
+            end
+            @(posedge clock);
+            count <= (2 * j);
+            j = j + 1;
+        end
+    end
+end
+
+endmodule
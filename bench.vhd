@@ -0,0 +1,109 @@
+-- File: bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench is
+end entity bench;
+
+
+architecture MyHDL of bench is
+
+
+
+signal input_interface: std_logic;
+signal output_interface: std_logic;
+signal clk: std_logic;
+signal interface_with_method_pipeline0_intermediate_interface: std_logic;
+signal interface_with_method_pipeline0_intermediate_interface_2: std_logic;
+signal interface_with_method_pipeline0_intermediate_interface_3: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model0_internal_in: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model0_internal_out: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model1_internal_in: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model1_internal_out: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model2_internal_in: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model2_internal_out: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model3_internal_in: std_logic;
+signal interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model3_internal_out: std_logic;
+
+begin
+
+
+input_interface <= '0';
+
+
+interface_with_method_pipeline0_interfacewithinstancesignal0_model0_do_something: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        write(L, string'("something"));
+        writeline(output, L);
+        interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model0_internal_out <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model0_internal_in;
+    end if;
+end process interface_with_method_pipeline0_interfacewithinstancesignal0_model0_do_something;
+
+
+interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model0_internal_in <= input_interface;
+interface_with_method_pipeline0_intermediate_interface <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model0_internal_out;
+
+interface_with_method_pipeline0_interfacewithinstancesignal0_model1_do_something: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        write(L, string'("something"));
+        writeline(output, L);
+        interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model1_internal_out <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model1_internal_in;
+    end if;
+end process interface_with_method_pipeline0_interfacewithinstancesignal0_model1_do_something;
+
+
+interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model1_internal_in <= interface_with_method_pipeline0_intermediate_interface;
+interface_with_method_pipeline0_intermediate_interface_2 <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model1_internal_out;
+
+interface_with_method_pipeline0_interfacewithinstancesignal0_model2_do_something: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        write(L, string'("something"));
+        writeline(output, L);
+        interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model2_internal_out <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model2_internal_in;
+    end if;
+end process interface_with_method_pipeline0_interfacewithinstancesignal0_model2_do_something;
+
+
+interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model2_internal_in <= interface_with_method_pipeline0_intermediate_interface_2;
+interface_with_method_pipeline0_intermediate_interface_3 <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model2_internal_out;
+
+interface_with_method_pipeline0_interfacewithinstancesignal0_model3_do_something: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        write(L, string'("something"));
+        writeline(output, L);
+        interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model3_internal_out <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model3_internal_in;
+    end if;
+end process interface_with_method_pipeline0_interfacewithinstancesignal0_model3_do_something;
+
+
+interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model3_internal_in <= interface_with_method_pipeline0_intermediate_interface_3;
+output_interface <= interface_with_method_pipeline0_InterfaceWithInstanceSignal0_model3_internal_out;
+
+clkgen: process is
+begin
+    clk <= '0';
+    for dummy in 0 to 20-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process clkgen;
+
+end architecture MyHDL;
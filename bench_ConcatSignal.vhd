@@ -0,0 +1,57 @@
+-- File: bench_ConcatSignal.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_ConcatSignal is
+end entity bench_ConcatSignal;
+
+
+architecture MyHDL of bench_ConcatSignal is
+
+
+
+signal a: unsigned(4 downto 0);
+signal b: std_logic;
+signal c: unsigned(2 downto 0);
+signal d: unsigned(3 downto 0);
+signal s: unsigned(12 downto 0);
+
+begin
+
+
+
+s(13-1 downto 8) <= a;
+s(7) <= b;
+s(7-1 downto 4) <= c;
+s(4-1 downto 0) <= d;
+
+check: process is
+    variable L: line;
+begin
+    for i in 0 to 32-1 loop
+        for j in 0 to 2-1 loop
+            for k in 0 to 8-1 loop
+                for m in 0 to 16-1 loop
+                    a <= to_unsigned(i, 5);
+                    b <= stdl(j);
+                    c <= to_unsigned(k, 3);
+                    d <= to_unsigned(m, 4);
+                    wait for 10 * 1 ns;
+                    write(L, to_hstring(s));
+                    writeline(output, L);
+                end loop;
+            end loop;
+        end loop;
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,69 @@
+-- File: bench_ConcatSignalUndriven.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_ConcatSignalUndriven is
+end entity bench_ConcatSignalUndriven;
+
+
+architecture MyHDL of bench_ConcatSignalUndriven is
+
+
+
+signal concat_sig: unsigned(31 downto 0);
+
+begin
+
+
+
+concat_sig(31) <= '0';
+concat_sig(30) <= '0';
+concat_sig(29) <= '0';
+concat_sig(28) <= '0';
+concat_sig(27) <= '0';
+concat_sig(26) <= '0';
+concat_sig(25) <= '0';
+concat_sig(24) <= '0';
+concat_sig(23) <= '0';
+concat_sig(22) <= '0';
+concat_sig(21) <= '0';
+concat_sig(20) <= '0';
+concat_sig(19) <= '0';
+concat_sig(18) <= '0';
+concat_sig(17) <= '0';
+concat_sig(16) <= '0';
+concat_sig(15) <= '0';
+concat_sig(14) <= '0';
+concat_sig(13) <= '0';
+concat_sig(12) <= '0';
+concat_sig(11) <= '0';
+concat_sig(10) <= '0';
+concat_sig(9) <= '0';
+concat_sig(8) <= '0';
+concat_sig(7) <= '0';
+concat_sig(6) <= '0';
+concat_sig(5) <= '0';
+concat_sig(4) <= '0';
+concat_sig(3) <= '0';
+concat_sig(2) <= '0';
+concat_sig(1) <= '0';
+concat_sig(0) <= '0';
+
+check: process is
+    variable L: line;
+begin
+    wait for 10 * 1 ns;
+    write(L, to_hstring(concat_sig));
+    writeline(output, L);
+    wait;
+end process check;
+
+end architecture MyHDL;
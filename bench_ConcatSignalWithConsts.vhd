@@ -0,0 +1,67 @@
+-- File: bench_ConcatSignalWithConsts.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_ConcatSignalWithConsts is
+end entity bench_ConcatSignalWithConsts;
+
+
+architecture MyHDL of bench_ConcatSignalWithConsts is
+
+
+
+signal a: unsigned(4 downto 0);
+signal b: std_logic;
+signal c: unsigned(2 downto 0);
+signal d: unsigned(3 downto 0);
+signal e: unsigned(0 downto 0);
+signal s: unsigned(28 downto 0);
+
+begin
+
+
+
+s(29-1 downto 27) <= "10";
+s(27-1 downto 22) <= a;
+s(22-1 downto 19) <= "011";
+s(18) <= b;
+s(17) <= '0';
+s(17-1 downto 14) <= c;
+s(13) <= '1';
+s(13-1 downto 9) <= d;
+s(9-1 downto 1) <= "00101010";
+s(0) <= e(0);
+
+check: process is
+    variable L: line;
+begin
+    for i in 0 to 32-1 loop
+        for j in 0 to 2-1 loop
+            for k in 0 to 8-1 loop
+                for m in 0 to 16-1 loop
+                    for n in 0 to (2 ** 1)-1 loop
+                        a <= to_unsigned(i, 5);
+                        b <= stdl(j);
+                        c <= to_unsigned(k, 3);
+                        d <= to_unsigned(m, 4);
+                        e <= to_unsigned(n, 1);
+                        wait for 10 * 1 ns;
+                        write(L, to_hstring(s));
+                        writeline(output, L);
+                    end loop;
+                end loop;
+            end loop;
+        end loop;
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
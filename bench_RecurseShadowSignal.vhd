@@ -0,0 +1,52 @@
+-- File: bench_RecurseShadowSignal.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_RecurseShadowSignal is
+end entity bench_RecurseShadowSignal;
+
+
+architecture MyHDL of bench_RecurseShadowSignal is
+
+
+
+signal s: unsigned(15 downto 0);
+
+begin
+
+
+
+
+check: process is
+    variable L: line;
+begin
+    for i in 0 to 25-1 loop
+        s <= to_unsigned(17767 + (i * 39), 16);
+        wait for 10 * 1 ns;
+        write(L, to_hstring(s));
+        writeline(output, L);
+        write(L, to_string(to_integer(s(16-1 downto 8))));
+        writeline(output, L);
+        write(L, to_string(to_integer(s(8-1 downto 0))));
+        writeline(output, L);
+        write(L, to_hstring(s(16-1 downto 12)));
+        writeline(output, L);
+        write(L, to_hstring(s(12-1 downto 8)));
+        writeline(output, L);
+        write(L, to_hstring(s(8-1 downto 4)));
+        writeline(output, L);
+        write(L, to_hstring(s(4-1 downto 0)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,53 @@
+-- File: bench_SliceSignal.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_SliceSignal is
+end entity bench_SliceSignal;
+
+
+architecture MyHDL of bench_SliceSignal is
+
+
+
+signal s: unsigned(7 downto 0);
+
+begin
+
+
+
+
+-- Running bench_SliceSignal 
+check: process is
+    variable L: line;
+begin
+    for i in 0 to 8-1 loop
+        s <= to_unsigned(i, 8);
+        wait for 10 * 1 ns;
+        write(L, to_string(to_integer(s(7))));
+        writeline(output, L);
+        write(L, to_string(to_integer(s(5))));
+        writeline(output, L);
+        write(L, to_string(to_integer(s(0))));
+        writeline(output, L);
+        write(L, to_hstring(s(8-1 downto 5)));
+        writeline(output, L);
+        write(L, to_hstring(s(6-1 downto 3)));
+        writeline(output, L);
+        write(L, to_hstring(s(8-1 downto 0)));
+        writeline(output, L);
+        write(L, to_hstring(s(4-1 downto 3)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,60 @@
+-- File: bench_TristateSignal.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_TristateSignal is
+end entity bench_TristateSignal;
+
+
+architecture MyHDL of bench_TristateSignal is
+
+
+
+signal a: unsigned(7 downto 0);
+signal b: unsigned(7 downto 0);
+signal c: unsigned(7 downto 0);
+signal s: unsigned(7 downto 0);
+
+begin
+
+
+
+s <= a;
+s <= b;
+s <= c;
+
+check: process is
+    variable L: line;
+begin
+    a <= "ZZZZZZZZ";
+    b <= "ZZZZZZZZ";
+    c <= "ZZZZZZZZ";
+    wait for 10 * 1 ns;
+    a <= to_unsigned(1, 8);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(s));
+    writeline(output, L);
+    a <= "ZZZZZZZZ";
+    b <= to_unsigned(122, 8);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(s));
+    writeline(output, L);
+    b <= "ZZZZZZZZ";
+    c <= to_unsigned(233, 8);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(s));
+    writeline(output, L);
+    c <= "ZZZZZZZZ";
+    wait for 10 * 1 ns;
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,70 @@
+-- File: bench_adapter.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_adapter is
+end entity bench_adapter;
+
+
+architecture MyHDL of bench_adapter is
+
+
+
+signal i_err: unsigned(5 downto 0);
+signal o_err: unsigned(3 downto 0);
+signal adapter0_0_1_nomatch: std_logic;
+signal adapter0_0_1_o_err_vec: unsigned(3 downto 0);
+signal adapter0_0_1_other: std_logic;
+signal adapter0_0_1_other_vec: unsigned(3 downto 0);
+
+begin
+
+
+
+adapter0_0_1_o_err_vec(3) <= i_err(0);
+adapter0_0_1_o_err_vec(2) <= i_err(1);
+adapter0_0_1_o_err_vec(1) <= adapter0_0_1_other;
+adapter0_0_1_o_err_vec(0) <= adapter0_0_1_nomatch;
+adapter0_0_1_other_vec(3) <= i_err(2);
+adapter0_0_1_other_vec(2) <= i_err(3);
+adapter0_0_1_other_vec(1) <= i_err(4);
+adapter0_0_1_other_vec(0) <= i_err(5);
+
+
+adapter0_0_1_nomatch <= '0';
+adapter0_0_1_other <= stdl(adapter0_0_1_other_vec /= 0);
+o_err <= adapter0_0_1_o_err_vec;
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 64-1 loop
+        i_err <= to_unsigned(i, 6);
+        wait for 10 * 1 ns;
+        assert (o_err(0) = '0')
+            report "*** AssertionError ***"
+            severity error;
+        assert (o_err(1) = (((i_err(2) or i_err(3)) or i_err(4)) or i_err(5)))
+            report "*** AssertionError ***"
+            severity error;
+        assert (o_err(2) = i_err(1))
+            report "*** AssertionError ***"
+            severity error;
+        assert (o_err(3) = i_err(0))
+            report "*** AssertionError ***"
+            severity error;
+        write(L, to_hstring(o_err));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,55 @@
+-- File: bench_case.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_case is
+end entity bench_case;
+
+
+architecture MyHDL of bench_case is
+
+
+
+signal a: unsigned(1 downto 0);
+signal z: unsigned(1 downto 0);
+
+begin
+
+
+
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 4-1 loop
+        a <= to_unsigned(i, 2);
+        wait for 10 * 1 ns;
+        write(L, to_hstring(z));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+map_case4_full0_comb: process (a) is
+begin
+    case a is
+        when "00" =>
+            z <= to_unsigned(0, 2);
+        when "01" =>
+            z <= to_unsigned(1, 2);
+        when "10" =>
+            z <= to_unsigned(2, 2);
+        when others => -- "11"
+            z <= to_unsigned(3, 2);
+    end case;
+end process map_case4_full0_comb;
+
+end architecture MyHDL;
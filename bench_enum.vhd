@@ -0,0 +1,103 @@
+-- File: bench_enum.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:06 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_enum is
+end entity bench_enum;
+
+
+architecture MyHDL of bench_enum is
+
+
+type t_enum_bitwise_op_1 is (
+	BW_AND,
+	BW_ANDN,
+	BW_OR,
+	BW_XOR
+	);
+
+signal a: unsigned(7 downto 0);
+signal b: unsigned(7 downto 0);
+signal c: unsigned(7 downto 0);
+signal clock: std_logic;
+signal op: t_enum_bitwise_op_1;
+
+function MYHDL77_bitwise(
+    a: in unsigned;
+    b: in unsigned;
+    op: in t_enum_bitwise_op_1
+    ) return unsigned is
+    variable r: unsigned(7 downto 0);
+begin
+    r := to_unsigned(0, 8);
+    case op is
+        when BW_AND =>
+            r := (a and b);
+        when BW_ANDN =>
+            r := ((not a) and b);
+        when BW_OR =>
+            r := (a or b);
+        when others => -- BW_XOR
+            r := (a xor b);
+    end case;
+    return r;
+end function MYHDL77_bitwise;
+
+begin
+
+
+
+
+
+c <= MYHDL77_bitwise(a, b, op);
+
+clockgen: process is
+begin
+    clock <= '1';
+    while True loop
+        wait for 10 * 1 ns;
+        clock <= stdl((not bool(clock)));
+    end loop;
+    wait;
+end process clockgen;
+
+stimulus: process is
+    variable L: line;
+begin
+    a <= to_unsigned(170, 8);
+    b <= to_unsigned(85, 8);
+    wait until rising_edge(clock);
+    write(L, string'("a="));
+    write(L, to_hstring(a));
+    write(L, string'(" b="));
+    write(L, to_hstring(b));
+    writeline(output, L);
+    op <= BW_AND;
+    wait until rising_edge(clock);
+    write(L, to_hstring(c));
+    writeline(output, L);
+    op <= BW_ANDN;
+    wait until rising_edge(clock);
+    write(L, to_hstring(c));
+    writeline(output, L);
+    op <= BW_OR;
+    wait until rising_edge(clock);
+    write(L, to_hstring(c));
+    writeline(output, L);
+    op <= BW_XOR;
+    wait until rising_edge(clock);
+    write(L, to_hstring(c));
+    writeline(output, L);
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,60 @@
+-- File: bench_permute.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bench_permute is
+end entity bench_permute;
+
+
+architecture MyHDL of bench_permute is
+
+
+
+signal a: unsigned(2 downto 0);
+signal x: unsigned(2 downto 0);
+signal permute0_0_q: unsigned(2 downto 0);
+
+begin
+
+
+
+permute0_0_q(2) <= a(0);
+permute0_0_q(1) <= a(2);
+permute0_0_q(0) <= a(1);
+
+
+x <= permute0_0_q;
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to (2 ** 3)-1 loop
+        a <= to_unsigned(i, 3);
+        wait for 10 * 1 ns;
+        write(L, to_string(to_integer(x)));
+        write(L, string'(" "));
+        write(L, to_string(to_integer(a)));
+        writeline(output, L);
+        assert (x(2) = a(0))
+            report "*** AssertionError ***"
+            severity error;
+        assert (x(1) = a(2))
+            report "*** AssertionError ***"
+            severity error;
+        assert (x(0) = a(1))
+            report "*** AssertionError ***"
+            severity error;
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,50 @@
+-- File: bin2grayBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bin2grayBench is
+end entity bin2grayBench;
+
+
+architecture MyHDL of bin2grayBench is
+
+
+
+signal B: unsigned(7 downto 0);
+signal G: unsigned(7 downto 0);
+
+begin
+
+
+
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 256-1 loop
+        B <= to_unsigned(i, 8);
+        wait for 10 * 1 ns;
+        write(L, to_string(to_integer(G)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+bin2gray20_0_comb: process (B) is
+    variable Bext: unsigned(8 downto 0);
+begin
+    Bext := resize(B, 9);
+    for i in 0 to 8-1 loop
+        G(i) <= (Bext((i + 1)) xor Bext(i));
+    end loop;
+end process bin2gray20_0_comb;
+
+end architecture MyHDL;
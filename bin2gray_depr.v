@@ -0,0 +1,35 @@
+// File: bin2gray_depr.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module bin2gray_depr (
+    G,
+    width
+);
+// Gray encoder.
+// 
+// B -- input intbv signal, binary encoded
+// G -- output intbv signal, gray encoded
+// width -- bit width
+
+output [0:0] G;
+reg [0:0] G;
+input [0:0] width;
+
+
+
+
+always @(width) begin: bin2gray_depr_comb
+    reg [1-1:0] Bext;
+    integer i;
+    Bext = 1'h0;
+    Bext = 1;
+    for (i=0; i<width; i=i+1) begin
+        G[i] = (Bext[(i + 1)] ^ Bext[i]);
+    end
+end
+
+endmodule
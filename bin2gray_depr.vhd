@@ -0,0 +1,45 @@
+-- File: bin2gray_depr.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bin2gray_depr is
+    port (
+        G: out unsigned(0 downto 0);
+        width: in unsigned(0 downto 0)
+    );
+end entity bin2gray_depr;
+-- Gray encoder.
+-- 
+-- B -- input intbv signal, binary encoded
+-- G -- output intbv signal, gray encoded
+-- width -- bit width
+
+architecture MyHDL of bin2gray_depr is
+
+
+
+
+begin
+
+
+
+
+bin2gray_depr_comb: process (width) is
+    variable Bext: unsigned(0 downto 0);
+begin
+    Bext := to_unsigned(0, 1);
+    Bext := to_unsigned(1, 1);
+    for i in 0 to width-1 loop
+        G(i) <= (Bext((i + 1)) xor Bext(i));
+    end loop;
+end process bin2gray_depr_comb;
+
+end architecture MyHDL;
@@ -0,0 +1,40 @@
+-- File: binOpsCheck0.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity binOpsCheck0 is
+    port (
+        a: in unsigned(0 downto 0);
+        b: in unsigned(0 downto 0);
+        c: in unsigned(0 downto 0);
+        x: out std_logic;
+        y: out std_logic;
+        z: out std_logic
+    );
+end entity binOpsCheck0;
+
+
+architecture MyHDL of binOpsCheck0 is
+
+
+
+
+begin
+
+
+
+
+
+x <= a(0);
+y <= (a(0) or b(0));
+z <= ((a(0) or b(0)) or c(0));
+
+end architecture MyHDL;
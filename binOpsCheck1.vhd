@@ -0,0 +1,38 @@
+-- File: binOpsCheck1.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity binOpsCheck1 is
+    port (
+        a: in unsigned(2 downto 0);
+        x: out std_logic;
+        y: out std_logic;
+        z: out std_logic
+    );
+end entity binOpsCheck1;
+
+
+architecture MyHDL of binOpsCheck1 is
+
+
+
+
+begin
+
+
+
+
+
+x <= a(0);
+y <= (a(0) or a(1));
+z <= ((a(0) or a(1)) or a(2));
+
+end architecture MyHDL;
@@ -0,0 +1,36 @@
+-- File: binOpsCheck2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity binOpsCheck2 is
+    port (
+        a: in unsigned(2 downto 0);
+        z: out unsigned(2 downto 0)
+    );
+end entity binOpsCheck2;
+
+
+architecture MyHDL of binOpsCheck2 is
+
+
+
+
+begin
+
+
+
+
+
+z(0) <= a(0);
+z(1) <= (a(0) or a(1));
+z(2) <= ((a(0) or a(1)) or a(2));
+
+end architecture MyHDL;
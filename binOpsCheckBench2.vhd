@@ -0,0 +1,194 @@
+-- File: binOpsCheckBench2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity binOpsCheckBench2 is
+end entity binOpsCheckBench2;
+
+
+architecture MyHDL of binOpsCheckBench2 is
+
+
+
+signal a: unsigned(1 downto 0);
+signal b: unsigned(1 downto 0);
+signal c: unsigned(1 downto 0);
+signal clk: std_logic;
+signal x: unsigned(1 downto 0);
+signal y: unsigned(1 downto 0);
+signal z: unsigned(1 downto 0);
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '1';
+    for dummy in 0 to 400-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process clkgen;
+
+stimulus: process is
+begin
+    a <= to_unsigned(0, 2);
+    b <= to_unsigned(0, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    wait until rising_edge(clk);
+    a <= to_unsigned(0, 2);
+    b <= to_unsigned(0, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(1, 2);
+    b <= to_unsigned(0, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(0, 2);
+    b <= to_unsigned(1, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(1, 2);
+    b <= to_unsigned(1, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(0, 2);
+    b <= to_unsigned(0, 2);
+    c <= to_unsigned(1, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(1, 2);
+    b <= to_unsigned(0, 2);
+    c <= to_unsigned(1, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(0, 2);
+    b <= to_unsigned(1, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(1, 2);
+    b <= to_unsigned(1, 2);
+    c <= to_unsigned(1, 2);
+    wait until rising_edge(clk);
+    a <= to_unsigned(0, 2);
+    b <= to_unsigned(0, 2);
+    c <= to_unsigned(0, 2);
+    wait until rising_edge(clk);
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+check: process is
+begin
+    wait until rising_edge(clk);
+    wait until rising_edge(clk);
+    wait until rising_edge(clk);
+    assert (x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 0)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 1)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 1)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    assert (x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (z = 0)
+        report "*** AssertionError ***"
+        severity error;
+    wait until rising_edge(clk);
+    wait;
+end process check;
+
+
+x <= a;
+y <= (a or b);
+z <= ((a or b) or c);
+
+end architecture MyHDL;
@@ -0,0 +1,152 @@
+-- File: binaryBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity binaryBench is
+end entity binaryBench;
+
+
+architecture MyHDL of binaryBench is
+
+
+
+signal BoolAnd: std_logic;
+signal BoolOr: std_logic;
+signal EQ: std_logic;
+signal GE: std_logic;
+signal GT: std_logic;
+signal LE: std_logic;
+signal LT: std_logic;
+signal LeftShift: signed (64 downto 0);
+signal Mul: signed (17 downto 0);
+signal NE: std_logic;
+signal RightShift: signed (14 downto 0);
+signal Sub: signed (14 downto 0);
+signal Sum: signed (14 downto 0);
+signal Sum1: signed (14 downto 0);
+signal Sum2: signed (14 downto 0);
+signal Sum3: signed (14 downto 0);
+signal aBit: std_logic;
+signal left: signed (8 downto 0);
+signal right: unsigned(1 downto 0);
+
+begin
+
+
+RightShift <= to_signed(0, 15);
+
+
+binaryops0_0_1_comb: process (left, right, aBit) is
+begin
+    LeftShift <= to_signed(0, 65);
+    if ((left < 256) and (right < 22) and (right >= 0)) then
+        LeftShift <= shift_left(resize(left, 65), to_integer(right));
+    end if;
+    Mul <= (resize(left, 15) * signed(resize(right, 3)));
+    Sub <= (resize(left, 15) - signed(resize(right, 3)));
+    Sum <= (resize(left, 15) + signed(resize(right, 3)));
+    Sum1 <= (resize(left, 15) + signed(resize(right(2-1 downto 0), 15)));
+    Sum2 <= (resize(left, 15) + to_signed(right(1), 15));
+    Sum3 <= (resize(left, 15) + to_signed(aBit, 2));
+    EQ <= stdl(left = signed(resize(right, 3)));
+    NE <= stdl(left /= signed(resize(right, 3)));
+    LT <= stdl(left < signed(resize(right, 3)));
+    GT <= stdl(left > signed(resize(right, 3)));
+    LE <= stdl(left <= signed(resize(right, 3)));
+    GE <= stdl(left >= signed(resize(right, 3)));
+    BoolAnd <= stdl(bool(left) and bool(right));
+    BoolOr <= stdl(bool(left) or bool(right));
+end process binaryops0_0_1_comb;
+
+stimulus: process is
+begin
+    for i in 0 to 14-1 loop
+        case i is
+            when 0 => left <= "101001001";
+            when 1 => left <= "111111101";
+            when 2 => left <= "101000101";
+            when 3 => left <= "110000000";
+            when 4 => left <= "111110000";
+            when 5 => left <= "010011010";
+            when 6 => left <= "000111101";
+            when 7 => left <= "001000010";
+            when 8 => left <= "110101110";
+            when 9 => left <= "011010000";
+            when 10 => left <= "100000010";
+            when 11 => left <= "011101011";
+            when 12 => left <= "100000010";
+            when others => left <= "011101011";
+        end case;
+        case i is
+            when 0 => right <= "10";
+            when 1 => right <= "00";
+            when 2 => right <= "00";
+            when 3 => right <= "00";
+            when 4 => right <= "01";
+            when 5 => right <= "00";
+            when 6 => right <= "01";
+            when 7 => right <= "11";
+            when 8 => right <= "11";
+            when 9 => right <= "01";
+            when 10 => right <= "00";
+            when 11 => right <= "11";
+            when 12 => right <= "11";
+            when others => right <= "00";
+        end case;
+        wait for 10 * 1 ns;
+    end loop;
+    wait;
+end process stimulus;
+
+check: process is
+    variable L: line;
+begin
+    while True loop
+        wait on left, right;
+        aBit <= stdl((not bool(aBit)));
+        wait for 1 * 1 ns;
+        write(L, to_hstring(unsigned(LeftShift)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Mul)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(RightShift)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sub)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sum)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sum1)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sum2)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(Sum3)));
+        writeline(output, L);
+        write(L, to_string(to_integer(EQ)));
+        writeline(output, L);
+        write(L, to_string(to_integer(NE)));
+        writeline(output, L);
+        write(L, to_string(to_integer(LT)));
+        writeline(output, L);
+        write(L, to_string(to_integer(GT)));
+        writeline(output, L);
+        write(L, to_string(to_integer(LE)));
+        writeline(output, L);
+        write(L, to_string(to_integer(GE)));
+        writeline(output, L);
+        write(L, to_string(to_integer(BoolAnd)));
+        writeline(output, L);
+        write(L, to_string(to_integer(BoolOr)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,93 @@
+// File: binaryOps.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module binaryOps (
+    LeftShift,
+    Mul,
+    RightShift,
+    Sub,
+    Sum,
+    Sum1,
+    Sum2,
+    Sum3,
+    EQ,
+    NE,
+    LT,
+    GT,
+    LE,
+    GE,
+    And,
+    Or,
+    left,
+    right,
+    bit
+);
+
+
+output signed [64:0] LeftShift;
+reg signed [64:0] LeftShift;
+output signed [17:0] Mul;
+reg signed [17:0] Mul;
+output signed [14:0] RightShift;
+reg signed [14:0] RightShift;
+output signed [14:0] Sub;
+reg signed [14:0] Sub;
+output signed [14:0] Sum;
+reg signed [14:0] Sum;
+output signed [14:0] Sum1;
+reg signed [14:0] Sum1;
+output signed [14:0] Sum2;
+reg signed [14:0] Sum2;
+output signed [14:0] Sum3;
+reg signed [14:0] Sum3;
+output EQ;
+reg EQ;
+output NE;
+reg NE;
+output LT;
+reg LT;
+output GT;
+reg GT;
+output LE;
+reg LE;
+output GE;
+reg GE;
+output And;
+reg And;
+output Or;
+reg Or;
+input signed [8:0] left;
+input [1:0] right;
+input bit;
+
+
+
+
+always @(left, right) begin: comb
+    if (((left < 256) && (right < 40) && (right >= 0))) begin
+        LeftShift <= (left << $signed({1'b0, right}));
+    end
+    Mul <= (left * $signed({1'b0, right}));
+    if (($signed({1'b0, right}) >= (-0))) begin
+        RightShift <= $signed(left >>> $signed({1'b0, right}));
+    end
+    Sub <= (left - $signed({1'b0, right}));
+    Sum <= (left + $signed({1'b0, right}));
+    Sum1 <= (left + $signed({1'b0, right[2-1:0]}));
+    Sum2 <= (left + $signed({1'b0, right[1]}));
+    Sum3 <= (left + $signed({1'b0, bit}));
+    EQ <= (left == $signed({1'b0, right}));
+    NE <= (left != $signed({1'b0, right}));
+    LT <= (left < $signed({1'b0, right}));
+    GT <= (left > $signed({1'b0, right}));
+    LE <= (left <= $signed({1'b0, right}));
+    GE <= (left >= $signed({1'b0, right}));
+    And <= ((left != 0) && (right != 0));
+    Or <= ((left != 0) || (right != 0));
+end
+
+endmodule
@@ -0,0 +1,53 @@
+-- File: bool_bench_case.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bool_bench_case is
+end entity bool_bench_case;
+
+
+architecture MyHDL of bool_bench_case is
+
+
+
+signal a: std_logic;
+signal z: unsigned(1 downto 0);
+
+begin
+
+
+
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 2-1 loop
+        a <= stdl(i);
+        wait for 10 * 1 ns;
+        write(L, to_hstring(z));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+map_case30_0_1_2_3_comb: process (a) is
+begin
+    case a is
+        when '0' =>
+            z <= to_unsigned(0, 2);
+        when '1' =>
+            z <= to_unsigned(1, 2);
+        when others =>
+            z <= to_unsigned(2, 2);
+    end case;
+end process map_case30_0_1_2_3_comb;
+
+end architecture MyHDL;
@@ -0,0 +1,43 @@
+-- File: bug_1835797.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bug_1835797 is
+end entity bug_1835797;
+-- Docstring in the middle.
+-- 
+--     
+
+architecture MyHDL of bug_1835797 is
+
+
+
+
+begin
+
+
+
+
+comb: process is
+    variable L: line;
+    variable v: signed(6 downto 0);
+begin
+    v := to_signed(0, 7);
+    -- Wrongly placed docstring
+    wait for 10 * 1 ns;
+    write(L, to_string(-15));
+    writeline(output, L);
+    write(L, to_string(45));
+    writeline(output, L);
+    wait;
+end process comb;
+
+end architecture MyHDL;
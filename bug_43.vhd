@@ -0,0 +1,39 @@
+-- File: bug_43.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bug_43 is
+    port (
+        sigin: in unsigned(3 downto 0);
+        sigout: out unsigned(3 downto 0)
+    );
+end entity bug_43;
+
+
+architecture MyHDL of bug_43 is
+
+
+
+
+begin
+
+
+
+
+comb: process (sigin) is
+    variable tmp: unsigned(1 downto 0);
+begin
+    sigout <= resize(unsigned'(sigin(0) & sigin(2)), 4);
+    tmp := unsigned'(sigin(0) & sigin(2));
+    sigout <= resize(tmp, 4);
+end process comb;
+
+end architecture MyHDL;
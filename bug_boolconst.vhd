@@ -0,0 +1,60 @@
+-- File: bug_boolconst.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity bug_boolconst is
+    port (
+        sigin: in std_logic;
+        sigout: out std_logic
+    );
+end entity bug_boolconst;
+
+
+architecture MyHDL of bug_boolconst is
+
+
+
+
+begin
+
+
+
+
+comb: process (sigin) is
+begin
+    sigout <= '0';
+    if False then
+        sigout <= sigin;
+    end if;
+    if False then
+        sigout <= sigin;
+    end if;
+    if (not False) then
+        sigout <= sigin;
+    end if;
+    if (not False) then
+        sigout <= sigin;
+    end if;
+    if True then
+        sigout <= sigin;
+    end if;
+    if True then
+        sigout <= sigin;
+    end if;
+    if (not True) then
+        sigout <= sigin;
+    end if;
+    if (not True) then
+        sigout <= sigin;
+    end if;
+end process comb;
+
+end architecture MyHDL;
@@ -0,0 +1,145 @@
+-- File: c_testbench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity c_testbench is
+end entity c_testbench;
+
+
+architecture MyHDL of c_testbench is
+
+
+
+signal clock: std_logic := '0';
+signal reset: std_logic := '0';
+signal a_x: signed (11 downto 0) := 12X"001";
+signal a_y: signed (12 downto 0) := 13X"0002";
+signal a_z: signed (12 downto 0) := 13X"0003";
+signal b_x: signed (11 downto 0) := 12X"001";
+signal b_y: signed (12 downto 0) := 13X"0002";
+signal b_z: signed (12 downto 0) := 13X"0003";
+signal c_x: signed (11 downto 0) := 12X"001";
+signal c_y: signed (12 downto 0) := 13X"0002";
+signal c_z: signed (12 downto 0) := 13X"0003";
+signal use_interfaces0_0_intfa_x: signed (11 downto 0) := 12X"001";
+signal use_interfaces0_0_intfa_y: signed (12 downto 0) := 13X"0002";
+signal use_interfaces0_0_intfa_z: signed (12 downto 0) := 13X"0003";
+signal use_interfaces0_0_intfaa_x: signed (11 downto 0) := 12X"001";
+signal use_interfaces0_0_intfaa_y: signed (12 downto 0) := 13X"0002";
+signal use_interfaces0_0_intfaa_z: signed (12 downto 0) := 13X"0003";
+signal use_interfaces0_0_modify0_0_1_intfa_x: signed (11 downto 0) := 12X"001";
+signal use_interfaces0_0_modify0_0_1_intfa_y: signed (12 downto 0) := 13X"0002";
+signal use_interfaces0_0_modify0_0_1_intfa_z: signed (12 downto 0) := 13X"0003";
+
+begin
+
+
+
+
+use_interfaces0_0_modify0_0_1_rtl_inc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '0') then
+            use_interfaces0_0_modify0_0_1_intfa_y <= to_signed(2, 13);
+            use_interfaces0_0_modify0_0_1_intfa_x <= to_signed(1, 12);
+            use_interfaces0_0_modify0_0_1_intfa_z <= to_signed(3, 13);
+        else
+            use_interfaces0_0_modify0_0_1_intfa_x <= (use_interfaces0_0_modify0_0_1_intfa_x + 1);
+            use_interfaces0_0_modify0_0_1_intfa_y <= (use_interfaces0_0_modify0_0_1_intfa_y + 2);
+            use_interfaces0_0_modify0_0_1_intfa_z <= (use_interfaces0_0_modify0_0_1_intfa_z + 3);
+        end if;
+    end if;
+end process use_interfaces0_0_modify0_0_1_rtl_inc;
+
+
+use_interfaces0_0_intfaa_x <= (use_interfaces0_0_modify0_0_1_intfa_x + 1);
+use_interfaces0_0_intfaa_y <= (use_interfaces0_0_modify0_0_1_intfa_y + 2);
+use_interfaces0_0_intfaa_z <= (use_interfaces0_0_modify0_0_1_intfa_z + 3);
+
+use_interfaces0_0_rtl_inc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '0') then
+            use_interfaces0_0_intfa_y <= to_signed(2, 13);
+            c_z <= to_signed(3, 13);
+            b_z <= to_signed(3, 13);
+            b_x <= to_signed(1, 12);
+            c_x <= to_signed(1, 12);
+            c_y <= to_signed(2, 13);
+            use_interfaces0_0_intfa_z <= to_signed(3, 13);
+            use_interfaces0_0_intfa_x <= to_signed(1, 12);
+            b_y <= to_signed(2, 13);
+        else
+            use_interfaces0_0_intfa_x <= (use_interfaces0_0_intfa_x - 1);
+            use_interfaces0_0_intfa_y <= (use_interfaces0_0_intfa_y - 2);
+            use_interfaces0_0_intfa_z <= (use_interfaces0_0_intfa_z - 3);
+            b_x <= (b_x + 1);
+            b_y <= (b_y + 2);
+            b_z <= (b_z + 3);
+            c_x <= (c_x + 1);
+            c_y <= (c_y + 2);
+            c_z <= (c_z + 3);
+        end if;
+    end if;
+end process use_interfaces0_0_rtl_inc;
+
+
+a_x <= (use_interfaces0_0_intfaa_x + 1);
+a_y <= (use_interfaces0_0_intfaa_y + 2);
+a_z <= (use_interfaces0_0_intfaa_z + 3);
+
+tb_clk: process is
+begin
+    clock <= '0';
+    wait for 10 * 1 ns;
+    while True loop
+        clock <= stdl((not bool(clock)));
+        wait for 10 * 1 ns;
+    end loop;
+    wait;
+end process tb_clk;
+
+tb_stim: process is
+    variable L: line;
+begin
+    reset <= '0';
+    wait for 23 * 1 ns;
+    reset <= '1';
+    wait for 33 * 1 ns;
+    for ii in 0 to 17-1 loop
+        write(L, string'("a: x="));
+        write(L, to_string(to_integer(a_x)));
+        write(L, string'(" y="));
+        write(L, to_string(to_integer(a_y)));
+        write(L, string'(" z="));
+        write(L, to_string(to_integer(a_z)));
+        writeline(output, L);
+        write(L, string'("b: x="));
+        write(L, to_string(to_integer(b_x)));
+        write(L, string'(" y="));
+        write(L, to_string(to_integer(b_y)));
+        write(L, string'(" z="));
+        write(L, to_string(to_integer(b_z)));
+        writeline(output, L);
+        write(L, string'("c: x="));
+        write(L, to_string(to_integer(c_x)));
+        write(L, string'(" y="));
+        write(L, to_string(to_integer(c_y)));
+        write(L, string'(" z="));
+        write(L, to_string(to_integer(c_z)));
+        writeline(output, L);
+        wait until rising_edge(clock);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process tb_stim;
+
+end architecture MyHDL;
@@ -0,0 +1,149 @@
+// File: c_testbench_one.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module c_testbench_one (
+
+);
+// yet another interface test.
+// This test is used to expose a particular bug that was discovered
+// during the development of interface conversion.  The structure
+// used in this example caused and invalid multiple driver error.
+
+
+reg clock;
+reg nested;
+reg reset;
+reg sdi;
+reg sdo;
+reg interfaces_top0_0_1_intf1_sig1;
+reg interfaces_top0_0_1_intf1_sig2;
+reg [7:0] interfaces_top0_0_1_intf1_sig3;
+reg interfaces_top0_0_1_intf3_sig1;
+reg interfaces_top0_0_1_intf3_sig2;
+reg [7:0] interfaces_top0_0_1_intf3_sig3;
+reg interfaces_top0_0_1_intf2_intf_sig2;
+reg interfaces_top0_0_1_use_nested_intf0_0_1_sig1;
+reg interfaces_top0_0_1_use_nested_intf0_0_1_sig2;
+reg interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1;
+reg interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2;
+reg [7:0] interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3;
+reg interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1;
+
+
+
+initial begin: tbclk
+    clock <= 1'b0;
+    while (1'b1) begin
+        # 3;
+        clock <= (!clock);
+    end
+end
+
+
+initial begin: tbstim
+    integer ii;
+    integer expected_bit;
+    sdi <= 1'b0;
+    reset <= 1'b1;
+    # 13;
+    reset <= (!1'b1);
+    @(posedge clock);
+    for (ii=0; ii<10; ii=ii+1) begin
+        $write("sdi: ");
+        $write("%0d", sdi);
+        $write(", sdo: ");
+        $write("%0d", sdo);
+        $write(", nested: ");
+        $write("%0d", nested);
+        $write("\n");
+        case (ii)
+            0: expected_bit = 0;
+            1: expected_bit = 0;
+            2: expected_bit = 0;
+            3: expected_bit = 1;
+            4: expected_bit = 1;
+            5: expected_bit = 1;
+            6: expected_bit = 0;
+            7: expected_bit = 1;
+            8: expected_bit = 0;
+            default: expected_bit = 1;
+        endcase
+        if (($signed({1'b0, sdo}) == expected_bit) !== 1) begin
+            $display("*** AssertionError ***");
+        end
+        sdi <= (!sdi);
+        @(posedge clock);
+    end
+    $finish;
+end
+
+
+always @(posedge clock) begin: interfaces_top0_0_1_use_nested_intf0_0_1_proc
+    if (reset == 1) begin
+        interfaces_top0_0_1_use_nested_intf0_0_1_sig1 <= 0;
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1 <= 0;
+        interfaces_top0_0_1_intf2_intf_sig2 <= 0;
+        interfaces_top0_0_1_use_nested_intf0_0_1_sig2 <= 0;
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 <= 0;
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1 <= 0;
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2 <= 0;
+    end
+    else begin
+        if (interfaces_top0_0_1_intf1_sig1) begin
+            interfaces_top0_0_1_use_nested_intf0_0_1_sig1 <= 1'b1;
+            interfaces_top0_0_1_use_nested_intf0_0_1_sig2 <= 1'b0;
+        end
+        else begin
+            interfaces_top0_0_1_use_nested_intf0_0_1_sig1 <= 1'b0;
+            interfaces_top0_0_1_use_nested_intf0_0_1_sig2 <= 1'b1;
+        end
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1 <= interfaces_top0_0_1_use_nested_intf0_0_1_sig1;
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2 <= (interfaces_top0_0_1_use_nested_intf0_0_1_sig2 || interfaces_top0_0_1_intf1_sig2);
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 <= (~interfaces_top0_0_1_intf1_sig3);
+        interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1 <= interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2;
+        interfaces_top0_0_1_intf2_intf_sig2 <= interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1;
+    end
+end
+
+
+always @(posedge clock) begin: interfaces_top0_0_1_something_peculiar0_0_1_proc
+    if (reset == 1) begin
+        interfaces_top0_0_1_intf3_sig1 <= 0;
+        interfaces_top0_0_1_intf3_sig3 <= 0;
+        interfaces_top0_0_1_intf3_sig2 <= 0;
+    end
+    else begin
+        if ((interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 > 0)) begin
+            interfaces_top0_0_1_intf3_sig1 <= (!interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1);
+            interfaces_top0_0_1_intf3_sig2 <= (!interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2);
+            interfaces_top0_0_1_intf3_sig3 <= (interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 + interfaces_top0_0_1_intf3_sig3);
+        end
+        else begin
+            interfaces_top0_0_1_intf3_sig3 <= 0;
+        end
+    end
+end
+
+
+always @(posedge clock) begin: interfaces_top0_0_1_assigns
+    if (reset == 1) begin
+        sdo <= 0;
+        interfaces_top0_0_1_intf1_sig2 <= 0;
+        interfaces_top0_0_1_intf1_sig3 <= 0;
+        nested <= 0;
+        interfaces_top0_0_1_intf1_sig1 <= 0;
+    end
+    else begin
+        interfaces_top0_0_1_intf1_sig1 <= sdi;
+        interfaces_top0_0_1_intf1_sig2 <= (!sdi);
+        interfaces_top0_0_1_intf1_sig3 <= {interfaces_top0_0_1_intf1_sig3[7-1:1], sdi};
+        sdo <= ((interfaces_top0_0_1_intf3_sig1 | interfaces_top0_0_1_intf3_sig2) | interfaces_top0_0_1_intf3_sig3[2]);
+        nested <= interfaces_top0_0_1_intf2_intf_sig2;
+    end
+end
+
+endmodule
@@ -0,0 +1,163 @@
+-- File: c_testbench_one.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity c_testbench_one is
+end entity c_testbench_one;
+-- yet another interface test.
+-- This test is used to expose a particular bug that was discovered
+-- during the development of interface conversion.  The structure
+-- used in this example caused and invalid multiple driver error.
+
+architecture MyHDL of c_testbench_one is
+
+
+
+signal clock: std_logic := '0';
+signal nested: std_logic := '0';
+signal reset: std_logic := '0';
+signal sdi: std_logic := '0';
+signal sdo: std_logic := '0';
+signal interfaces_top0_0_1_intf1_sig1: std_logic := '0';
+signal interfaces_top0_0_1_intf1_sig2: std_logic := '0';
+signal interfaces_top0_0_1_intf1_sig3: unsigned(7 downto 0) := 8X"00";
+signal interfaces_top0_0_1_intf3_sig1: std_logic := '0';
+signal interfaces_top0_0_1_intf3_sig2: std_logic := '0';
+signal interfaces_top0_0_1_intf3_sig3: unsigned(7 downto 0) := 8X"00";
+signal interfaces_top0_0_1_intf2_intf_sig2: std_logic := '0';
+signal interfaces_top0_0_1_use_nested_intf0_0_1_sig1: std_logic := '0';
+signal interfaces_top0_0_1_use_nested_intf0_0_1_sig2: std_logic := '0';
+signal interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1: std_logic := '0';
+signal interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2: std_logic := '0';
+signal interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3: unsigned(7 downto 0) := 8X"00";
+signal interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1: std_logic := '0';
+
+begin
+
+
+
+
+tbclk: process is
+begin
+    clock <= '0';
+    while True loop
+        wait for 3 * 1 ns;
+        clock <= stdl((not bool(clock)));
+    end loop;
+    wait;
+end process tbclk;
+
+tbstim: process is
+    variable L: line;
+    variable expected_bit: integer;
+begin
+    sdi <= '0';
+    reset <= '1';
+    wait for 13 * 1 ns;
+    reset <= stdl((not True));
+    wait until rising_edge(clock);
+    for ii in 0 to 10-1 loop
+        write(L, string'("sdi: "));
+        write(L, to_string(to_integer(sdi)));
+        write(L, string'(", sdo: "));
+        write(L, to_string(to_integer(sdo)));
+        write(L, string'(", nested: "));
+        write(L, to_string(to_integer(nested)));
+        writeline(output, L);
+        case ii is
+            when 0 => expected_bit := 0;
+            when 1 => expected_bit := 0;
+            when 2 => expected_bit := 0;
+            when 3 => expected_bit := 1;
+            when 4 => expected_bit := 1;
+            when 5 => expected_bit := 1;
+            when 6 => expected_bit := 0;
+            when 7 => expected_bit := 1;
+            when 8 => expected_bit := 0;
+            when others => expected_bit := 1;
+        end case;
+        assert (sdo = stdl(expected_bit))
+            report "*** AssertionError ***"
+            severity error;
+        sdi <= stdl((not bool(sdi)));
+        wait until rising_edge(clock);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process tbstim;
+
+interfaces_top0_0_1_use_nested_intf0_0_1_proc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '1') then
+            interfaces_top0_0_1_use_nested_intf0_0_1_sig1 <= '0';
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1 <= '0';
+            interfaces_top0_0_1_intf2_intf_sig2 <= '0';
+            interfaces_top0_0_1_use_nested_intf0_0_1_sig2 <= '0';
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 <= to_unsigned(0, 8);
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1 <= '0';
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2 <= '0';
+        else
+            if bool(interfaces_top0_0_1_intf1_sig1) then
+                interfaces_top0_0_1_use_nested_intf0_0_1_sig1 <= '1';
+                interfaces_top0_0_1_use_nested_intf0_0_1_sig2 <= '0';
+            else
+                interfaces_top0_0_1_use_nested_intf0_0_1_sig1 <= '0';
+                interfaces_top0_0_1_use_nested_intf0_0_1_sig2 <= '1';
+            end if;
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1 <= interfaces_top0_0_1_use_nested_intf0_0_1_sig1;
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2 <= stdl(bool(interfaces_top0_0_1_use_nested_intf0_0_1_sig2) or bool(interfaces_top0_0_1_intf1_sig2));
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 <= (not interfaces_top0_0_1_intf1_sig3);
+            interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1 <= interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2;
+            interfaces_top0_0_1_intf2_intf_sig2 <= interfaces_top0_0_1_use_nested_intf0_0_1_intf2_intf_sig1;
+        end if;
+    end if;
+end process interfaces_top0_0_1_use_nested_intf0_0_1_proc;
+
+interfaces_top0_0_1_something_peculiar0_0_1_proc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '1') then
+            interfaces_top0_0_1_intf3_sig1 <= '0';
+            interfaces_top0_0_1_intf3_sig3 <= to_unsigned(0, 8);
+            interfaces_top0_0_1_intf3_sig2 <= '0';
+        else
+            if (interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 > 0) then
+                interfaces_top0_0_1_intf3_sig1 <= stdl((not bool(interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig1)));
+                interfaces_top0_0_1_intf3_sig2 <= stdl((not bool(interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig2)));
+                interfaces_top0_0_1_intf3_sig3 <= (interfaces_top0_0_1_use_nested_intf0_0_1_intf2_sig3 + interfaces_top0_0_1_intf3_sig3);
+            else
+                interfaces_top0_0_1_intf3_sig3 <= to_unsigned(0, 8);
+            end if;
+        end if;
+    end if;
+end process interfaces_top0_0_1_something_peculiar0_0_1_proc;
+
+interfaces_top0_0_1_assigns: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '1') then
+            sdo <= '0';
+            interfaces_top0_0_1_intf1_sig2 <= '0';
+            interfaces_top0_0_1_intf1_sig3 <= to_unsigned(0, 8);
+            nested <= '0';
+            interfaces_top0_0_1_intf1_sig1 <= '0';
+        else
+            interfaces_top0_0_1_intf1_sig1 <= sdi;
+            interfaces_top0_0_1_intf1_sig2 <= stdl((not bool(sdi)));
+            interfaces_top0_0_1_intf1_sig3 <= resize(unsigned'(interfaces_top0_0_1_intf1_sig3(7-1 downto 1) & sdi), 8);
+            sdo <= ((interfaces_top0_0_1_intf3_sig1 or interfaces_top0_0_1_intf3_sig2) or interfaces_top0_0_1_intf3_sig3(2));
+            nested <= interfaces_top0_0_1_intf2_intf_sig2;
+        end if;
+    end if;
+end process interfaces_top0_0_1_assigns;
+
+end architecture MyHDL;
@@ -0,0 +1,80 @@
+-- File: c_testbench_three.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity c_testbench_three is
+end entity c_testbench_three;
+-- this will test the use of constants in an inteface
+-- as well as top-level interface conversion.
+
+architecture MyHDL of c_testbench_three is
+
+
+
+signal clock: std_logic := '0';
+signal reset: std_logic := '0';
+signal x: signed (13 downto 0) := 14X"0003";
+signal y: signed (8 downto 0) := 9X"004";
+
+begin
+
+
+
+
+top_const0_0_rtl1: process (clock, reset) is
+    variable v: integer;
+begin
+    if (reset = '0') then
+        x <= to_signed(3, 14);
+    elsif rising_edge(clock) then
+        v := ((9 ** 3) + (10 ** 3));
+        x <= to_signed(v - 1729, 14);
+    end if;
+end process top_const0_0_rtl1;
+
+
+y <= resize(((x + 707) - (3 * 235)) - 2, 9);
+
+tbclk: process is
+begin
+    clock <= '0';
+    while True loop
+        wait for 3 * 1 ns;
+        clock <= stdl((not bool(clock)));
+    end loop;
+    wait;
+end process tbclk;
+
+tbstim: process is
+    variable L: line;
+begin
+    reset <= '0';
+    wait for 33 * 1 ns;
+    reset <= stdl((not False));
+    wait until rising_edge(clock);
+    wait until rising_edge(clock);
+    write(L, string'("x: "));
+    write(L, to_string(to_integer(x)));
+    writeline(output, L);
+    write(L, string'("y: "));
+    write(L, to_string(to_integer(y)));
+    writeline(output, L);
+    assert (x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (y = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process tbstim;
+
+end architecture MyHDL;
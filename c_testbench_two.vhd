@@ -0,0 +1,54 @@
+-- File: c_testbench_two.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity c_testbench_two is
+end entity c_testbench_two;
+
+
+architecture MyHDL of c_testbench_two is
+
+
+
+signal x: signed (3 downto 0) := 4X"0";
+signal y: signed (3 downto 0) := 4X"0";
+signal z: signed (3 downto 0) := 4X"0";
+signal top_multi_comb0_0_multi_comb0_0_1_x_x: signed (3 downto 0) := 4X"0";
+signal top_multi_comb0_0_multi_comb0_0_1_y_y: signed (3 downto 0) := 4X"0";
+signal top_multi_comb0_0_multi_comb0_0_1_z_z_z: signed (3 downto 0) := 4X"0";
+
+begin
+
+
+
+x <= top_multi_comb0_0_multi_comb0_0_1_x_x;
+top_multi_comb0_0_multi_comb0_0_1_y_y <= y;
+top_multi_comb0_0_multi_comb0_0_1_z_z_z <= z;
+
+
+top_multi_comb0_0_multi_comb0_0_1_x_x <= (top_multi_comb0_0_multi_comb0_0_1_y_y + top_multi_comb0_0_multi_comb0_0_1_z_z_z);
+
+tb_stim: process is
+    variable L: line;
+begin
+    y <= to_signed(3, 4);
+    z <= to_signed(2, 4);
+    wait for 10 * 1 ns;
+    write(L, string'("x: "));
+    write(L, to_string(to_integer(x)));
+    writeline(output, L);
+    assert (x = 5)
+        report "*** AssertionError ***"
+        severity error;
+    wait;
+end process tb_stim;
+
+end architecture MyHDL;
@@ -0,0 +1,69 @@
+-- File: chunk_buffer_sim.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity chunk_buffer_sim is
+    port (
+        Clk: out std_logic;
+        Reset: out std_logic;
+        Input: out unsigned(255 downto 0);
+        Output: out unsigned(7 downto 0)
+    );
+end entity chunk_buffer_sim;
+
+
+architecture MyHDL of chunk_buffer_sim is
+
+
+
+signal chunk_buffer0_idx: unsigned(31 downto 0);
+
+begin
+
+
+
+
+chunk_buffer0_goto_next: process (Clk, Reset) is
+begin
+    if (Reset = '1') then
+        chunk_buffer0_idx <= to_unsigned(0, 32);
+        Output <= to_unsigned(0, 8);
+    elsif rising_edge(Clk) then
+        chunk_buffer0_idx <= (chunk_buffer0_idx + 1);
+        Output <= Input(to_integer(chunk_buffer0_idx + 8)-1 downto to_integer(chunk_buffer0_idx));
+    end if;
+end process chunk_buffer0_goto_next;
+
+tb_clk: process is
+begin
+    Clk <= '0';
+    wait for (20 / 2) * 1 ns;
+    while True loop
+        Clk <= stdl((not bool(Clk)));
+        wait for (20 / 2) * 1 ns;
+    end loop;
+    wait;
+end process tb_clk;
+
+tb_logic: process is
+begin
+    Reset <= '1';
+    wait for 70 * 1 ns;
+    Reset <= '0';
+    Input <= to_unsigned(11259375, 256);
+    for dummy in 0 to 100-1 loop
+        wait for (20 / 2) * 1 ns;
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process tb_logic;
+
+end architecture MyHDL;
@@ -0,0 +1,50 @@
+-- File: constants.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity constants is
+    port (
+        v: out signed (4 downto 0);
+        u: out unsigned(7 downto 0);
+        x: out std_logic;
+        y: out std_logic;
+        z: out std_logic;
+        a: in std_logic
+    );
+end entity constants;
+
+
+architecture MyHDL of constants is
+
+
+
+signal b: std_logic;
+signal c: std_logic;
+signal d: unsigned(7 downto 0);
+signal e: signed (4 downto 0);
+
+begin
+
+
+b <= '0';
+c <= '1';
+d <= to_unsigned(5, 8);
+e <= to_signed(4, 5);
+
+
+
+u <= d;
+v <= e;
+x <= b;
+y <= c;
+z <= a;
+
+end architecture MyHDL;
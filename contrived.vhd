@@ -0,0 +1,56 @@
+-- File: contrived.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity contrived is
+    port (
+        A: in unsigned(7 downto 0);
+        Y: out unsigned(7 downto 0)
+    );
+end entity contrived;
+
+
+architecture MyHDL of contrived is
+
+
+
+constant PAT1: unsigned(7 downto 0) := 8X"42" /* 66 */;
+constant PAT2: unsigned(7 downto 0) := 8X"bd" /* 189 */;
+signal y1a2: unsigned(7 downto 0);
+
+begin
+
+
+
+
+scramble0_dsc: process (A) is
+begin
+    for i in 0 to 8-1 loop
+        if bool(PAT1(i)) then
+            y1a2(i) <= stdl((not bool(A(i))));
+        else
+            y1a2(i) <= A(i);
+        end if;
+    end loop;
+end process scramble0_dsc;
+
+scramble1_dsc: process (y1a2) is
+begin
+    for i in 0 to 8-1 loop
+        if bool(PAT2(i)) then
+            Y(i) <= stdl((not bool(y1a2(i))));
+        else
+            Y(i) <= y1a2(i);
+        end if;
+    end loop;
+end process scramble1_dsc;
+
+end architecture MyHDL;
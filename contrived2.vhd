@@ -0,0 +1,56 @@
+-- File: contrived2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity contrived2 is
+    port (
+        A: in unsigned(7 downto 0);
+        Y: out unsigned(7 downto 0)
+    );
+end entity contrived2;
+
+
+architecture MyHDL of contrived2 is
+
+
+
+signal y1a2: unsigned(7 downto 0);
+constant scramble0_0_1_Pattern: unsigned(7 downto 0) := 8X"42" /* 66 */;
+constant scramble1_0_1_Pattern: unsigned(7 downto 0) := 8X"bd" /* 189 */;
+
+begin
+
+
+
+
+scramble0_0_1_dsc: process (A) is
+begin
+    for i in 0 to 8-1 loop
+        if bool(scramble0_0_1_Pattern(i)) then
+            y1a2(i) <= stdl((not bool(A(i))));
+        else
+            y1a2(i) <= A(i);
+        end if;
+    end loop;
+end process scramble0_0_1_dsc;
+
+scramble1_0_1_dsc: process (y1a2) is
+begin
+    for i in 0 to 8-1 loop
+        if bool(scramble1_0_1_Pattern(i)) then
+            Y(i) <= stdl((not bool(y1a2(i))));
+        else
+            Y(i) <= y1a2(i);
+        end if;
+    end loop;
+end process scramble1_0_1_dsc;
+
+end architecture MyHDL;
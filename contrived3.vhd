@@ -0,0 +1,44 @@
+-- File: contrived3.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity contrived3 is
+    port (
+        Sel: in unsigned(2 downto 0);
+        Y: out unsigned(7 downto 0)
+    );
+end entity contrived3;
+
+
+architecture MyHDL of contrived3 is
+
+
+
+type t_array_A is array(0 to 8-1) of unsigned(7 downto 0);
+constant A: t_array_A := (
+    8X"4e",
+    8X"b1",
+    8X"d8",
+    8X"08",
+    8X"c6",
+    8X"bd",
+    8X"8c",
+    8X"9e");
+
+begin
+
+
+
+
+
+Y <= A(to_integer(Sel));
+
+end architecture MyHDL;
@@ -0,0 +1,42 @@
+-- File: contrived4.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity contrived4 is
+    port (
+        Clk: in std_logic;
+        D: in std_logic;
+        CE: in std_logic;
+        Q: out std_logic
+    );
+end entity contrived4;
+
+
+architecture MyHDL of contrived4 is
+
+
+
+
+begin
+
+
+
+
+dff: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        if bool(CE) then
+            Q <= D;
+        end if;
+    end if;
+end process dff;
+
+end architecture MyHDL;
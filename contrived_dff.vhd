@@ -0,0 +1,41 @@
+-- File: contrived_dff.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity contrived_dff is
+    port (
+        Clk: in std_logic;
+        D: in std_logic;
+        Q: out std_logic;
+        OE: out std_logic
+    );
+end entity contrived_dff;
+
+
+architecture MyHDL of contrived_dff is
+
+
+
+
+begin
+
+
+
+
+cdff: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        Q <= D;
+        OE <= stdl(bool(Q) and bool(D));
+    end if;
+end process cdff;
+
+end architecture MyHDL;
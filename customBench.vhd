@@ -0,0 +1,25 @@
+-- File: customBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity customBench is
+end entity customBench;
+
+
+architecture MyHDL of customBench is
+
+
+
+signal count: unsigned(7 downto 0);
+signal enable: std_logic;
+signal clock: std_logic;
+signal reset: std_logic;
+
@@ -0,0 +1,52 @@
+// File: decFunc.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:09 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module decFunc (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
+output signed [7:0] count;
+reg signed [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+function signed [8-1:0] MYHDL737_decFuncFunc;
+    input signed [8-1:0] cnt;
+    reg signed [8-1:0] count_next;
+begin: MYHDL738_RETURN
+    count_next = 0;
+    if ((count == (-128))) begin
+        count_next = (128 - 1);
+    end
+    else begin
+        count_next = (cnt - 1);
+    end
+    MYHDL737_decFuncFunc = count_next;
+    disable MYHDL738_RETURN;
+end
+endfunction
+
+
+always @(posedge clock, negedge reset) begin: decfuncgen
+    if ((reset == 0)) begin
+        count <= 0;
+    end
+    else begin
+        if (enable) begin
+            count <= MYHDL737_decFuncFunc(count);
+        end
+    end
+end
+
+endmodule
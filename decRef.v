@@ -0,0 +1,47 @@
+// File: decRef.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:09 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module decRef (
+    count,
+    enable,
+    clock,
+    reset
+);
+// Decrementer with enable.
+// 
+// count -- output
+// enable -- control input, decrement when 1
+// clock -- clock input
+// reset -- asynchronous reset input
+// n -- counter max value
+
+output signed [7:0] count;
+reg signed [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+
+always @(posedge clock, negedge reset) begin: comb
+    if ((reset == 0)) begin
+        count <= 0;
+    end
+    else begin
+        if (enable) begin
+            if ((count == (-128))) begin
+                count <= (128 - 1);
+            end
+            else begin
+                count <= (count - 1);
+            end
+        end
+    end
+end
+
+endmodule
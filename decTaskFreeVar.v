@@ -0,0 +1,47 @@
+// File: decTaskFreeVar.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:09 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module decTaskFreeVar (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
+output signed [7:0] count;
+reg signed [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+task MYHDL745_decTaskFunc;
+begin: MYHDL746_RETURN
+    if (enable) begin
+        if ((count == (-128))) begin
+            count <= (128 - 1);
+        end
+        else begin
+            count <= (count - 1);
+        end
+    end
+end
+endtask
+
+
+always @(posedge clock, negedge reset) begin: dectaskgen
+    if ((reset == 0)) begin
+        count <= 0;
+    end
+    else begin
+        MYHDL745_decTaskFunc;
+    end
+end
+
+endmodule
@@ -0,0 +1,34 @@
+// File: design1.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module design1 (
+    a,
+    b,
+    c,
+    d,
+    p,
+    q,
+    r
+);
+
+
+input a;
+input b;
+input c;
+input d;
+output p;
+wire p;
+input [7:0] q;
+input r;
+
+
+
+
+
+assign p = (a | b);
+
+endmodule
@@ -0,0 +1,38 @@
+// File: design2.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module design2 (
+    a,
+    b,
+    c,
+    d,
+    p,
+    q,
+    r
+);
+
+
+input a;
+input b;
+input c;
+input d;
+output p;
+wire p;
+output [7:0] q;
+wire [7:0] q;
+output r;
+wire r;
+
+
+
+
+
+assign p = (a | b);
+assign q = (c & d);
+assign r = (a ^ c);
+
+endmodule
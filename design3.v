@@ -0,0 +1,41 @@
+// File: design3.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module design3 (
+    a,
+    b,
+    c,
+    d,
+    p,
+    q,
+    r
+);
+
+
+input a;
+input b;
+input c;
+input d;
+output p;
+reg p;
+output [7:0] q;
+reg [7:0] q;
+output r;
+reg r;
+
+
+
+
+always @(c, b, a, d) begin: comb
+    if (a) begin
+        p = (c | b);
+        q = (c & d);
+        r = (d ^ c);
+    end
+end
+
+endmodule
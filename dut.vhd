@@ -0,0 +1,45 @@
+-- File: dut.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity dut is
+end entity dut;
+
+
+architecture MyHDL of dut is
+
+
+
+signal count: unsigned(6 downto 0) := 7X"00";
+
+begin
+
+
+
+
+seq: process is
+    variable L: line;
+begin
+    count <= to_unsigned(50, 7);
+    for dummy in 0 to 300-1 loop
+        wait for 10 * 1 ns;
+        write(L, to_hstring(count));
+        writeline(output, L);
+        if ((signed(resize(count, 8)) - 1) < 0) then
+            count <= to_unsigned(97, 7);
+        else
+            count <= (count - 1);
+        end if;
+    end loop;
+    wait;
+end process seq;
+
+end architecture MyHDL;
@@ -0,0 +1,32 @@
+// File: edge1.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:09 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module edge1 (
+    flag,
+    sig,
+    clock
+);
+
+
+output flag;
+reg flag;
+input sig;
+input clock;
+
+reg sig_Z1;
+
+
+
+always @(posedge clock) begin: detect
+    sig_Z1 <= sig;
+    flag <= 1'b0;
+    if ((sig && (!sig_Z1))) begin
+        flag <= 1'b1;
+    end
+end
+
+endmodule
@@ -0,0 +1,29 @@
+// File: edge2.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:09 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module edge2 (
+    flag,
+    sig,
+    clock
+);
+
+
+output flag;
+reg flag;
+input sig;
+input clock;
+
+reg sig_Z1;
+
+
+
+always @(posedge clock) begin: detect
+    sig_Z1 <= sig;
+    flag <= (sig && (!sig_Z1));
+end
+
+endmodule
@@ -0,0 +1,29 @@
+// File: edge4.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:10 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module edge4 (
+    flag,
+    sig,
+    clock
+);
+
+
+output flag;
+reg flag;
+input sig;
+input clock;
+
+
+
+
+always @(posedge clock) begin: detect
+    reg sig_Z1;
+    flag <= (sig && (!sig_Z1));
+    sig_Z1 = (sig != 0);
+end
+
+endmodule
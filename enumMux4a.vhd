@@ -0,0 +1,69 @@
+-- File: enumMux4a.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity enumMux4a is
+    port (
+        sel: in unsigned(1 downto 0);
+        in0: in unsigned(3 downto 0);
+        in1: in unsigned(3 downto 0);
+        in2: in unsigned(3 downto 0);
+        in3: in unsigned(3 downto 0);
+        out0: out unsigned(3 downto 0)
+    );
+end entity enumMux4a;
+
+
+architecture MyHDL of enumMux4a is
+
+
+type t_enum_t_opts_1 is (
+	SEL0,
+	SEL1,
+	SEL2,
+	SEL3
+	);
+
+signal sel_enum: t_enum_t_opts_1 := SEL0;
+
+begin
+
+
+
+
+mapping: process (sel) is
+begin
+    if (0 = sel) then
+        sel_enum <= SEL0;
+    elsif (1 = sel) then
+        sel_enum <= SEL1;
+    elsif (2 = sel) then
+        sel_enum <= SEL2;
+    elsif (3 = sel) then
+        sel_enum <= SEL3;
+    end if;
+end process mapping;
+
+rtl: process (in3, in0, in2, sel_enum, in1) is
+begin
+    case sel_enum is
+        when SEL0 =>
+            out0 <= in0;
+        when SEL1 =>
+            out0 <= in1;
+        when SEL2 =>
+            out0 <= in2;
+        when others => -- SEL3
+            out0 <= in3;
+    end case;
+end process rtl;
+
+end architecture MyHDL;
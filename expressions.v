@@ -0,0 +1,62 @@
+// File: expressions.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module expressions (
+    a,
+    b,
+    clk
+);
+
+
+output signed [6:0] a;
+reg signed [6:0] a;
+output [5:0] b;
+reg [5:0] b;
+input clk;
+
+reg [5:0] c;
+
+
+
+initial begin: comb
+    reg signed [7-1:0] d;
+    d = 0;
+    d = (-17);
+    c <= 5;
+    @(posedge clk);
+    a <= (c + 1);
+    b <= (c + 1);
+    @(posedge clk);
+    a <= ($signed({1'b0, c}) + (-10));
+    b <= ($signed({1'b0, c}) + (-1));
+    @(posedge clk);
+    a <= ($signed({1'b0, c}) < (-10));
+    b <= ($signed({1'b0, c}) < (-1));
+    @(posedge clk);
+    a <= (d + $signed({1'b0, c}));
+    b <= (d >= $signed({1'b0, c}));
+    @(posedge clk);
+    @(posedge clk);
+    a <= (d + (-$signed({1'b0, c})));
+    b <= ($signed({1'b0, c}) + (-d));
+    @(posedge clk);
+    a <= (-d);
+    @(posedge clk);
+    a <= (-c);
+    @(posedge clk);
+    c <= 46;
+    @(posedge clk);
+    a <= ((~d) + 1);
+    b <= ((~c) + 1);
+    @(posedge clk);
+    a <= ((~c) + 1);
+    b <= ((~d) + 1);
+    @(posedge clk);
+    $finish;
+end
+
+endmodule
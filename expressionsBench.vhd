@@ -0,0 +1,93 @@
+-- File: expressionsBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity expressionsBench is
+end entity expressionsBench;
+
+
+architecture MyHDL of expressionsBench is
+
+
+
+signal a: signed (6 downto 0);
+signal b: unsigned(5 downto 0);
+signal clk: std_logic;
+signal expressions0_c: unsigned(5 downto 0);
+
+begin
+
+
+
+
+expressions0_comb: process is
+    variable d: signed(6 downto 0);
+begin
+    d := to_signed(0, 7);
+    d := to_signed(-17, 7);
+    expressions0_c <= to_unsigned(5, 6);
+    wait until rising_edge(clk);
+    a <= signed(resize(expressions0_c, 7) + 1);
+    b <= (expressions0_c + 1);
+    wait until rising_edge(clk);
+    a <= (signed(resize(expressions0_c, 7)) + (-10));
+    b <= resize(unsigned(signed(resize(expressions0_c, 7)) + (-1)), 6);
+    wait until rising_edge(clk);
+    a <= to_signed(signed(resize(expressions0_c, 7)) < (-10), 7);
+    b <= to_unsigned(signed(resize(expressions0_c, 7)) < (-1), 6);
+    wait until rising_edge(clk);
+    a <= (d + signed(resize(expressions0_c, 7)));
+    b <= to_unsigned(d >= signed(resize(expressions0_c, 7)), 6);
+    wait until rising_edge(clk);
+    wait until rising_edge(clk);
+    a <= (d + (-expressions0_c));
+    b <= resize(unsigned(signed(resize(expressions0_c, 7)) + (-d)), 6);
+    wait until rising_edge(clk);
+    a <= (-d);
+    wait until rising_edge(clk);
+    a <= (-expressions0_c);
+    wait until rising_edge(clk);
+    expressions0_c <= to_unsigned(46, 6);
+    wait until rising_edge(clk);
+    a <= ((not d) + 1);
+    b <= ((not expressions0_c) + 1);
+    wait until rising_edge(clk);
+    a <= signed(resize((not expressions0_c), 7) + 1);
+    b <= resize(unsigned((not d) + 1), 6);
+    wait until rising_edge(clk);
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process expressions0_comb;
+
+check: process is
+    variable L: line;
+begin
+    while True loop
+        wait until rising_edge(clk);
+        wait for 1 * 1 ns;
+        write(L, to_string(to_integer(a)));
+        writeline(output, L);
+        write(L, to_string(to_integer(b)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+clkgen: process is
+begin
+    while True loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    wait;
+end process clkgen;
+
+end architecture MyHDL;
@@ -0,0 +1,33 @@
+// File: f.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module f (
+    a,
+    b
+);
+
+
+input a;
+input b;
+
+
+
+function [1-1:0] MYHDL432_h;
+    input [1-1:0] b;
+begin: MYHDL433_RETURN
+    MYHDL432_h = b;
+    disable MYHDL433_RETURN;
+end
+endfunction
+
+
+initial begin: g1_0_1_comb
+    MYHDL432_h(a);
+    @(a);
+end
+
+endmodule
@@ -0,0 +1,66 @@
+-- File: fsm4a.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity fsm4a is
+    port (
+        clk: in std_logic;
+        rst: in unsigned(0 downto 0);
+        rd: in unsigned(0 downto 0);
+        wr: in unsigned(0 downto 0)
+    );
+end entity fsm4a;
+
+
+architecture MyHDL of fsm4a is
+
+
+type t_enum_t_fsma_opts_1 is (
+	IDLE,
+	READ,
+	WRITE,
+	ERROR
+	);
+
+signal smp: t_enum_t_fsma_opts_1 := IDLE;
+
+begin
+
+
+
+
+rtl: process (clk) is
+begin
+    if rising_edge(clk) then
+        if bool(rst) then
+            smp <= IDLE;
+        else
+            case smp is
+                when IDLE => 
+                    smp <= IDLE;
+                    if bool(rd) then
+                        smp <= READ;
+                    end if;
+                    if bool(wr) then
+                        smp <= WRITE;
+                    end if;
+                when READ => 
+                    smp <= IDLE;
+                when WRITE => 
+                    smp <= IDLE;
+                when others => 
+                    smp <= IDLE;
+            end case;
+        end if;
+    end if;
+end process rtl;
+
+end architecture MyHDL;
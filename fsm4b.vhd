@@ -0,0 +1,48 @@
+-- File: fsm4b.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity fsm4b is
+    port (
+        clk: in std_logic;
+        a: in unsigned(0 downto 0);
+        b: in unsigned(0 downto 0);
+        c: in unsigned(0 downto 0);
+        z: out unsigned(2 downto 0)
+    );
+end entity fsm4b;
+
+
+architecture MyHDL of fsm4b is
+
+
+
+
+begin
+
+
+
+
+rtl: process (clk) is
+begin
+    if rising_edge(clk) then
+        case unsigned'(a & b & c) is
+            when "111" => 
+                z <= to_unsigned(6, 3);
+            when "101" | "110" => 
+                z <= to_unsigned(7, 3);
+            when others => 
+                z <= to_unsigned(0, 3);
+        end case;
+    end if;
+end process rtl;
+
+end architecture MyHDL;
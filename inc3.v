@@ -0,0 +1,24 @@
+// File: inc3.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:15 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module inc3 (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
+output [7:0] count;
+reg [7:0] count;
+input enable;
+input clock;
+input reset;
+
+wire [7:0] inc20_0_1_2_3_4_5_6_7_8_nextCount;
+
+
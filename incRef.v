@@ -0,0 +1,42 @@
+// File: incRef.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:15 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module incRef (
+    count,
+    enable,
+    clock,
+    reset
+);
+// Incrementer with enable.
+// 
+// count -- output
+// enable -- control input, increment when 1
+// clock -- clock input
+// reset -- asynchronous reset input
+// n -- counter max value
+
+output [7:0] count;
+reg [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+
+always @(posedge clock, negedge reset) begin: comb
+    if ((reset == 0)) begin
+        count <= 0;
+    end
+    else begin
+        if (enable) begin
+            count <= ((count + 1) % 256);
+        end
+    end
+end
+
+endmodule
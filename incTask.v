@@ -0,0 +1,50 @@
+// File: incTask.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:11 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module incTask (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
+output [7:0] count;
+reg [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+task MYHDL853_incTaskFunc;
+    inout [8-1:0] cnt;
+    input [1-1:0] enable;
+    input [1-1:0] reset;
+    input n;
+    integer n;
+begin: MYHDL854_RETURN
+    if (enable) begin
+        cnt = ((cnt + 1) % n);
+    end
+end
+endtask
+
+
+always @(posedge clock, negedge reset) begin: inctaskgen
+    reg [8-1:0] cnt;
+    if ((reset == 0)) begin
+        cnt = 0;
+        count <= 0;
+    end
+    else begin
+        MYHDL853_incTaskFunc(cnt, enable, reset, 256);
+        count <= cnt;
+    end
+end
+
+endmodule
@@ -0,0 +1,42 @@
+// File: incTaskFreeVar.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:11 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module incTaskFreeVar (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
+output [7:0] count;
+reg [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+task MYHDL856_incTaskFunc;
+begin: MYHDL857_RETURN
+    if (enable) begin
+        count <= ((count + 1) % 256);
+    end
+end
+endtask
+
+
+always @(posedge clock, negedge reset) begin: inctaskgen
+    if ((reset == 0)) begin
+        count <= 0;
+    end
+    else begin
+        MYHDL856_incTaskFunc;
+    end
+end
+
+endmodule
@@ -0,0 +1,47 @@
+// File: inc_initial.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:11 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module inc_initial (
+    count,
+    enable,
+    clock,
+    reset
+);
+// Incrementer with enable.
+// 
+// count -- output
+// enable -- control input, increment when 1
+// clock -- clock input
+// reset -- asynchronous reset input
+// n -- counter max value
+
+output [7:0] count;
+reg [7:0] count;
+input enable;
+input clock;
+input reset;
+
+
+
+
+initial begin: comb
+    integer dummy;
+    for (dummy=0; dummy<100; dummy=dummy+1) begin
+        @(posedge clock, negedge reset);
+        if ((reset == 0)) begin
+            count <= 0;
+        end
+        else begin
+            if (enable) begin
+                count <= ((count + 1) % 256);
+            end
+        end
+    end
+    $finish;
+end
+
+endmodule
@@ -0,0 +1,69 @@
+-- File: init_reset_tb.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity init_reset_tb is
+end entity init_reset_tb;
+
+
+architecture MyHDL of init_reset_tb is
+
+
+
+signal clk: std_logic := '0';
+signal reset: std_logic := '0';
+signal s_large: unsigned(31 downto 0) := 32X"c0000000";
+signal s_small: unsigned(31 downto 0) := 32X"0000000c";
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '0';
+    for dummy in 0 to 10-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process clkgen;
+
+raise_reset: process is
+begin
+    wait until rising_edge(clk);
+    reset <= '1';
+    wait until rising_edge(clk);
+    reset <= '0';
+    wait;
+end process raise_reset;
+
+seq: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        if (reset = '1') then
+            s_small <= to_unsigned(12, 32);
+            s_large <= unsigned'("11000000000000000000000000000000");
+        else
+            write(L, to_hstring(s_large));
+            writeline(output, L);
+            write(L, to_hstring(s_small));
+            writeline(output, L);
+            s_large <= (s_large + 1);
+            s_small <= (s_small + 1);
+        end if;
+    end if;
+end process seq;
+
+end architecture MyHDL;
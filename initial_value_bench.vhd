@@ -0,0 +1,61 @@
+-- File: initial_value_bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity initial_value_bench is
+end entity initial_value_bench;
+
+
+architecture MyHDL of initial_value_bench is
+
+
+
+signal clk: std_logic := '0';
+signal input_signal: signed (6 downto 0) := 7X"7d";
+signal output_signal: signed (6 downto 0) := 7X"00";
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '0';
+    for dummy in 0 to 10-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process clkgen;
+
+
+output_signal <= input_signal;
+
+drive_and_check: process (clk) is
+begin
+    if rising_edge(clk) then
+        input_signal <= to_signed(0, 7);
+        
+    end if;
+end process drive_and_check;
+
+int_writer0_0_1_2_3_4_writer: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        write(L, to_hstring(unsigned(output_signal)));
+        writeline(output, L);
+    end if;
+end process int_writer0_0_1_2_3_4_writer;
+
+end architecture MyHDL;
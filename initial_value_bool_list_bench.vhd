@@ -0,0 +1,71 @@
+-- File: initial_value_bool_list_bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity initial_value_bool_list_bench is
+end entity initial_value_bool_list_bench;
+
+
+architecture MyHDL of initial_value_bool_list_bench is
+
+
+
+signal clk: std_logic := '0';
+type t_array_input_signal_list is array(0 to 10-1) of std_logic;
+signal input_signal_list: t_array_input_signal_list := (others => '0');
+type t_array_output_signal_list is array(0 to 10-1) of std_logic;
+signal output_signal_list: t_array_output_signal_list := (others => '1');
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '0';
+    for dummy in 0 to 10-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process clkgen;
+
+output_driver: process (input_signal_list) is
+begin
+    for i in 0 to 10-1 loop
+        output_signal_list(i) <= input_signal_list(i);
+    end loop;
+end process output_driver;
+
+drive_and_check: process (clk) is
+begin
+    if rising_edge(clk) then
+        for i in 0 to 10-1 loop
+            input_signal_list(i) <= '1';
+        end loop;
+        
+    end if;
+end process drive_and_check;
+
+bool_list_writer0_list_writer: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        for i in 0 to 10-1 loop
+            write(L, to_string(to_integer(output_signal_list(i))));
+            writeline(output, L);
+        end loop;
+    end if;
+end process bool_list_writer0_list_writer;
+
+end architecture MyHDL;
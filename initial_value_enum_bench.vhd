@@ -0,0 +1,72 @@
+-- File: initial_value_enum_bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity initial_value_enum_bench is
+end entity initial_value_enum_bench;
+
+
+architecture MyHDL of initial_value_enum_bench is
+
+
+type t_enum_states_1 is (
+	a,
+	b,
+	c,
+	d
+	);
+
+signal clk: std_logic := '0';
+signal sig: t_enum_states_1 := c;
+
+begin
+
+
+
+
+state_walker: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        case sig is
+            when a =>
+                sig <= c;
+                write(L, string'("a"));
+                writeline(output, L);
+            when c =>
+                sig <= a;
+                write(L, string'("c"));
+                writeline(output, L);
+            when b =>
+                sig <= d;
+                write(L, string'("b"));
+                writeline(output, L);
+            when others => -- d
+                sig <= b;
+                write(L, string'("d"));
+                writeline(output, L);
+        end case;
+        
+    end if;
+end process state_walker;
+
+clkgen: process is
+begin
+    clk <= '0';
+    for dummy in 0 to 20-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process clkgen;
+
+end architecture MyHDL;
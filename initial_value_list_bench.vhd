@@ -0,0 +1,106 @@
+-- File: initial_value_list_bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity initial_value_list_bench is
+end entity initial_value_list_bench;
+
+
+architecture MyHDL of initial_value_list_bench is
+
+
+
+signal clk: std_logic := '0';
+type t_array_input_signal_list is array(0 to 10-1) of signed (71 downto 0);
+signal input_signal_list: t_array_input_signal_list := (
+    72X"6075941334781a3cc0",
+    72X"644ba45ef15bcb96c2",
+    72X"4e72d179738be7cd98",
+    72X"f85d2a75022276e228",
+    72X"f0eb6cd55b4e3c81d3",
+    72X"43c1b500ddb506681c",
+    72X"08cc9a312510170f1b",
+    72X"cedcd406f80b409d0d",
+    72X"03b01191476d3b8d63",
+    72X"011a995ea49826bc77");
+type t_array_output_signal_list is array(0 to 10-1) of signed (71 downto 0);
+signal output_signal_list: t_array_output_signal_list := (others => 72X"000000000000000000");
+
+begin
+
+
+
+
+clkgen: process is
+begin
+    clk <= '0';
+    for dummy in 0 to 10-1 loop
+        wait for 10 * 1 ns;
+        clk <= stdl((not bool(clk)));
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process clkgen;
+
+
+output_signal_list(0) <= input_signal_list(0);
+
+
+output_signal_list(1) <= input_signal_list(1);
+
+
+output_signal_list(2) <= input_signal_list(2);
+
+
+output_signal_list(3) <= input_signal_list(3);
+
+
+output_signal_list(4) <= input_signal_list(4);
+
+
+output_signal_list(5) <= input_signal_list(5);
+
+
+output_signal_list(6) <= input_signal_list(6);
+
+
+output_signal_list(7) <= input_signal_list(7);
+
+
+output_signal_list(8) <= input_signal_list(8);
+
+
+output_signal_list(9) <= input_signal_list(9);
+
+drive_and_check: process (clk) is
+begin
+    if rising_edge(clk) then
+        for i in 0 to 10-1 loop
+            input_signal_list(i) <= to_signed(0, 72);
+        end loop;
+        
+    end if;
+end process drive_and_check;
+
+
+
+INITIAL_VALUE_BENCH_OUTPUT_WRITER: process (clk) is
+    variable L: line;
+begin
+    if rising_edge(clk) then
+        for i in 0 to 10-1 loop
+            write(L, to_hstring(unsigned(output_signal_list(i))));
+            writeline(output, L);
+        end loop;
+    end if;
+end process INITIAL_VALUE_BENCH_OUTPUT_WRITER;
+
+end architecture MyHDL;
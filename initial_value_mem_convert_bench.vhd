@@ -0,0 +1,109 @@
+-- File: initial_value_mem_convert_bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity initial_value_mem_convert_bench is
+end entity initial_value_mem_convert_bench;
+
+
+architecture MyHDL of initial_value_mem_convert_bench is
+
+
+
+signal wr: std_logic;
+signal wrd: unsigned(4 downto 0);
+signal rdd: unsigned(4 downto 0) := 5X"00";
+signal addr: unsigned(3 downto 0);
+signal clock: std_logic := '0';
+signal reset: std_logic := '0';
+type t_array_memory0_mem is array(0 to 16-1) of unsigned(4 downto 0);
+signal memory0_mem: t_array_memory0_mem := (others => 5X"00");
+
+begin
+
+
+wr <= '0';
+wrd <= to_unsigned(0, 5);
+addr <= to_unsigned(0, 4);
+
+
+memory0_memory_init0_beh_init: process is
+begin
+    for ii in 0 to 16-1 loop
+        case ii is
+            when 0 => memory0_mem(ii) <= "00000";
+            when 1 => memory0_mem(ii) <= "00000";
+            when 2 => memory0_mem(ii) <= "00000";
+            when 3 => memory0_mem(ii) <= "00000";
+            when 4 => memory0_mem(ii) <= "00000";
+            when 5 => memory0_mem(ii) <= "00000";
+            when 6 => memory0_mem(ii) <= "00000";
+            when 7 => memory0_mem(ii) <= "00000";
+            when 8 => memory0_mem(ii) <= "00000";
+            when 9 => memory0_mem(ii) <= "00000";
+            when 10 => memory0_mem(ii) <= "00000";
+            when 11 => memory0_mem(ii) <= "00000";
+            when 12 => memory0_mem(ii) <= "00000";
+            when 13 => memory0_mem(ii) <= "00000";
+            when 14 => memory0_mem(ii) <= "00000";
+            when others => memory0_mem(ii) <= "00000";
+        end case;
+    end loop;
+    wait for 10 * 1 ns;
+    wait;
+end process memory0_memory_init0_beh_init;
+
+memory0_beh_mem: process (clock, reset) is
+begin
+    if (reset = '0') then
+        memory0_mem(0) <= to_unsigned(0, 5);
+        memory0_mem(1) <= to_unsigned(0, 5);
+        memory0_mem(2) <= to_unsigned(0, 5);
+        memory0_mem(3) <= to_unsigned(0, 5);
+        memory0_mem(4) <= to_unsigned(0, 5);
+        memory0_mem(5) <= to_unsigned(0, 5);
+        memory0_mem(6) <= to_unsigned(0, 5);
+        memory0_mem(7) <= to_unsigned(0, 5);
+        memory0_mem(8) <= to_unsigned(0, 5);
+        memory0_mem(9) <= to_unsigned(0, 5);
+        memory0_mem(10) <= to_unsigned(0, 5);
+        memory0_mem(11) <= to_unsigned(0, 5);
+        memory0_mem(12) <= to_unsigned(0, 5);
+        memory0_mem(13) <= to_unsigned(0, 5);
+        memory0_mem(14) <= to_unsigned(0, 5);
+        memory0_mem(15) <= to_unsigned(0, 5);
+        rdd <= to_unsigned(0, 5);
+    elsif rising_edge(clock) then
+        rdd <= memory0_mem(to_integer(addr));
+        if bool(wr) then
+            memory0_mem(to_integer(addr)) <= wrd;
+        end if;
+    end if;
+end process memory0_beh_mem;
+
+genclk: process is
+begin
+    while True loop
+        clock <= stdl((not bool(clock)));
+        wait for 5 * 1 ns;
+    end loop;
+    wait;
+end process genclk;
+
+genreset: process is
+begin
+    reset <= '0';
+    wait for 35 * 1 ns;
+    reset <= '1';
+    wait;
+end process genreset;
+
+end architecture MyHDL;
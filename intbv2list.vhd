@@ -0,0 +1,61 @@
+-- File: intbv2list.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity intbv2list is
+end entity intbv2list;
+-- Conversion between intbv and list of boolean signals.
+
+architecture MyHDL of intbv2list is
+
+
+
+signal a: unsigned(7 downto 0) := 8X"00";
+signal z: unsigned(7 downto 0) := 8X"00";
+type t_array_b is array(0 to 8-1) of std_logic;
+signal b: t_array_b := (others => '0');
+
+begin
+
+
+
+
+extract: process (a) is
+begin
+    for i in 0 to 8-1 loop
+        b(i) <= a(i);
+    end loop;
+end process extract;
+
+assemble: process (b(0), b(1), b(2), b(3), b(4), b(5), b(6), b(7)) is
+begin
+    for i in 0 to 8-1 loop
+        z(i) <= b(i);
+    end loop;
+end process assemble;
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 256-1 loop
+        a <= to_unsigned(i, 8);
+        wait for 10 * 1 ns;
+        assert (z = a)
+            report "*** AssertionError ***"
+            severity error;
+        write(L, to_hstring(a));
+        writeline(output, L);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
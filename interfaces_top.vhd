@@ -0,0 +1,113 @@
+-- File: interfaces_top.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity interfaces_top is
+    port (
+        clock: in std_logic;
+        reset: in std_logic;
+        sdi: in std_logic;
+        sdo: out std_logic;
+        nested: out std_logic
+    );
+end entity interfaces_top;
+
+
+architecture MyHDL of interfaces_top is
+
+
+
+signal intf1_sig1: std_logic := '0';
+signal intf1_sig2: std_logic := '0';
+signal intf1_sig3: unsigned(7 downto 0) := 8X"00";
+signal intf3_sig1: std_logic := '0';
+signal intf3_sig2: std_logic := '0';
+signal intf3_sig3: unsigned(7 downto 0) := 8X"00";
+signal intf2_intf_sig2: std_logic := '0';
+signal use_nested_intf1_sig1: std_logic := '0';
+signal use_nested_intf1_sig2: std_logic := '0';
+signal use_nested_intf1_intf2_sig1: std_logic := '0';
+signal use_nested_intf1_intf2_sig2: std_logic := '0';
+signal use_nested_intf1_intf2_sig3: unsigned(7 downto 0) := 8X"00";
+signal use_nested_intf1_intf2_intf_sig1: std_logic := '0';
+
+begin
+
+
+
+
+use_nested_intf1_proc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '1') then
+            use_nested_intf1_sig1 <= '0';
+            use_nested_intf1_intf2_sig1 <= '0';
+            intf2_intf_sig2 <= '0';
+            use_nested_intf1_sig2 <= '0';
+            use_nested_intf1_intf2_sig3 <= to_unsigned(0, 8);
+            use_nested_intf1_intf2_intf_sig1 <= '0';
+            use_nested_intf1_intf2_sig2 <= '0';
+        else
+            if bool(intf1_sig1) then
+                use_nested_intf1_sig1 <= '1';
+                use_nested_intf1_sig2 <= '0';
+            else
+                use_nested_intf1_sig1 <= '0';
+                use_nested_intf1_sig2 <= '1';
+            end if;
+            use_nested_intf1_intf2_sig1 <= use_nested_intf1_sig1;
+            use_nested_intf1_intf2_sig2 <= stdl(bool(use_nested_intf1_sig2) or bool(intf1_sig2));
+            use_nested_intf1_intf2_sig3 <= (not intf1_sig3);
+            use_nested_intf1_intf2_intf_sig1 <= use_nested_intf1_intf2_sig2;
+            intf2_intf_sig2 <= use_nested_intf1_intf2_intf_sig1;
+        end if;
+    end if;
+end process use_nested_intf1_proc;
+
+something_peculiar1_proc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '1') then
+            intf3_sig1 <= '0';
+            intf3_sig3 <= to_unsigned(0, 8);
+            intf3_sig2 <= '0';
+        else
+            if (use_nested_intf1_intf2_sig3 > 0) then
+                intf3_sig1 <= stdl((not bool(use_nested_intf1_intf2_sig1)));
+                intf3_sig2 <= stdl((not bool(use_nested_intf1_intf2_sig2)));
+                intf3_sig3 <= (use_nested_intf1_intf2_sig3 + intf3_sig3);
+            else
+                intf3_sig3 <= to_unsigned(0, 8);
+            end if;
+        end if;
+    end if;
+end process something_peculiar1_proc;
+
+assigns: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '1') then
+            sdo <= '0';
+            intf1_sig2 <= '0';
+            intf1_sig3 <= to_unsigned(0, 8);
+            nested <= '0';
+            intf1_sig1 <= '0';
+        else
+            intf1_sig1 <= sdi;
+            intf1_sig2 <= stdl((not bool(sdi)));
+            intf1_sig3 <= resize(unsigned'(intf1_sig3(7-1 downto 1) & sdi), 8);
+            sdo <= ((intf3_sig1 or intf3_sig2) or intf3_sig3(2));
+            nested <= intf2_intf_sig2;
+        end if;
+    end if;
+end process assigns;
+
+end architecture MyHDL;
@@ -0,0 +1,47 @@
+-- File: invalid_function_underscore.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:06 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity invalid_function_underscore is
+    port (
+        clock: in std_logic;
+        input_sig: in std_logic;
+        output_sig: out std_logic
+    );
+end entity invalid_function_underscore;
+
+
+architecture MyHDL of invalid_function_underscore is
+
+
+
+signal ttt: std_logic;
+signal invalid_signal_underscore0_0__foo: std_logic;
+
+begin
+
+
+
+
+
+invalid_signal_underscore0_0__foo <= stdl(bool(input_sig) and bool(input_sig));
+
+
+ttt <= invalid_signal_underscore0_0__foo;
+
+do_something: process (clock) is
+begin
+    if rising_edge(clock) then
+        output_sig <= ttt;
+    end if;
+end process do_something;
+
+end architecture MyHDL;
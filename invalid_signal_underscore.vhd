@@ -0,0 +1,38 @@
+-- File: invalid_signal_underscore.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:06 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity invalid_signal_underscore is
+    port (
+        input_sig: in std_logic;
+        output_sig: out std_logic
+    );
+end entity invalid_signal_underscore;
+
+
+architecture MyHDL of invalid_signal_underscore is
+
+
+
+signal _foo: std_logic;
+
+begin
+
+
+
+
+
+_foo <= stdl(bool(input_sig) and bool(input_sig));
+
+
+output_sig <= _foo;
+
+end architecture MyHDL;
@@ -0,0 +1,49 @@
+-- File: issue_117_2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity issue_117_2 is
+    port (
+        clk: in std_logic;
+        sdi: in std_logic;
+        pdo: out unsigned(7 downto 0);
+        sel: in unsigned(1 downto 0)
+    );
+end entity issue_117_2;
+
+
+architecture MyHDL of issue_117_2 is
+
+
+
+signal delay_reg: unsigned(7 downto 0) := 8X"00";
+
+begin
+
+
+
+
+rtl: process (clk) is
+begin
+    if rising_edge(clk) then
+        case sel is
+            when "00" =>
+                delay_reg <= resize(unsigned'('0' & delay_reg(((8 - 1) - 1)-1 downto 1) & sdi), 8);
+            when "01" =>
+                delay_reg <= resize(unsigned'(delay_reg((8 - 1)-1 downto (1 + 1)) & '0' & sdi), 8);
+            when others => -- "10"
+                delay_reg <= resize(unsigned'(delay_reg((8 - 1)-1 downto (1 + 1)) & sdi & '0'), 8);
+                pdo <= delay_reg;
+        end case;
+    end if;
+end process rtl;
+
+end architecture MyHDL;
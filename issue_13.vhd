@@ -0,0 +1,61 @@
+-- File: issue_13.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity issue_13 is
+    port (
+        reset: in std_logic;
+        clk: in std_logic;
+        d: in unsigned(31 downto 0);
+        en: in std_logic;
+        q: out unsigned(7 downto 0)
+    );
+end entity issue_13;
+
+
+architecture MyHDL of issue_13 is
+
+
+
+
+function MYHDL2450_calculateHec(
+    header: in unsigned
+    ) return integer is
+    variable hec: unsigned(7 downto 0);
+    variable bit: std_logic;
+begin
+    hec := to_unsigned(0, 8);
+    for ii in 32-1 downto 0 loop
+        bit := header(ii);
+        hec(8-1 downto 0) := unsigned'(hec(7-1 downto 2) & ((bit xor hec(1)) xor hec(7)) & ((bit xor hec(0)) xor hec(7)) & (bit xor hec(7)));
+    end loop;
+    return (hec xor to_unsigned(85, 8));
+end function MYHDL2450_calculateHec;
+
+begin
+
+
+
+
+comb: process (clk) is
+begin
+    if rising_edge(clk) then
+        if (reset = '1') then
+            q <= to_unsigned(0, 8);
+        else
+            if bool(en) then
+                q <= to_unsigned(MYHDL2450_calculateHec(d), 8);
+            end if;
+        end if;
+    end if;
+end process comb;
+
+end architecture MyHDL;
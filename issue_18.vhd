@@ -0,0 +1,54 @@
+-- File: issue_18.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity issue_18 is
+    port (
+        dout: out std_logic_vector(7 downto 0);
+        din: in std_logic_vector(7 downto 0);
+        addr: in std_logic_vector(6 downto 0);
+        we: in std_logic;
+        clk: in std_logic
+    );
+end entity issue_18;
+-- Ram model 
+
+architecture MyHDL of issue_18 is
+
+
+
+signal dout_num: unsigned(7 downto 0) := 8X"00";
+signal din_num: unsigned(7 downto 0) := 8X"00";
+signal addr_num: unsigned(6 downto 0) := 7X"00";
+type t_array_mem is array(0 to 128-1) of unsigned(7 downto 0);
+signal mem: t_array_mem := (others => 8X"00");
+
+begin
+
+dout <= std_logic_vector(dout_num);
+din_num <= unsigned(din);
+addr_num <= unsigned(addr);
+
+
+
+write: process (clk) is
+begin
+    if rising_edge(clk) then
+        if bool(we) then
+            mem(to_integer(addr_num)) <= din_num;
+        end if;
+    end if;
+end process write;
+
+
+dout_num <= mem(to_integer(addr_num));
+
+end architecture MyHDL;
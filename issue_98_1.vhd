@@ -0,0 +1,28 @@
+-- File: issue_98_1.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity issue_98_1 is
+    port (
+        sda: inout std_logic;
+        scl: inout std_logic;
+        sda_i: out std_logic;
+        sda_o: in std_logic;
+        scl_i: out std_logic;
+        scl_o: in std_logic
+    );
+end entity issue_98_1;
+
+
+architecture MyHDL of issue_98_1 is
+
+
+
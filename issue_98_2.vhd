@@ -0,0 +1,45 @@
+-- File: issue_98_2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity issue_98_2 is
+    port (
+        sda: inout unsigned(1 downto 0);
+        scl: inout unsigned(1 downto 0);
+        sda_i: out unsigned(1 downto 0);
+        sda_o: in unsigned(1 downto 0);
+        scl_i: out unsigned(1 downto 0);
+        scl_o: in unsigned(1 downto 0)
+    );
+end entity issue_98_2;
+
+
+architecture MyHDL of issue_98_2 is
+
+
+
+signal scl_d: unsigned(1 downto 0) := 2X"None";
+signal sda_d: unsigned(1 downto 0) := 2X"None";
+
+begin
+
+
+
+sda <= sda_d;
+scl <= scl_d;
+
+
+sda_i <= sda;
+sda_d <= tern_op(cond => (not bool(sda_o)), if_true => to_unsigned(0, 2), if_false => "ZZ");
+scl_i <= scl;
+scl_d <= tern_op(cond => (not bool(scl_o)), if_true => "ZZ", if_false => to_unsigned(1, 2));
+
+end architecture MyHDL;
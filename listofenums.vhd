@@ -0,0 +1,92 @@
+-- File: listofenums.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity listofenums is
+    port (
+        Clk: in std_logic;
+        Reset: in std_logic;
+        Start: in std_logic;
+        Progress: in std_logic;
+        Ended: out std_logic
+    );
+end entity listofenums;
+
+
+architecture MyHDL of listofenums is
+
+
+type t_enum_listofenums_states_1 is (
+	IDLE,
+	Doing_Nothing,
+	Procrastinating,
+	Getting_Ready,
+	Executing
+	);
+attribute enum_encoding of t_enum_listofenums_states_1: type is "00001 00010 00100 01000 10000";
+
+signal smn: t_enum_listofenums_states_1 := IDLE;
+signal smp: t_enum_listofenums_states_1 := IDLE;
+signal stateindex: unsigned(2 downto 0) := 3X"0";
+type t_array_stack is array(0 to 5-1) of t_enum_listofenums_states_1;
+constant stack: t_array_stack := (
+    IDLE,
+    Doing_Nothing,
+    Procrastinating,
+    Getting_Ready,
+    Executing);
+
+begin
+
+
+
+
+smcomb: process (Start, Progress, stateindex, smp) is
+begin
+    Ended <= '0';
+    if bool(Start) then
+        smn <= stack(1);
+    else
+        if bool(Progress) then
+            if (signed(resize(stateindex, 4)) < (5 - 1)) then
+                smn <= stack(to_integer(stateindex + 1));
+            else
+                smn <= smp;
+            end if;
+        else
+            smn <= smp;
+        end if;
+    end if;
+    -- note that if we exchange the two following lines
+    -- we get a failing conversion to VHDL (only; Verilog is fine ...) 
+    if (smp = Executing) then
+        Ended <= '1';
+    end if;
+end process smcomb;
+
+smsync: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        if (Reset = '1') then
+            stateindex <= to_unsigned(0, 3);
+            smp <= IDLE;
+        else
+            smp <= smn;
+            if (bool(Start) or bool(Progress)) then
+                if (signed(resize(stateindex, 4)) < (5 - 1)) then
+                    stateindex <= (stateindex + 1);
+                end if;
+            end if;
+        end if;
+    end if;
+end process smsync;
+
+end architecture MyHDL;
@@ -0,0 +1,46 @@
+-- File: mixed.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity mixed is
+end entity mixed;
+
+
+architecture MyHDL of mixed is
+
+
+
+signal z: unsigned(5 downto 0) := 6X"00";
+type t_array_a is array(0 to 3-1) of signed (5 downto 0);
+signal a: t_array_a := (others => 6X"00");
+type t_array_b is array(0 to 3-1) of unsigned(4 downto 0);
+signal b: t_array_b := (others => 5X"00");
+
+begin
+
+
+
+
+
+z <= unsigned(a(1) + signed(resize(b(2), 6)));
+
+stimulus: process is
+    variable L: line;
+begin
+    a(0) <= to_signed(-6, 6);
+    b(2) <= to_unsigned(15, 5);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(z));
+    writeline(output, L);
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,36 @@
+-- File: module42_2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity module42_2 is
+    port (
+        sigin: in unsigned(1 downto 0);
+        sigout: out unsigned(1 downto 0)
+    );
+end entity module42_2;
+
+
+architecture MyHDL of module42_2 is
+
+
+
+
+begin
+
+
+
+
+output: process (sigin) is
+begin
+    sigout <= sigin(2-1 downto 0);
+end process output;
+
+end architecture MyHDL;
@@ -0,0 +1,162 @@
+-- File: multiBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity multiBench is
+end entity multiBench;
+
+
+architecture MyHDL of multiBench is
+
+
+
+signal Bitand: unsigned(3 downto 0);
+signal Bitor: unsigned(3 downto 0);
+signal Bitxor: unsigned(3 downto 0);
+signal Booland: std_logic;
+signal Boolor: std_logic;
+signal argm: unsigned(3 downto 0);
+signal argn: unsigned(3 downto 0);
+signal argp: unsigned(3 downto 0);
+
+begin
+
+
+
+
+multiops0_comb: process (argm, argn, argp) is
+begin
+    Bitand <= ((argm and argn) and argp);
+    Bitor <= ((argm or argn) or argp);
+    Bitxor <= ((argm xor argn) xor argp);
+    Booland <= stdl(bool(argm) and bool(argn) and bool(argp));
+    Boolor <= stdl(bool(argm) and bool(argn) and bool(argp));
+end process multiops0_comb;
+
+stimulus: process is
+begin
+    for i in 0 to 15-1 loop
+        case i is
+            when 0 => argm <= "0001";
+            when 1 => argm <= "0010";
+            when 2 => argm <= "0011";
+            when 3 => argm <= "0100";
+            when 4 => argm <= "0101";
+            when 5 => argm <= "0110";
+            when 6 => argm <= "0111";
+            when 7 => argm <= "1000";
+            when 8 => argm <= "1001";
+            when 9 => argm <= "1010";
+            when 10 => argm <= "1011";
+            when 11 => argm <= "1100";
+            when 12 => argm <= "1101";
+            when 13 => argm <= "1110";
+            when others => argm <= "1111";
+        end case;
+        case i is
+            when 0 => argn <= "0001";
+            when 1 => argn <= "0010";
+            when 2 => argn <= "0011";
+            when 3 => argn <= "0100";
+            when 4 => argn <= "0101";
+            when 5 => argn <= "0110";
+            when 6 => argn <= "0111";
+            when 7 => argn <= "1000";
+            when 8 => argn <= "1001";
+            when 9 => argn <= "1010";
+            when 10 => argn <= "1011";
+            when 11 => argn <= "1100";
+            when 12 => argn <= "1101";
+            when 13 => argn <= "1110";
+            when others => argn <= "1111";
+        end case;
+        case i is
+            when 0 => argp <= "0001";
+            when 1 => argp <= "0010";
+            when 2 => argp <= "0011";
+            when 3 => argp <= "0100";
+            when 4 => argp <= "0101";
+            when 5 => argp <= "0110";
+            when 6 => argp <= "0111";
+            when 7 => argp <= "1000";
+            when 8 => argp <= "1001";
+            when 9 => argp <= "1010";
+            when 10 => argp <= "1011";
+            when 11 => argp <= "1100";
+            when 12 => argp <= "1101";
+            when 13 => argp <= "1110";
+            when others => argp <= "1111";
+        end case;
+        wait for 10 * 1 ns;
+    end loop;
+    for i in 0 to 10-1 loop
+        case i is
+            when 0 => argm <= "0001";
+            when 1 => argm <= "1100";
+            when 2 => argm <= "1110";
+            when 3 => argm <= "0110";
+            when 4 => argm <= "1001";
+            when 5 => argm <= "1111";
+            when 6 => argm <= "0100";
+            when 7 => argm <= "1111";
+            when 8 => argm <= "1001";
+            when others => argm <= "0010";
+        end case;
+        case i is
+            when 0 => argn <= "1000";
+            when 1 => argn <= "1010";
+            when 2 => argn <= "1001";
+            when 3 => argn <= "1010";
+            when 4 => argn <= "1001";
+            when 5 => argn <= "1100";
+            when 6 => argn <= "0010";
+            when 7 => argn <= "0110";
+            when 8 => argn <= "1100";
+            when others => argn <= "0100";
+        end case;
+        case i is
+            when 0 => argp <= "0010";
+            when 1 => argp <= "1001";
+            when 2 => argp <= "0001";
+            when 3 => argp <= "0111";
+            when 4 => argp <= "1110";
+            when 5 => argp <= "0111";
+            when 6 => argp <= "1000";
+            when 7 => argp <= "0001";
+            when 8 => argp <= "0011";
+            when others => argp <= "0011";
+        end case;
+        wait for 10 * 1 ns;
+    end loop;
+    wait;
+end process stimulus;
+
+check: process is
+    variable L: line;
+begin
+    while True loop
+        wait on argm, argn, argp;
+        wait for 1 * 1 ns;
+        write(L, to_hstring(Bitand));
+        writeline(output, L);
+        write(L, to_hstring(Bitor));
+        writeline(output, L);
+        write(L, to_hstring(Bitxor));
+        writeline(output, L);
+        write(L, to_string(to_integer(Booland)));
+        writeline(output, L);
+        write(L, to_string(to_integer(Boolor)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
@@ -0,0 +1,45 @@
+// File: multiOps.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:15 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module multiOps (
+    Bitand,
+    Bitor,
+    Bitxor,
+    And,
+    Or,
+    argm,
+    argn,
+    argp
+);
+
+
+output [3:0] Bitand;
+reg [3:0] Bitand;
+output [3:0] Bitor;
+reg [3:0] Bitor;
+output [3:0] Bitxor;
+reg [3:0] Bitxor;
+output And;
+reg And;
+output Or;
+reg Or;
+input [3:0] argm;
+input [3:0] argn;
+input [3:0] argp;
+
+
+
+
+always @(argm, argn, argp) begin: comb
+    Bitand <= ((argm & argn) & argp);
+    Bitor <= ((argm | argn) | argp);
+    Bitxor <= ((argm ^ argn) ^ argp);
+    And <= ((argm != 0) && (argn != 0) && (argp != 0));
+    Or <= ((argm != 0) && (argn != 0) && (argp != 0));
+end
+
+endmodule
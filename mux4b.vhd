@@ -0,0 +1,49 @@
+-- File: mux4b.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity mux4b is
+    port (
+        sel: in unsigned(1 downto 0);
+        in0: in unsigned(3 downto 0);
+        in1: in unsigned(3 downto 0);
+        in2: in unsigned(3 downto 0);
+        in3: in unsigned(3 downto 0);
+        out0: out unsigned(3 downto 0)
+    );
+end entity mux4b;
+
+
+architecture MyHDL of mux4b is
+
+
+
+
+begin
+
+
+
+
+rtl: process (sel, in3, in0, in2, in1) is
+begin
+    case sel is
+        when "00" => 
+            out0 <= in0;
+        when "01" => 
+            out0 <= in1;
+        when "10" => 
+            out0 <= in2;
+        when others => 
+            out0 <= in3;
+    end case;
+end process rtl;
+
+end architecture MyHDL;
@@ -0,0 +1,72 @@
+-- File: muxBench0.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity muxBench0 is
+end entity muxBench0;
+
+
+architecture MyHDL of muxBench0 is
+
+
+type t_enum_t_opts_1 is (
+	SEL0,
+	SEL1,
+	SEL2,
+	SEL3
+	);
+
+signal in0: unsigned(3 downto 0);
+signal in1: unsigned(3 downto 0);
+signal in2: unsigned(3 downto 0);
+signal in3: unsigned(3 downto 0);
+signal out0: unsigned(3 downto 0) := 4X"0";
+signal sel: unsigned(1 downto 0);
+signal enumMux4a1_sel_enum: t_enum_t_opts_1 := SEL0;
+
+begin
+
+
+in0 <= to_unsigned(0, 4);
+in1 <= to_unsigned(0, 4);
+in2 <= to_unsigned(0, 4);
+in3 <= to_unsigned(0, 4);
+sel <= to_unsigned(0, 2);
+
+
+enummux4a1_mapping: process (sel) is
+begin
+    if (0 = sel) then
+        enumMux4a1_sel_enum <= SEL0;
+    elsif (1 = sel) then
+        enumMux4a1_sel_enum <= SEL1;
+    elsif (2 = sel) then
+        enumMux4a1_sel_enum <= SEL2;
+    elsif (3 = sel) then
+        enumMux4a1_sel_enum <= SEL3;
+    end if;
+end process enummux4a1_mapping;
+
+enummux4a1_rtl: process (in3, in0, in2, enumMux4a1_sel_enum, in1) is
+begin
+    case enumMux4a1_sel_enum is
+        when SEL0 =>
+            out0 <= in0;
+        when SEL1 =>
+            out0 <= in1;
+        when SEL2 =>
+            out0 <= in2;
+        when others => -- SEL3
+            out0 <= in3;
+    end case;
+end process enummux4a1_rtl;
+
+end architecture MyHDL;
@@ -0,0 +1,30 @@
+// File: my_bundle.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:14 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module my_bundle (
+    p,
+    q
+);
+
+
+input p;
+output q;
+reg q;
+
+wire r;
+
+assign r = 1'd0;
+
+
+initial begin: or_gate0_comb
+    while (1) begin
+        q <= (p | r);
+        @(p, r);
+    end
+end
+
+endmodule
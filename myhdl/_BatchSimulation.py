@@ -0,0 +1,808 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module that provides the batch simulation engine.
+
+A batch simulation runs a design for many independent lanes at once,
+cycle by cycle. Each signal holds a NumPy vector with a value per lane,
+and the functions of the blocks are translated into code that works on
+these vectors. An if statement whose test differs between lanes runs
+both branches, each one for the lanes that take it.
+
+The design is restricted as for cycle-based simulation, and the blocks
+to the convertible subset of arithmetic, bitwise, comparison and
+if/ternary logic. The conversion analyzer checks the blocks and
+infers the types of their variables.
+
+NumPy is an optional dependency, only needed for batch simulation.
+
+"""
+import ast
+import builtins
+
+from myhdl import SimulationError
+from myhdl._Signal import _Signal, _PosedgeWaiterList, _isListOfSigs
+from myhdl._enum import EnumItemType
+from myhdl._intbv import intbv
+from myhdl._modbv import modbv
+from myhdl._concat import concat
+from myhdl._always_comb import _AlwaysComb
+from myhdl._always_seq import _AlwaysSeq
+from myhdl._always import _Always
+from myhdl._levelize import _sortBlocks
+from myhdl._CycleSimulation import _checkDesign
+from myhdl._Simulation import _flatten
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class _error:
+    pass
+
+
+_error.Numpy = "batch simulation requires numpy"
+_error.NotSupported = "batch simulation does not support"
+_error.SignalType = "batch simulation only supports bool, int, intbv " \
+                    "and enum signals of up to 63 bits"
+_error.Signal = "signal is not part of the batch simulation"
+_error.Lanes = "expected a single value or a value per lane"
+
+
+_binOps = {
+    ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.FloorDiv: '//',
+    ast.Mod: '%', ast.Pow: '**', ast.LShift: '<<', ast.RShift: '>>',
+    ast.BitAnd: '&', ast.BitOr: '|', ast.BitXor: '^'}
+
+_cmpOps = {
+    ast.Eq: '==', ast.NotEq: '!=', ast.Lt: '<', ast.LtE: '<=',
+    ast.Gt: '>', ast.GtE: '>='}
+
+
+def _laneValue(val):
+    """ Return the lane value of a signal value """
+    if isinstance(val, EnumItemType):
+        return val._index
+    return int(val)
+
+
+def _fixer(obj):
+    """ Return a function that checks or wraps lane values of the type of
+    obj, or None if any value will do. """
+    if isinstance(obj, bool):
+        def fix(v):
+            bad = v[(v != 0) & (v != 1)]
+            if len(bad):
+                raise ValueError("Expected boolean value, got %s" % bad[0])
+            return v
+    elif isinstance(obj, modbv) and obj._min is not None and \
+            obj._max is not None:
+        lo = obj._min
+        span = obj._max - obj._min
+
+        def fix(v):
+            return (v - lo) % span + lo
+    elif isinstance(obj, intbv) and (obj._min is not None or
+                                     obj._max is not None):
+        # an intbv can be bounded on one side only
+        lo, hi = obj._min, obj._max
+
+        def fix(v):
+            if hi is not None:
+                bad = v[v >= hi]
+                if len(bad):
+                    raise ValueError("intbv value %s >= maximum %s" %
+                                     (bad[0], hi))
+            if lo is not None:
+                bad = v[v < lo]
+                if len(bad):
+                    raise ValueError("intbv value %s < minimum %s" %
+                                     (bad[0], lo))
+            return v
+    else:
+        return None
+    return fix
+
+
+def _setBit(old, val, mask, i):
+    """ Return old with bit i set to val, in the lanes of mask """
+    val = numpy.asarray(val, dtype=numpy.int64)
+    if mask is not None:
+        val = numpy.where(mask, val, (old >> i) & 1)
+    if ((val != 0) & (val != 1)).any():
+        raise ValueError("intbv[i] = v requires v in (0, 1)\n"
+                         "            i == %s " % i)
+    return (old & ~(1 << i)) | (val << i)
+
+
+def _setSlice(old, val, mask, i, j):
+    """ Return old with bits [i:j] set to val, in the lanes of mask """
+    val = numpy.asarray(val, dtype=numpy.int64)
+    if i is None:
+        q = old % (1 << j)
+        new = val * (1 << j) + q
+    else:
+        lim = 1 << (i - j)
+        if mask is not None:
+            val = numpy.where(mask, val, 0)
+        if ((val >= lim) | (val < -lim)).any():
+            raise ValueError("intbv[i:j] = v abs(v) too large\n"
+                             "            i, j == %s, %s" % (i, j))
+        new = (old & ~((lim - 1) << j)) | (val << j)
+    if mask is not None:
+        new = numpy.where(mask, new, old)
+    return new
+
+
+class _Translator(object):
+
+    """ Translate an analyzed block function into lane-parallel code.
+
+    Signal values are read from the lists _myhdl_V (current values) and
+    _myhdl_X (next values), and nonlocal intbv variables from _myhdl_R.
+    Local variables hold lane vectors, except for loop variables.
+
+    """
+
+    def __init__(self, tree, sim):
+        self.tree = tree
+        self.sim = sim
+        self.consts = {}
+        self.lines = []
+        self.outputs = []
+        self.labels = 0
+        self.loopvars = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.For) and isinstance(node.target, ast.Name):
+                self.loopvars.add(node.target.id)
+        self.vars = [n for n in tree.vardict if n not in self.loopvars]
+        self.regs = {}
+        for n, reg in tree.nonlocaldict.items():
+            self.regs[n] = sim._regIndex(reg)
+
+    def unsupported(self, node, what):
+        raise SimulationError(_error.NotSupported, "%s in %s, line %s" % (
+            what, self.tree.body[0].name,
+            getattr(node, 'lineno', 0) + self.tree.lineoffset))
+
+    def emit(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+    def label(self, prefix):
+        self.labels += 1
+        return '_myhdl_%s%d' % (prefix, self.labels)
+
+    def const(self, value, prefix='c'):
+        name = self.label(prefix)
+        self.consts[name] = value
+        return name
+
+    def obj(self, name):
+        if name in self.tree.symdict:
+            return self.tree.symdict[name]
+        return getattr(builtins, name, None)
+
+    def signal(self, node):
+        """ Return the signal that a name refers to, or None """
+        if isinstance(node, ast.Name) and node.id not in self.vars and \
+                node.id not in self.loopvars and node.id not in self.regs:
+            obj = self.obj(node.id)
+            if isinstance(obj, _Signal):
+                return obj
+            if _isListOfSigs(obj):
+                self.unsupported(node, "list of signals %s" % node.id)
+        return None
+
+    def value(self, node):
+        """ Return an object with the type of the value of a signal or
+        variable operand, or None """
+        if isinstance(node, ast.Attribute) and node.attr in ('next', 'val'):
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        if node.id in self.regs:
+            return self.tree.nonlocaldict[node.id]
+        elif node.id in self.vars:
+            return self.tree.vardict[node.id]
+        sig = self.signal(node)
+        return sig._init if sig is not None else None
+
+    def width(self, node):
+        """ Return the bit width of an unsigned operand, or 0 if unknown """
+        obj = self.value(node)
+        if isinstance(node, ast.Subscript):
+            key = self.key(node)
+            if self.value(node.value) is None:
+                return 0  # a table
+            if not isinstance(key, ast.Slice):
+                return 1
+            hi = self.static(key.lower)
+            lo = self.static(key.upper) if key.upper is not None else 0
+            if hi is not None and lo is not None:
+                return hi - lo
+        elif isinstance(node, ast.Constant) and isinstance(node.value, bool):
+            return 1
+        elif isinstance(node, (ast.Compare, ast.BoolOp)) or \
+                isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return 1
+        elif isinstance(node, ast.BinOp) and \
+                isinstance(node.op, (ast.BitAnd, ast.BitOr, ast.BitXor)):
+            left, right = self.width(node.left), self.width(node.right)
+            if left and right:
+                return max(left, right)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+                and self.obj(node.func.id) is concat:
+            widths = [self.width(arg) for arg in node.args]
+            if all(widths):
+                return sum(widths)
+        if isinstance(obj, bool):
+            return 1
+        if isinstance(obj, intbv) and obj._nrbits and obj._min >= 0:
+            return obj._nrbits
+        return 0
+
+    def bitvector(self, node):
+        """ Return the bit width of an operand that is an unsigned intbv,
+        as ~ and signed() need it, or 0 if it isn't one """
+        if isinstance(node, ast.Subscript) and \
+                isinstance(self.key(node), ast.Slice) or \
+                isinstance(node, ast.Call):
+            return self.width(node)
+        if isinstance(self.value(node), intbv):
+            return self.width(node)
+        return 0
+
+    def static(self, node):
+        """ Return the value of an expression without lane operands, or
+        None if it isn't known before the simulation. """
+        if node is None:
+            return None
+        src, lane = self.expr(node)
+        if lane:
+            return None
+        try:
+            return int(eval(src, dict(self.tree.symdict, **self.consts)))
+        except Exception:
+            return None
+
+    def key(self, node):
+        # note that a[hi:lo] is a slice with lower hi and upper lo
+        if isinstance(node.slice, getattr(ast, 'Index', ())):
+            return node.slice.value  # Python 3.8
+        return node.slice
+
+    def truth(self, node, src):
+        """ Return the truth value of a lane expression """
+        if isinstance(node, (ast.Compare, ast.BoolOp)) or \
+                isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return src
+        return '(%s != 0)' % src
+
+    # expressions; each one returns its source and whether it is a lane value
+
+    def expr(self, node):
+        method = getattr(self, 'expr' + type(node).__name__, None)
+        if method is None:
+            self.unsupported(node, "%s expression" % type(node).__name__)
+        return method(node)
+
+    def exprConstant(self, node):
+        value = node.value
+        if isinstance(value, (bool, int)):
+            return repr(int(value)), False
+        self.unsupported(node, "constant %r" % (value,))
+
+    def exprName(self, node):
+        n = node.id
+        if n in self.vars:
+            return n, True
+        if n in self.loopvars:
+            return n, False
+        if n in self.regs:
+            return '_myhdl_R[%d]' % self.regs[n], True
+        sig = self.signal(node)
+        if sig is not None:
+            return '_myhdl_V[%d]' % self.sim._sigIndex(sig), True
+        obj = self.obj(n)
+        if isinstance(obj, (bool, int, intbv, EnumItemType)):
+            return repr(_laneValue(obj)), False
+        self.unsupported(node, "reference to %s" % n)
+
+    def exprAttribute(self, node):
+        obj = getattr(node, 'obj', None)
+        if isinstance(obj, EnumItemType):
+            return repr(obj._index), False
+        sig = self.signal(node.value)
+        if sig is not None:
+            i = self.sim._sigIndex(sig)
+            if node.attr == 'next':
+                return '_myhdl_X[%d]' % i, True
+            elif node.attr == 'val':
+                return '_myhdl_V[%d]' % i, True
+            elif node.attr in ('min', 'max'):
+                return repr(getattr(sig, node.attr)), False
+        self.unsupported(node, "attribute %s" % node.attr)
+
+    def exprBinOp(self, node):
+        op = _binOps.get(type(node.op))
+        if op is None:
+            self.unsupported(node, "operator %s" % type(node.op).__name__)
+        left, llane = self.expr(node.left)
+        right, rlane = self.expr(node.right)
+        return '(%s %s %s)' % (left, op, right), llane or rlane
+
+    def exprUnaryOp(self, node):
+        src, lane = self.expr(node.operand)
+        if isinstance(node.op, ast.Not):
+            return ('(%s == 0)' if lane else '(not %s)') % src, lane
+        elif isinstance(node.op, ast.USub):
+            return '(-%s)' % src, lane
+        elif isinstance(node.op, ast.UAdd):
+            return src, lane
+        w = self.bitvector(node.operand)
+        if w:
+            return '(~%s & %d)' % (src, (1 << w) - 1), lane
+        return '(~%s)' % src, lane
+
+    def exprBoolOp(self, node):
+        values = [self.expr(v) for v in node.values]
+        if any(lane for __, lane in values):
+            op = ' & ' if isinstance(node.op, ast.And) else ' | '
+            return '(%s)' % op.join(self.truth(v, src) for v, (src, __) in
+                                    zip(node.values, values)), True
+        op = ' and ' if isinstance(node.op, ast.And) else ' or '
+        return '(%s)' % op.join(src for src, __ in values), False
+
+    def exprCompare(self, node):
+        ops = []
+        for op in node.ops:
+            if type(op) not in _cmpOps:
+                self.unsupported(node, "operator %s" % type(op).__name__)
+            ops.append(_cmpOps[type(op)])
+        operands = [self.expr(node.left)]
+        operands.extend(self.expr(c) for c in node.comparators)
+        if not any(lane for __, lane in operands):
+            src = operands[0][0]
+            for op, (right, __) in zip(ops, operands[1:]):
+                src += ' %s %s' % (op, right)
+            return '(%s)' % src, False
+        terms = []
+        for k, op in enumerate(ops):
+            terms.append('(%s %s %s)' % (operands[k][0], op, operands[k + 1][0]))
+        return '(%s)' % ' & '.join(terms), True
+
+    def exprIfExp(self, node):
+        test, tlane = self.expr(node.test)
+        body, blane = self.expr(node.body)
+        orelse, olane = self.expr(node.orelse)
+        if tlane:
+            return '_myhdl_where(%s, %s, %s)' % (
+                self.truth(node.test, test), body, orelse), True
+        return '(%s if %s else %s)' % (body, test, orelse), blane or olane
+
+    def exprSubscript(self, node):
+        value = node.value
+        key = self.key(node)
+        if isinstance(value, ast.Name) and self.signal(value) is None and \
+                value.id not in self.vars and value.id not in self.regs:
+            rom = self.obj(value.id)
+            if isinstance(rom, tuple) and not isinstance(key, ast.Slice):
+                table = self.const(numpy.array(rom, dtype=numpy.int64), 'rom')
+                index, lane = self.expr(key)
+                return '%s[%s]' % (table, index), lane
+        src, lane = self.expr(value)
+        if isinstance(key, ast.Slice):
+            if key.step is not None:
+                self.unsupported(node, "slice step")
+            lo, lolane = self.expr(key.upper) if key.upper else ('0', False)
+            lane = lane or lolane
+            if key.lower is None:
+                return '(%s >> %s)' % (src, lo), lane
+            hi, hilane = self.expr(key.lower)
+            w = self.width(node)
+            if w and lo == '0':
+                return '(%s & %d)' % (src, (1 << w) - 1), lane
+            elif w:
+                return '((%s >> %s) & %d)' % (src, lo, (1 << w) - 1), lane
+            return '((%s >> %s) & ((1 << (%s - %s)) - 1))' % (
+                src, lo, hi, lo), lane or hilane
+        index, ilane = self.expr(key)
+        return '((%s >> %s) & 1)' % (src, index), lane or ilane
+
+    def exprCall(self, node):
+        func = node.func
+        if node.keywords and not (isinstance(func, ast.Name) and
+                                  self.obj(func.id) in (intbv, modbv)):
+            self.unsupported(node, "keyword arguments")
+        if isinstance(func, ast.Attribute) and func.attr == 'signed' and \
+                not node.args:
+            src, lane = self.expr(func.value)
+            w = self.bitvector(func.value)
+            if w:
+                half = 1 << (w - 1)
+                src = '(((%s + %d) & %d) - %d)' % (src, half, 2 * half - 1, half)
+            return src, lane
+        f = self.obj(func.id) if isinstance(func, ast.Name) else None
+        args = node.args
+        if f in (int, intbv, modbv) and len(args) == 1:
+            return self.expr(args[0])
+        elif f is bool and len(args) == 1:
+            src, lane = self.expr(args[0])
+            return ('(%s != 0)' if lane else 'bool(%s)') % src, lane
+        elif f is abs and len(args) == 1:
+            src, lane = self.expr(args[0])
+            return '%s(%s)' % ('_myhdl_abs' if lane else 'abs', src), lane
+        elif f is len and len(args) == 1:
+            sig = self.signal(args[0])
+            if sig is not None:
+                return repr(len(sig)), False
+        elif f is concat and args:
+            terms = []
+            shift = 0
+            lanes = False
+            for arg in reversed(args):
+                src, lane = self.expr(arg)
+                lanes = lanes or lane
+                terms.append('(%s << %d)' % (src, shift) if shift else src)
+                w = self.width(arg)
+                if not w and arg is not args[0]:
+                    self.unsupported(node, "concat operand of unknown width")
+                shift += w
+            return '(%s)' % ' | '.join(reversed(terms)), lanes
+        self.unsupported(node, "function call")
+
+    # statements
+
+    def stmts(self, body, mask, indent):
+        start = len(self.lines)
+        for node in body:
+            method = getattr(self, 'stmt' + type(node).__name__, None)
+            if method is None:
+                self.unsupported(node, "%s statement" % type(node).__name__)
+            method(node, mask, indent)
+        if len(self.lines) == start:
+            self.emit(indent, 'pass')
+
+    def stmtPass(self, node, mask, indent):
+        pass
+
+    def stmtExpr(self, node, mask, indent):
+        if isinstance(node.value, ast.Constant) and \
+                isinstance(node.value.value, str):
+            return  # doc string
+        self.unsupported(node, "expression statement")
+
+    def stmtAssign(self, node, mask, indent):
+        if len(node.targets) != 1:
+            self.unsupported(node, "multiple assignment")
+        src, __ = self.expr(node.value)
+        self.assign(node.targets[0], src, mask, indent)
+
+    def stmtAugAssign(self, node, mask, indent):
+        target = node.target
+        if not isinstance(target, ast.Name):
+            self.unsupported(node, "augmented assignment")
+        value = ast.BinOp(left=ast.Name(id=target.id, ctx=ast.Load()),
+                          op=node.op, right=node.value)
+        src, __ = self.expr(ast.copy_location(value, node))
+        self.assign(target, src, mask, indent)
+
+    def assign(self, target, src, mask, indent):
+        if isinstance(target, ast.Name):
+            if target.id not in self.vars:
+                self.unsupported(target, "assignment to %s" % target.id)
+            self.setLanes(target.id, src, mask, None, indent)
+            return
+        if isinstance(target, ast.Attribute):
+            dst, fix = self.lvalue(target)
+            self.setLanes(dst, src, mask, fix, indent)
+            return
+        if not isinstance(target, ast.Subscript):
+            self.unsupported(target, "assignment target")
+        dst, fix = self.lvalue(target.value)
+        key = self.key(target)
+        m = mask or 'None'
+        if isinstance(key, ast.Slice):
+            if key.upper is None and key.lower is None:
+                self.setLanes(dst, src, mask, fix, indent)
+                return
+            hi = self.expr(key.lower)[0] if key.lower else 'None'
+            lo = self.expr(key.upper)[0] if key.upper else '0'
+            value = '_myhdl_setSlice(%s, %s, %s, %s, %s)' % (dst, src, m, hi, lo)
+        else:
+            value = '_myhdl_setBit(%s, %s, %s, %s)' % (
+                dst, src, m, self.expr(key)[0])
+        if fix is not None:
+            value = '%s(%s)' % (fix, value)
+        self.emit(indent, '%s = %s' % (dst, value))
+
+    def lvalue(self, node):
+        """ Return the destination of an assignment and its fixer name """
+        if isinstance(node, ast.Attribute) and node.attr == 'next':
+            sig = self.signal(node.value)
+            if sig is not None:
+                i = self.sim._sigIndex(sig)
+                if i not in self.outputs:
+                    self.outputs.append(i)
+                fix = self.sim._fix[i] and '_myhdl_fix[%d]' % i
+                return '_myhdl_X[%d]' % i, fix
+        elif isinstance(node, ast.Name) and node.id in self.regs:
+            k = self.regs[node.id]
+            return '_myhdl_R[%d]' % k, self.sim._regFix[k] and '_myhdl_regFix[%d]' % k
+        elif isinstance(node, ast.Name) and node.id in self.vars:
+            fix = _fixer(self.tree.vardict[node.id])
+            return node.id, fix and self.const(fix, 'fix')
+        self.unsupported(node, "assignment target")
+
+    def setLanes(self, dst, src, mask, fix, indent):
+        if mask is None:
+            value = '_myhdl_lane(%s)' % src
+        else:
+            value = '_myhdl_where(%s, %s, %s)' % (mask, src, dst)
+        if fix is not None:
+            value = '%s(%s)' % (fix, value)
+        self.emit(indent, '%s = %s' % (dst, value))
+
+    def stmtIf(self, node, mask, indent):
+        test, lane = self.expr(node.test)
+        if not lane:
+            self.emit(indent, 'if %s:' % test)
+            self.stmts(node.body, mask, indent + 1)
+            if node.orelse:
+                self.emit(indent, 'else:')
+                self.stmts(node.orelse, mask, indent + 1)
+            return
+        # run each branch for the lanes that take it
+        cond = self.label('c')
+        self.emit(indent, '%s = %s' % (cond, self.truth(node.test, test)))
+        for body, m in ((node.body, cond), (node.orelse, '~' + cond)):
+            if not body:
+                continue
+            bmask = self.label('m')
+            if mask is not None:
+                m = '%s & %s' % (mask, m)
+            self.emit(indent, '%s = %s' % (bmask, m))
+            self.emit(indent, 'if %s.any():' % bmask)
+            self.stmts(body, bmask, indent + 1)
+
+    def stmtFor(self, node, mask, indent):
+        it = node.iter
+        if node.orelse or not isinstance(node.target, ast.Name) or \
+                not isinstance(it, ast.Call) or not isinstance(it.func, ast.Name):
+            self.unsupported(node, "for loop")
+        args = [self.expr(arg) for arg in it.args]
+        if any(lane for __, lane in args):
+            self.unsupported(node, "for loop over lane values")
+        self.emit(indent, 'for %s in %s(%s):' % (
+            node.target.id, it.func.id, ', '.join(src for src, __ in args)))
+        self.stmts(node.body, mask, indent + 1)
+
+    def function(self, masked):
+        """ Return the translated function, and the signals it assigns.
+
+        masked -- if set, the function takes a mask of the lanes to run
+
+        """
+        funcdef = self.tree.body[0]
+        mask = '_myhdl_m' if masked else None
+        self.lines = []
+        self.emit(0, 'def %s(%s):' % (funcdef.name, mask or ''))
+        for n in self.vars:
+            self.emit(1, '%s = _myhdl_zero' % n)
+        self.stmts(funcdef.body, mask, 1)
+        namespace = dict(self.tree.symdict)
+        namespace.update(self.consts)
+        namespace.update(self.sim._namespace)
+        code = compile('\n'.join(self.lines) + '\n',
+                       '<batch %s>' % funcdef.name, 'exec')
+        exec(code, namespace)
+        return namespace[funcdef.name], self.outputs
+
+
+class BatchSimulation(object):
+
+    """ Batch simulation of a single clock synchronous design.
+
+    Every signal holds a value per lane. Assigning to an item sets a
+    signal for all lanes, and indexing returns its values as an array.
+
+    """
+
+    def __init__(self, *args, lanes):
+        """ Construct a batch simulation object.
+
+        *args -- list of arguments. Each argument is an always_seq, always
+                 or always_comb block, or a nested sequence of them.
+        lanes -- number of lanes
+
+        """
+        if numpy is None:
+            raise ImportError(_error.Numpy)
+        from myhdl.conversion._analyze import _analyzeGens
+        arglist = _flatten(*args)
+        __, combs, edge = _checkDesign(arglist)
+        seqs = [arg for arg in arglist
+                if isinstance(arg, _Always) and not isinstance(arg, _AlwaysComb)]
+        self.lanes = lanes
+        self._shape = (lanes,)
+        self._index = {}
+        self._V = []
+        self._X = []
+        self._fix = []
+        self._regs = {}
+        self._R = []
+        self._regFix = []
+        self._namespace = {
+            '_myhdl_V': self._V, '_myhdl_X': self._X, '_myhdl_R': self._R,
+            '_myhdl_fix': self._fix, '_myhdl_regFix': self._regFix,
+            '_myhdl_where': numpy.where, '_myhdl_abs': numpy.abs,
+            '_myhdl_lane': self._lane, '_myhdl_zero': self._lane(0),
+            '_myhdl_setBit': _setBit, '_myhdl_setSlice': _setSlice}
+        self._clock = self._sigIndex(edge.sig)
+        self._active = int(isinstance(edge, _PosedgeWaiterList))
+
+        # the analyzer marks signals as driven and read for conversion
+        blocks = seqs + combs
+        marks = []
+        for b in blocks:
+            for s in b.sigdict.values():
+                marks.append((s, s._driven, s._read))
+                s._driven = None
+        try:
+            trees = _analyzeGens(blocks, {})
+        finally:
+            for s, driven, read in marks:
+                s._driven, s._read = driven, read
+        trees = dict(zip(map(id, blocks), trees))
+
+        self._seqs = []
+        self._seqOutputs = []
+        for b in seqs:
+            t = _Translator(trees[id(b)], self)
+            func, outputs = t.function(masked=False)
+            if isinstance(b, _AlwaysSeq) and b.reset is not None:
+                mfunc, __ = t.function(masked=True)
+                func = self._resetFunc(b, t, func, mfunc)
+            self._seqs.append(func)
+            self._seqOutputs.extend(i for i in outputs
+                                    if i not in self._seqOutputs)
+        order, __ = _sortBlocks(combs)
+        self._combs = []
+        self._clockRead = False
+        for k in order:
+            tree = trees[id(combs[k])]
+            func, outputs = _Translator(tree, self).function(masked=False)
+            self._combs.append((func, outputs))
+            self._clockRead |= any(tree.sigdict.get(n) is edge.sig
+                                   for n in tree.inputs)
+        self._dirty = True
+
+    def _lane(self, val):
+        val = numpy.asarray(val, dtype=numpy.int64)
+        if val.shape != self._shape:
+            val = numpy.broadcast_to(val, self._shape)
+        return val
+
+    def _sigIndex(self, sig):
+        i = self._index.get(id(sig))
+        if i is None:
+            init = sig._init
+            if not isinstance(init, (bool, int, intbv, EnumItemType)) or \
+                    isinstance(init, intbv) and sig._nrbits > 63:
+                raise SimulationError(_error.SignalType, repr(sig))
+            i = self._index[id(sig)] = len(self._V)
+            val = self._lane(_laneValue(init))
+            self._V.append(val)
+            self._X.append(val)
+            self._fix.append(_fixer(init))
+        return i
+
+    def _regIndex(self, reg):
+        k = self._regs.get(id(reg))
+        if k is None:
+            k = self._regs[id(reg)] = len(self._R)
+            self._R.append(self._lane(int(reg)))
+            self._regFix.append(_fixer(reg))
+        return k
+
+    def _resetFunc(self, block, translator, func, mfunc):
+        """ Return a function that runs a sequential block with a
+        synchronous reset, resetting the lanes in which it is active. """
+        V, X, R = self._V, self._X, self._R
+        reset = self._sigIndex(block.reset)
+        active = int(block.reset.active)
+        sigregs = [(self._sigIndex(s), _laneValue(s._init))
+                   for s in block.sigregs]
+        varregs = [(self._regIndex(reg), init)
+                   for __, reg, init in block.varregs]
+        for i, __ in sigregs:
+            if i not in translator.outputs:
+                translator.outputs.append(i)
+
+        def seq():
+            r = V[reset] == active
+            if not r.any():
+                func()
+                return
+            for i, init in sigregs:
+                X[i] = numpy.where(r, init, X[i])
+            for k, init in varregs:
+                R[k] = numpy.where(r, init, R[k])
+            m = ~r
+            if m.any():
+                mfunc(m)
+
+        return seq
+
+    def _settle(self):
+        V, X = self._V, self._X
+        for func, outputs in self._combs:
+            func()
+            for i in outputs:
+                V[i] = X[i]
+        self._dirty = False
+
+    def _setClock(self, level):
+        i = self._clock
+        if self._clockRead and self._V[i][0] != level:
+            self._V[i] = self._X[i] = self._lane(level)
+            self._dirty = True
+
+    def run(self, cycles=1):
+        """ Run the simulation for a number of clock cycles.
+
+        cycles -- number of clock cycles (default: 1)
+
+        """
+        V, X = self._V, self._X
+        for __ in range(cycles):
+            self._setClock(not self._active)
+            if self._dirty:
+                self._settle()
+            self._setClock(self._active)
+            for seq in self._seqs:
+                seq()
+            for i in self._seqOutputs:
+                V[i] = X[i]
+            self._settle()
+
+    def __getitem__(self, sig):
+        i = self._index.get(id(sig))
+        if i is None:
+            raise SimulationError(_error.Signal, repr(sig))
+        if self._dirty:
+            self._settle()
+        return numpy.array(self._V[i])
+
+    def __setitem__(self, sig, values):
+        i = self._index.get(id(sig))
+        if i is None:
+            raise SimulationError(_error.Signal, repr(sig))
+        if isinstance(values, EnumItemType):
+            values = values._index
+        values = numpy.asarray(values, dtype=numpy.int64)
+        if values.shape not in ((), self._shape):
+            raise ValueError(_error.Lanes)
+        values = numpy.array(numpy.broadcast_to(values, self._shape))
+        if self._fix[i] is not None:
+            values = self._fix[i](values)
+        self._V[i] = self._X[i] = values
+        self._dirty = True
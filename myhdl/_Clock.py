@@ -0,0 +1,93 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module that provides the Clock class. """
+from myhdl._intbv import intbv
+from myhdl._Signal import _Signal
+from myhdl._simulator import _state
+
+
+class _error:
+    pass
+
+
+_error.SigType = "Clock signal should be a bool or single bit signal"
+_error.TimeType = "Clock %s should be a natural integer"
+_error.Period = "Clock period should be at least 2"
+_error.Duty = "Clock duty cycle leaves no high or low time"
+
+
+class Clock(object):
+
+    """ Clock that the simulator toggles without a generator.
+
+    The edges of the clock are future events of the simulation, that
+    change the signal at the start of their time step, before any
+    process runs. Edge waiters and waveform tracing work as for other
+    signals.
+    """
+
+    def __init__(self, sig, period, phase=0, duty=0.5):
+        """ Construct a clock.
+
+        sig -- the clock signal, with a bool or single bit value
+        period -- the clock period
+        phase -- the time the waveform is shifted by (default: 0)
+        duty -- the high fraction of the period (default: 0.5)
+
+        The signal keeps its initial value for phase plus its low or
+        high time, and toggles after that.
+        """
+        if not isinstance(sig, _Signal):
+            raise TypeError(_error.SigType)
+        val = sig._val
+        if isinstance(val, bool):
+            self._values = (False, True)
+        elif isinstance(val, intbv) and sig._nrbits == 1:
+            self._values = (0, 1)
+        else:
+            raise TypeError(_error.SigType)
+        for name, t in (('period', period), ('phase', phase)):
+            if not isinstance(t, int) or t < 0:
+                raise TypeError(_error.TimeType % name)
+        if period < 2:
+            raise ValueError(_error.Period)
+        high = int(round(period * duty))
+        if not 0 < high < period:
+            raise ValueError(_error.Duty)
+        self.sig = sig
+        self.period = period
+        self.phase = phase
+        self.duty = duty
+        self.name = None
+        # time until the next edge, indexed by the current value
+        self._times = (period - high, high)
+
+    def _start(self, futureEvents):
+        futureEvents.schedule(self.phase + self._times[bool(self.sig._val)],
+                              self)
+
+    def apply(self):
+        """ Toggle the signal, schedule the next edge, return the waiters """
+        sig = self.sig
+        val = not sig._val
+        sig._setNextVal(self._values[val])
+        context = _state.context
+        context._futureEvents.schedule(context._time + self._times[val], self)
+        return sig._update()
@@ -0,0 +1,258 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module that provides the cycle-based simulation engine.
+
+A design that consists of always_seq and always blocks on a single
+clock edge, plus always_comb logic without loops, can be simulated
+cycle by cycle: the combinational logic is evaluated once per cycle in
+topological order, and the registers are committed in bulk at the clock
+edge. No waiters are involved.
+
+"""
+from myhdl import StopSimulation, SimulationError
+from myhdl import _simulator
+from myhdl._Signal import _Signal, _WaiterList, _PosedgeWaiterList
+from myhdl._ShadowSignal import _ShadowSignal
+from myhdl._SignalArray import SignalArray
+from myhdl._always_comb import _AlwaysComb
+from myhdl._always_seq import _AlwaysSeq
+from myhdl._always import _Always
+from myhdl._levelize import _outputs, _sortBlocks
+from myhdl._util import _printExcInfo
+from myhdl._Simulation import (Simulation, _clearSiglist, _flatten,
+                               _hookFunc, _newHooks)
+from myhdl import _Simulation
+
+
+class _error:
+    pass
+
+
+_error.ArgType = "cycle-based simulation only supports always_seq, " \
+                 "always and always_comb blocks"
+_error.Clock = "cycle-based simulation requires a single clock edge"
+_error.AsyncReset = "cycle-based simulation does not support asynchronous resets"
+_error.CombLoop = "cycle-based simulation does not support combinational loops"
+_error.SignalType = "cycle-based simulation does not support delayed or shadow signals"
+_error.SignalArray = "cycle-based simulation does not support SignalArray memories"
+
+
+class _CycleSimulation(Simulation):
+
+    """ Cycle-based simulation of a single clock synchronous design.
+
+    Each cycle takes period time units: the clock is set to its inactive
+    level at the start of the cycle, and makes its active edge after half
+    a period.
+
+    The on_timestep, on_commit and on_suspend kernel hooks are supported;
+    there are no delta cycles, so on_delta hooks are not called.
+
+    """
+
+    def __init__(self, *args, period=10):
+        """ Construct a cycle-based simulation object.
+
+        *args -- list of arguments. Each argument is an always_seq, always
+                 or always_comb block, or a nested sequence of them.
+        period -- clock period in time units (default: 10)
+
+        """
+        arglist = _flatten(*args)
+        seqs, combs, edge = _checkDesign(arglist)
+        context = self._context = _simulator._context()
+        if context._simulation is not None:
+            raise SimulationError(_Simulation._error.MultipleSim)
+        context._simulation = self
+        context._time = 0
+        _clearSiglist(context._siglist)
+        self._cosims = []
+        self._finished = False
+        self._runs = 0
+        self.profile = None
+        self._hooks = _newHooks()
+        self._onTimestep = self._onCommit = None
+        self._clock = edge.sig
+        self._active = isinstance(edge, _PosedgeWaiterList)
+        self._period = period
+        self._t = 0
+        self._seqs = seqs
+        order, __ = _sortBlocks(combs)
+        self._funcs = [combs[i].func for i in order]
+        readers = {}
+        for k, i in enumerate(order):
+            for s in combs[i].senslist:
+                readers.setdefault(id(s), []).append(k)
+        self._readers = readers
+        self._dirty = [True] * len(order)
+
+    def _commit(self):
+        """ Update the signals in the siglist and mark their readers. """
+        readers = self._readers
+        dirty = self._dirty
+        siglist = self._context._siglist
+        if self._onCommit is None:
+            for s in siglist:
+                if s._val != s._next:
+                    s._update()
+                    for k in readers.get(id(s), ()):
+                        dirty[k] = True
+                else:
+                    s._pending = False
+        else:
+            changed = []
+            for s in siglist:
+                if s._val != s._next:
+                    s._update()
+                    changed.append(s)
+                    for k in readers.get(id(s), ()):
+                        dirty[k] = True
+                else:
+                    s._pending = False
+            if changed:
+                self._onCommit(changed)
+        del siglist[:]
+
+    def _settle(self):
+        """ Evaluate the combinational logic in topological order. """
+        funcs = self._funcs
+        dirty = self._dirty
+        self._commit()
+        for k, func in enumerate(funcs):
+            if dirty[k]:
+                dirty[k] = False
+                func()
+                self._commit()
+
+    def _advance(self, t):
+        context = self._context
+        if t != context._time:
+            context._time = t
+            if context._tracing:
+                print("#%s" % t, file=context._tf)
+            if self._onTimestep is not None:
+                self._onTimestep(t)
+
+    def run(self, cycles=None, quiet=0):
+        """ Run the simulation for a number of clock cycles.
+
+        cycles -- number of clock cycles (default: forever)
+        quiet -- don't print StopSimulation messages (default: off)
+
+        """
+        if self._finished:
+            raise StopSimulation("Simulation has already finished")
+        self._runs += 1
+        clock = self._clock
+        active = self._active
+        half = self._period // 2
+        seqs = self._seqs
+        context = self._context
+        self._onTimestep = _hookFunc(self._hooks['on_timestep'])
+        self._onCommit = _hookFunc(self._hooks['on_commit'])
+        n = 0
+        try:
+            with context:
+                while cycles is None or n < cycles:
+                    t = self._t
+                    self._advance(t)
+                    clock.next = not active
+                    self._settle()
+                    self._advance(t + half)
+                    clock.next = active
+                    self._commit()
+                    for seq in seqs:
+                        seq()
+                    self._settle()
+                    self._t = t + self._period
+                    n += 1
+        except StopSimulation:
+            if not quiet:
+                _printExcInfo()
+            self._finalize()
+            return 0
+        except Exception:
+            self._finalize()
+            raise
+        if context._tracing:
+            context._tf.flush()
+        for func in self._hooks['on_suspend']:
+            func()
+        return 1
+
+
+def _seqFunc(block):
+    """ Return a function that runs a sequential block at the clock edge """
+    if not isinstance(block, _AlwaysSeq) or block.reset is None:
+        return block.func
+    reset = block.reset
+    func = block.func
+    reset_sigs = block.reset_sigs
+    reset_vars = block.reset_vars
+
+    def seq():
+        if reset == reset.active:
+            reset_sigs()
+            reset_vars()
+        else:
+            func()
+
+    return seq
+
+
+def _checkDesign(arglist):
+    """ Check that a design can be simulated cycle by cycle.
+
+    Return the functions to run at the clock edge, the always_comb
+    blocks, and the clock edge.
+
+    """
+    seqs = []
+    combs = []
+    edges = []
+    for arg in arglist:
+        if isinstance(arg, _AlwaysComb):
+            if _outputs(arg) is None:
+                raise SimulationError(_error.SignalType, arg.name)
+            combs.append(arg)
+        elif isinstance(arg, _Always):
+            senslist = arg.senslist
+            if len(senslist) != 1 or not isinstance(senslist[0], _WaiterList):
+                if isinstance(arg, _AlwaysSeq):
+                    raise SimulationError(_error.AsyncReset, arg.name)
+                raise SimulationError(_error.Clock, arg.name)
+            edges.append(senslist[0])
+            seqs.append(_seqFunc(arg))
+        else:
+            raise SimulationError(_error.ArgType, repr(arg))
+    if not edges or any(e is not edges[0] for e in edges):
+        raise SimulationError(_error.Clock)
+    order, __ = _sortBlocks(combs)
+    if len(order) < len(combs):
+        raise SimulationError(_error.CombLoop)
+    for b in combs + [arg for arg in arglist if isinstance(arg, _Always)]:
+        for s in b.sigdict.values():
+            if type(s)._update is not _Signal._update or \
+                    isinstance(s, _ShadowSignal) or hasattr(s, '_waiter'):
+                raise SimulationError(_error.SignalType, repr(s))
+        for s in b.losdict.values():
+            if isinstance(s, SignalArray):
+                raise SimulationError(_error.SignalArray, repr(s))
+    return seqs, combs, edges[0]
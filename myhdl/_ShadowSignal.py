@@ -23,11 +23,11 @@
 
 import warnings
 from copy import deepcopy
+from functools import partial
 
 from myhdl._Signal import _Signal
-from myhdl._Waiter import _SignalWaiter, _SignalTupleWaiter
 from myhdl._intbv import intbv
-from myhdl._simulator import _siglist
+from myhdl._simulator import _state
 from myhdl._bin import bin
 
 # shadow signals
@@ -47,9 +47,17 @@ class _ShadowSignal(_Signal):
         raise AttributeError("ShadowSignals are readonly")
 
 
+def _addShadow(sig, refresh):
+    # refresh is called when sig changes
+    if sig._shadows:
+        sig._shadows.append(refresh)
+    else:
+        sig._shadows = [refresh]
+
+
 class _SliceSignal(_ShadowSignal):
 
-    __slots__ = ('_sig', '_left', '_right')
+    __slots__ = ('_sig', '_left', '_right', '_mask')
 
     def __init__(self, sig, left, right=None):
         # XXX error checks
@@ -61,11 +69,13 @@ class _SliceSignal(_ShadowSignal):
         sig._read = True
         self._left = left
         self._right = right
+        self._mask = None
         if right is None:
-            gen = self._genfuncIndex()
+            _addShadow(sig, self._refreshIndex)
         else:
-            gen = self._genfuncSlice()
-        self._waiter = _SignalWaiter(gen)
+            if self._nrbits:
+                self._mask = (1 << self._nrbits) - 1
+            _addShadow(sig, self._refreshSlice)
 
     def __repr__(self):
         if self._right is None:
@@ -73,19 +83,24 @@ class _SliceSignal(_ShadowSignal):
         else:
             return repr(self._sig) + '({}, {})'.format(self._left, self._right)
 
-    def _genfuncIndex(self):
-        sig, index = self._sig, self._left
-        set_next = _Signal.next.fset
-        while 1:
-            set_next(self, sig[index])
-            yield sig
-
-    def _genfuncSlice(self):
-        sig, left, right = self._sig, self._left, self._right
-        set_next = _Signal.next.fset
-        while 1:
-            set_next(self, sig[left:right])
-            yield sig
+    def _refreshIndex(self):
+        val = self._sig._val[self._left]
+        if val != self._next:
+            self._next = val
+            if not self._pending:
+                self._pending = True
+                _state.siglist.append(self)
+
+    def _refreshSlice(self):
+        val = self._sig._val._val >> self._right
+        if self._mask is not None:
+            val &= self._mask
+        next = self._next
+        if val != next._val:
+            next._val = val
+            if not self._pending:
+                self._pending = True
+                _state.siglist.append(self)
 
     def _setName(self, hdl):
         # if we depend on a ShadowSignal ourselves
@@ -178,32 +193,34 @@ class ConcatSignal(_ShadowSignal):
         self._initval = val
         ini = intbv(val)[nrbits:]
         _ShadowSignal.__init__(self, ini)
-        gen = self.genfunc()
-        self._waiter = _SignalTupleWaiter(gen)
-
-    def genfunc(self):
-        set_next = _Signal.next.fset
-        args = self._args
-        sigargs = self._sigargs
-        nrbits = self._nrbits
-        newval = intbv(self._initval)[nrbits:]
-        while 1:
-            hi = nrbits
-            for a in args:
-                if isinstance(a, bool):
-                    w = 1
-                else:
-                    w = len(a)
-                lo = hi - w
-                # note: 'a in sigargs' is equivalence check, not identity
-                if isinstance(a, _Signal):
-                    if isinstance(a._val, intbv):
-                        newval[hi:lo] = a[w:]
-                    else:
-                        newval[hi:lo] = a
-                hi = lo
-            set_next(self, newval)
-            yield sigargs
+        # the fields of each signal argument, refreshed when it changes
+        fields = {}
+        hi = nrbits
+        for a in args:
+            if isinstance(a, bool):
+                w = 1
+            else:
+                w = len(a)
+            lo = hi - w
+            if isinstance(a, _Signal):
+                fields.setdefault(id(a), (a, []))[1].append((lo, (1 << w) - 1))
+            hi = lo
+        for a, positions in fields.values():
+            _addShadow(a, partial(self._refresh, a, tuple(positions)))
+
+    def _refresh(self, sig, positions):
+        v = sig._val
+        if isinstance(v, intbv):
+            v = v._val
+        next = self._next
+        val = next._val
+        for lo, mask in positions:
+            val = val & ~(mask << lo) | (v & mask) << lo
+        if val != next._val:
+            next._val = val
+            if not self._pending:
+                self._pending = True
+                _state.siglist.append(self)
 
     def _markRead(self):
         self._read = True
@@ -360,37 +377,48 @@ def TristateSignal(val):
 
 class _TristateSignal(_ShadowSignal):
 
-    __slots__ = ('_drivers', '_orival')
+    __slots__ = ('_drivers', '_orival', '_active')
 
     def __init__(self, val):
         self._drivers = []
+        # the drivers with a value other than None
+        self._active = {}
         # construct normally to set type / size info right
         _ShadowSignal.__init__(self, val)
         self._orival = deepcopy(val)  # keep for drivers
         # reset signal values to None
         self._next = self._val = self._init = None
-        self._waiter = _SignalTupleWaiter(self._resolve())
 
     def driver(self):
         d = _TristateDriver(self)
         self._drivers.append(d)
+        _addShadow(d, partial(self._driverChanged, d))
         return d
 
-    def _resolve(self):
-        # set_next = _ShadowSignal._set_next
-        senslist = self._drivers
-        while 1:
-            yield senslist
-            res = None
-            for d in senslist:
-                if res is None:
-                    res = d._val
-                elif d._val is not None:
-                    warnings.warn("Bus contention", category=BusContentionWarning)
-                    res = None
-                    break
-            self._next = res
-            _siglist.append(self)
+    def _driverChanged(self, d):
+        if d._val is None:
+            self._active.pop(id(d), None)
+        else:
+            self._active[id(d)] = d
+        if not self._pending:
+            self._pending = True
+            _state.siglist.append(self)
+
+    def _update(self):
+        # resolve once per delta cycle, after the drivers changed
+        active = self._active
+        if len(active) == 1:
+            for d in active.values():
+                self._next = d._val
+        else:
+            if active:
+                warnings.warn("Bus contention", category=BusContentionWarning)
+            self._next = None
+        return _Signal._update(self)
+
+    def _clear(self):
+        _Signal._clear(self)
+        self._active.clear()
 
     def toVerilog(self):
         lines = []
@@ -427,10 +455,14 @@ class _TristateDriver(_Signal):
         if val is None:
             self._next = None
         else:
-            # restore original value to cater for intbv handler
-            self._next = self._sig._orival
+            if self._next is None:
+                # restore original value to cater for intbv handler; each
+                # driver needs its own copy
+                self._next = deepcopy(self._sig._orival)
             self._setNextVal(val)
-        _siglist.append(self)
+        if not self._pending:
+            self._pending = True
+            _state.siglist.append(self)
 
     def __repr__(self):
         return "_TristateDriver(" + repr(self._val) + ")"
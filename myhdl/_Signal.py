@@ -26,19 +26,16 @@ posedge -- callable to model a rising edge on a signal in a yield statement
 negedge -- callable to model a falling edge on a signal in a yield statement
 
 """
+from collections import deque
 from copy import copy, deepcopy
 
 from myhdl import _simulator as sim
-from myhdl._simulator import _futureEvents
-from myhdl._simulator import _siglist
-from myhdl._simulator import _signals
+from myhdl._simulator import _state
 from myhdl._intbv import intbv
 from myhdl._bin import bin
 
 # from myhdl._enum import EnumItemType
 
-_schedule = _futureEvents.append
-
 
 def _isListOfSigs(obj):
     """ Check if obj is a non-empty list of signals. """
@@ -51,8 +48,33 @@ def _isListOfSigs(obj):
         return False
 
 
+# returned by _update when no waiters need to run
+_noWaiters = ()
+
+# initial values are never modified, so signals with equal ones can share
+# a single copy; the cache is bounded for designs with many distinct values
+_initCache = {}
+_initCacheSize = 4096
+
+
+def _sharedInit(val):
+    """ Return a copy of an initial value that may be shared. """
+    if not isinstance(val, intbv) or hasattr(val, '__dict__'):
+        # immutable values are their own copy; other objects are not shared
+        return deepcopy(val)
+    key = (type(val), val._val, val._min, val._max, val._nrbits)
+    init = _initCache.get(key)
+    if init is None:
+        init = deepcopy(val)
+        if len(_initCache) < _initCacheSize:
+            _initCache[key] = init
+    return init
+
+
 class _WaiterList(list):
 
+    __slots__ = ()
+
     def purge(self):
         if self:
             self[:] = [w for w in self if not w.hasRun]
@@ -60,6 +82,8 @@ class _WaiterList(list):
 
 class _PosedgeWaiterList(_WaiterList):
 
+    __slots__ = ('sig',)
+
     def __init__(self, sig):
         self.sig = sig
 
@@ -72,6 +96,8 @@ class _PosedgeWaiterList(_WaiterList):
 
 class _NegedgeWaiterList(_WaiterList):
 
+    __slots__ = ('sig',)
+
     def __init__(self, sig):
         self.sig = sig
 
@@ -94,12 +120,14 @@ def negedge(sig):
 # signal factory function
 
 
-def Signal(val=None, delay=None):
+def Signal(val=None, delay=None, transport=False):
     """ Return a new _Signal (default or delay 0) or DelayedSignal """
     if delay is not None:
         if delay < 0:
             raise TypeError("Signal: delay should be >= 0")
-        return _DelayedSignal(val, delay)
+        return _DelayedSignal(val, delay, transport)
+    elif transport:
+        raise TypeError("Signal: transport requires a delay")
     else:
         return _Signal(val)
 
@@ -120,7 +148,7 @@ class _Signal(object):
                  '_setNextVal', '_copyVal2Next', '_printVcd',
                  '_driven', '_read', '_name', '_used', '_inList',
                  '_waiter', 'toVHDL', 'toVerilog', '_slicesigs',
-                 '_numeric'
+                 '_numeric', '_pending', '_spareWaiters', '_shadows'
                  )
 
     def __init__(self, val=None):
@@ -129,7 +157,7 @@ class _Signal(object):
         val -- initial value
 
         """
-        self._init = deepcopy(val)
+        self._init = _sharedInit(val)
         self._val = deepcopy(val)
         self._next = deepcopy(val)
         self._min = self._max = None
@@ -166,17 +194,26 @@ class _Signal(object):
             if hasattr(val, '_nrbits'):
                 self._nrbits = val._nrbits
         self._eventWaiters = _WaiterList()
-        self._posedgeWaiters = _PosedgeWaiterList(self)
-        self._negedgeWaiters = _NegedgeWaiterList(self)
+        # the other waiter lists, the slice signals and the shadow signal
+        # refresh functions are only created when they are needed
+        self._spareWaiters = None
+        self._pending = False
+        self._posedgeWaiters = self._negedgeWaiters = _noWaiters
         self._code = ""
-        self._slicesigs = []
+        self._slicesigs = ()
+        self._shadows = ()
         self._tracing = 0
-        _signals.append(self)
+        _state.context._signals.append(self)
 
     def _clear(self):
         del self._eventWaiters[:]
-        del self._posedgeWaiters[:]
-        del self._negedgeWaiters[:]
+        if self._spareWaiters is not None:
+            del self._spareWaiters[:]
+        self._pending = False
+        if self._posedgeWaiters:
+            del self._posedgeWaiters[:]
+        if self._negedgeWaiters:
+            del self._negedgeWaiters[:]
         self._val = deepcopy(self._init)
         self._next = deepcopy(self._init)
         self._name = self._driven = None
@@ -187,16 +224,29 @@ class _Signal(object):
             s._clear()
 
     def _update(self):
+        self._pending = False
         val, next = self._val, self._next
         if val != next:
-            waiters = self._eventWaiters[:]
-            del self._eventWaiters[:]
+            # swap the event waiter list with the spare one; the caller
+            # consumes the returned list before the next update
+            waiters = self._eventWaiters
+            spare = self._spareWaiters
+            if spare is None:
+                spare = _WaiterList()
+            else:
+                del spare[:]
+            self._eventWaiters = spare
+            self._spareWaiters = waiters
             if not val and next:
-                waiters.extend(self._posedgeWaiters[:])
-                del self._posedgeWaiters[:]
+                edgeWaiters = self._posedgeWaiters
+                if edgeWaiters:
+                    waiters.extend(edgeWaiters)
+                    del edgeWaiters[:]
             elif not next and val:
-                waiters.extend(self._negedgeWaiters[:])
-                del self._negedgeWaiters[:]
+                edgeWaiters = self._negedgeWaiters
+                if edgeWaiters:
+                    waiters.extend(edgeWaiters)
+                    del edgeWaiters[:]
             if next is None:
                 self._val = None
             elif isinstance(val, intbv):
@@ -207,9 +257,13 @@ class _Signal(object):
                 self._val = deepcopy(next)
             if self._tracing:
                 self._printVcd()
+            if self._shadows:
+                # shadow signals follow in the same delta cycle
+                for refresh in self._shadows:
+                    refresh()
             return waiters
         else:
-            return []
+            return _noWaiters
 
     # support for the 'val' attribute
     @property
@@ -221,7 +275,9 @@ class _Signal(object):
     def next(self):
         #        if self._next is self._val:
         #            self._next = deepcopy(self._val)
-        _siglist.append(self)
+        if not self._pending:
+            self._pending = True
+            _state.siglist.append(self)
         return self._next
 
     @next.setter
@@ -229,17 +285,25 @@ class _Signal(object):
         if isinstance(val, _Signal):
             val = val._val
         self._setNextVal(val)
-        _siglist.append(self)
+        if not self._pending:
+            self._pending = True
+            _state.siglist.append(self)
 
     # support for the 'posedge' attribute
     @property
     def posedge(self):
-        return self._posedgeWaiters
+        waiters = self._posedgeWaiters
+        if waiters is _noWaiters:
+            waiters = self._posedgeWaiters = _PosedgeWaiterList(self)
+        return waiters
 
     # support for the 'negedge' attribute
     @property
     def negedge(self):
-        return self._negedgeWaiters
+        waiters = self._negedgeWaiters
+        if waiters is _noWaiters:
+            waiters = self._negedgeWaiters = _NegedgeWaiterList(self)
+        return waiters
 
     # support for the 'min' and 'max' attribute
     @property
@@ -337,7 +401,10 @@ class _Signal(object):
     ### use call interface for shadow signals ###
     def __call__(self, left, right=None):
         s = _SliceSignal(self, left, right)
-        self._slicesigs.append(s)
+        if self._slicesigs:
+            self._slicesigs.append(s)
+        else:
+            self._slicesigs = [s]
         return s
 
     ### operators for which delegation to current value is appropriate ###
@@ -587,46 +654,114 @@ class _Signal(object):
 
 class _DelayedSignal(_Signal):
 
-    __slots__ = ('_nextZ', '_delay', '_timeStamp',
+    __slots__ = ('_delay', '_transport', '_queue', '_event', '_scheduled',
                  )
 
-    def __init__(self, val=None, delay=1):
+    def __init__(self, val=None, delay=1, transport=False):
         """ Construct a new DelayedSignal.
 
         Automatically invoked through the Signal new method.
         val -- initial value
         delay -- non-zero delay value
+        transport -- transport instead of inertial delay
         """
         _Signal.__init__(self, val)
-        self._nextZ = val
         self._delay = delay
-        self._timeStamp = 0
+        self._transport = transport
+        # the projected changes, as (time, value) pairs in time order;
+        # intbv values are kept as int
+        self._queue = deque()
+        # the future event that applies the head of the queue, and its time
+        self._event = _SignalWrap(self)
+        self._scheduled = None
+
+    def _clear(self):
+        _Signal._clear(self)
+        self._queue.clear()
+        self._scheduled = None
 
     def _update(self):
-        if self._next != self._nextZ:
-            self._timeStamp = sim._time
-        self._nextZ = self._next
-        t = sim._time + self._delay
-        _schedule((t, _SignalWrap(self, self._next, self._timeStamp)))
-        return []
-
-    def _apply(self, next, timeStamp):
+        self._pending = False
+        next = self._next
         val = self._val
-        if timeStamp == self._timeStamp and val != next:
-            waiters = self._eventWaiters[:]
-            del self._eventWaiters[:]
-            if not val and next:
-                waiters.extend(self._posedgeWaiters[:])
-                del self._posedgeWaiters[:]
-            elif not next and val:
-                waiters.extend(self._negedgeWaiters[:])
-                del self._negedgeWaiters[:]
-            self._val = copy(next)
-            if self._tracing:
-                self._printVcd()
-            return waiters
+        if self._type is intbv:
+            next = next._val
+            val = val._val
+        queue = self._queue
+        context = _state.context
+        t = context._time + self._delay
+        if self._transport:
+            # a change replaces the changes projected at or after its time
+            while queue and queue[-1][0] >= t:
+                queue.pop()
+            if next != (queue[-1][1] if queue else val):
+                queue.append((t, next))
+        elif next != (queue[-1][1] if queue else val):
+            # a change cancels the projected one
+            queue.clear()
+            if next != val:
+                queue.append((t, next))
+        elif queue and t < queue[0][0]:
+            # the same change with a shorter delay comes first
+            queue[0] = (t, next)
+        if queue and (self._scheduled is None or queue[0][0] < self._scheduled):
+            self._scheduled = queue[0][0]
+            context._futureEvents.schedule(self._scheduled, self._event)
+        return _noWaiters
+
+    def _apply(self):
+        context = _state.context
+        now = context._time
+        if now != self._scheduled:
+            # superseded by an earlier event
+            return _noWaiters
+        self._scheduled = None
+        queue = self._queue
+        if not queue or queue[0][0] > now:
+            changed = False
+        else:
+            changed = True
+            while queue and queue[0][0] <= now:
+                next = queue.popleft()[1]
+        if queue:
+            self._scheduled = queue[0][0]
+            context._futureEvents.schedule(self._scheduled, self._event)
+        if not changed:
+            return _noWaiters
+        val = self._val
+        isIntbv = self._type is intbv
+        if isIntbv:
+            val = val._val
+        if val == next:
+            return _noWaiters
+        waiters = self._eventWaiters
+        spare = self._spareWaiters
+        if spare is None:
+            spare = _WaiterList()
         else:
-            return []
+            del spare[:]
+        self._eventWaiters = spare
+        self._spareWaiters = waiters
+        if not val and next:
+            edgeWaiters = self._posedgeWaiters
+            if edgeWaiters:
+                waiters.extend(edgeWaiters)
+                del edgeWaiters[:]
+        elif not next and val:
+            edgeWaiters = self._negedgeWaiters
+            if edgeWaiters:
+                waiters.extend(edgeWaiters)
+                del edgeWaiters[:]
+        if isIntbv:
+            self._val._val = next
+        else:
+            self._val = copy(next)
+        if self._tracing:
+            self._printVcd()
+        if self._shadows:
+            for refresh in self._shadows:
+                refresh()
+        return waiters
 
     # support for the 'delay' attribute
     @property
@@ -637,16 +772,23 @@ class _DelayedSignal(_Signal):
     def delay(self, delay):
         self._delay = delay
 
+    # support for the 'transport' attribute
+    @property
+    def transport(self):
+        return self._transport
+
 
 class _SignalWrap(object):
 
-    def __init__(self, sig, next, timeStamp):
+    """ Future event that applies the projected changes of a delayed signal """
+
+    __slots__ = ('sig',)
+
+    def __init__(self, sig):
         self.sig = sig
-        self.next = next
-        self.timeStamp = timeStamp
 
     def apply(self):
-        return self.sig._apply(self.next, self.timeStamp)
+        return self.sig._apply()
 
 
 class Constant(_Signal):
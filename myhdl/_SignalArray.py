@@ -0,0 +1,270 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module that provides the SignalArray class.
+
+A SignalArray models a memory. Its words are kept in a compact buffer,
+and a word is only turned into a signal when it is indexed.
+
+"""
+from array import array
+from copy import deepcopy
+
+from myhdl import _simulator as sim
+from myhdl._simulator import _state
+from myhdl._Signal import _Signal, _WaiterList, _noWaiters
+from myhdl._intbv import intbv
+from myhdl._bin import bin
+
+
+def _typecode(val):
+    """ Return the array typecode for the words of a memory, or None
+    if they need a list. """
+    if isinstance(val, bool):
+        return 'B'
+    if not isinstance(val, intbv) or val._min is None or val._max is None:
+        return None
+    signed = val._min < 0
+    for tc in ('bhilq' if signed else 'BHILQ'):
+        bits = array(tc).itemsize * 8
+        if signed and -2 ** (bits - 1) <= val._min and val._max <= 2 ** (bits - 1):
+            return tc
+        if not signed and val._max <= 2 ** bits:
+            return tc
+    return None
+
+
+class SignalArray(object):
+
+    """ Memory of signals with a compact word buffer.
+
+    Indexing returns the signal of a word, which is created on first
+    access; words that are never indexed only take buffer space. A change
+    of any word wakes up the processes that wait on the memory.
+
+    Properties:
+    next -- assigning a value sets all words (write-only)
+
+    """
+
+    __slots__ = ('_buf', '_sigs', '_depth', '_init', '_initVal', '_fill',
+                 '_eventWaiters', '_spareWaiters', '_pending', '_name',
+                 '_tracing', '_codes', '_nrbits')
+
+    def __init__(self, val, depth):
+        """ Construct a memory.
+
+        val -- initial value of the words: a bool, int or intbv
+        depth -- number of words
+
+        """
+        if not isinstance(val, (bool, int, intbv)):
+            raise TypeError("SignalArray: expected bool, int or intbv, got %s"
+                            % type(val))
+        if depth <= 0:
+            raise ValueError("SignalArray: depth should be > 0")
+        self._init = deepcopy(val)
+        self._initVal = int(val)
+        self._depth = depth
+        tc = _typecode(val)
+        if tc is None:
+            self._buf = [self._initVal] * depth
+        else:
+            self._buf = array(tc, [self._initVal]) * depth
+        self._sigs = {}
+        self._fill = None
+        self._eventWaiters = _WaiterList()
+        self._spareWaiters = _WaiterList()
+        self._pending = False
+        self._name = None
+        self._tracing = 0
+        self._codes = None
+        if isinstance(val, bool):
+            self._nrbits = 1
+        elif isinstance(val, intbv):
+            self._nrbits = val._nrbits
+        else:
+            self._nrbits = 0
+        _state.context._signals.append(self)
+
+    def __len__(self):
+        return self._depth
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._depth))]
+        i = int(index)
+        if i < 0:
+            i += self._depth
+        if not 0 <= i < self._depth:
+            raise IndexError("SignalArray index out of range")
+        sig = self._sigs.get(i)
+        if sig is None:
+            sig = self._sigs[i] = _ArraySignal(self, i)
+        return sig
+
+    def __iter__(self):
+        for i in range(self._depth):
+            yield self[i]
+
+    def __setitem__(self, key, val):
+        raise TypeError("SignalArray object doesn't support item/slice assignment")
+
+    def __hash__(self):
+        raise TypeError("SignalArrays are unhashable")
+
+    def __repr__(self):
+        return "SignalArray(%r, %d)" % (self._init, self._depth)
+
+    def _items(self):
+        """ Return the (index, signal) pairs of the words that are signals """
+        return sorted(self._sigs.items())
+
+    def _word(self, i):
+        """ Return the value of word i as an element value """
+        v = self._buf[i]
+        init = self._init
+        if isinstance(init, bool):
+            return bool(v)
+        if isinstance(init, intbv):
+            val = deepcopy(init)
+            val._val = v
+            return val
+        return v
+
+    # support for the 'next' attribute: set all words
+    def _setNext(self, val):
+        if isinstance(val, _Signal):
+            val = val._val
+        self._fill = int(val)
+        for sig in self._sigs.values():
+            sig.next = val
+        if not self._pending:
+            self._pending = True
+            _state.siglist.append(self)
+
+    next = property(None, _setNext)
+
+    def _update(self):
+        self._pending = False
+        fill = self._fill
+        self._fill = None
+        if fill is None:
+            return _noWaiters
+        buf = self._buf
+        if buf.count(fill) == self._depth:
+            return _noWaiters
+        if self._tracing:
+            for i, v in enumerate(buf):
+                if v != fill and i not in self._sigs:
+                    self._printVcdWord(i, fill)
+        buf[:] = array(buf.typecode, [fill]) * self._depth \
+            if isinstance(buf, array) else [fill] * self._depth
+        # words that are signals are updated by their own commit
+        for i, sig in self._sigs.items():
+            buf[i] = int(sig._val)
+        return self._wake()
+
+    def _wake(self):
+        """ Return the waiters of the memory, swapping in the spare list """
+        waiters = self._eventWaiters
+        spare = self._eventWaiters = self._spareWaiters
+        del spare[:]
+        self._spareWaiters = waiters
+        return waiters
+
+    def _clear(self):
+        del self._eventWaiters[:]
+        del self._spareWaiters[:]
+        self._pending = False
+        self._fill = None
+        buf = self._buf
+        if isinstance(buf, array):
+            buf[:] = array(buf.typecode, [self._initVal]) * self._depth
+        else:
+            buf[:] = [self._initVal] * self._depth
+
+    # vcd support
+    def _trace(self, namegen):
+        """ Assign vcd codes to the words and return them """
+        if not self._tracing:
+            self._tracing = 1
+            codes = self._codes = [next(namegen) for __ in range(self._depth)]
+            for i, sig in self._sigs.items():
+                if sig._tracing:
+                    # keep the code of a word that is traced by name
+                    codes[i] = sig._code
+                else:
+                    sig._tracing = 1
+                    sig._code = codes[i]
+        return self._codes
+
+    def _vcdType(self):
+        """ Return the vcd type and width of the words """
+        if self._nrbits:
+            return 'reg', self._nrbits
+        return 'real', 1
+
+    def _printVcdWord(self, i, v):
+        code = self._codes[i]
+        if isinstance(self._init, bool):
+            print("%d%s" % (v, code), file=sim._tf)
+        elif self._nrbits:
+            print("b%s %s" % (bin(v, self._nrbits), code), file=sim._tf)
+        elif isinstance(self._init, intbv):
+            print("s%s %s" % (hex(v), code), file=sim._tf)
+        else:
+            print("s%s %s" % (v, code), file=sim._tf)
+
+    def _printVcd(self):
+        for i, v in enumerate(self._buf):
+            self._printVcdWord(i, v)
+
+    # conversion support
+    def _toVerilog(self):
+        return ", ".join("%s[%d]" % (self._name, i) for i in range(self._depth))
+
+
+class _ArraySignal(_Signal):
+
+    """ Signal of a word of a SignalArray """
+
+    __slots__ = ('_array', '_index')
+
+    def __init__(self, array, index):
+        _Signal.__init__(self, array._word(index))
+        self._init = deepcopy(array._init)
+        self._array = array
+        self._index = index
+        if array._tracing:
+            self._tracing = 1
+            self._code = array._codes[index]
+
+    def _update(self):
+        waiters = _Signal._update(self)
+        if waiters is not _noWaiters:
+            array = self._array
+            array._buf[self._index] = int(self._val)
+            if array._eventWaiters:
+                waiters.extend(array._wake())
+        return waiters
+
+    def _clear(self):
+        _Signal._clear(self)
+        self._array._buf[self._index] = self._array._initVal
@@ -0,0 +1,243 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module that provides bulk access to the values of signals.
+
+sample -- function that returns the values of signals as an array
+drive -- function that sets the next values of signals from an array
+SignalGroup -- class that holds signals for repeated bulk access
+
+NumPy is an optional dependency, only needed for bulk access.
+
+"""
+from operator import attrgetter
+
+from myhdl._simulator import _state
+from myhdl._Signal import _Signal
+from myhdl._intbv import intbv
+from myhdl._modbv import modbv
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class _error:
+    pass
+
+
+_error.Numpy = "bulk signal access requires numpy"
+_error.ArgType = "signal group members should be bool, int or bounded " \
+                 "intbv signals of up to 63 bits"
+_error.Drive = "signal can't be driven in bulk"
+_error.Values = "expected a value per signal"
+
+_getVal = attrgetter('_val')
+_getIntbvVal = attrgetter('_val._val')
+
+
+class _Kind(object):
+
+    """ The members of a group with the same kind of value """
+
+    def __init__(self, group, indices):
+        self.signals = [group[i] for i in indices]
+        # None if the members are in group order
+        if len(indices) == len(group):
+            self.indices = None
+        else:
+            self.indices = numpy.array(indices, dtype=numpy.intp)
+
+
+class SignalGroup(object):
+
+    """ Group of signals whose values are read or set in a single call.
+
+    The signals are classified when the group is constructed, so that
+    repeated calls only have to move the values.
+
+    """
+
+    def __init__(self, signals):
+        """ Construct a signal group.
+
+        signals -- sequence of bool, int or intbv signals
+
+        """
+        if numpy is None:
+            raise ImportError(_error.Numpy)
+        signals = list(signals)
+        bools, ints, intbvs, bounded, wrapped = [], [], [], [], []
+        drivable = True
+        for i, s in enumerate(signals):
+            if not isinstance(s, _Signal):
+                raise TypeError(_error.ArgType)
+            val = s._val
+            if isinstance(val, bool):
+                bools.append(i)
+            elif isinstance(val, intbv):
+                # values of unbounded intbvs may not fit in the array
+                if not 0 < s._nrbits <= 63:
+                    raise TypeError(_error.ArgType)
+                intbvs.append(i)
+                if isinstance(val, modbv):
+                    wrapped.append(i)
+                else:
+                    bounded.append(i)
+            elif isinstance(val, int):
+                ints.append(i)
+            else:
+                raise TypeError(_error.ArgType)
+            if type(s).next is not _Signal.next or \
+                    getattr(s._setNextVal, '__func__', None) not in (
+                        _Signal._setNextBool, _Signal._setNextInt,
+                        _Signal._setNextIntbv):
+                drivable = False
+        self._signals = signals
+        self._plain = _Kind(signals, bools + ints)
+        self._intbvs = _Kind(signals, intbvs)
+        self._bools = _Kind(signals, bools)
+        self._ints = _Kind(signals, ints)
+        self._drivable = drivable
+        self._lower = self._bound(bounded, '_min')
+        self._upper = self._bound(bounded, '_max')
+        self._wrapped = self._bounds(wrapped)
+
+    def _bound(self, indices, attr):
+        """ Return the indices of the members that have a bound, and the
+        bounds, or None """
+        pairs = [(i, getattr(self._signals[i], attr)) for i in indices]
+        pairs = [(i, b) for i, b in pairs if b is not None]
+        if not pairs:
+            return None
+        indices, bounds = zip(*pairs)
+        return (numpy.array(indices, dtype=numpy.intp),
+                numpy.array(bounds, dtype=numpy.int64))
+
+    def _bounds(self, indices):
+        """ Return the indices of members and their bounds, or None """
+        if not indices:
+            return None
+        lo = [self._signals[i]._min for i in indices]
+        hi = [self._signals[i]._max for i in indices]
+        return (numpy.array(indices, dtype=numpy.intp),
+                numpy.array(lo, dtype=numpy.int64),
+                numpy.array(hi, dtype=numpy.int64))
+
+    def __len__(self):
+        return len(self._signals)
+
+    def sample(self):
+        """ Return the current values of the signals as an array """
+        n = len(self._signals)
+        plain, intbvs = self._plain, self._intbvs
+        if intbvs.indices is None:
+            return numpy.fromiter(map(_getIntbvVal, intbvs.signals),
+                                  numpy.int64, n)
+        if plain.indices is None:
+            return numpy.fromiter(map(_getVal, plain.signals), numpy.int64, n)
+        values = numpy.empty(n, dtype=numpy.int64)
+        values[plain.indices] = numpy.fromiter(
+            map(_getVal, plain.signals), numpy.int64, len(plain.signals))
+        values[intbvs.indices] = numpy.fromiter(
+            map(_getIntbvVal, intbvs.signals), numpy.int64, len(intbvs.signals))
+        return values
+
+    def _select(self, values, kind):
+        if kind.indices is None:
+            return values.tolist()
+        return values[kind.indices].tolist()
+
+    def drive(self, values):
+        """ Set the next values of the signals from an array.
+
+        values -- sequence with a value per signal
+
+        The values are checked against the types and bounds of the signals
+        before any signal is set, and modbv values are wrapped.
+
+        """
+        if not self._drivable:
+            raise TypeError(_error.Drive)
+        values = numpy.asarray(values)
+        if values.shape != (len(self._signals),):
+            raise ValueError(_error.Values)
+        values = values.astype(numpy.int64, casting='safe', copy=False)
+        if self._bools.signals:
+            v = values if self._bools.indices is None else \
+                values[self._bools.indices]
+            bad = numpy.flatnonzero((v != 0) & (v != 1))
+            if len(bad):
+                raise ValueError("Expected boolean value, got %s" % v[bad[0]])
+        if self._upper is not None:
+            indices, hi = self._upper
+            v = values[indices]
+            bad = numpy.flatnonzero(v >= hi)
+            if len(bad):
+                k = bad[0]
+                raise ValueError("intbv value %s >= maximum %s" % (v[k], hi[k]))
+        if self._lower is not None:
+            indices, lo = self._lower
+            v = values[indices]
+            bad = numpy.flatnonzero(v < lo)
+            if len(bad):
+                k = bad[0]
+                raise ValueError("intbv value %s < minimum %s" % (v[k], lo[k]))
+        if self._wrapped is not None:
+            indices, lo, hi = self._wrapped
+            values = values.copy()
+            values[indices] = (values[indices] - lo) % (hi - lo) + lo
+
+        for s, v in zip(self._bools.signals, self._select(values, self._bools)):
+            s._next = bool(v)
+        for s, v in zip(self._ints.signals, self._select(values, self._ints)):
+            s._next = v
+        for s, v in zip(self._intbvs.signals, self._select(values, self._intbvs)):
+            s._next._val = v
+        # register the signals for update in one go
+        pending = [s for s in self._signals if not s._pending]
+        for s in pending:
+            s._pending = True
+        _state.siglist.extend(pending)
+
+
+def _group(signals):
+    if isinstance(signals, SignalGroup):
+        return signals
+    return SignalGroup(signals)
+
+
+def sample(signals):
+    """ Return the current values of signals as an array.
+
+    signals -- sequence of signals, or a SignalGroup
+
+    """
+    return _group(signals).sample()
+
+
+def drive(signals, values):
+    """ Set the next values of signals from an array.
+
+    signals -- sequence of signals, or a SignalGroup
+    values -- sequence with a value per signal
+
+    """
+    _group(signals).drive(values)
@@ -19,22 +19,28 @@
 
 """ Module that provides the Simulation class """
 import os
-from operator import itemgetter
+import pickle
+import sys
+import traceback
+from time import perf_counter
 from types import GeneratorType
 
 from myhdl import StopSimulation, _SuspendSimulation
 from myhdl import _simulator, SimulationError
+from myhdl._Clock import Clock
+from myhdl._Signal import _noWaiters
 from myhdl._Cosimulation import Cosimulation
-from myhdl._simulator import _signals, _siglist, _futureEvents
+from myhdl._simulator import _schedulers
 from myhdl._Waiter import _Waiter
 from myhdl._Waiter import _inferWaiter
 from myhdl._Waiter import _SignalTupleWaiter
 from myhdl._util import _printExcInfo
 from myhdl._instance import _Instantiator
+from myhdl._always import _Always
 from myhdl._block import _Block
-
-schedule = _futureEvents.append
-
+from myhdl._levelize import _CombNetwork, _levelize
+from myhdl._profiler import _Profiler
+from myhdl._specialize import _specialize
 
 class _error:
     pass
@@ -43,6 +49,7 @@ class _error:
 _error.ArgType = "Inappriopriate argument type"
 _error.MultipleCosim = "Only a single cosimulator argument allowed"
 _error.DuplicatedArg = "Duplicated argument"
+_error.Scheduler = "Unknown scheduler"
 
 # flatten Block objects out
 
@@ -60,7 +67,22 @@ def _flatten(*args):
     return arglist
 
 
-_error.MultipleSim = "Only a single Simulation instance is allowed"
+_error.MultipleSim = "Only a single Simulation instance per context is allowed"
+_error.Fork = "Checkpoints require os.fork"
+_error.CheckpointCosim = "Checkpoints are not supported with cosimulation"
+_error.CheckpointStale = "Simulation has run since the checkpoint"
+_error.BranchFailed = "Branch process failed"
+_error.Hook = "Unknown kernel hook"
+
+
+class _Checkpoint(object):
+
+    """ Handle to the state of a simulation at a checkpoint """
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.runs = sim._runs
+        self.time = sim._context._time
 
 
 class Simulation(object):
@@ -69,46 +91,153 @@ class Simulation(object):
 
     Methods:
     run -- run a simulation for some duration
+    checkpoint -- return a handle to the current simulation state
+    branch -- run a function on a copy of the state at a checkpoint
+    add_hooks -- register kernel event hooks
+    remove_hooks -- unregister kernel event hooks
+
+    Attributes:
+    profile -- the profiler of the simulation, or None
+
+    A simulation uses the SimulationContext that is current when it is
+    constructed, and makes it current while it runs.
 
     """
-    _no_of_instances = 0
 
-    def __init__(self, *args):
+    def __init__(self, *args, scheduler='heap', levelize=False, profile=False,
+                 specialize=False):
         """ Construct a simulation object.
 
-        *args -- list of arguments. Each argument is a generator or
-                 a nested sequence of generators.
+        *args -- list of arguments. Each argument is a generator, a
+                 Clock or a nested sequence of them.
+        scheduler -- future event queue: 'heap' (default) or 'wheel'
+        levelize -- evaluate networks of always_comb blocks in
+                    topological order (default: off)
+        profile -- record activation counts and wall time per process
+                   in the profile attribute (default: off)
+        specialize -- run always, always_comb and always_seq blocks as
+                      functions specialized for their signals
+                      (default: off)
 
         """
-        _simulator._time = 0
-        arglist = _flatten(*args)
-        self._waiters, self._cosims = _makeWaiters(arglist)
-        if Simulation._no_of_instances > 0:
+        if scheduler not in _schedulers:
+            raise SimulationError(_error.Scheduler, repr(scheduler))
+        context = self._context = _simulator._context()
+        if context._simulation is not None:
             raise SimulationError(_error.MultipleSim)
-        Simulation._no_of_instances += 1
+        context._time = 0
+        arglist = _flatten(*args)
+        simfuncs = _specializeBlocks(arglist) if specialize else {}
+        self._waiters, self._cosims, clocks, aliases = _makeWaiters(
+            arglist, levelize, simfuncs)
+        context._simulation = self
         self._finished = False
-        del _futureEvents[:]
-        del _siglist[:]
+        self._runs = 0
+        self.profile = _Profiler(args, aliases) if profile else None
+        self._hooks = _newHooks()
+        context._futureEvents = _schedulers[scheduler]()
+        for clock in clocks:
+            clock._start(context._futureEvents)
+        _clearSiglist(context._siglist)
 
     def _finalize(self):
+        context = self._context
         cosims = self._cosims
         if cosims:
             for cosim in cosims:
                 os.close(cosim._rt)
                 os.close(cosim._wf)
                 cosim._child.wait()
-        if _simulator._tracing:
-            _simulator._tracing = 0
-            _simulator._tf.close()
+        if context._tracing:
+            context._tracing = 0
+            context._tf.close()
         # clean up for potential new run with same signals
-        for s in _signals:
+        for s in context._signals:
             s._clear()
-        Simulation._no_of_instances = 0
+        context._simulation = None
         self._finished = True
 
     def quit(self):
         self._finalize()
 
+    def add_hooks(self, **hooks):
+        """ Register kernel event hooks.
+
+        on_timestep -- called as on_timestep(t) when time advances to t
+        on_delta -- called as on_delta(n) at the start of each delta cycle,
+                    where n counts the delta cycles of the time step
+        on_commit -- called as on_commit(signals) after the signal update
+                     of a delta cycle, with the signals that changed
+        on_suspend -- called as on_suspend() when run returns after the
+                      requested duration
+
+        Hooks that are not registered cost nothing in the run loop.
+
+        """
+        for name, func in hooks.items():
+            if name not in self._hooks:
+                raise SimulationError(_error.Hook, name)
+            self._hooks[name].append(func)
+
+    def remove_hooks(self, **hooks):
+        """ Unregister kernel event hooks registered with add_hooks. """
+        for name, func in hooks.items():
+            if name not in self._hooks:
+                raise SimulationError(_error.Hook, name)
+            if func in self._hooks[name]:
+                self._hooks[name].remove(func)
+
+    def checkpoint(self):
+        """ Return a handle to the current simulation state.
+
+        The handle can be passed to branch as long as the simulation
+        does not run further.
+
+        """
+        if not hasattr(os, 'fork'):
+            raise SimulationError(_error.Fork)
+        if self._cosims:
+            raise SimulationError(_error.CheckpointCosim)
+        if self._finished:
+            raise StopSimulation("Simulation has already finished")
+        return _Checkpoint(self)
+
+    def branch(self, checkpoint, func, *args):
+        """ Run a function on a copy of the simulation at a checkpoint.
+
+        checkpoint -- handle returned by the checkpoint method
+        func -- function called as func(sim, *args) in a forked child
+                process, where it can drive signals and run the copy of
+                the simulation further
+
+        The return value of func is sent back over a pipe and returned;
+        an exception raised by func is raised again. The simulation in
+        this process is not affected.
+
+        """
+        if checkpoint.sim is not self or checkpoint.runs != self._runs:
+            raise SimulationError(_error.CheckpointStale)
+        if self._finished:
+            raise StopSimulation("Simulation has already finished")
+        r, w = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(r)
+            _runBranch(self, w, func, args)
+        os.close(w)
+        with os.fdopen(r, 'rb') as f:
+            data = f.read()
+        __, status = os.waitpid(pid, 0)
+        if not data:
+            raise SimulationError(_error.BranchFailed,
+                                  "exit status %s" % status)
+        ok, value = pickle.loads(data)
+        if not ok:
+            raise value
+        return value
+
     def run(self, duration=None, quiet=0):
         """ Run the simulation for some duration.
 
@@ -121,122 +250,315 @@ class Simulation(object):
         # From this point it will propagate to the caller, that can catch it.
         if self._finished:
             raise StopSimulation("Simulation has already finished")
-        waiters = self._waiters
+        self._runs += 1
+        context = self._context
         maxTime = None
         if duration:
             stop = _Waiter(None)
             stop.hasRun = 1
-            maxTime = _simulator._time + duration
-            schedule((maxTime, stop))
-        cosims = self._cosims
-        t = _simulator._time
-        actives = {}
-        tracing = _simulator._tracing
-        tracefile = _simulator._tf
+            maxTime = context._time + duration
+            context._futureEvents.schedule(maxTime, stop)
+        tracing = context._tracing
+        tracefile = context._tf if tracing else None
         exc = []
-        _pop = waiters.pop
-        _append = waiters.append
-        _extend = waiters.extend
-
-        while 1:
+        profile = self.profile
+        hooks = _kernelHooks(self._hooks)
+
+        try:
+            with context:
+                if profile is None and hooks is None:
+                    _kernel(self._waiters, self._cosims, context._siglist,
+                            context._futureEvents, maxTime, duration, exc,
+                            tracefile)
+                elif profile is None:
+                    # the compiled kernel has no hook or profiler support
+                    _run(self._waiters, self._cosims, context._siglist,
+                         context._futureEvents, maxTime, duration, exc,
+                         tracefile, None, hooks)
+                else:
+                    start = perf_counter()
+                    profile.resume()
+                    try:
+                        _run(self._waiters, self._cosims, context._siglist,
+                             context._futureEvents, maxTime, duration, exc,
+                             tracefile, profile, hooks)
+                    finally:
+                        profile.runtime += perf_counter() - start
+                        profile.flush()
+
+        except _SuspendSimulation:
+            if not quiet:
+                _printExcInfo()
+            if tracing:
+                tracefile.flush()
+            for func in self._hooks['on_suspend']:
+                func()
+            return 1
+
+        except StopSimulation:
+            if not quiet:
+                _printExcInfo()
+            self._finalize()
+            self._finished = True
+            return 0
+
+        except Exception as e:
+            if tracing:
+                tracefile.flush()
+            # if the exception came from a yield, make sure we can resume
+            if exc and e is exc[0]:
+                pass  # don't finalize
+            else:
+                self._finalize()
+            # now reraise the exepction
+            raise
+
+
+def _clearSiglist(siglist):
+    """ Drop the pending signal updates """
+    for s in siglist:
+        s._pending = False
+    del siglist[:]
+
+
+def _newHooks():
+    return {'on_timestep': [], 'on_delta': [], 'on_commit': [],
+            'on_suspend': []}
+
+
+def _hookFunc(funcs):
+    """ Return a single callable for a list of hooks, or None """
+    if not funcs:
+        return None
+    if len(funcs) == 1:
+        return funcs[0]
+    funcs = tuple(funcs)
+
+    def hook(*args):
+        for func in funcs:
+            func(*args)
+
+    return hook
+
+
+def _kernelHooks(hooks):
+    """ Return the hooks of the run loop, or None if there are none """
+    kernelHooks = (_hookFunc(hooks['on_timestep']),
+                   _hookFunc(hooks['on_delta']),
+                   _hookFunc(hooks['on_commit']))
+    if kernelHooks == (None, None, None):
+        return None
+    return kernelHooks
+
+
+def _runBranch(sim, w, func, args):
+    """ Run a branch in the forked child process and exit """
+    context = sim._context
+    if context._tracing:
+        # don't write to the trace file of the parent
+        context._tf = open(os.devnull, 'w')
+    try:
+        try:
+            data = pickle.dumps((True, func(sim, *args)))
+        except Exception as e:
+            e.__traceback__ = None
             try:
+                data = pickle.dumps((False, e))
+            except Exception:
+                data = pickle.dumps((False, SimulationError(
+                    _error.BranchFailed, traceback.format_exc())))
+        with os.fdopen(w, 'wb') as f:
+            f.write(data)
+    finally:
+        # os._exit skips the interpreter cleanup that flushes output
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(0)
+
+
+def _run(waiters, cosims, siglist, futureEvents, maxTime, duration, exc,
+         tracefile, profiler=None, hooks=None):
+    """ Run the simulation loop until an exception stops it.
+
+    This is the reference implementation of the simulation kernel. The
+    _simrunc extension module provides a compiled version with the same
+    signature and behavior, without the optional profiler and hooks.
 
-                for s in _siglist:
-                    _extend(s._update())
-                del _siglist[:]
-
-                while waiters:
-                    waiter = _pop()
-                    try:
-                        waiter.next(waiters, actives, exc)
-                    except StopIteration:
-                        continue
-
-                if cosims:
-                    any_cosim_changes = False
-                    for cosim in cosims:
-                        any_cosim_changes = \
-                            any_cosim_changes or cosim._hasChange
-                    for cosim in cosims:
-                        cosim._get()
-                    if _siglist or any_cosim_changes:
-                        # It should be safe to _put a cosim with no changes
-                        # because _put with the same values should be
-                        # idempotent. We need to _put them all here because
-                        # otherwise we can desync _get/_put.
-                        for cosim in cosims:
-                            cosim._put(t)
-                        continue
-                elif _siglist:
+    """
+    t = _simulator._time
+    actives = {}
+    _pop = waiters.pop
+    _append = waiters.append
+    _extend = waiters.extend
+    if hooks is None:
+        on_timestep = on_delta = on_commit = None
+    else:
+        on_timestep, on_delta, on_commit = hooks
+    delta = 0
+    # the signals that changed in the current delta cycle, including the
+    # ones that future events changed at the start of a time step
+    changed = []
+
+    while 1:
+
+        if on_delta is not None:
+            on_delta(delta)
+            delta += 1
+
+        if on_commit is None:
+            for s in siglist:
+                _extend(s._update())
+        else:
+            # signals that resolve in their update, like tristate buses,
+            # only know whether they change afterwards
+            for s in siglist:
+                sigWaiters = s._update()
+                if sigWaiters is not _noWaiters:
+                    _extend(sigWaiters)
+                    if s.__class__ is _CombNetwork:
+                        # the outputs that a network updated
+                        changed.extend(s.committed)
+                    else:
+                        changed.append(s)
+            if changed:
+                on_commit(changed)
+                changed = []
+        del siglist[:]
+
+        if profiler is None:
+            while waiters:
+                waiter = _pop()
+                try:
+                    waiter.next(waiters, actives, exc)
+                except StopIteration:
                     continue
+        else:
+            profiler.runWaiters(waiters, actives, exc, siglist)
 
-                if actives:
-                    for wl in actives.values():
-                        wl.purge()
-                    actives = {}
-
-                # at this point it is safe to potentially suspend a simulation
-                if exc:
-                    raise exc[0]
-
-                # future events
-                if _futureEvents:
-                    if t == maxTime:
-                        raise _SuspendSimulation(
-                            "Simulated %s timesteps" % duration)
-                    _futureEvents.sort(key=itemgetter(0))
-                    t = _simulator._time = _futureEvents[0][0]
-                    if tracing:
-                        print("#%s" % t, file=tracefile)
-                    if cosims:
-                        for cosim in cosims:
-                            cosim._put(t)
-                    while _futureEvents:
-                        newt, event = _futureEvents[0]
-                        if newt == t:
-                            if isinstance(event, _Waiter):
-                                _append(event)
-                            else:
-                                _extend(event.apply())
-                            del _futureEvents[0]
-                        else:
-                            break
-                else:
-                    raise StopSimulation("No more events")
-
-            except _SuspendSimulation:
-                if not quiet:
-                    _printExcInfo()
-                if tracing:
-                    tracefile.flush()
-                return 1
-
-            except StopSimulation:
-                if not quiet:
-                    _printExcInfo()
-                self._finalize()
-                self._finished = True
-                return 0
-
-            except Exception as e:
-                if tracing:
-                    tracefile.flush()
-                # if the exception came from a yield, make sure we can resume
-                if exc and e is exc[0]:
-                    pass  # don't finalize
+        if cosims:
+            any_cosim_changes = False
+            for cosim in cosims:
+                any_cosim_changes = \
+                    any_cosim_changes or cosim._hasChange
+            for cosim in cosims:
+                cosim._get()
+            if siglist or any_cosim_changes:
+                # It should be safe to _put a cosim with no changes
+                # because _put with the same values should be
+                # idempotent. We need to _put them all here because
+                # otherwise we can desync _get/_put.
+                for cosim in cosims:
+                    cosim._put(t)
+                continue
+        elif siglist:
+            continue
+
+        if actives:
+            for wl in actives.values():
+                wl.purge()
+            actives = {}
+
+        # at this point it is safe to potentially suspend a simulation
+        if exc:
+            raise exc[0]
+
+        # future events
+        if futureEvents:
+            if t == maxTime:
+                raise _SuspendSimulation(
+                    "Simulated %s timesteps" % duration)
+            t = _simulator._time = futureEvents.nextTime()
+            if profiler is not None:
+                profiler.timestep()
+            if on_timestep is not None:
+                on_timestep(t)
+            delta = 0
+            if tracefile is not None:
+                print("#%s" % t, file=tracefile)
+            if cosims:
+                for cosim in cosims:
+                    cosim._put(t)
+            for event in futureEvents.pop(t):
+                if isinstance(event, _Waiter):
+                    _append(event)
+                elif on_commit is None:
+                    _extend(event.apply())
                 else:
-                    self._finalize()
-                # now reraise the exepction
-                raise
+                    # clock edges and changes of delayed signals
+                    sigWaiters = event.apply()
+                    if sigWaiters is not _noWaiters:
+                        _extend(sigWaiters)
+                        changed.append(event.sig)
+        else:
+            raise StopSimulation("No more events")
 
 
-def _makeWaiters(arglist):
+def _loadKernel():
+    """ Return the simulation kernel.
+
+    The compiled kernel is used when it has been built, unless the
+    MYHDL_SIMRUNC environment variable is set to 0.
+
+    """
+    if os.environ.get('MYHDL_SIMRUNC', '1') == '0':
+        return _run
+    try:
+        from myhdl._simrunc import run
+    except ImportError:
+        return _run
+    return run
+
+
+_kernel = _loadKernel()
+
+
+def _specializeBlocks(arglist):
+    """ Return the specialized functions of the always blocks in arglist,
+    by id of the block. """
+    simfuncs = {}
+    for arg in arglist:
+        if isinstance(arg, _Always):
+            func = _specialize(arg.func)
+            if func is not None:
+                simfuncs[id(arg)] = func
+    return simfuncs
+
+
+def _makeWaiters(arglist, levelize=False, simfuncs=None):
+    """ Return the waiters, cosimulations and clocks of a simulation.
+
+    simfuncs -- the functions to run instead of those of the always
+                blocks, by id of the block
+
+    Blocks with a function in simfuncs get a new generator for this
+    simulation. The last return value maps those generators to the
+    generators of their blocks.
+
+    """
+    context = _simulator._context()
+    if simfuncs is None:
+        simfuncs = {}
     waiters = []
     ids = set()
     cosims = []
+    clocks = []
+    aliases = {}
+    levelized = set()
+    if levelize:
+        for network in _levelize(arglist, simfuncs):
+            waiters.append(network)
+            levelized.update(id(b) for b in network.blocks)
     for arg in arglist:
-        if isinstance(arg, GeneratorType):
+        if id(arg) in levelized:
+            pass
+        elif isinstance(arg, GeneratorType):
             waiters.append(_inferWaiter(arg))
+        elif id(arg) in simfuncs:
+            gen = arg.genfunc(simfuncs[id(arg)])
+            aliases[gen] = arg.gen
+            waiters.append(arg._waiter()(gen))
         elif isinstance(arg, _Instantiator):
             waiters.append(arg.waiter)
         elif isinstance(arg, Cosimulation):
@@ -244,6 +566,8 @@ def _makeWaiters(arglist):
             waiters.append(_SignalTupleWaiter(arg._waiter()))
         elif isinstance(arg, _Waiter):
             waiters.append(arg)
+        elif isinstance(arg, Clock):
+            clocks.append(arg)
         elif arg == True:
             pass
         else:
@@ -252,7 +576,7 @@ def _makeWaiters(arglist):
             raise SimulationError(_error.DuplicatedArg)
         ids.add(id(arg))
     # add waiters for shadow signals
-    for sig in _signals:
+    for sig in context._signals:
         if hasattr(sig, '_waiter'):
             waiters.append(sig._waiter)
-    return waiters, cosims
+    return waiters, cosims, clocks, aliases
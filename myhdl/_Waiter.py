@@ -21,18 +21,15 @@
 from types import GeneratorType
 
 import ast
-import inspect
 
 
-from myhdl._util import _dedent
+from myhdl import _diskcache
+from myhdl._util import _CodeCache, _makeCodeAST
 from myhdl._delay import delay
 from myhdl._join import join
 from myhdl._Signal import _Signal, _WaiterList, posedge, negedge
-from myhdl import _simulator
-from myhdl._simulator import _futureEvents
-
-
-schedule = _futureEvents.append
+from myhdl._SignalArray import SignalArray
+from myhdl._simulator import _state
 
 
 class _Waiter(object):
@@ -88,14 +85,15 @@ class _Waiter(object):
                 clause.append(clone)
                 if nr > 1:
                     actives[id(clause)] = clause
-            elif isinstance(clause, _Signal):
+            elif isinstance(clause, (_Signal, SignalArray)):
                 wl = clause._eventWaiters
                 wl.append(clone)
                 if nr > 1:
                     actives[id(wl)] = wl
             elif isinstance(clause, delay):
-                t = _simulator._time
-                schedule((t + clause._time, clone))
+                context = _state.context
+                context._futureEvents.schedule(context._time + clause._time,
+                                               clone)
             elif isinstance(clause, GeneratorType):
                 waiters.append(_Waiter(clause, clone))
             elif isinstance(clause, _Instantiator):
@@ -122,7 +120,8 @@ class _DelayWaiter(_Waiter):
 
     def next(self, waiters, actives, exc):
         clause = next(self.generator)
-        schedule((_simulator._time + clause._time, self))
+        context = _state.context
+        context._futureEvents.schedule(context._time + clause._time, self)
 
 
 class _EdgeWaiter(_Waiter):
@@ -200,25 +199,57 @@ class _kind(object):
     UNDEFINED = 6
 
 
+def _nameKind(obj):
+    """ Return the kind of the object that a name refers to """
+    if isinstance(obj, (_Signal, SignalArray)):
+        return _kind.SIGNAL
+    elif obj is delay:
+        return _kind.DELAY
+    elif obj is posedge or obj is negedge:
+        return _kind.EDGE
+    return _kind.UNDEFINED
+
+
+# per code object: the names in the source, and the inferred kind for
+# each combination of the kinds of those names
+_yieldInfo = _CodeCache()
+
+
 def _inferWaiter(gen):
     f = gen.gi_frame
-    s = inspect.getsource(f)
-    s = _dedent(s)
-    root = ast.parse(s)
-    root.symdict = f.f_globals.copy()
-    root.symdict.update(f.f_locals)
-    # print ast.dump(root)
-    v = _YieldVisitor(root)
-    v.visit(root)
-    if v.kind == _kind.EDGE_TUPLE:
+    code = f.f_code
+    info = _yieldInfo.get(code)
+    if info is None:
+        info = _diskcache._get(code, 'waiter')
+        if info is None:
+            root = _makeCodeAST(code)
+            names = sorted(set(node.id for node in ast.walk(root)
+                               if isinstance(node, ast.Name)))
+            info = (names, {})
+            _diskcache._put(code, 'waiter', info)
+        _yieldInfo[code] = info
+    names, kinds = info
+    # the inferred kind only depends on what the names refer to
+    flocals, fglobals = f.f_locals, f.f_globals
+    key = tuple([_nameKind(flocals[n] if n in flocals else fglobals.get(n))
+                 for n in names])
+    kind = kinds.get(key)
+    if kind is None:
+        root = _makeCodeAST(code)
+        root.symdict = fglobals.copy()
+        root.symdict.update(flocals)
+        v = _YieldVisitor(root)
+        v.visit(root)
+        kind = kinds[key] = v.kind
+    if kind == _kind.EDGE_TUPLE:
         return _EdgeTupleWaiter(gen)
-    if v.kind == _kind.SIGNAL_TUPLE:
+    if kind == _kind.SIGNAL_TUPLE:
         return _SignalTupleWaiter(gen)
-    if v.kind == _kind.DELAY:
+    if kind == _kind.DELAY:
         return _DelayWaiter(gen)
-    if v.kind == _kind.EDGE:
+    if kind == _kind.EDGE:
         return _EdgeWaiter(gen)
-    if v.kind == _kind.SIGNAL:
+    if kind == _kind.SIGNAL:
         return _SignalWaiter(gen)
     # default
     return _Waiter(gen)
@@ -265,16 +296,7 @@ class _YieldVisitor(ast.NodeVisitor):
         node.kind = fn.kind
 
     def visit_Name(self, node):
-        n = node.id
-        node.kind = _kind.UNDEFINED
-        if n in self.root.symdict:
-            obj = self.root.symdict[n]
-            if isinstance(obj, _Signal):
-                node.kind = _kind.SIGNAL
-            elif obj is delay:
-                node.kind = _kind.DELAY
-            elif obj is posedge or obj is negedge:
-                node.kind = _kind.EDGE
+        node.kind = _nameKind(self.root.symdict.get(node.id))
 
     def visit_Attribute(self, node):
         node.kind = _kind.UNDEFINED
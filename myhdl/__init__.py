@@ -22,12 +22,17 @@
 
     This module provides the following myhdl objects:
     Simulation -- simulation class
+    SimulationContext -- class that holds the state of a simulation
     StopSimulation -- exception that stops a simulation
     now -- function that returns the current time
     Signal -- factory function to model hardware signals
     SignalType -- Signal base class
     ConcatSignal --  factory function that models a concatenation shadow signal
     TristateSignal -- factory function that models a tristate shadow signal
+    SignalArray -- class that models a memory with a compact word buffer
+    SignalGroup -- class that holds signals for bulk value access
+    sample -- function that returns the values of signals as an array
+    drive -- function that sets the next values of signals from an array
     delay -- callable to model delay in a yield statement
     posedge -- callable to model a rising edge on a signal in a yield statement
     negedge -- callable to model a falling edge on a signal in a yield statement
@@ -47,6 +52,8 @@
     ResetSignal --
     enum -- function that returns an enumeration type
     traceSignals -- function that enables signal tracing in a VCD file
+    sweep -- function that runs a testbench over a parameter grid
+    BatchSimulation -- class that simulates a design for many lanes at once
     toVerilog -- function that converts a design to Verilog
     toVHDL -- function that converts a design to VHDL
     OpenPort -- 
@@ -155,9 +162,12 @@ from ._join import join
 from ._Signal import posedge, negedge, Signal, SignalType, Constant
 from ._ShadowSignal import ConcatSignal
 from ._ShadowSignal import TristateSignal
-from ._simulator import now
+from ._SignalArray import SignalArray
+from ._SignalGroup import SignalGroup, sample, drive
+from ._simulator import now, SimulationContext
 from ._delay import delay
 from ._Cosimulation import Cosimulation
+from ._Clock import Clock
 from ._Simulation import Simulation
 from ._misc import instances, downrange
 from ._always_comb import always_comb
@@ -167,6 +177,8 @@ from ._instance import instance
 from ._block import block
 from ._enum import enum, EnumType, EnumItemType
 from ._traceSignals import traceSignals
+from ._sweep import sweep
+from ._BatchSimulation import BatchSimulation
 from ._openport import OpenPort
 from ._hdlclass import HdlClass# , hdlinstances
 
@@ -188,12 +200,18 @@ __all__ = ["bin",
            "Constant",
            "ConcatSignal",
            "TristateSignal",
+           "SignalArray",
+           "SignalGroup",
+           "sample",
+           "drive",
            "now",
            "delay",
            "downrange",
            "StopSimulation",
            "Cosimulation",
+           "Clock",
            "Simulation",
+           "SimulationContext",
            "instances",
            "instance",
            "block",
@@ -205,6 +223,8 @@ __all__ = ["bin",
            "EnumType",
            "EnumItemType",
            "traceSignals",
+           "sweep",
+           "BatchSimulation",
            "toVerilog",
            "toVHDL",
            "conversion",
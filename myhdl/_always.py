@@ -25,6 +25,7 @@ from myhdl._util import _isGenFunc
 from myhdl._delay import delay
 from myhdl._Signal import _Signal
 from myhdl._Signal import _WaiterList
+from myhdl._SignalArray import SignalArray
 from myhdl._Waiter import _Waiter, _SignalWaiter, _SignalTupleWaiter, \
     _DelayWaiter, _EdgeWaiter, _EdgeTupleWaiter
 from myhdl._instance import _Instantiator, _getCallInfo
@@ -38,7 +39,7 @@ _error.NrOfArgs = "decorated function should not have arguments"
 _error.DecNrOfArgs = "decorator should have arguments"
 
 
-def _get_sigdict(sigs, symdict):
+def _get_sigdict(sigs, callinfo):
     """Lookup signals in caller namespace and return sigdict
 
     Lookup signals in then namespace of a caller. This is used to add
@@ -49,7 +50,15 @@ def _get_sigdict(sigs, symdict):
     """
 
     sigdict = {}
-    for n, v in symdict.items():
+    if not sigs:
+        return sigdict
+    f_locals = callinfo.f_locals
+    for n, v in callinfo.f_globals.items():
+        if n not in f_locals:
+            for s in sigs:
+                if s is v:
+                    sigdict[n] = s
+    for n, v in f_locals.items():
         for s in sigs:
             if s is v:
                 sigdict[n] = s
@@ -68,9 +77,9 @@ def always(*args):
             arg.sig._read = True
             arg.sig._used = True
             sigargs.append(arg.sig)
-        elif not isinstance(arg, delay):
+        elif not isinstance(arg, (delay, SignalArray)):
             raise AlwaysError(_error.DecArgType)
-    sigdict = _get_sigdict(sigargs, callinfo.symdict)
+    sigdict = _get_sigdict(sigargs, callinfo)
 
     def _always_decorator(func):
         if not isinstance(func, FunctionType):
@@ -100,7 +109,9 @@ class _Always(_Instantiator):
     def _waiter(self):
         # infer appropriate waiter class
         # first infer base type of arguments
-        for t in (_Signal, _WaiterList, delay):
+        # a memory wakes up its waiters like a signal
+        sigtypes = (_Signal, SignalArray)
+        for t in (sigtypes, _WaiterList, delay):
             if isinstance(self.senslist[0], t):
                 bt = t
         for s in self.senslist[1:]:
@@ -112,22 +123,24 @@ class _Always(_Instantiator):
         if bt is delay:
             w = _DelayWaiter
         elif len(self.senslist) == 1:
-            if bt is _Signal:
+            if bt is sigtypes:
                 w = _SignalWaiter
             elif bt is _WaiterList:
                 w = _EdgeWaiter
         else:
-            if bt is _Signal:
+            if bt is sigtypes:
                 w = _SignalTupleWaiter
             elif bt is _WaiterList:
                 w = _EdgeTupleWaiter
         return w
 
-    def genfunc(self):
+    def genfunc(self, func=None):
+        # func replaces the block function, e.g. by a specialized one
         senslist = self.senslist
         if len(senslist) == 1:
             senslist = senslist[0]
-        func = self.func
+        if func is None:
+            func = self.func
         while 1:
             yield senslist
             func()
@@ -22,6 +22,7 @@ from types import FunctionType
 
 from myhdl import AlwaysCombError
 from myhdl._Signal import _Signal, _isListOfSigs, Constant
+from myhdl._SignalArray import SignalArray
 from myhdl._util import _isGenFunc
 from myhdl._instance import _getCallInfo
 from myhdl._always import _Always
@@ -66,15 +67,18 @@ class _AlwaysComb(_Always):
                 senslist.append(s)
             elif _isListOfSigs(s) and not isinstance(s[0], Constant):
                 senslist.extend(s)
+            elif isinstance(s, SignalArray):
+                senslist.append(s)
         self.senslist = tuple(senslist)
         if len(self.senslist) == 0:
             raise AlwaysCombError(_error.EmptySensitivityList)
 
-    def genfunc(self):
+    def genfunc(self, func=None):
         senslist = self.senslist
         if len(senslist) == 1:
             senslist = senslist[0]
-        func = self.func
+        if func is None:
+            func = self.func
         while 1:
             func()
             yield senslist
@@ -23,6 +23,7 @@ from types import FunctionType
 from myhdl import AlwaysError, intbv
 from myhdl._util import _isGenFunc
 from myhdl._Signal import _Signal, _WaiterList, _isListOfSigs
+from myhdl._SignalArray import SignalArray
 from myhdl._always import _Always, _get_sigdict
 from myhdl._instance import _getCallInfo
 
@@ -67,7 +68,7 @@ def always_seq(edge, reset):
         reset._read = True
         reset._used = True
         sigargs.append(reset)
-    sigdict = _get_sigdict(sigargs, callinfo.symdict)
+    sigdict = _get_sigdict(sigargs, callinfo)
 
     def _always_seq_decorator(func):
         if not isinstance(func, FunctionType):
@@ -110,7 +111,8 @@ class _AlwaysSeq(_Always):
         varregs = self.varregs = []
         for n in self.outputs:
             reg = self.symdict[n]
-            if isinstance(reg, _Signal):
+            if isinstance(reg, (_Signal, SignalArray)):
+                # a memory is reset as a whole
                 sigregs.append(reg)
             elif isinstance(reg, intbv):
                 varregs.append((n, reg, int(reg)))
@@ -129,13 +131,14 @@ class _AlwaysSeq(_Always):
             _, reg, init = v
             reg._val = init
 
-    def genfunc_reset(self):
+    def genfunc_reset(self, func=None):
         senslist = self.senslist
         if len(senslist) == 1:
             senslist = senslist[0]
         reset_sigs = self.reset_sigs
         reset_vars = self.reset_vars
-        func = self.func
+        if func is None:
+            func = self.func
         while 1:
             yield senslist
             if self.reset == self.reset.active:
@@ -144,11 +147,12 @@ class _AlwaysSeq(_Always):
             else:
                 func()
 
-    def genfunc_no_reset(self):
+    def genfunc_no_reset(self, func=None):
         senslist = self.senslist
         assert len(senslist) == 1
         senslist = senslist[0]
-        func = self.func
+        if func is None:
+            func = self.func
         while 1:
             yield senslist
             func()
@@ -19,18 +19,21 @@
 
 """ Block with the @block decorator function. """
 import inspect
+import sys
 
 # from functools import wraps
 import functools
 
 import myhdl
-from myhdl import BlockError, BlockInstanceError, Cosimulation
-from myhdl._instance import _Instantiator
+from myhdl import BlockError, BlockInstanceError, Cosimulation, _diskcache
+from myhdl._Clock import Clock
+from myhdl._instance import _Instantiator, _CallInfo, _isBlockContext
 from myhdl._util import _flatten
 from myhdl._extractHierarchy import (_makeMemInfo,
                                      _UserVerilogCode, _UserVhdlCode,
                                      _UserVerilogInstance, _UserVhdlInstance)
 from myhdl._Signal import _Signal, _isListOfSigs
+from myhdl._SignalArray import SignalArray
 from myhdl._misc import isboundmethod
 
 from weakref import WeakValueDictionary
@@ -44,14 +47,6 @@ _error.ArgType = "%s: A block should return block or instantiator objects"
 _error.InstanceError = "%s: subblock %s should be encapsulated in a block decorator"
 
 
-class _CallInfo(object):
-
-    def __init__(self, name, modctxt, symdict):
-        self.name = name
-        self.modctxt = modctxt
-        self.symdict = symdict
-
-
 def _getCallInfo():
     """Get info on the caller of a BlockInstance.
 
@@ -66,30 +61,13 @@ def _getCallInfo():
 
     """
 
-    stack = inspect.stack()
-    # caller may be undefined if instantiation from a Python module
-    callerrec = None
-    funcrec = stack[3]
-    name = funcrec[3]
-    if len(stack) > 4:
-        callerrec = stack[4]
+    frame = sys._getframe(3)
     # special case for list comprehension's extra scope in PY3
-    if name == '<listcomp>':
-        funcrec = stack[4]
-        if len(stack) > 5:
-            callerrec = stack[5]
-
-    name = funcrec[3]
-    frame = funcrec[0]
-    symdict = dict(frame.f_globals)
-    symdict.update(frame.f_locals)
-    modctxt = False
-    if callerrec is not None:
-        f_locals = callerrec[0].f_locals
-        if 'self' in f_locals:
-            modctxt = isinstance(f_locals['self'], _Block)
-
-    return _CallInfo(name, modctxt, symdict)
+    if frame.f_code.co_name == '<listcomp>':
+        frame = frame.f_back
+    # caller may be undefined if instantiation from a Python module
+    modctxt = _isBlockContext(frame.f_back)
+    return _CallInfo(frame.f_code.co_name, modctxt, frame)
 
 
 # ## I don't think this is the right place for uniqueifying the name.
@@ -161,7 +139,10 @@ class block_decorator(object):
 
     def __init__(self, func):
         self.srcfile = inspect.getsourcefile(func)
-        self.srcline = inspect.getsourcelines(func)[0]
+        self.srcline = _diskcache._get(func.__code__, 'lines')
+        if self.srcline is None:
+            self.srcline = inspect.getsourcelines(func)[0]
+            _diskcache._put(func.__code__, 'lines', self.srcline)
         self.func = func
         functools.update_wrapper(self, func)
         self.calls = 0
@@ -172,6 +153,11 @@ class block_decorator(object):
 
         self.bound_functions = WeakValueDictionary()
 
+    def __reduce__(self):
+        # pickle by reference, as for the decorated function, so that
+        # block factories can be sent to worker processes
+        return self.__qualname__
+
     @classmethod
     def set_decorator_parameters(cls, **kwargs):
         for param_name, value in kwargs.items:
@@ -266,11 +252,14 @@ class _Block(object):
         if hasattr(deco, 'vhdl_instance'):
             self.vhdl_code = _UserVhdlInstance(deco.vhdl_instance, self.symdict, func.__name__,
                                                func, srcfile, srcline)
-        self._config_sim = {'trace': False}
+        self._config_sim = {'trace': False, 'scheduler': 'heap',
+                            'levelize': False, 'profile': False,
+                            'specialize': False}
 
     def _verifySubs(self):
         for inst in self.subs:
-            if not isinstance(inst, (_Block, _Instantiator, Cosimulation)):
+            if not isinstance(inst, (_Block, _Instantiator, Cosimulation,
+                                     Clock)):
                 raise BlockError(_error.ArgType % (self.name,))
             if isinstance(inst, (_Block, _Instantiator)):
                 if not inst.modctxt:
@@ -283,7 +272,7 @@ class _Block(object):
         for inst in self.subs:
             # the symdict of a block instance is defined by
             # the call context of its instantiations
-            if isinstance(inst, Cosimulation):
+            if isinstance(inst, (Cosimulation, Clock)):
                 continue  # ignore
             if self.symdict is None:
                 self.symdict = inst.callinfo.symdict
@@ -304,7 +293,7 @@ class _Block(object):
                 self.sigdict[n] = v
                 if n in usedsigdict:
                     v._markUsed()
-            if _isListOfSigs(v):
+            if _isListOfSigs(v) or isinstance(v, SignalArray):
                 m = _makeMemInfo(v)
                 self.memdict[n] = m
                 if n in usedlosdict:
@@ -403,20 +392,48 @@ class _Block(object):
             setattr(converter, k, v)
         return converter(self)
 
-    def config_sim(self, trace=False, **kwargs):
+    def config_sim(self, trace=False, scheduler='heap', levelize=False,
+                   profile=False, specialize=False, **kwargs):
         self._config_sim['trace'] = trace
+        self._config_sim['scheduler'] = scheduler
+        self._config_sim['levelize'] = levelize
+        self._config_sim['profile'] = profile
+        self._config_sim['specialize'] = specialize
         if trace:
             for k, v in kwargs.items():
                 setattr(myhdl.traceSignals, k, v)
             myhdl.traceSignals(self)
 
-    def run_sim(self, duration=None, quiet=0):
+    def run_sim(self, duration=None, quiet=0, cycles=None, mode='event'):
+        from myhdl._CycleSimulation import _CycleSimulation
+        if mode not in ('event', 'cycle'):
+            raise BlockInstanceError('unknown simulation mode %s' % mode)
+        if mode == 'cycle' and duration is not None:
+            raise BlockInstanceError('cycle mode runs for a number of cycles, '
+                                     'not a duration')
+        if mode == 'event' and cycles is not None:
+            raise BlockInstanceError('event mode runs for a duration, '
+                                     'not a number of cycles')
+        if self.sim is not None and \
+                isinstance(self.sim, _CycleSimulation) != (mode == 'cycle'):
+            raise BlockInstanceError('simulation was started in %s mode' % (
+                'cycle' if mode == 'event' else 'event'))
         if self.sim is None:
             sim = self
             # if self._config_sim['trace']:
             #    sim = myhdl.traceSignals(self)
-            self.sim = myhdl._Simulation.Simulation(sim)
-        self.sim.run(duration, quiet)
+            if mode == 'cycle':
+                self.sim = _CycleSimulation(sim)
+            else:
+                self.sim = myhdl._Simulation.Simulation(
+                    sim, scheduler=self._config_sim['scheduler'],
+                    levelize=self._config_sim['levelize'],
+                    profile=self._config_sim['profile'],
+                    specialize=self._config_sim['specialize'])
+        if mode == 'cycle':
+            return self.sim.run(cycles, quiet)
+        else:
+            return self.sim.run(duration, quiet)
 
     def quit_sim(self):
         if self.sim is not None:
@@ -0,0 +1,146 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module with the opt-in on-disk cache of elaboration results.
+
+The cache is enabled by setting the MYHDL_CACHE environment variable,
+to a directory or to 1 for the default directory. The results for the
+functions in a source file are kept in a single cache file, keyed by
+the path and contents of the source file, the Python version and the
+MyHDL version. The cache files are written at exit, and the least
+recently used ones are removed when the cache grows beyond _maxsize.
+"""
+import atexit
+import hashlib
+import linecache
+import os
+import pickle
+import sys
+
+_FORMAT = 1
+
+# bound on the total size of the cache files, in bytes
+_maxsize = 64 * 1024 * 1024
+
+
+def _cacheDir():
+    d = os.environ.get('MYHDL_CACHE', '')
+    if d in ('', '0'):
+        return None
+    if d == '1':
+        base = os.environ.get('XDG_CACHE_HOME') or \
+            os.path.join(os.path.expanduser('~'), '.cache')
+        d = os.path.join(base, 'myhdl')
+    return d
+
+
+# the cache directory, None when the cache is disabled
+_dir = _cacheDir()
+
+# per source file: the cache file, its entries and its contents when loaded
+_files = {}
+
+
+def _key(code, kind):
+    return (kind, code.co_name, code.co_firstlineno)
+
+
+def _get(code, kind):
+    """ Return the cached result of a kind for a code object, or None. """
+    if _dir is None:
+        return None
+    return _entries(code).get(_key(code, kind))
+
+
+def _put(code, kind, value):
+    """ Cache the result of a kind for a code object.
+
+    The value is saved at exit, including later changes to it.
+    """
+    if _dir is None:
+        return
+    _entries(code)[_key(code, kind)] = value
+
+
+def _entries(code):
+    filename = code.co_filename
+    rec = _files.get(filename)
+    if rec is None:
+        rec = _files[filename] = _load(filename)
+    return rec[1]
+
+
+def _load(filename):
+    import myhdl
+    lines = linecache.getlines(filename)
+    if not lines:
+        # no source, so nothing to key on
+        return [None, {}, None]
+    h = hashlib.sha1()
+    h.update(repr((_FORMAT, sys.version, myhdl.__version__,
+                   os.path.abspath(filename))).encode())
+    h.update(''.join(lines).encode('utf-8', 'surrogateescape'))
+    path = os.path.join(_dir, h.hexdigest() + '.pickle')
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        entries = pickle.loads(data)
+        os.utime(path)  # most recently used
+    except Exception:
+        # missing, unreadable or stale
+        return [path, {}, None]
+    return [path, entries, data]
+
+
+def _save():
+    if _dir is None or not _files:
+        return
+    try:
+        os.makedirs(_dir, exist_ok=True)
+        for path, entries, data in _files.values():
+            if path is None or not entries:
+                continue
+            new = pickle.dumps(entries, pickle.HIGHEST_PROTOCOL)
+            if new == data:
+                continue
+            tmp = "%s.%d.tmp" % (path, os.getpid())
+            with open(tmp, 'wb') as f:
+                f.write(new)
+            os.replace(tmp, path)
+        _evict()
+    except OSError:
+        pass  # the cache is only an optimization
+
+
+def _evict():
+    files = []
+    for name in os.listdir(_dir):
+        if name.endswith('.pickle'):
+            path = os.path.join(_dir, name)
+            st = os.stat(path)
+            files.append((st.st_mtime, st.st_size, path))
+    total = sum(size for __, size, __ in files)
+    for __, size, path in sorted(files):
+        if total <= _maxsize:
+            break
+        os.remove(path)
+        total -= size
+
+
+atexit.register(_save)
@@ -26,6 +26,7 @@ import string
 
 from myhdl import ExtractHierarchyError, ToVerilogError, ToVHDLError
 from myhdl._Signal import _Signal, _isListOfSigs
+from myhdl._SignalArray import SignalArray
 from myhdl._util import _flatten
 from myhdl._util import _genfunc
 from myhdl._misc import _isGenSeq
@@ -69,6 +70,13 @@ class _MemInfo(object):
         self._driven = None
         self._read = None
 
+    def items(self):
+        """ Return the (index, signal) pairs of the memory """
+        if isinstance(self.mem, SignalArray):
+            # only the words that are signals take part
+            return self.mem._items()
+        return enumerate(self.mem)
+
 
 def _getMemInfo(mem):
     return _memInfoMap[id(mem)]
@@ -351,7 +359,7 @@ class _HierExtr(object):
                             sigdict[n] = v
                             if n in cellvars:
                                 v._markUsed()
-                        if _isListOfSigs(v):
+                        if _isListOfSigs(v) or isinstance(v, SignalArray):
                             m = _makeMemInfo(v)
                             memdict[n] = m
                             if n in cellvars:
@@ -18,13 +18,17 @@
 #  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
 
 """ Module with the always function. """
-import inspect
+import ast
+import sys
 from types import FunctionType
 
-from myhdl import InstanceError
-from myhdl._util import _isGenFunc, _makeAST
+from myhdl import InstanceError, _diskcache
+from myhdl._intbv import intbv
+from myhdl._Signal import _Signal, _isListOfSigs
+from myhdl._SignalArray import SignalArray
+from myhdl._util import _CodeCache, _isGenFunc, _makeAST
 from myhdl._Waiter import _inferWaiter
-from myhdl._resolverefs import _AttrRefTransformer
+from myhdl._resolverefs import _AttrRefTransformer, _reserved, _resolvesAttr
 from myhdl._visitors import _SigNameVisitor
 
 
@@ -36,10 +40,34 @@ _error.ArgType = "decorated object should be a generator function"
 
 class _CallInfo(object):
 
-    def __init__(self, name, modctxt, symdict):
+    def __init__(self, name, modctxt, frame):
         self.name = name
         self.modctxt = modctxt
-        self.symdict = symdict
+        # the globals are shared with the caller, the locals are a snapshot
+        self.f_globals = frame.f_globals
+        f_locals = frame.f_locals
+        if f_locals is self.f_globals:
+            f_locals = {}
+        self.f_locals = dict(f_locals)
+        self._symdict = None
+
+    @property
+    def symdict(self):
+        """ The namespace of the caller, merged on first use. """
+        if self._symdict is None:
+            symdict = dict(self.f_globals)
+            symdict.update(self.f_locals)
+            self._symdict = symdict
+        return self._symdict
+
+
+def _isBlockContext(frame):
+    """ Check if a frame is the call of a block function by a _Block. """
+    from myhdl import _block
+    if frame is None:
+        return False
+    f_locals = frame.f_locals
+    return 'self' in f_locals and isinstance(f_locals['self'], _block._Block)
 
 
 def _getCallInfo():
@@ -53,18 +81,42 @@ def _getCallInfo():
     2: the block function that defines instances
     3: the caller of the block function, e.g. the BlockInstance.
     """
-    from myhdl import _block
-    funcrec = inspect.stack()[2]
-    name = funcrec[3]
-    frame = funcrec[0]
-    symdict = dict(frame.f_globals)
-    symdict.update(frame.f_locals)
-    modctxt = False
-    callerrec = inspect.stack()[3]
-    f_locals = callerrec[0].f_locals
-    if 'self' in f_locals:
-        modctxt = isinstance(f_locals['self'], _block._Block)
-    return _CallInfo(name, modctxt, symdict)
+    frame = sys._getframe(2)
+    modctxt = _isBlockContext(frame.f_back)
+    return _CallInfo(frame.f_code.co_name, modctxt, frame)
+
+
+def _sigNameKind(obj):
+    """ Return the kind of a name's object, as seen by _SigNameVisitor. """
+    if isinstance(obj, _Signal):
+        return 1
+    elif isinstance(obj, SignalArray):
+        return 2
+    elif isinstance(obj, intbv):
+        return 3
+    elif _isListOfSigs(obj):
+        return 4
+    return 0
+
+
+def _nameRefs(tree):
+    """ Return the names and attribute references in a tree. """
+    names = set()
+    attrrefs = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute) and \
+                isinstance(node.value, ast.Name) and \
+                node.attr not in _reserved:
+            attrrefs.add((node.value.id, node.attr))
+    return sorted(names), sorted(attrrefs)
+
+
+# per code object: the names and attribute references in the function,
+# and the signal analysis for each combination of the kinds of the
+# objects that the names refer to
+_nameInfo = _CodeCache()
 
 
 def instance(genfunc):
@@ -86,28 +138,69 @@ class _Instantiator(object):
         self.modctxt = callinfo.modctxt
         self.genfunc = genfunc
         self.gen = genfunc()
-        # infer symdict
-        f = self.funcobj
-        varnames = f.__code__.co_varnames
+        self._analyzeNames()
+
+    def _analyzeNames(self):
+        """ Infer the symdict, inputs, outputs and signals of the instance. """
+        code = self.funcobj.__code__
+        tree = None
+        info = _nameInfo.get(code)
+        if info is None:
+            info = _diskcache._get(code, 'names')
+            if info is None:
+                tree = self.ast
+                names, attrrefs = _nameRefs(tree)
+                info = (names, attrrefs, {})
+                _diskcache._put(code, 'names', info)
+            _nameInfo[code] = info
+        names, attrrefs, results = info
+        # infer symdict, from the names that the function refers to
+        callinfo = self.callinfo
+        f_globals, f_locals = callinfo.f_globals, callinfo.f_locals
+        varnames = code.co_varnames
         symdict = {}
-        for n, v in callinfo.symdict.items():
-            if n not in varnames:
-                symdict[n] = v
+        for n in names:
+            if n in varnames:
+                continue
+            if n in f_locals:
+                symdict[n] = f_locals[n]
+            elif n in f_globals:
+                symdict[n] = f_globals[n]
+        # resolved attribute references add names, so analyze those anew
+        key = None
+        for name, attr in attrrefs:
+            if _resolvesAttr(symdict, name, attr):
+                # new names should not clash with any name in the caller
+                symdict = {}
+                for n, v in callinfo.symdict.items():
+                    if n not in varnames:
+                        symdict[n] = v
+                break
+        else:
+            key = tuple([_sigNameKind(symdict.get(n)) for n in names])
         self.symdict = symdict
-
-        # print modname, genfunc.__name__
-        tree = self.ast
-        # print ast.dump(tree)
-        v = _AttrRefTransformer(self)
-        v.visit(tree)
-        v = _SigNameVisitor(self.symdict)
-        v.visit(tree)
-        self.inputs = v.inputs
-        self.outputs = v.outputs
-        self.inouts = v.inouts
-        self.embedded_func = v.embedded_func
-        self.sigdict = v.sigdict
-        self.losdict = v.losdict
+        result = results.get(key)
+        if result is None:
+            if tree is None:
+                tree = self.ast
+            # print ast.dump(tree)
+            v = _AttrRefTransformer(self)
+            v.visit(tree)
+            v = _SigNameVisitor(symdict)
+            v.visit(tree)
+            result = (frozenset(v.inputs), frozenset(v.outputs),
+                      frozenset(v.inouts), v.embedded_func,
+                      tuple(v.sigdict), tuple(v.losdict))
+            if key is not None:
+                results[key] = result
+        else:
+            self.objlist = []
+        inputs, outputs, inouts, self.embedded_func, signames, losnames = result
+        self.inputs = set(inputs)
+        self.outputs = set(outputs)
+        self.inouts = set(inouts)
+        self.sigdict = dict([(n, symdict[n]) for n in signames])
+        self.losdict = dict([(n, symdict[n]) for n in losnames])
 
     @property
     def name(self):
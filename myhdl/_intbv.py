@@ -23,13 +23,28 @@ import builtins
 from myhdl._bin import bin
 
 
+def _fullRange(cls, val, nrbits):
+    """ Return a full-range unsigned object of class cls.
+
+    The bounds follow from the bit width, so there is nothing to compute
+    or check; val should be in range.
+
+    """
+    obj = object.__new__(cls)
+    obj._val = val
+    obj._min = 0
+    obj._max = 1 << nrbits
+    obj._nrbits = nrbits
+    return obj
+
+
 class intbv(object):
-    # __slots__ = ('_val', '_min', '_max', '_nrbits', '_handleBounds')
+    __slots__ = ('_val', '_min', '_max', '_nrbits')
 
     def __init__(self, val=0, min=None, max=None, _nrbits=0):
         if _nrbits:
             self._min = 0
-            self._max = 2 ** _nrbits
+            self._max = 1 << _nrbits
         else:
             self._min = min
             self._max = max
@@ -90,14 +105,25 @@ class intbv(object):
 
     # copy methods
     def __copy__(self):
-        c = type(self)(self._val)
+        cls = type(self)
+        if cls.__init__ is _intbvInit:
+            # all state is in the slots: no need to construct and check
+            c = object.__new__(cls)
+            c._val = self._val
+        else:
+            c = cls(self._val)
         c._min = self._min
         c._max = self._max
         c._nrbits = self._nrbits
         return c
 
     def __deepcopy__(self, visit):
-        c = type(self)(self._val)
+        cls = type(self)
+        if cls.__init__ is _intbvInit:
+            c = object.__new__(cls)
+            c._val = self._val
+        else:
+            c = cls(self._val)
         c._min = self._min
         c._max = self._max
         c._nrbits = self._nrbits
@@ -136,8 +162,7 @@ class intbv(object):
             if i <= j:
                 raise ValueError("intbv[i:j] requires i > j\n"
                                  "            i, j == %s, %s" % (i, j))
-            res = intbv((self._val & (1 << i) - 1) >> j, _nrbits=i - j)
-            return res
+            return _fullRange(intbv, (self._val & (1 << i) - 1) >> j, i - j)
         else:
             i = int(key)
             res = bool((self._val >> i) & 0x1)
@@ -562,3 +587,6 @@ class intbv(object):
             return intbv(retVal)[self._nrbits:]
         else:
             return intbv(retVal)
+
+
+_intbvInit = intbv.__init__
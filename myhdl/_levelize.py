@@ -0,0 +1,246 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module with levelized scheduling of always_comb blocks.
+
+When always_comb blocks feed each other, a change ripples through them
+one delta cycle per level, and a block may run several times per time
+step. A levelized network evaluates such blocks once, in topological
+order, within a single delta cycle.
+
+"""
+from myhdl._Signal import _Signal, _isListOfSigs
+from myhdl._simulator import _state
+from myhdl._always_comb import _AlwaysComb
+
+
+def _sigs(obj):
+    if isinstance(obj, _Signal):
+        return [obj]
+    elif _isListOfSigs(obj):
+        return list(obj)
+    return None
+
+
+def _outputs(block):
+    """ Return the output signals of a block, or None if the block
+    can't be levelized. """
+    if block.inouts or not block.outputs:
+        return None
+    outputs = []
+    for n in block.outputs:
+        sigs = _sigs(block.symdict.get(n))
+        if sigs is None:
+            return None
+        for s in sigs:
+            # delayed, shadow and other special signals update differently
+            if type(s)._update is not _Signal._update:
+                return None
+        outputs.extend(sigs)
+    return outputs
+
+
+class _CombTrigger(object):
+
+    """ Waiter that marks a block of a network for evaluation. """
+
+    __slots__ = ('network', 'index', 'hasRun')
+
+    def __init__(self, network, index):
+        self.network = network
+        self.index = index
+        self.hasRun = 0
+
+    def next(self, waiters, actives, exc):
+        if self.hasRun:
+            raise StopIteration
+        self.hasRun = 1
+        network = self.network
+        network.dirty[self.index] = True
+        if not network.pending:
+            network.pending = True
+            # evaluate after the other waiters of this delta cycle
+            waiters.insert(0, network)
+
+
+class _CombNetwork(object):
+
+    """ Waiter that evaluates always_comb blocks in topological order.
+
+    Signals driven inside the network are updated as soon as their
+    block has run, so that the blocks that read them see the new value
+    in the same delta cycle. Only signals driven from outside the
+    network wake it up.
+
+    The network runs after the other waiters of its delta cycle, so no
+    other process sees the early updates. The processes that wait on
+    the updated signals run in the next delta cycle, as they would
+    without levelization: the network registers itself in the siglist,
+    and returns their waiters from its _update method.
+
+    """
+
+    __slots__ = ('blocks', 'funcs', 'outputs', 'inputs', 'triggers',
+                 'dirty', 'pending', 'deferred', 'committed', '_pending')
+
+    def __init__(self, blocks, simfuncs=None):
+        producers = {}
+        for i, b in enumerate(blocks):
+            for s in _outputs(b):
+                producers.setdefault(id(s), []).append(i)
+        consumers = {}
+        inputs = []
+        for j, b in enumerate(blocks):
+            external = []
+            for s in b.senslist:
+                if id(s) in producers:
+                    consumers.setdefault(id(s), []).append(j)
+                else:
+                    external.append(s)
+            inputs.append(external)
+        self.blocks = blocks
+        simfuncs = simfuncs or {}
+        self.funcs = [simfuncs.get(id(b), b.func) for b in blocks]
+        self.outputs = [[(s, consumers.get(id(s), ())) for s in _outputs(b)]
+                        for b in blocks]
+        self.inputs = inputs
+        self.triggers = [None] * len(blocks)
+        self.dirty = [True] * len(blocks)
+        self.pending = True
+        # the waiters of the updated signals, and those signals
+        self.deferred = []
+        self.committed = []
+        self._pending = False
+
+    def _update(self):
+        """ Return the waiters of the signals updated in the last delta
+        cycle, like a signal update does. """
+        self._pending = False
+        waiters = self.deferred
+        self.deferred = []
+        return waiters
+
+    def next(self, waiters, actives, exc):
+        self.pending = False
+        dirty = self.dirty
+        deferred = self.deferred
+        if not self._pending:
+            del self.committed[:]
+        for i, func in enumerate(self.funcs):
+            if not dirty[i]:
+                continue
+            dirty[i] = False
+            func()
+            for s, consumers in self.outputs[i]:
+                if s._val != s._next:
+                    deferred.extend(s._update())
+                    self.committed.append(s)
+                    for j in consumers:
+                        dirty[j] = True
+        if self.committed and not self._pending:
+            self._pending = True
+            _state.siglist.append(self)
+        for i, inputs in enumerate(self.inputs):
+            trigger = self.triggers[i]
+            if not inputs or (trigger is not None and not trigger.hasRun):
+                continue
+            trigger = self.triggers[i] = _CombTrigger(self, i)
+            for s in inputs:
+                wl = s._eventWaiters
+                wl.append(trigger)
+                if len(inputs) > 1:
+                    actives[id(wl)] = wl
+
+
+def _sortBlocks(blocks):
+    """ Sort always_comb blocks topologically.
+
+    Return the indices of the blocks in evaluation order, and the
+    successors of each block. Blocks that are part of a combinational
+    loop, or that read a signal driven from one, are left out.
+
+    """
+    producers = {}
+    for i, b in enumerate(blocks):
+        for s in _outputs(b):
+            producers.setdefault(id(s), set()).add(i)
+    succs = [set() for b in blocks]
+    for j, b in enumerate(blocks):
+        for s in b.senslist:
+            for i in producers.get(id(s), ()):
+                succs[i].add(j)
+    # topological sort; blocks in or behind a loop never get ready
+    indegree = [0] * len(blocks)
+    for i in range(len(blocks)):
+        for j in succs[i]:
+            indegree[j] += 1
+    ready = [i for i in range(len(blocks)) if indegree[i] == 0]
+    order = []
+    while ready:
+        i = ready.pop()
+        order.append(i)
+        for j in succs[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                ready.append(j)
+    return order, succs
+
+
+def _levelize(arglist, simfuncs=None):
+    """ Group the always_comb blocks in arglist into networks.
+
+    simfuncs -- the functions to run instead of those of the blocks, by
+                id of the block
+
+    Return a list of networks. Blocks that are part of a combinational
+    loop, or that have no neighbour to be evaluated with, are left out
+    and stay event-driven.
+
+    """
+    blocks = [arg for arg in arglist
+              if isinstance(arg, _AlwaysComb) and _outputs(arg) is not None]
+    order, succs = _sortBlocks(blocks)
+    # connected groups of sorted blocks
+    rank = dict((i, r) for r, i in enumerate(order))
+    neighbours = dict((i, set()) for i in order)
+    for i in order:
+        for j in succs[i]:
+            if j in rank:
+                neighbours[i].add(j)
+                neighbours[j].add(i)
+    networks = []
+    seen = set()
+    for i in order:
+        if i in seen:
+            continue
+        group = []
+        todo = [i]
+        seen.add(i)
+        while todo:
+            k = todo.pop()
+            group.append(k)
+            for m in neighbours[k]:
+                if m not in seen:
+                    seen.add(m)
+                    todo.append(m)
+        if len(group) > 1:
+            group.sort(key=rank.get)
+            networks.append(_CombNetwork([blocks[k] for k in group],
+                                         simfuncs))
+    return networks
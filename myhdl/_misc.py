@@ -25,14 +25,16 @@ downrange -- function that returns a downward range
 
 """
 import inspect
+import sys
 
+from myhdl._Clock import Clock
 from myhdl._Cosimulation import Cosimulation
 from myhdl._instance import _Instantiator
 
 
 def _isGenSeq(obj):
     from myhdl._block import _Block
-    if isinstance(obj, (Cosimulation, _Instantiator, _Block)):
+    if isinstance(obj, (Cosimulation, Clock, _Instantiator, _Block)):
         return True
     if not isinstance(obj, (list, tuple, set)):
         return False
@@ -53,8 +55,7 @@ def isboundmethod(m):
 
 
 def instances():
-    f = inspect.currentframe()
-    d = inspect.getouterframes(f)[1][0].f_locals
+    d = sys._getframe(1).f_locals
     l = []
     for v in d.values():
         if _isGenSeq(v):
@@ -18,7 +18,7 @@
 #  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
 
 """ Module with the modbv class """
-from ._intbv import intbv
+from ._intbv import intbv, _fullRange
 
 
 class modbv(intbv):
@@ -28,7 +28,12 @@ class modbv(intbv):
         lo, hi, val = self._min, self._max, self._val
         if lo is not None:
             if val < lo or val >= hi:
-                self._val = (val - lo) % (hi - lo) + lo
+                span = hi - lo
+                if span & (span - 1):
+                    self._val = (val - lo) % span + lo
+                else:
+                    # full range: wrap with a mask
+                    self._val = ((val - lo) & (span - 1)) + lo
 
     def __repr__(self):
         return "modbv(" + repr(self._val) + ")"
@@ -51,8 +56,7 @@ class modbv(intbv):
             if i <= j:
                 raise ValueError("modbv[i:j] requires i > j\n"
                                  "            i, j == %s, %s" % (i, j))
-            res = modbv((self._val & (1 << i) - 1) >> j, _nrbits=i - j)
-            return res
+            return _fullRange(modbv, (self._val & (1 << i) - 1) >> j, i - j)
         else:
             i = int(key)
             res = bool((self._val >> i) & 0x1)
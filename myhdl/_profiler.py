@@ -0,0 +1,229 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module with the simulation profiler.
+
+The profiler runs the waiters of each delta cycle on behalf of the
+simulation kernel, and records per process how often it resumed, how
+much wall time it took, and how many signals it wrote.
+
+"""
+import json
+from time import perf_counter
+
+from myhdl._block import _Block
+from myhdl._getHierarchy import _getHierarchy
+from myhdl._instance import _Instantiator
+
+
+class _ProcessStats(object):
+
+    __slots__ = ('name', 'resumes', 'time', 'writes')
+
+    def __init__(self, name):
+        self.name = name
+        self.resumes = 0
+        self.time = 0.0
+        self.writes = 0
+
+
+class _Profiler(object):
+
+    """ Activation counts and wall time of the processes of a simulation.
+
+    Processes are named after their place in the block hierarchy. A
+    generator that is spawned by a process is named after that process.
+
+    Methods:
+    report -- return the profile as a table
+    json -- return the profile as a JSON string
+
+    """
+
+    def __init__(self, args, aliases=None):
+        self._names = {}
+        self._stats = {}
+        self._used = set()
+        self._spawned = {}
+        self.runtime = 0.0
+        self.timesteps = 0
+        self.deltas = 0
+        self.deltahist = {}
+        self._stepDeltas = 0
+        self._recorded = None
+        self._resuming = False
+        for arg in args:
+            self._nameArg(arg)
+        # generators that run on behalf of the generator of a block
+        for gen, orig in (aliases or {}).items():
+            if orig in self._names:
+                self._names[gen] = self._names[orig]
+
+    def _nameArg(self, arg):
+        if isinstance(arg, _Block):
+            path = []
+            for inst in _getHierarchy(arg.name, arg).hierarchy:
+                del path[inst.level - 1:]
+                path.append(inst.name)
+                for name, sub in inst.subs:
+                    if isinstance(sub, _Instantiator):
+                        self._names[sub.gen] = '.'.join(path + [name])
+        elif isinstance(arg, _Instantiator):
+            self._names[arg.gen] = arg.name
+        elif isinstance(arg, (list, tuple, set)):
+            for item in arg:
+                self._nameArg(item)
+
+    def _key(self, waiter):
+        """ Return the object that identifies the process of a waiter """
+        key = getattr(waiter, 'generator', None)
+        if key is None:
+            # levelized networks and their triggers
+            key = getattr(waiter, 'network', waiter)
+        return key
+
+    def _newStat(self, waiter, key):
+        caller = getattr(waiter, 'caller', None)
+        if caller is not None:
+            # spawned generators of a process share their statistics
+            name = '%s/%s' % (self._stat(caller).name, key.__qualname__)
+            stat = self._spawned.get(name)
+            if stat is None:
+                stat = self._spawned[name] = _ProcessStats(name)
+            return stat
+        name = self._names.get(key)
+        if name is None:
+            if hasattr(key, 'blocks'):
+                name = '+'.join(self._names.get(b.gen, b.name)
+                                for b in key.blocks)
+            else:
+                name = getattr(key, '__qualname__', type(key).__name__)
+        if name in self._used:
+            n = 2
+            while '%s#%s' % (name, n) in self._used:
+                n += 1
+            name = '%s#%s' % (name, n)
+        self._used.add(name)
+        return _ProcessStats(name)
+
+    def _stat(self, waiter):
+        key = self._key(waiter)
+        stat = self._stats.get(key)
+        if stat is None:
+            stat = self._newStat(waiter, key)
+            if stat.name not in self._spawned:
+                self._stats[key] = stat
+        return stat
+
+    def runWaiters(self, waiters, actives, exc, siglist):
+        """ Run the waiters of a delta cycle and record their cost """
+        if self._resuming:
+            self._resuming = False
+            if not waiters:
+                # a resumed run continues the time step it stopped in
+                return
+        self.deltas += 1
+        self._stepDeltas += 1
+        while waiters:
+            waiter = waiters.pop()
+            if getattr(waiter, 'hasRun', 0):
+                # stale entry of a waiter that already ran
+                continue
+            nrsigs = len(siglist)
+            start = perf_counter()
+            try:
+                waiter.next(waiters, actives, exc)
+            except StopIteration:
+                pass
+            elapsed = perf_counter() - start
+            stat = self._stat(waiter)
+            stat.resumes += 1
+            stat.time += elapsed
+            stat.writes += len(siglist) - nrsigs
+
+    def _record(self):
+        """ Record the number of delta cycles of the current time step,
+        replacing an earlier record of the same time step """
+        hist = self.deltahist
+        if self._recorded is None:
+            self.timesteps += 1
+        else:
+            hist[self._recorded] -= 1
+            if not hist[self._recorded]:
+                del hist[self._recorded]
+        n = self._recorded = self._stepDeltas
+        hist[n] = hist.get(n, 0) + 1
+
+    def timestep(self):
+        """ Record the current time step when the simulation time advances """
+        self._record()
+        self._stepDeltas = 0
+        self._recorded = None
+
+    def resume(self):
+        """ Note that a run starts or resumes """
+        self._resuming = True
+
+    def flush(self):
+        """ Record the open time step when a run returns or stops """
+        if self._stepDeltas:
+            self._record()
+
+    def stats(self):
+        """ Return the process statistics, most expensive first """
+        stats = list(self._stats.values()) + list(self._spawned.values())
+        return sorted(stats, key=lambda s: -s.time)
+
+    def asdict(self):
+        return {
+            'runtime': self.runtime,
+            'timesteps': self.timesteps,
+            'deltas': self.deltas,
+            'deltahist': dict(self.deltahist),
+            'processes': [{'name': s.name, 'resumes': s.resumes,
+                           'time': s.time, 'writes': s.writes}
+                          for s in self.stats()],
+        }
+
+    def json(self, **kwargs):
+        """ Return the profile as a JSON string.
+
+        kwargs -- passed to json.dumps
+
+        """
+        return json.dumps(self.asdict(), **kwargs)
+
+    def report(self):
+        """ Return the profile as a table """
+        stats = self.stats()
+        width = max([len(s.name) for s in stats] + [len('process')])
+        lines = ["%-*s %10s %10s %7s %10s" %
+                 (width, 'process', 'resumes', 'time(s)', '%time', 'writes')]
+        total = self.runtime or 1.0
+        for s in stats:
+            lines.append("%-*s %10d %10.4f %7.1f %10d" %
+                         (width, s.name, s.resumes, s.time,
+                          100.0 * s.time / total, s.writes))
+        lines.append("")
+        lines.append("run time: %.4f s, time steps: %d, delta cycles: %d" %
+                     (self.runtime, self.timesteps, self.deltas))
+        if self.deltahist:
+            lines.append("delta cycles per time step: " + ", ".join(
+                "%d: %d" % (n, c) for n, c in sorted(self.deltahist.items())))
+        return "\n".join(lines)
@@ -30,6 +30,23 @@ def _suffixer(name, used_names):
     return next(s for s in new_names if s not in used_names)
 
 
+# attributes that are never resolved to an object
+_reserved = ('next', 'posedge', 'negedge', 'max', 'min', 'val', 'signed',
+             'verilog_code', 'vhdl_code')
+
+
+def _resolvesAttr(symdict, name, attr):
+    """ Check if the attribute reference name.attr resolves to an object. """
+    if name not in symdict:
+        return False
+    obj = symdict[name]
+    if isinstance(obj, (EnumType, FunctionType)):
+        return False
+    elif isinstance(obj, SignalType):
+        return not hasattr(SignalType, attr)
+    return True
+
+
 class _AttrRefTransformer(ast.NodeTransformer):
 
     def __init__(self, data):
@@ -41,27 +58,19 @@ class _AttrRefTransformer(ast.NodeTransformer):
     def visit_Attribute(self, node):
         self.generic_visit(node)
 
-        reserved = ('next', 'posedge', 'negedge', 'max', 'min', 'val', 'signed',
-                    'verilog_code', 'vhdl_code')
-        if node.attr in reserved:
+        if node.attr in _reserved:
             return node
 
         # Don't handle subscripts for now.
         if not isinstance(node.value, ast.Name):
             return node
 
-        # Don't handle locals
-        if node.value.id not in self.data.symdict:
+        # Don't handle locals, enums and functions, handle signals as long
+        # as it is a new attribute
+        if not _resolvesAttr(self.data.symdict, node.value.id, node.attr):
             return node
 
         obj = self.data.symdict[node.value.id]
-        # Don't handle enums and functions, handle signals as long as it is a new attribute
-        if isinstance(obj, (EnumType, FunctionType)):
-            return node
-        elif isinstance(obj, SignalType):
-            if hasattr(SignalType, node.attr):
-                return node
-
         attrobj = getattr(obj, node.attr)
 
         orig_name = node.value.id + '.' + node.attr
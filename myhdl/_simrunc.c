@@ -0,0 +1,404 @@
+/*
+ *  This file is part of the myhdl library, a Python package for using
+ *  Python as a Hardware Description Language.
+ *
+ *  Copyright (C) 2003-2008 Jan Decaluwe
+ *
+ *  The myhdl library is free software; you can redistribute it and/or
+ *  modify it under the terms of the GNU Lesser General Public License as
+ *  published by the Free Software Foundation; either version 2.1 of the
+ *  License, or (at your option) any later version.
+ *
+ *  This library is distributed in the hope that it will be useful, but
+ *  WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ *  Lesser General Public License for more details.
+ *
+ *  You should have received a copy of the GNU Lesser General Public
+ *  License along with this library; if not, write to the Free Software
+ *  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+ */
+
+/*
+ * Compiled simulation kernel.
+ *
+ * The run function is a C version of myhdl._Simulation._run, which
+ * remains the reference implementation. Both take the same arguments and
+ * only return by raising an exception.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+
+static PyObject *_simulator = NULL;
+static PyObject *_Waiter = NULL;
+static PyObject *StopSimulation = NULL;
+static PyObject *SuspendSimulation = NULL;
+
+static PyObject *str_update = NULL;
+static PyObject *str_next = NULL;
+static PyObject *str_hasChange = NULL;
+static PyObject *str_get = NULL;
+static PyObject *str_put = NULL;
+static PyObject *str_purge = NULL;
+static PyObject *str_nextTime = NULL;
+static PyObject *str_pop = NULL;
+static PyObject *str_apply = NULL;
+static PyObject *str_time = NULL;
+static PyObject *str_write = NULL;
+
+
+/* The myhdl objects are looked up on the first run, as this module is
+   imported while the myhdl package is being initialized. */
+static int
+init_myhdl(void)
+{
+    PyObject *myhdl, *waiterModule;
+
+    if (_simulator != NULL) {
+        return 0;
+    }
+    myhdl = PyImport_ImportModule("myhdl");
+    if (myhdl == NULL) {
+        return -1;
+    }
+    StopSimulation = PyObject_GetAttrString(myhdl, "StopSimulation");
+    SuspendSimulation = PyObject_GetAttrString(myhdl, "_SuspendSimulation");
+    Py_DECREF(myhdl);
+    if (StopSimulation == NULL || SuspendSimulation == NULL) {
+        return -1;
+    }
+    waiterModule = PyImport_ImportModule("myhdl._Waiter");
+    if (waiterModule == NULL) {
+        return -1;
+    }
+    _Waiter = PyObject_GetAttrString(waiterModule, "_Waiter");
+    Py_DECREF(waiterModule);
+    if (_Waiter == NULL) {
+        return -1;
+    }
+    _simulator = PyImport_ImportModule("myhdl._simulator");
+    if (_simulator == NULL) {
+        return -1;
+    }
+    return 0;
+}
+
+
+/* list.extend for the waiter lists returned by _update and apply */
+static int
+extend(PyObject *list, PyObject *seq)
+{
+    PyObject *fast, **items;
+    Py_ssize_t i, n;
+
+    fast = PySequence_Fast(seq, "expected a list of waiters");
+    if (fast == NULL) {
+        return -1;
+    }
+    n = PySequence_Fast_GET_SIZE(fast);
+    items = PySequence_Fast_ITEMS(fast);
+    for (i = 0; i < n; i++) {
+        if (PyList_Append(list, items[i]) < 0) {
+            Py_DECREF(fast);
+            return -1;
+        }
+    }
+    Py_DECREF(fast);
+    return 0;
+}
+
+
+/* call a method without arguments on each cosimulation object, or with
+   argument arg if it is not NULL */
+static int
+call_cosims(PyObject *cosims, PyObject *name, PyObject *arg)
+{
+    PyObject *fast, *r;
+    Py_ssize_t i;
+
+    fast = PySequence_Fast(cosims, "expected a list of cosimulations");
+    if (fast == NULL) {
+        return -1;
+    }
+    for (i = 0; i < PySequence_Fast_GET_SIZE(fast); i++) {
+        r = PyObject_CallMethodObjArgs(PySequence_Fast_GET_ITEM(fast, i),
+                                       name, arg, NULL);
+        if (r == NULL) {
+            Py_DECREF(fast);
+            return -1;
+        }
+        Py_DECREF(r);
+    }
+    Py_DECREF(fast);
+    return 0;
+}
+
+
+/* any_cosim_changes = any_cosim_changes or cosim._hasChange */
+static int
+any_cosim_changes(PyObject *cosims)
+{
+    PyObject *fast, *change;
+    Py_ssize_t i;
+    int res = 0;
+
+    fast = PySequence_Fast(cosims, "expected a list of cosimulations");
+    if (fast == NULL) {
+        return -1;
+    }
+    for (i = 0; i < PySequence_Fast_GET_SIZE(fast) && !res; i++) {
+        change = PyObject_GetAttr(PySequence_Fast_GET_ITEM(fast, i),
+                                  str_hasChange);
+        if (change == NULL) {
+            Py_DECREF(fast);
+            return -1;
+        }
+        res = PyObject_IsTrue(change);
+        Py_DECREF(change);
+    }
+    Py_DECREF(fast);
+    return res;
+}
+
+
+static PyObject *
+run(PyObject *self, PyObject *args)
+{
+    PyObject *waiters, *cosims, *siglist, *futureEvents;
+    PyObject *maxTime, *duration, *exc, *tracefile;
+    PyObject *t = NULL, *actives = NULL;
+    PyObject *s, *waiter, *r, *values, *events, *event, *msg;
+    Py_ssize_t i, n;
+    int hasCosims, changes, res;
+
+    if (!PyArg_ParseTuple(args, "O!OO!OOOO!O:run",
+                          &PyList_Type, &waiters, &cosims,
+                          &PyList_Type, &siglist, &futureEvents,
+                          &maxTime, &duration, &PyList_Type, &exc,
+                          &tracefile)) {
+        return NULL;
+    }
+    if (init_myhdl() < 0) {
+        return NULL;
+    }
+    hasCosims = PyObject_IsTrue(cosims);
+    if (hasCosims < 0) {
+        return NULL;
+    }
+    t = PyObject_GetAttr(_simulator, str_time);
+    if (t == NULL) {
+        return NULL;
+    }
+    actives = PyDict_New();
+    if (actives == NULL) {
+        goto error;
+    }
+
+    for (;;) {
+
+        /* signal updates; the list may grow while it is walked */
+        for (i = 0; i < PyList_GET_SIZE(siglist); i++) {
+            s = PyList_GET_ITEM(siglist, i);
+            Py_INCREF(s);
+            r = PyObject_CallMethodObjArgs(s, str_update, NULL);
+            Py_DECREF(s);
+            if (r == NULL) {
+                goto error;
+            }
+            res = extend(waiters, r);
+            Py_DECREF(r);
+            if (res < 0) {
+                goto error;
+            }
+        }
+        if (PyList_SetSlice(siglist, 0, PyList_GET_SIZE(siglist), NULL) < 0) {
+            goto error;
+        }
+
+        /* run the waiters, last in first out */
+        while ((n = PyList_GET_SIZE(waiters)) > 0) {
+            waiter = PyList_GET_ITEM(waiters, n - 1);
+            Py_INCREF(waiter);
+            if (PyList_SetSlice(waiters, n - 1, n, NULL) < 0) {
+                Py_DECREF(waiter);
+                goto error;
+            }
+            r = PyObject_CallMethodObjArgs(waiter, str_next,
+                                           waiters, actives, exc, NULL);
+            Py_DECREF(waiter);
+            if (r == NULL) {
+                if (PyErr_ExceptionMatches(PyExc_StopIteration)) {
+                    PyErr_Clear();
+                    continue;
+                }
+                goto error;
+            }
+            Py_DECREF(r);
+        }
+
+        if (hasCosims) {
+            changes = any_cosim_changes(cosims);
+            if (changes < 0) {
+                goto error;
+            }
+            if (call_cosims(cosims, str_get, NULL) < 0) {
+                goto error;
+            }
+            if (PyList_GET_SIZE(siglist) > 0 || changes) {
+                if (call_cosims(cosims, str_put, t) < 0) {
+                    goto error;
+                }
+                continue;
+            }
+        }
+        else if (PyList_GET_SIZE(siglist) > 0) {
+            continue;
+        }
+
+        if (PyDict_GET_SIZE(actives) > 0) {
+            values = PyDict_Values(actives);
+            if (values == NULL) {
+                goto error;
+            }
+            for (i = 0; i < PyList_GET_SIZE(values); i++) {
+                r = PyObject_CallMethodObjArgs(PyList_GET_ITEM(values, i),
+                                               str_purge, NULL);
+                if (r == NULL) {
+                    Py_DECREF(values);
+                    goto error;
+                }
+                Py_DECREF(r);
+            }
+            Py_DECREF(values);
+            PyDict_Clear(actives);
+        }
+
+        /* at this point it is safe to potentially suspend a simulation */
+        if (PyList_GET_SIZE(exc) > 0) {
+            event = PyList_GET_ITEM(exc, 0);
+            PyErr_SetObject((PyObject *)Py_TYPE(event), event);
+            goto error;
+        }
+
+        /* future events */
+        res = PyObject_IsTrue(futureEvents);
+        if (res < 0) {
+            goto error;
+        }
+        if (!res) {
+            PyErr_SetString(StopSimulation, "No more events");
+            goto error;
+        }
+        res = PyObject_RichCompareBool(t, maxTime, Py_EQ);
+        if (res < 0) {
+            goto error;
+        }
+        if (res) {
+            msg = PyUnicode_FromFormat("Simulated %S timesteps", duration);
+            if (msg != NULL) {
+                PyErr_SetObject(SuspendSimulation, msg);
+                Py_DECREF(msg);
+            }
+            goto error;
+        }
+        r = PyObject_CallMethodObjArgs(futureEvents, str_nextTime, NULL);
+        if (r == NULL) {
+            goto error;
+        }
+        Py_SETREF(t, r);
+        if (PyObject_SetAttr(_simulator, str_time, t) < 0) {
+            goto error;
+        }
+        if (tracefile != Py_None) {
+            msg = PyUnicode_FromFormat("#%S\n", t);
+            if (msg == NULL) {
+                goto error;
+            }
+            r = PyObject_CallMethodObjArgs(tracefile, str_write, msg, NULL);
+            Py_DECREF(msg);
+            if (r == NULL) {
+                goto error;
+            }
+            Py_DECREF(r);
+        }
+        if (hasCosims) {
+            if (call_cosims(cosims, str_put, t) < 0) {
+                goto error;
+            }
+        }
+        r = PyObject_CallMethodObjArgs(futureEvents, str_pop, t, NULL);
+        if (r == NULL) {
+            goto error;
+        }
+        events = PySequence_Fast(r, "expected a list of events");
+        Py_DECREF(r);
+        if (events == NULL) {
+            goto error;
+        }
+        for (i = 0; i < PySequence_Fast_GET_SIZE(events); i++) {
+            event = PySequence_Fast_GET_ITEM(events, i);
+            res = PyObject_IsInstance(event, _Waiter);
+            if (res > 0) {
+                res = PyList_Append(waiters, event);
+            }
+            else if (res == 0) {
+                r = PyObject_CallMethodObjArgs(event, str_apply, NULL);
+                if (r == NULL) {
+                    res = -1;
+                }
+                else {
+                    res = extend(waiters, r);
+                    Py_DECREF(r);
+                }
+            }
+            if (res < 0) {
+                Py_DECREF(events);
+                goto error;
+            }
+        }
+        Py_DECREF(events);
+    }
+
+ error:
+    Py_XDECREF(t);
+    Py_XDECREF(actives);
+    return NULL;
+}
+
+
+static PyMethodDef simruncmethods[] = {
+    {"run", (PyCFunction)run, METH_VARARGS,
+     "Run the simulation loop until an exception stops it."},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef simruncmodule = {
+    PyModuleDef_HEAD_INIT,
+    "_simrunc",
+    "Compiled simulation kernel",
+    -1,
+    simruncmethods
+};
+
+
+#define INTERN(var, name) \
+    if ((var = PyUnicode_InternFromString(name)) == NULL) return NULL;
+
+PyMODINIT_FUNC
+PyInit__simrunc(void)
+{
+    INTERN(str_update, "_update");
+    INTERN(str_next, "next");
+    INTERN(str_hasChange, "_hasChange");
+    INTERN(str_get, "_get");
+    INTERN(str_put, "_put");
+    INTERN(str_purge, "purge");
+    INTERN(str_nextTime, "nextTime");
+    INTERN(str_pop, "pop");
+    INTERN(str_apply, "apply");
+    INTERN(str_time, "_time");
+    INTERN(str_write, "write");
+    return PyModule_Create(&simruncmodule);
+}
@@ -20,20 +20,214 @@
 """ Simulator internals and the now function
 
 This module provides the following objects:
+SimulationContext -- class that holds the state of a simulation
 now -- function that returns the current simulation time
 
 """
+import sys
+import threading
+from heapq import heappush, heappop
+from itertools import count
+from types import ModuleType
 
 
-_signals = []
+class _EventQueue(object):
+
+    """ Future event queue.
+
+    Events are kept in a binary heap ordered on time. A sequence number
+    keeps events that are scheduled for the same time point in insertion
+    order.
+
+    """
+
+    __slots__ = ('_heap', '_count')
+
+    def __init__(self):
+        self._heap = []
+        self._count = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def clear(self):
+        del self._heap[:]
+
+    def schedule(self, t, event):
+        heappush(self._heap, (t, next(self._count), event))
+
+    def nextTime(self):
+        return self._heap[0][0]
+
+    def pop(self, t):
+        """ Remove and return the events scheduled at time t """
+        heap = self._heap
+        events = []
+        while heap and heap[0][0] == t:
+            events.append(heappop(heap)[2])
+        return events
+
+
+class _TimingWheel(object):
+
+    """ Future event queue based on a timing wheel.
+
+    Events less than size time units ahead of the current time are kept
+    in the slot indexed by their time modulo size. Other events go to an
+    overflow heap. The times of the occupied slots are kept in a small
+    heap, so that finding the next time point doesn't scan empty slots.
+    For designs dominated by clocks and short delays, scheduling and
+    popping events is O(1), plus O(log n) per time point in the number
+    of occupied slots.
+
+    """
+
+    __slots__ = ('_slots', '_mask', '_size', '_now', '_nrEvents',
+                 '_times', '_overflow')
+
+    def __init__(self, size=1024):
+        if size <= 0 or size & (size - 1):
+            raise ValueError("timing wheel size should be a power of 2")
+        self._size = size
+        self._mask = size - 1
+        self._slots = [[] for __ in range(size)]
+        self._now = 0
+        self._nrEvents = 0
+        self._times = []
+        self._overflow = _EventQueue()
+
+    def __len__(self):
+        return self._nrEvents + len(self._overflow)
+
+    def clear(self):
+        for slot in self._slots:
+            del slot[:]
+        self._now = 0
+        self._nrEvents = 0
+        del self._times[:]
+        self._overflow.clear()
+
+    def schedule(self, t, event):
+        if t - self._now < self._size:
+            slot = self._slots[t & self._mask]
+            if not slot:
+                heappush(self._times, t)
+            slot.append(event)
+            self._nrEvents += 1
+        else:
+            self._overflow.schedule(t, event)
+
+    def nextTime(self):
+        overflow = self._overflow
+        if self._times:
+            t = self._times[0]
+            if overflow:
+                return min(t, overflow.nextTime())
+            return t
+        return overflow.nextTime()
+
+    def pop(self, t):
+        """ Remove and return the events scheduled at time t """
+        self._now = t
+        i = t & self._mask
+        events = self._slots[i]
+        if events:
+            self._slots[i] = []
+            self._nrEvents -= len(events)
+            heappop(self._times)
+        if self._overflow:
+            # overflow events for time t were scheduled before any wheel
+            # event for time t, so they come first to keep insertion order
+            events = self._overflow.pop(t) + events
+        return events
+
+
+_schedulers = {'heap': _EventQueue,
+               'wheel': _TimingWheel,
+               }
+
 _blocks = []
-_siglist = []
-_futureEvents = []
-_time = 0
-_tracing = 0
-_tf = None
+
+
+class SimulationContext(object):
+
+    """ State of a simulation.
+
+    Signals register with the context that is current when they are
+    created, and a Simulation uses the context that is current when it
+    is constructed. Each thread starts with its own context, so
+    independent simulations can run in threads. Within a thread, a
+    context can be made current with a with statement, for example to
+    keep a design in memory while another one runs.
+
+    """
+
+    def __init__(self):
+        self._signals = []
+        self._siglist = []
+        self._futureEvents = _EventQueue()
+        self._time = 0
+        self._tracing = 0
+        self._tf = None
+        self._simulation = None
+
+    def __enter__(self):
+        _state.stack.append(_state.context)
+        _activate(self)
+        return self
+
+    def __exit__(self, *exc):
+        _activate(_state.stack.pop())
+
+
+class _State(threading.local):
+
+    """ The current context of each thread """
+
+    def __init__(self):
+        self.stack = []
+        self.context = SimulationContext()
+        self.siglist = self.context._siglist
+
+
+def _activate(context):
+    _state.context = context
+    _state.siglist = context._siglist
+
+
+_state = _State()
+
+
+def _context():
+    """ Return the current context """
+    return _state.context
 
 
 def now():
     """ Return the current simulation time """
-    return _time
+    return _state.context._time
+
+
+class _SimulatorModule(ModuleType):
+
+    """ Module type that resolves the simulation state through the
+    current context. """
+
+
+def _contextProperty(name):
+
+    def fget(module):
+        return getattr(_state.context, name)
+
+    def fset(module, value):
+        setattr(_state.context, name, value)
+
+    return property(fget, fset)
+
+
+for _name in ('_signals', '_siglist', '_futureEvents', '_time', '_tracing',
+              '_tf'):
+    setattr(_SimulatorModule, _name, _contextProperty(_name))
+del _name
+
+sys.modules[__name__].__class__ = _SimulatorModule
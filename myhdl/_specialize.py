@@ -0,0 +1,349 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module with the specialization of always block functions.
+
+The function of an always, always_comb or always_seq block is rewritten
+into Python code that works on the signals it refers to directly:
+signal operands are replaced by their current value, and assignments
+to the next value of a signal check the value inline and store it.
+Values that the inline checks don't accept go through the next
+attribute as before. The signals that a function assigns are registered
+for update once, when it returns.
+
+Only the signals that the function refers to as free variables are
+specialized. A specialized function checks on each call that they still
+refer to the same signals, and calls the original function if not.
+
+"""
+import ast
+import types
+
+from myhdl._intbv import intbv
+from myhdl._modbv import modbv
+from myhdl._Signal import _Signal
+from myhdl._simulator import _state
+from myhdl._util import _makeAST
+
+# signal methods that delegate to the current value
+_readMethods = (
+    '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+    '__truediv__', '__rtruediv__', '__floordiv__', '__rfloordiv__',
+    '__mod__', '__rmod__', '__pow__', '__rpow__', '__lshift__',
+    '__rlshift__', '__rshift__', '__rrshift__', '__and__', '__rand__',
+    '__or__', '__ror__', '__xor__', '__rxor__', '__neg__', '__pos__',
+    '__invert__', '__bool__', '__getitem__', '__eq__', '__ne__', '__lt__',
+    '__le__', '__gt__', '__ge__')
+
+_binOps = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+           ast.Pow, ast.LShift, ast.RShift, ast.BitAnd, ast.BitOr, ast.BitXor)
+_cmpOps = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+_prefix = '_myhdl_'
+
+# statements to set the next value of a signal, per kind of signal
+_setNext = {
+    'bool': """
+if _myhdl_v.__class__ is bool:
+    {sig}._next = _myhdl_v
+else:
+    {sig}.next = _myhdl_v
+""",
+    'int': """
+if _myhdl_v.__class__ is int:
+    {sig}._next = _myhdl_v
+else:
+    {sig}.next = _myhdl_v
+""",
+    'intbv': """
+if _myhdl_v.__class__ in _myhdl_intbvs:
+    _myhdl_v = _myhdl_v._val
+if _myhdl_v.__class__ is int{bounds}:
+    {sig}._next._val = _myhdl_v
+else:
+    {sig}.next = _myhdl_v
+""",
+}
+
+
+def _sigKind(sig):
+    """ Return how the next value of a signal can be set inline.
+
+    Return None if the signal can't be specialized, and '' if it can
+    only be read.
+    """
+    cls = type(sig)
+    for m in _readMethods:
+        if getattr(cls, m) is not getattr(_Signal, m):
+            return None
+    if cls.next is not _Signal.next:
+        return ''
+    setter = getattr(sig._setNextVal, '__func__', None)
+    if setter is _Signal._setNextBool:
+        return 'bool'
+    elif setter is _Signal._setNextInt:
+        return 'int'
+    elif setter is _Signal._setNextIntbv and type(sig._next) in (intbv, modbv):
+        return 'intbv'
+    return ''
+
+
+class _Specializer(ast.NodeTransformer):
+
+    def __init__(self, sigs):
+        self.sigs = sigs  # name -> signal
+        self.kinds = {}
+        for n, s in sigs.items():
+            self.kinds[n] = _sigKind(s)
+        self.used = []
+        self.assigned = []
+
+    def isSig(self, node):
+        return isinstance(node, ast.Name) and node.id in self.kinds
+
+    def isValue(self, node):
+        return isinstance(node, ast.Constant) or getattr(node, 'isValue', False)
+
+    def use(self, name, names):
+        if name not in names:
+            names.append(name)
+
+    def val(self, node):
+        self.use(node.id, self.used)
+        new = ast.Attribute(value=ast.Name(id=node.id, ctx=ast.Load()),
+                            attr='_val', ctx=ast.Load())
+        new.isValue = True
+        return ast.copy_location(new, node)
+
+    def test(self, node):
+        # only the truth value of a test matters
+        if self.isSig(node):
+            return self.val(node)
+        if isinstance(node, ast.BoolOp):
+            node.values = [self.test(v) for v in node.values]
+        return node
+
+    def visit_scope(self, node):
+        return node  # names may be rebound in nested scopes
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = visit_scope
+    visit_Lambda = visit_ListComp = visit_SetComp = visit_scope
+    visit_DictComp = visit_GeneratorExp = visit_scope
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, _binOps):
+            if self.isSig(node.left):
+                node.left = self.val(node.left)
+                if self.isSig(node.right):
+                    node.right = self.val(node.right)
+            elif self.isSig(node.right) and self.isValue(node.left):
+                node.right = self.val(node.right)
+            node.isValue = self.isValue(node.left) and self.isValue(node.right)
+        return node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if self.isSig(node.operand):
+            node.operand = self.val(node.operand)
+        node.isValue = isinstance(node.op, ast.Not) or \
+            self.isValue(node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        for op in node.ops:
+            if not isinstance(op, _cmpOps):
+                return node
+        if self.isSig(node.left):
+            node.left = self.val(node.left)
+        prev = node.left
+        for i, c in enumerate(node.comparators):
+            if self.isSig(c) and self.isValue(prev):
+                node.comparators[i] = c = self.val(c)
+            prev = c
+        node.isValue = self.isValue(node.left) and \
+            all(self.isValue(c) for c in node.comparators)
+        return node
+
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load) and self.isSig(node.value):
+            node.value = self.val(node.value)
+            node.isValue = True
+        return node
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if node.attr == 'next' and isinstance(node.ctx, ast.Load) and \
+                self.isSig(node.value) and self.kinds[node.value.id]:
+            # reading the next value registers the signal, like assigning it
+            name = node.value.id
+            self.use(name, self.used)
+            self.use(name, self.assigned)
+            new = ast.Attribute(value=ast.Name(id=name, ctx=ast.Load()),
+                                attr='_next', ctx=ast.Load())
+            return ast.copy_location(new, node)
+        return node
+
+    def visit_If(self, node):
+        self.generic_visit(node)
+        node.test = self.test(node.test)
+        return node
+
+    visit_While = visit_IfExp = visit_If
+
+    def visit_Assign(self, node):
+        self.generic_visit(node)
+        if len(node.targets) != 1:
+            return node
+        target = node.targets[0]
+        if not (isinstance(target, ast.Attribute) and target.attr == 'next'
+                and self.isSig(target.value)):
+            return node
+        name = target.value.id
+        value = node.value
+        if self.isSig(value):
+            # the next attribute takes the value of a signal
+            value = self.val(value)
+        kind = self.kinds[name]
+        if not kind:
+            node.value = value
+            return node
+        self.use(name, self.used)
+        self.use(name, self.assigned)
+        bounds = ''
+        sig = self.sigs[name]
+        if kind == 'intbv':
+            # an intbv can be bounded on one side only
+            if sig._min is not None:
+                bounds += ' and %d <= _myhdl_v' % sig._min
+            if sig._max is not None:
+                bounds += ' and _myhdl_v < %d' % sig._max
+        stmts = [ast.Assign(targets=[ast.Name(id='_myhdl_v', ctx=ast.Store())],
+                            value=value)]
+        stmts.extend(ast.parse(_setNext[kind].format(sig=name,
+                                                     bounds=bounds)).body)
+        for stmt in stmts:
+            ast.copy_location(stmt, node)
+            for n in ast.walk(stmt):
+                ast.copy_location(n, node)
+        return stmts
+
+
+def _specialize(func):
+    """ Return a specialized version of an always block function.
+
+    func -- the function
+
+    Return None if the function has nothing to specialize. The assigned
+    signals are registered for update in the siglist of the context that
+    is current when the function runs.
+    """
+    code = func.__code__
+    if not code.co_freevars:
+        return None
+    freevars = dict(zip(code.co_freevars, func.__closure__))
+    sigs = {}
+    for n, cell in freevars.items():
+        try:
+            obj = cell.cell_contents
+        except ValueError:  # empty cell
+            continue
+        if isinstance(obj, _Signal) and _sigKind(obj) is not None:
+            sigs[n] = obj
+    if not sigs:
+        return None
+    tree = _makeAST(func)
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.FunctionDef):
+        return None
+    funcdef = tree.body[0]
+    for node in ast.walk(funcdef):
+        if isinstance(node, (ast.Global, ast.Nonlocal, ast.Yield,
+                             ast.YieldFrom, ast.Await)):
+            return None
+        if isinstance(node, ast.Name) and node.id.startswith(_prefix):
+            return None
+    v = _Specializer(sigs)
+    funcdef.body = [v.visit(stmt) for stmt in funcdef.body]
+    body = []
+    for stmt in funcdef.body:
+        body.extend(stmt if isinstance(stmt, list) else [stmt])
+    if not v.used:
+        return None
+
+    # check the signals on each call, and register the assigned ones
+    guard = " or ".join("%s is not _myhdl_s_%s" % (n, n) for n in v.used)
+    register = "".join("""
+        if not {0}._pending:
+            {0}._pending = True
+            _myhdl_state.siglist.append({0})""".format(n) for n in v.assigned)
+    src = """
+def _myhdl_func():
+    if {0}:
+        return _myhdl_orig()
+    try:
+        pass
+    finally:
+        pass{1}
+""".format(guard, register)
+    wrapper = ast.parse(src).body[0]
+    trystmt = wrapper.body[1]
+    trystmt.body = body
+    if v.assigned:
+        trystmt.finalbody = trystmt.finalbody[1:]
+        funcdef.body = wrapper.body
+    else:
+        funcdef.body = wrapper.body[:1] + body
+    funcdef.decorator_list = []
+    funcdef.name = func.__name__
+
+    # compile in a factory, so that the free variables become cells
+    cells = dict(freevars)
+    helpers = {'_myhdl_orig': func, '_myhdl_state': _state,
+               '_myhdl_intbvs': (intbv, modbv)}
+    for n in v.used:
+        helpers['_myhdl_s_%s' % n] = sigs[n]
+    for n, obj in helpers.items():
+        cells[n] = types.CellType(obj)
+    names = sorted(cells)
+    factory = ast.FunctionDef(
+        name='_myhdl_factory',
+        args=ast.arguments(posonlyargs=[], args=[], vararg=None,
+                           kwonlyargs=[], kw_defaults=[], kwarg=None,
+                           defaults=[]),
+        body=[ast.Assign(targets=[ast.Name(id=n, ctx=ast.Store())
+                                  for n in names],
+                         value=ast.Constant(value=None)),
+              funcdef,
+              ast.Return(value=ast.Name(id=func.__name__, ctx=ast.Load()))],
+        decorator_list=[])
+    module = ast.Module(body=[factory], type_ignores=[])
+    ast.fix_missing_locations(module)
+    ast.increment_lineno(module, tree.lineoffset)
+    modcode = compile(module, code.co_filename, 'exec', dont_inherit=True)
+    factorycode = [c for c in modcode.co_consts
+                   if isinstance(c, types.CodeType)][0]
+    funccode = [c for c in factorycode.co_consts
+                if isinstance(c, types.CodeType)][0]
+    closure = tuple(cells[n] for n in funccode.co_freevars)
+    sfunc = types.FunctionType(funccode, func.__globals__, func.__name__,
+                               None, closure)
+    sfunc.__qualname__ = func.__qualname__
+    return sfunc
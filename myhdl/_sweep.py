@@ -0,0 +1,135 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Module with the sweep function.
+
+sweep runs a testbench for each point of a parameter grid, in a pool of
+worker processes.
+
+"""
+import itertools
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from myhdl._simulator import SimulationContext
+
+
+class SweepResult(object):
+
+    """ Outcome of one point of a sweep.
+
+    Attributes:
+    params -- keyword arguments passed to the block factory
+    value -- return value of run_sim: 0 if the simulation stopped,
+             1 if it ran for the requested duration
+    exception -- exception raised by the point, or None
+    traceback -- formatted traceback of the exception, or None
+    time -- simulated time at the end of the point
+    walltime -- wall clock time of the point in seconds
+
+    """
+
+    __slots__ = ('params', 'value', 'exception', 'traceback', 'time',
+                 'walltime')
+
+    def __init__(self, params, value=None, exception=None, traceback=None,
+                 time=None, walltime=None):
+        self.params = params
+        self.value = value
+        self.exception = exception
+        self.traceback = traceback
+        self.time = time
+        self.walltime = walltime
+
+    def __repr__(self):
+        return "SweepResult(%r, value=%r, exception=%r, time=%r)" % \
+            (self.params, self.value, self.exception, self.time)
+
+
+def _points(grid):
+    """ Return the list of parameter dicts of a grid.
+
+    A dict maps each parameter name on a sequence of values, and stands
+    for all combinations. Any other iterable yields the parameter dicts.
+
+    """
+    if isinstance(grid, dict):
+        names = list(grid)
+        return [dict(zip(names, values))
+                for values in itertools.product(*[grid[n] for n in names])]
+    return [dict(params) for params in grid]
+
+
+def _runPoint(factory, params, duration):
+    """ Elaborate and simulate one point in a fresh context """
+    start = time.perf_counter()
+    result = SweepResult(params)
+    context = SimulationContext()
+    with context:
+        top = None
+        try:
+            top = factory(**params)
+            result.value = top.run_sim(duration, quiet=1)
+        except Exception as e:
+            result.exception = e
+            result.traceback = traceback.format_exc()
+        finally:
+            if top is not None and top.sim is not None and \
+                    not top.sim._finished:
+                top.quit_sim()
+    result.time = context._time
+    result.walltime = time.perf_counter() - start
+    return result
+
+
+def sweep(factory, grid, duration=None, workers=None):
+    """ Run a block factory for each point of a parameter grid.
+
+    factory -- block factory, called with the parameters of each point
+               as keyword arguments; it should be defined at module level
+               so that it can be sent to the worker processes
+    grid -- dict that maps parameter names on sequences of values, or
+            an iterable of parameter dicts
+    duration -- simulation duration of each point (default: forever)
+    workers -- number of worker processes (default: number of CPUs)
+
+    Each point is elaborated and simulated in its own simulation context
+    in a worker process. Yields a SweepResult for each point, in the
+    order in which the points finish.
+
+    """
+    points = _points(grid)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = {}
+    try:
+        for params in points:
+            future = executor.submit(_runPoint, factory, params, duration)
+            futures[future] = params
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # the point could not be sent to or from a worker
+                yield SweepResult(futures[future], exception=e,
+                                  traceback=traceback.format_exc())
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
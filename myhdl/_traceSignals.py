@@ -31,6 +31,7 @@ from myhdl import _simulator, __version__, EnumItemType
 from myhdl._extractHierarchy import _HierExtr
 from myhdl import TraceSignalsError
 from myhdl._ShadowSignal import _TristateSignal, _TristateDriver
+from myhdl._SignalArray import SignalArray
 from myhdl._block import _Block
 from myhdl._getHierarchy import _getHierarchy
 
@@ -267,8 +268,20 @@ def _writeVcdSigs(f, hierarchy, tracelists):
                     fullpathnames.append(fullpathname)
                     print(f"{' '*indent}$scope module {nn} $end", file=f)
                     indent += 2
+                    mem = memdict[n].mem
+                    if isinstance(mem, SignalArray):
+                        # declare the words from the buffer, without
+                        # turning them into signals
+                        codes = mem._trace(namegen)
+                        vcdtype, ww = mem._vcdType()
+                        for memindex, code in enumerate(codes):
+                            print(f"{' '*indent}$var {vcdtype} {ww} {code} {nn}({memindex}) $end", file=f)
+                        siglist.append(mem)
+                        indent -= 2
+                        print(f"{' '*indent}$upscope $end", file=f)
+                        continue
                     memindex = 0
-                    for s in memdict[n].mem:
+                    for s in mem:
                         sval = _getSval(s)
                         if sval is None:
                             raise ValueError(f"{nn} of module {name} has no initial value")
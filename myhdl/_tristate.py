@@ -1,7 +1,7 @@
 import warnings
 
 from myhdl._Signal import _Signal, _DelayedSignal
-from myhdl._simulator import _siglist
+from myhdl._simulator import _state
 
 
 class BusContentionWarning(UserWarning):
@@ -63,7 +63,10 @@ class _TristateDriver(_Signal):
             self._next = None
         else:
             self._setNextVal(val)
-        _siglist.append(self._bus)
+        bus = self._bus
+        if not bus._pending:
+            bus._pending = True
+            _state.siglist.append(bus)
 
 
 class _DelayedTristate(_DelayedSignal, _Tristate):
@@ -25,9 +25,13 @@ import ast
 import sys
 import inspect
 
+from collections import OrderedDict
+
 from tokenize import generate_tokens, untokenize, INDENT
 from io import StringIO
 
+from myhdl import _diskcache
+
 
 def _printExcInfo():
     kind, value = sys.exc_info()[:2]
@@ -70,27 +74,90 @@ def _dedent(s):
     return untokenize(result)
 
 
+class _CodeCache(object):
+
+    """ Cache of information per code object.
+
+    The cache holds at most maxsize code objects, and drops the least
+    recently used one when it is full, so that long sessions that build
+    many designs don't keep every code object alive.
+
+    Code objects compare equal regardless of their file, so entries are
+    keyed on the code object and its file name.
+
+    """
+
+    __slots__ = ('_data', '_maxsize')
+
+    def __init__(self, maxsize=1024):
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, code):
+        data = self._data
+        key = (code, code.co_filename)
+        info = data.get(key)
+        if info is not None:
+            data.move_to_end(key)
+        return info
+
+    def __setitem__(self, code, info):
+        data = self._data
+        key = (code, code.co_filename)
+        data[key] = info
+        data.move_to_end(key)
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
+# per code object: the dedented source, compile flags and source location
+_sourceInfo = _CodeCache()
+
+
 def _makeAST(f):
-    # Need to look at the flags used to compile the original function f and
+    return _makeCodeAST(f.__code__)
+
+
+def _makeCodeAST(code):
+    # the tree is compiled anew on each call, as callers modify it
+    info = _sourceInfo.get(code)
+    if info is None:
+        info = _diskcache._get(code, 'source')
+        if info is None:
+            info = _getSourceInfo(code)
+            _diskcache._put(code, 'source', info)
+        _sourceInfo[code] = info
+    s, flags, sourcefile, lineoffset = info
+    # use compile instead of ast.parse so that additional flags can be passed
+    tree = compile(s, filename='<unknown>', mode='exec',
+        flags=flags, dont_inherit=True)
+    # tree = ast.parse(s)
+    tree.sourcefile = sourcefile
+    tree.lineoffset = lineoffset
+    return tree
+
+
+def _getSourceInfo(code):
+    # Need to look at the flags used to compile the original function and
     # pass these same flags to the compile() function. This ensures that
     # syntax-changing __future__ imports like print_function work correctly.
-    orig_f_co_flags = f.__code__.co_flags
+    orig_f_co_flags = code.co_flags
     # co_flags can contain various internal flags that we can't pass to
     # compile(), so strip them out here
     valid_flags = 0
     for future_feature in __future__.all_feature_names:
         feature = getattr(__future__, future_feature)
         valid_flags |= feature.compiler_flag
-    s = inspect.getsource(f)
-    s = _dedent(s)
-    # use compile instead of ast.parse so that additional flags can be passed
+    lines, lnum = inspect.getsourcelines(code)
+    s = _dedent(''.join(lines))
     flags = ast.PyCF_ONLY_AST | (orig_f_co_flags & valid_flags)
-    tree = compile(s, filename='<unknown>', mode='exec',
-        flags=flags, dont_inherit=True)
-    # tree = ast.parse(s)
-    tree.sourcefile = inspect.getsourcefile(f)
-    tree.lineoffset = inspect.getsourcelines(f)[1] - 1
-    return tree
+    return s, flags, inspect.getsourcefile(code), lnum - 1
 
 
 def _genfunc(gen):
@@ -40,6 +40,7 @@ from myhdl.conversion._misc import (_error, _access, _kind,
                                     _get_argnames)
 from myhdl._extractHierarchy import _isMem, _getMemInfo, _UserCode
 from myhdl._Signal import _Signal, _WaiterList, _isListOfSigs
+from myhdl._SignalArray import SignalArray
 from myhdl._ShadowSignal import _ShadowSignal, _SliceSignal, _TristateDriver
 from myhdl._util import _flatten
 from myhdl._util import _isTupleOfInts
@@ -121,7 +122,9 @@ def _analyzeSigs(hierarchy, hdl='Verilog'):
     for m in memlist:
         if not m._used:
             continue
-        for i, s in enumerate(m.mem):
+        if isinstance(m.mem, SignalArray):
+            m.mem._name = m.name
+        for i, s in m.items():
             s._name = "%s%s%s%s" % (m.name, open, i, close)
             s._used = False
             if s._inList:
@@ -339,7 +342,8 @@ class _FirstPassVisitor(ast.NodeVisitor, _ConversionMixin):
 
 
 def getNrBits(obj):
-    if hasattr(obj, '_nrbits'):
+    # classes such as intbv have slot descriptors, not bit widths
+    if hasattr(obj, '_nrbits') and not isinstance(obj, type):
         return obj._nrbits
     return None
 
@@ -1131,7 +1135,14 @@ class _AnalyzeAlwaysSeqVisitor(_AnalyzeBlockVisitor):
         _AnalyzeBlockVisitor.__init__(self, tree)
         self.tree.senslist = senslist
         self.tree.reset = reset
-        self.tree.sigregs = sigregs
+        # a memory is reset word by word in HDL code
+        regs = []
+        for s in sigregs:
+            if isinstance(s, SignalArray):
+                regs.extend(s)
+            else:
+                regs.append(s)
+        self.tree.sigregs = regs
         self.tree.varregs = varregs
 
     def visit_FunctionDef(self, node):
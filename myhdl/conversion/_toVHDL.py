@@ -44,6 +44,7 @@ from myhdl._extractHierarchy import (_HierExtr, _isMem, _getMemInfo,
 
 from myhdl._instance import _Instantiator
 from myhdl._Signal import _Signal, _WaiterList, posedge, negedge, Constant
+from myhdl._SignalArray import SignalArray
 from myhdl._enum import EnumType, EnumItemType
 from myhdl._intbv import intbv
 from myhdl._modbv import modbv
@@ -270,7 +271,7 @@ class _ToVHDLConvertor(object):
             sig._clear()
         for mem in memlist:
             mem.name = None
-            for s in mem.mem:
+            for __, s in mem.items():
                 s._clear()
 
         # clean up attributes
@@ -516,7 +517,7 @@ def _writeSigDecls(f, intf, siglist, memlist):
         if not m._used:
             continue
         # infer attributes for the case of named signals in a list
-        for i, s in enumerate(m.mem):
+        for i, s in m.items():
             if not m._driven and s._driven:
                 m._driven = s._driven
             if not m._read and s._read:
@@ -532,9 +533,9 @@ def _writeSigDecls(f, intf, siglist, memlist):
         if not toVHDL.initial_values and not isinstance(m.mem[0], Constant):
             val_str = ""
         else:
-            sig_vhdl_objs = [inferVhdlObj(each) for each in m.mem]
+            sig_vhdl_objs = [inferVhdlObj(each) for __, each in m.items()]
 
-            if all([each._init == m.mem[0]._init for each in m.mem]):
+            if all([each._init == m.mem[0]._init for __, each in m.items()]):
                 if isinstance(m.mem[0]._init, bool):
                     val_str = (
                         ' := (others => \'%s\')' % str(int(m.mem[0]._init)))
@@ -655,7 +656,7 @@ def _convertGens(genlist, siglist, memlist, vfile):
     # hack for slice signals in a list
     for m in memlist:
         if m._read:
-            for s in m.mem:
+            for __, s in m.items():
                 if hasattr(s, 'toVHDL'):
                     print(s.toVHDL(), file=vfile)
     print(file=vfile)
@@ -2533,7 +2534,7 @@ class _AnnotateTypesVisitor(ast.NodeVisitor, _ConversionMixin):
         else:
             node.slice.value.vhd = vhd_int()
         obj = node.value.obj
-        if isinstance(obj, list):
+        if isinstance(obj, (list, SignalArray)):
             assert len(obj)
             node.vhd = inferVhdlObj(obj[0])
         elif isinstance(obj, _Ram):
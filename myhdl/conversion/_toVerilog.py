@@ -224,7 +224,7 @@ class _ToVerilogConvertor(object):
             sig._clear()
         for mem in memlist:
             mem.name = None
-            for s in mem.mem:
+            for __, s in mem.items():
                 s._clear()
 
         # clean up attributes
@@ -359,7 +359,7 @@ def _writeSigDecls(f, intf, siglist, memlist):
         if not m._used:
             continue
         # infer attributes for the case of named signals in a list
-        for s in m.mem:
+        for __, s in m.items():
             if not m._driven and s._driven:
                 m._driven = s._driven
                 # once suffices
@@ -380,7 +380,7 @@ def _writeSigDecls(f, intf, siglist, memlist):
             k = m._driven
 
             if toVerilog.initial_values and not k == 'wire':
-                if all([each._init == m.mem[0]._init for each in m.mem]):
+                if all([each._init == m.mem[0]._init for __, each in m.items()]):
                     if toVerilog.initial_values == 'skip_zero_mem_init' and int(m.mem[0]._init) == 0:
                         pass
                     else:
@@ -1651,6 +1651,8 @@ class _ConvertTaskVisitor(_ConvertVisitor):
 
 
 def _maybeNegative(obj):
+    if isinstance(obj, type):
+        return False
     if hasattr(obj, '_min') and (obj._min is not None) and (obj._min < 0):
         return True
     if isinstance(obj, int) and obj < 0:
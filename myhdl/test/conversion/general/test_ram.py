@@ -1,7 +1,7 @@
 import os
 path = os.path
 
-from myhdl import (block, Signal, intbv, delay, always_comb,
+from myhdl import (block, Signal, SignalArray, intbv, delay, always_comb,
                    always, instance, StopSimulation,
                    conversion
                    )
@@ -78,6 +78,24 @@ def ram_deco2(dout, din, addr, we, clk, depth=128):
     return write, read
 
 
+@block
+def ram_array(dout, din, addr, we, clk, depth=128):
+    """  Ram model with a SignalArray memory """
+
+    mem = SignalArray(intbv(0)[8:], depth)
+
+    @always(clk.posedge)
+    def write():
+        if we:
+            mem[addr].next = din
+
+    @always_comb
+    def read():
+        dout.next = mem[addr]
+
+    return write, read
+
+
 @block
 def ram2(dout, din, addr, we, clk, depth=128):
 
@@ -145,6 +163,10 @@ def testram_deco2():
     assert conversion.verify(RamBench(ram_deco2)) == 0
 
 
+def testram_array():
+    assert conversion.verify(RamBench(ram_array)) == 0
+
+
 def testram_clocked():
     assert conversion.verify(RamBench(ram_clocked)) == 0
 
@@ -0,0 +1,200 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for BatchSimulation """
+import pytest
+
+from myhdl import (BatchSimulation, ResetSignal, Signal, Simulation,
+                   SimulationError, always_comb, always_seq, block, concat,
+                   delay, enum, instance, intbv, modbv)
+from myhdl import _BatchSimulation
+
+numpy = pytest.importorskip('numpy')
+
+QUIET = 1
+
+t_state = enum('IDLE', 'RUN', 'DONE')
+ROM = tuple(range(0, 64, 4))
+
+
+@block
+def dut(clk, rst, a, b, q, s, st, y):
+    m = Signal(intbv(0)[8:])
+
+    @always_seq(clk.posedge, reset=rst)
+    def seq():
+        if a > b:
+            q.next = q + a
+        elif a == b:
+            q.next = q - 1 if b[0] else q ^ b
+        else:
+            q.next[4:0] = a[4:0]
+        if st == t_state.IDLE:
+            if a[7]:
+                st.next = t_state.RUN
+        elif st == t_state.RUN:
+            st.next = t_state.DONE if b > 100 else t_state.RUN
+        else:
+            st.next = t_state.IDLE
+
+    @always_comb
+    def pack():
+        m.next = concat(a[4:0], b[4:0])
+
+    @always_comb
+    def comb():
+        s.next = a[4:1] == 3 and not b[2]
+        v = 0
+        for i in range(4):
+            v = v + m[i]
+        y.next = ROM[a[4:0]] + v + ~m[8:4]
+
+    return seq, pack, comb
+
+
+def signals():
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    a, b = [Signal(intbv(0)[8:]) for __ in range(2)]
+    q = Signal(modbv(0)[12:])
+    s = Signal(bool(0))
+    st = Signal(t_state.IDLE)
+    y = Signal(intbv(0)[10:])
+    return clk, rst, a, b, q, s, st, y
+
+
+def simulate(stimuli):
+    """ Simulate a single lane, and return its outputs after each cycle """
+    clk, rst, a, b, q, s, st, y = sigs = signals()
+    outputs = []
+
+    @instance
+    def bench():
+        for ra, rb, rr in stimuli:
+            a.next, b.next, rst.next = ra, rb, rr
+            yield delay(5)
+            clk.next = 1
+            yield delay(1)
+            outputs.append([int(q), int(s), st.val._index, int(y)])
+            yield delay(4)
+            clk.next = 0
+
+    sim = Simulation(dut(*sigs), bench)
+    sim.run(quiet=QUIET)
+    sim.quit()
+    return outputs
+
+
+class TestBatchSimulation:
+
+    def testLanes(self):
+        lanes, cycles = 8, 30
+        rng = numpy.random.default_rng(5)
+        A = rng.integers(0, 256, (cycles, lanes))
+        B = rng.integers(0, 256, (cycles, lanes))
+        B[::3] = A[::3]
+        R = (rng.random((cycles, lanes)) < 0.1).astype(int)
+        clk, rst, a, b, q, s, st, y = sigs = signals()
+        sim = BatchSimulation(dut(*sigs), lanes=lanes)
+        outputs = []
+        for t in range(cycles):
+            sim[a], sim[b], sim[rst] = A[t], B[t], R[t]
+            sim.run()
+            outputs.append([sim[sig] for sig in (q, s, st, y)])
+        for lane in range(lanes):
+            expected = simulate(zip(A[:, lane].tolist(), B[:, lane].tolist(),
+                                    R[:, lane].tolist()))
+            for t in range(cycles):
+                assert [int(o[lane]) for o in outputs[t]] == expected[t]
+
+    def testBounds(self):
+        clk = Signal(bool(0))
+        a = Signal(intbv(0)[4:])
+        q = Signal(intbv(0)[4:])
+
+        @always_seq(clk.posedge, reset=None)
+        def seq():
+            if a < 8:
+                q.next = a + 9
+
+        sim = BatchSimulation(seq, lanes=3)
+        # lanes that don't take the branch are not checked
+        sim[a] = [1, 9, 15]
+        sim.run()
+        assert sim[q].tolist() == [10, 0, 0]
+        sim[a] = [1, 8, 7]
+        with pytest.raises(ValueError):
+            sim.run()
+        with pytest.raises(ValueError):
+            sim[a] = 16
+        with pytest.raises(ValueError):
+            sim[a] = [1, 2]
+
+    def testHalfBounded(self):
+        clk = Signal(bool(0))
+        a = Signal(intbv(0, max=8))
+        b = Signal(intbv(0, min=-4))
+
+        @always_seq(clk.posedge, reset=None)
+        def seq():
+            a.next = a + 3
+            b.next = b - 1
+
+        sim = BatchSimulation(seq, lanes=2)
+        sim[a] = [-20, 1]
+        sim[b] = [5, 0]
+        sim.run()
+        assert sim[a].tolist() == [-17, 4]
+        assert sim[b].tolist() == [4, -1]
+        with pytest.raises(ValueError):
+            sim[a] = [8, 0]
+        with pytest.raises(ValueError):
+            sim[b] = [0, -5]
+        sim[a] = [5, 0]
+        with pytest.raises(ValueError):
+            sim.run()
+
+    def testUnsupported(self):
+        clk = Signal(bool(0))
+        a = Signal(intbv(0)[4:])
+        q = Signal(intbv(0)[4:])
+
+        @always_seq(clk.posedge, reset=None)
+        def seq():
+            v = intbv(0)[4:]
+            v[:] = a
+            while v > 0:
+                v[:] = v - 1
+            q.next = v
+
+        with pytest.raises(SimulationError) as excinfo:
+            BatchSimulation(seq, lanes=3)
+        assert excinfo.value.kind == _BatchSimulation._error.NotSupported
+
+    def testNoNumpy(self, monkeypatch):
+        monkeypatch.setattr(_BatchSimulation, 'numpy', None)
+        clk = Signal(bool(0))
+        q = Signal(bool(0))
+
+        @always_seq(clk.posedge, reset=None)
+        def seq():
+            q.next = not q
+
+        with pytest.raises(ImportError):
+            BatchSimulation(seq, lanes=3)
@@ -0,0 +1,142 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for Clock """
+import pytest
+
+from myhdl import (Clock, Signal, Simulation, always, always_seq, block,
+                   delay, instance, instances, intbv, now, traceSignals)
+from myhdl._Clock import _error
+
+QUIET = 1
+
+
+def edges(clk, gen, duration=100):
+    changes = []
+
+    @instance
+    def monitor():
+        while 1:
+            yield clk
+            changes.append((now(), int(clk)))
+
+    sim = Simulation(gen, monitor)
+    sim.run(duration, quiet=QUIET)
+    sim.quit()
+    return changes
+
+
+def classic(clk, half):
+
+    @always(delay(half))
+    def clkgen():
+        clk.next = not clk
+
+    return clkgen
+
+
+class TestClock:
+
+    @pytest.mark.parametrize('init', [0, 1])
+    def testClassic(self, init):
+        clk = Signal(bool(init))
+        expected = edges(clk, classic(clk, 5))
+        clk = Signal(bool(init))
+        assert edges(clk, Clock(clk, 10)) == expected
+
+    def testPhaseDuty(self):
+        clk = Signal(bool(0))
+        assert edges(clk, Clock(clk, 10, phase=3, duty=0.3), 35) == \
+            [(10, 1), (13, 0), (20, 1), (23, 0), (30, 1), (33, 0)]
+
+    def testBit(self):
+        clk = Signal(intbv(0)[1:])
+        assert edges(clk, Clock(clk, 4), 10) == \
+            [(2, 1), (4, 0), (6, 1), (8, 0), (10, 1)]
+        assert type(clk.val) is intbv
+
+    def testEdgeWaiters(self):
+        clk = Signal(bool(0))
+        count = Signal(intbv(0)[8:])
+        falls = []
+
+        @always(clk.posedge)
+        def counter():
+            count.next = count + 1
+
+        @instance
+        def monitor():
+            while 1:
+                yield clk.negedge
+                falls.append((now(), int(count)))
+
+        sim = Simulation(Clock(clk, 10), counter, monitor)
+        sim.run(40, quiet=QUIET)
+        sim.quit()
+        assert falls == [(10, 1), (20, 2), (30, 3), (40, 4)]
+
+    def testArgs(self):
+        with pytest.raises(TypeError):
+            Clock(Signal(intbv(0)[2:]), 10)
+        with pytest.raises(TypeError):
+            Clock(Signal(bool(0)), 10.0)
+        with pytest.raises(ValueError) as e:
+            Clock(Signal(bool(0)), 1)
+        assert str(e.value) == _error.Period
+        with pytest.raises(ValueError) as e:
+            Clock(Signal(bool(0)), 10, duty=0.01)
+        assert str(e.value) == _error.Duty
+
+
+@block
+def clocked(clk, q):
+
+    clock = Clock(clk, 10)
+
+    @always_seq(clk.posedge, reset=None)
+    def logic():
+        q.next = q + 1
+
+    return instances()
+
+
+@block
+def bench():
+    clk = Signal(bool(0))
+    q = Signal(intbv(0)[8:])
+    inst = clocked(clk, q)
+    return inst
+
+
+class TestClockBlock:
+
+    def testTrace(self, tmpdir):
+        with tmpdir.as_cwd():
+            inst = traceSignals(bench())
+            sim = Simulation(inst)
+            sim.run(30, quiet=QUIET)
+            sim.quit()
+            with open('bench.vcd') as f:
+                vcd = f.read()
+        steps = vcd.split('#')
+        # the clock rises at 5, 15 and 25, and falls at 10, 20 and 30
+        assert [s.split()[0] for s in steps[-6:]] == \
+            ['5', '10', '15', '20', '25', '30']
+        code = vcd.split('$var reg 1 ')[1].split()[0]
+        assert '1' + code in steps[-6] and '0' + code in steps[-5]
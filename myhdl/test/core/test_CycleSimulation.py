@@ -0,0 +1,277 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for cycle-based simulation """
+import pytest
+
+from myhdl import (BlockInstanceError, ResetSignal, Signal, SimulationError,
+                   always, always_comb, always_seq, block, delay, instance,
+                   intbv, now, traceSignals)
+from myhdl._CycleSimulation import _CycleSimulation, _error
+from helpers import raises_kind
+
+QUIET = 1
+
+
+@block
+def dut(log, clk, rst, q, z):
+    s = Signal(intbv(0)[8:])
+    t = Signal(intbv(0)[8:])
+
+    @always_seq(clk.posedge, reset=rst)
+    def counter():
+        q.next = (q + 1) % 256
+
+    @always(clk.posedge)
+    def resetter():
+        rst.next = q == 11
+
+    @always_comb
+    def mul():
+        s.next = (q * 3) % 256
+
+    @always_comb
+    def add():
+        t.next = (s + q) % 256
+
+    @always_comb
+    def mix():
+        z.next = t ^ s ^ q
+
+    @always(clk.posedge)
+    def monitor():
+        log.append((now(), int(q), int(z), bool(rst)))
+
+    return counter, resetter, mul, add, mix, monitor
+
+
+def signals():
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    q = Signal(intbv(0)[8:])
+    z = Signal(intbv(0)[8:])
+    return clk, rst, q, z
+
+
+@block
+def eventBench(log):
+    clk, rst, q, z = signals()
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    return dut(log, clk, rst, q, z), clkgen
+
+
+@block
+def cycleBench(log):
+    return dut(log, *signals())
+
+
+class TestCycleSimulation:
+
+    def testCompareEvent(self):
+        ref = []
+        top = eventBench(ref)
+        top.run_sim(295, quiet=QUIET)
+        top.quit_sim()
+        res = []
+        top = cycleBench(res)
+        top.run_sim(cycles=30, mode='cycle', quiet=QUIET)
+        top.quit_sim()
+        assert len(ref) == 30
+        assert res == ref
+
+    def testResume(self):
+        ref = []
+        top = cycleBench(ref)
+        top.run_sim(cycles=30, mode='cycle', quiet=QUIET)
+        top.quit_sim()
+        res = []
+        top = cycleBench(res)
+        for __ in range(10):
+            top.run_sim(cycles=3, mode='cycle', quiet=QUIET)
+        assert now() == 295
+        top.quit_sim()
+        assert res == ref
+
+    def testExternalInputs(self):
+        clk = Signal(bool(0))
+        a = Signal(intbv(0)[8:])
+        b = Signal(intbv(0)[8:])
+        q = Signal(intbv(0)[8:])
+
+        @always_comb
+        def inc():
+            b.next = (a + 1) % 256
+
+        @always(clk.posedge)
+        def reg():
+            q.next = b
+
+        sim = _CycleSimulation(inc, reg)
+        for v in (3, 7, 42):
+            a.next = v
+            sim.run(1, quiet=QUIET)
+            assert q == v + 1
+        sim.quit()
+
+    def testTrace(self, tmpdir):
+        with tmpdir.as_cwd():
+            top = traceSignals(cycleBench([]))
+            sim = _CycleSimulation(top)
+            sim.run(5, quiet=QUIET)
+            sim.quit()
+            with open('cycleBench.vcd') as f:
+                lines = f.read().splitlines()
+        times = [line for line in lines if line.startswith('#')]
+        assert times == ['#%s' % t for t in range(5, 50, 5)]
+
+    def testHooks(self):
+        clk = Signal(bool(0))
+        q = Signal(intbv(0)[8:])
+
+        @always(clk.posedge)
+        def reg():
+            q.next = (q + 1) % 256
+
+        times = []
+        commits = []
+        suspends = []
+        sim = _CycleSimulation(reg)
+        sim.add_hooks(on_timestep=times.append,
+                      on_commit=lambda sigs: commits.append(
+                          [s is q for s in sigs]),
+                      on_suspend=lambda: suspends.append(now()))
+        sim.run(2, quiet=QUIET)
+        sim.quit()
+        assert times == [5, 10, 15]
+        # clock edge, register update, falling clock, and so on
+        assert commits == [[False], [True], [False], [False], [True]]
+        assert suspends == [15]
+
+    def testUnknownMode(self):
+        top = cycleBench([])
+        with pytest.raises(BlockInstanceError):
+            top.run_sim(cycles=1, mode='levels', quiet=QUIET)
+
+    def testModeMismatch(self):
+        top = cycleBench([])
+        with pytest.raises(BlockInstanceError):
+            top.run_sim(10, mode='cycle', quiet=QUIET)
+        with pytest.raises(BlockInstanceError):
+            top.run_sim(cycles=1, quiet=QUIET)
+        top.run_sim(10, quiet=QUIET)
+        # the simulation was started in event mode
+        with pytest.raises(BlockInstanceError):
+            top.run_sim(cycles=1, mode='cycle', quiet=QUIET)
+        top.quit_sim()
+
+
+class TestCycleSimulationErrors:
+
+    def testGenerator(self):
+        clk = Signal(bool(0))
+        q = Signal(0)
+
+        @always(clk.posedge)
+        def reg():
+            q.next = 1
+
+        @instance
+        def stimulus():
+            yield delay(10)
+
+        with raises_kind(SimulationError, _error.ArgType):
+            _CycleSimulation(reg, stimulus)
+
+    def testAsyncReset(self):
+        clk = Signal(bool(0))
+        rst = ResetSignal(0, active=1, isasync=True)
+        q = Signal(0)
+
+        @always_seq(clk.posedge, reset=rst)
+        def reg():
+            q.next = 1
+
+        with raises_kind(SimulationError, _error.AsyncReset):
+            _CycleSimulation(reg)
+
+    def testTwoClocks(self):
+        clk1 = Signal(bool(0))
+        clk2 = Signal(bool(0))
+        q1 = Signal(0)
+        q2 = Signal(0)
+
+        @always(clk1.posedge)
+        def reg1():
+            q1.next = 1
+
+        @always(clk2.posedge)
+        def reg2():
+            q2.next = 1
+
+        with raises_kind(SimulationError, _error.Clock):
+            _CycleSimulation(reg1, reg2)
+
+    def testCombLoop(self):
+        clk = Signal(bool(0))
+        a = Signal(0)
+        b = Signal(0)
+        c = Signal(0)
+
+        @always(clk.posedge)
+        def reg():
+            a.next = c
+
+        @always_comb
+        def f():
+            b.next = a + c
+
+        @always_comb
+        def g():
+            c.next = b
+
+        with raises_kind(SimulationError, _error.CombLoop):
+            _CycleSimulation(reg, f, g)
+
+    def testDelayedSignal(self):
+        clk = Signal(bool(0))
+        q = Signal(0, delay=2)
+
+        @always(clk.posedge)
+        def reg():
+            q.next = 1
+
+        with raises_kind(SimulationError, _error.SignalType):
+            _CycleSimulation(reg)
+
+    def testShadowSignal(self):
+        clk = Signal(bool(0))
+        a = Signal(intbv(0)[8:])
+        low = a(4, 0)
+        q = Signal(intbv(0)[4:])
+
+        @always(clk.posedge)
+        def reg():
+            q.next = low
+
+        with raises_kind(SimulationError, _error.SignalType):
+            _CycleSimulation(reg)
@@ -1,4 +1,7 @@
+import pytest
+
 from myhdl import (Signal, intbv, instance, delay, ConcatSignal, TristateSignal)
+from myhdl._ShadowSignal import BusContentionWarning
 from myhdl._Simulation import Simulation
 
 
@@ -232,3 +235,87 @@ def bench_TristateSignal():
 
 def test_TristateSignal():
     Simulation(bench_TristateSignal()).run()
+
+
+def bench_ShadowSameDelta():
+    s = Signal(intbv(0)[8:])
+    t = Signal(intbv(0)[4:])
+    low, bit = s(4, 0), s(7)
+    cat = ConcatSignal(s(8, 4), t, low)
+
+    @instance
+    def check():
+        for i in range(1, 2 ** len(s)):
+            s.next = i
+            t.next = i % 16
+            yield s
+            # the shadow signals changed in the same delta cycle
+            assert low == s[4:0]
+            assert bit == s[7]
+            assert cat == (s[8:4] << 8 | t << 4 | s[4:0])
+
+    return check
+
+
+def test_ShadowSameDelta():
+    Simulation(bench_ShadowSameDelta()).run()
+
+
+def bench_ConcatSignalNoGlitch(events):
+    a = Signal(bool(1))
+    b = Signal(bool(0))
+    c = ConcatSignal(a, b, a)
+
+    @instance
+    def stimulus():
+        for va, vb in ((0, 1), (1, 0), (0, 0), (1, 1)):
+            yield delay(10)
+            a.next = va
+            b.next = vb
+
+    @instance
+    def monitor():
+        while 1:
+            yield c
+            events.append(int(c))
+
+    return stimulus, monitor
+
+
+def test_ConcatSignalNoGlitch():
+    events = []
+    Simulation(bench_ConcatSignalNoGlitch(events)).run()
+    # one change per update of the arguments, without intermediate values
+    assert events == [0b010, 0b101, 0b000, 0b111]
+
+
+def bench_TristateContention():
+    s = TristateSignal(intbv(0)[8:])
+    a, b, c = s.driver(), s.driver(), s.driver()
+
+    @instance
+    def check():
+        a.next = 1
+        yield delay(10)
+        # one driver hands over to another
+        a.next = None
+        b.next = 2
+        yield delay(10)
+        assert s == 2
+        a.next = 3
+        c.next = 4
+        yield delay(10)
+        assert s == None
+        b.next = None
+        c.next = None
+        yield delay(10)
+        assert s == 3
+
+    return check
+
+
+def test_TristateContention():
+    with pytest.warns(BusContentionWarning) as record:
+        Simulation(bench_TristateContention()).run()
+    # a single warning for the delta cycle with three active drivers
+    assert len(record) == 1
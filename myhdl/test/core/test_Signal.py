@@ -199,13 +199,13 @@ class TestSig:
         s1._posedgeWaiters = self.posedgeWaiters[:]
         s1._negedgeWaiters = self.negedgeWaiters[:]
         waiters = s1._update()
-        assert waiters == []
+        assert len(waiters) == 0
         assert s1._eventWaiters == self.eventWaiters
         assert s1._posedgeWaiters == self.posedgeWaiters
         assert s1._negedgeWaiters == self.negedgeWaiters
 
     def testNextAccess(self):
-        """ each next attribute access puts a sig in a global siglist """
+        """ next attribute access puts a sig in a global siglist once """
         del _siglist[:]
         s = [None] * 4
         for i in range(len(s)):
@@ -216,8 +216,34 @@ class TestSig:
         s[3].next = 0
         s[3].next = 1
         s[3].next = 3
-        for i in range(len(s)):
-            assert _siglist.count(s[i]) == i
+        assert _siglist.count(s[0]) == 0
+        for i in range(1, len(s)):
+            assert _siglist.count(s[i]) == 1
+        for sig in _siglist:
+            sig._update()
+        del _siglist[:]
+        # after an update, the signal can be put in the siglist again
+        s[3].next = 2
+        assert _siglist == [s[3]]
+        s[3]._update()
+        del _siglist[:]
+
+    def testLazyState(self):
+        """ edge waiter lists and init values are only allocated when needed """
+        s1 = Signal(intbv(5)[8:])
+        s2 = Signal(intbv(5)[8:])
+        assert not hasattr(s1._val, '__dict__')
+        assert s1._init is s2._init
+        assert s1._val is not s2._val and s1._next is not s1._val
+        assert s1._posedgeWaiters == () and s1._slicesigs == ()
+        edge = s1.posedge
+        assert edge is s1.posedge and edge.sig is s1
+        assert s2._posedgeWaiters == ()
+        s1.next = 6
+        s1._update()
+        assert s1._val == 6 and s1._init == 5
+        s1._clear()
+        assert s1._val == 5 and s2._init == 5
 
 
 class TestSignalAsNum:
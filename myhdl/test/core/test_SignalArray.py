@@ -0,0 +1,231 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for SignalArray """
+import pytest
+
+from myhdl import (ResetSignal, Signal, SignalArray, SimulationError,
+                   StopSimulation, always, always_comb, always_seq, block,
+                   delay, instance, intbv)
+from myhdl._CycleSimulation import _CycleSimulation, _error as _cycleError
+from myhdl._SignalArray import _ArraySignal
+from helpers import raises_kind
+
+QUIET = 1
+
+
+@block
+def ram(clk, we, addr, din, dout, mem):
+
+    @always(clk.posedge)
+    def write():
+        if we:
+            mem[addr].next = din
+
+    @always_comb
+    def read():
+        dout.next = mem[addr]
+
+    return write, read
+
+
+@block
+def ram_top(clk, we, addr, din, dout):
+    mem = SignalArray(intbv(0)[8:], 8)
+    return ram(clk, we, addr, din, dout, mem)
+
+
+class TestSignalArray:
+
+    def testBuffer(self):
+        assert SignalArray(bool(0), 8)._buf.typecode == 'B'
+        assert SignalArray(intbv(0)[8:], 8)._buf.typecode == 'B'
+        assert SignalArray(intbv(0)[16:], 8)._buf.typecode == 'H'
+        assert SignalArray(intbv(0, min=-8, max=8), 8)._buf.typecode == 'b'
+        # words that don't fit a machine integer are kept in a list
+        assert isinstance(SignalArray(intbv(0)[80:], 8)._buf, list)
+        assert isinstance(SignalArray(0, 8)._buf, list)
+
+    def testLazyWords(self):
+        mem = SignalArray(intbv(5)[8:], 1024)
+        assert len(mem) == 1024
+        assert mem._sigs == {}
+        s = mem[3]
+        assert isinstance(s, _ArraySignal)
+        assert s == 5 and s._nrbits == 8
+        assert mem[3] is s
+        assert mem[-1] is mem[1023]
+        assert mem[Signal(intbv(3)[10:])] is s
+        assert [i for i, __ in mem._items()] == [3, 1023]
+        with pytest.raises(IndexError):
+            mem[1024]
+        with pytest.raises(TypeError):
+            mem[0] = 1
+        with pytest.raises(TypeError):
+            SignalArray(0.5, 4)
+
+    def testSimulation(self):
+        clk = Signal(bool(0))
+        we = Signal(bool(0))
+        addr = Signal(intbv(0, min=0, max=64))
+        din = Signal(intbv(0)[8:])
+        dout = Signal(intbv(0)[8:])
+        mem = SignalArray(intbv(0)[8:], 64)
+        data = {}
+
+        @block
+        def bench():
+
+            @instance
+            def stimulus():
+                for a in (3, 17, 63, 17):
+                    addr.next = a
+                    din.next = a + 100
+                    we.next = 1
+                    clk.next = 1
+                    yield delay(10)
+                    clk.next = 0
+                    yield delay(10)
+                    data[a] = int(dout)
+                we.next = 0
+                addr.next = 5
+                yield delay(10)
+                data[5] = int(dout)
+                raise StopSimulation()
+
+            return ram(clk, we, addr, din, dout, mem), stimulus
+
+        bench().run_sim(quiet=QUIET)
+        assert data == {3: 103, 17: 117, 63: 163, 5: 0}
+        # the simulation is cleaned up after it stops
+        assert mem._buf.count(0) == 64
+
+    def testBuffered(self):
+        mem = SignalArray(intbv(0)[8:], 16)
+        seen = []
+
+        @block
+        def bench():
+
+            @instance
+            def writer():
+                mem[2].next = 7
+                yield delay(10)
+                mem[2].next = 9
+                yield delay(10)
+
+            @instance
+            def watcher():
+                while 1:
+                    yield mem
+                    seen.append(list(mem._buf))
+
+            return writer, watcher
+
+        top = bench()
+        top.run_sim(30, quiet=QUIET)
+        assert [buf[2] for buf in seen] == [7, 9]
+        top.quit_sim()
+
+    def testReset(self):
+        clk = Signal(bool(0))
+        reset = ResetSignal(0, active=1, isasync=False)
+        mem = SignalArray(intbv(1)[4:], 32)
+
+        @block
+        def bench():
+
+            @always_seq(clk.posedge, reset=reset)
+            def write():
+                mem[4].next = 9
+
+            @instance
+            def stimulus():
+                for r in (0, 1):
+                    reset.next = r
+                    clk.next = 1
+                    yield delay(10)
+                    clk.next = 0
+                    yield delay(10)
+
+            return write, stimulus
+
+        top = bench()
+        top.run_sim(15, quiet=QUIET)
+        assert mem._buf[4] == 9
+        top.run_sim(20, quiet=QUIET)
+        assert list(mem._buf) == [1] * 32
+        top.quit_sim()
+
+    def testTrace(self, tmpdir):
+        @block
+        def tracer():
+            mem = SignalArray(intbv(0)[4:], 8)
+
+            @instance
+            def writer():
+                yield delay(10)
+                mem[6].next = 5
+
+            return writer
+
+        with tmpdir.as_cwd():
+            top = tracer()
+            top.config_sim(trace=True, tracelists=True)
+            top.run_sim(20, quiet=QUIET)
+            top.quit_sim()
+            vcd = tmpdir.join('tracer.vcd').read()
+        declared = [l.split() for l in vcd.splitlines() if 'mem(' in l]
+        assert [d[4] for d in declared] == ['mem(%d)' % i for i in range(8)]
+        code = declared[6][3]
+        assert 'b0101 %s' % code in vcd.split('#10')[1]
+
+    def convert(self, hdl, tmpdir):
+        clk = Signal(bool(0))
+        we = Signal(bool(0))
+        addr = Signal(intbv(0, min=0, max=8))
+        din = Signal(intbv(0)[8:])
+        dout = Signal(intbv(0)[8:])
+        top = ram_top(clk, we, addr, din, dout)
+        top.convert(hdl=hdl, path=str(tmpdir))
+        return tmpdir.join('ram_top.' + ('vhd' if hdl == 'VHDL' else 'v')).read()
+
+    def testToVHDL(self, tmpdir):
+        code = self.convert('VHDL', tmpdir)
+        assert 'type t_array_mem is array(0 to 8-1) of unsigned(7 downto 0);' in code
+        assert 'mem(to_integer(addr)) <= din;' in code
+        # a word reads as the memory element type, not as a std_logic
+        assert 'dout <= mem(to_integer(addr));' in code
+
+    def testToVerilog(self, tmpdir):
+        code = self.convert('Verilog', tmpdir)
+        assert 'reg [7:0] mem [0:8-1];' in code
+        assert 'mem[addr] <= din;' in code
+        assert 'assign dout = mem[addr];' in code
+
+    def testCycleSimulation(self):
+        clk = Signal(bool(0))
+        we = Signal(bool(0))
+        addr = Signal(intbv(0, min=0, max=8))
+        din = Signal(intbv(0)[8:])
+        dout = Signal(intbv(0)[8:])
+        mem = SignalArray(intbv(0)[8:], 8)
+        top = ram(clk, we, addr, din, dout, mem)
+        with raises_kind(SimulationError, _cycleError.SignalArray):
+            _CycleSimulation(top.subs)
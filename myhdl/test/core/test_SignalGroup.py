@@ -0,0 +1,106 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for SignalGroup, sample and drive """
+import pytest
+
+from myhdl import (ConcatSignal, Signal, SignalGroup, Simulation, delay,
+                   drive, enum, instance, intbv, modbv, sample)
+from myhdl import _SignalGroup
+from myhdl._simulator import _state
+
+numpy = pytest.importorskip('numpy')
+
+QUIET = 1
+
+
+def signals():
+    return [Signal(bool(0)), Signal(intbv(5)[8:]), Signal(3),
+            Signal(modbv(0)[4:]), Signal(intbv(-2, min=-8, max=8))]
+
+
+class TestSignalGroup:
+
+    def testSample(self):
+        sigs = signals()
+        assert sample(sigs).tolist() == [0, 5, 3, 0, -2]
+        assert sample(sigs[1:2]).tolist() == [5]
+        assert sample([sigs[0], sigs[2]]).tolist() == [0, 3]
+        assert sample(SignalGroup([])).tolist() == []
+
+    def testDrive(self):
+        sigs = signals()
+        group = SignalGroup(sigs)
+        results = []
+
+        @instance
+        def bench():
+            group.drive([1, 200, -7, 17, 7])
+            assert len(_state.siglist) == len(sigs)
+            # the signals are only registered once
+            drive(group, numpy.array([1, 201, -7, 18, 7]))
+            assert len(_state.siglist) == len(sigs)
+            assert sample(group).tolist() == [0, 5, 3, 0, -2]
+            yield delay(1)
+            results.append(group.sample().tolist())
+
+        sim = Simulation(bench)
+        sim.run(quiet=QUIET)
+        sim.quit()
+        assert results == [[1, 201, -7, 2, 7]]
+        assert type(sigs[0].val) is bool
+
+    def testChecks(self):
+        sigs = signals()
+        group = SignalGroup(sigs)
+        for values in ([2, 0, 0, 0, 0], [0, 256, 0, 0, 0], [0, 0, 0, 0, -9]):
+            with pytest.raises(ValueError):
+                group.drive(values)
+        with pytest.raises(ValueError):
+            group.drive([0, 0, 0])
+        with pytest.raises(TypeError):
+            group.drive([0.5, 0, 0, 0, 0])
+        # nothing was driven
+        assert [s.next for s in sigs] == [s.val for s in sigs]
+
+    def testArgType(self):
+        t_state = enum('A', 'B')
+        for s in (Signal(t_state.A), Signal(intbv(0)[64:]), 1):
+            with pytest.raises(TypeError):
+                SignalGroup([s])
+        a, b = Signal(intbv(1)[4:]), Signal(intbv(2)[4:])
+        c = ConcatSignal(a, b)
+        group = SignalGroup([c, a(2, 0)])
+        assert group.sample().tolist() == [0x12, 1]
+        with pytest.raises(TypeError):
+            group.drive([0, 0])
+
+    def testUnbounded(self):
+        # the values of intbvs without both bounds may not fit
+        for s in (Signal(intbv(0, max=8)), Signal(intbv(0, min=-8)),
+                  Signal(intbv(2**70))):
+            with pytest.raises(TypeError):
+                sample([s])
+            with pytest.raises(TypeError):
+                drive([s], [0])
+
+    def testNoNumpy(self, monkeypatch):
+        monkeypatch.setattr(_SignalGroup, 'numpy', None)
+        with pytest.raises(ImportError):
+            sample([Signal(bool(0))])
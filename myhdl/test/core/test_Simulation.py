@@ -18,13 +18,21 @@
 #  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
 
 """ Run unit tests for Simulation """
+import os
 import random
+import subprocess
+import sys
+import tempfile
+import threading
 from random import randrange
 from unittest import TestCase
 
-from myhdl import (Signal, Simulation, SimulationError, StopSimulation, delay,
+from myhdl import (Clock, Signal, Simulation, SimulationContext,
+                   SimulationError, StopSimulation, TristateSignal, delay,
                    intbv, join, now)
+from myhdl import _simulator
 from myhdl._Simulation import _error
+from myhdl._simulator import _EventQueue, _TimingWheel
 from helpers import raises_kind
 
 random.seed(1)  # random, but deterministic
@@ -712,6 +720,7 @@ class Waveform(TestCase):
 
     """ Test of all sorts of event response in a waveform """
 
+    scheduler = 'heap'
     waveform = []
     duration = 0
     sigdelay = 0
@@ -748,7 +757,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isPosedge)
         response = self.response(clause=s.posedge, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testNegedge(self):
@@ -757,7 +767,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isNegedge)
         response = self.response(clause=s.negedge, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testEdge(self):
@@ -767,7 +778,8 @@ class Waveform(TestCase):
         expected = getExpectedTimes(self.waveform, isEdge)
         response = self.response(clause=(s.negedge, s.posedge),
                                  expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testEvent(self):
@@ -777,7 +789,8 @@ class Waveform(TestCase):
         expected = getExpectedTimes(self.waveform, isEvent)
         # print expected
         response = self.response(clause=s, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantEvents(self):
@@ -786,7 +799,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isEvent)
         response = self.response(clause=(s,) * 6, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantEventAndEdges(self):
@@ -796,7 +810,8 @@ class Waveform(TestCase):
         expected = getExpectedTimes(self.waveform, isEvent)
         response = self.response(clause=(s, s.negedge, s.posedge),
                                  expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantPosedges(self):
@@ -805,7 +820,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isPosedge)
         response = self.response(clause=(s.posedge,) * 3, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantNegedges(self):
@@ -814,7 +830,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isNegedge)
         response = self.response(clause=(s.negedge,) * 9, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
 
@@ -863,6 +880,20 @@ class WaveformInertialDelayStress(Waveform):
         duration += interval
 
 
+class WaveformWheel(Waveform):
+
+    """ Repeat waveform tests with the timing wheel scheduler """
+
+    scheduler = 'wheel'
+
+
+class WaveformSigDelayWheel(WaveformSigDelay):
+
+    """ Repeat delayed signal waveform tests with the timing wheel scheduler """
+
+    scheduler = 'wheel'
+
+
 class SimulationRunMethod(Waveform):
 
     """ Basic test of run method of Simulation object """
@@ -873,6 +904,95 @@ class SimulationRunMethod(Waveform):
             duration = randrange(1, 300)
 
 
+class DelayedSignal(TestCase):
+
+    """ Check inertial and transport delay of delayed signals """
+
+    def changes(self, sig, stimuli):
+        result = []
+
+        def stimulus():
+            t = 0
+            for at, val in stimuli:
+                yield delay(at - t)
+                t = at
+                sig.next = val
+
+        def monitor():
+            while 1:
+                yield sig
+                result.append((now(), int(sig.val)))
+
+        Simulation(stimulus(), monitor()).run(100, quiet=QUIET)
+        return result
+
+    def testInertial(self):
+        """ Pulses shorter than the delay are rejected """
+        s = Signal(0, delay=10)
+        assert not s.transport
+        stimuli = [(0, 1), (3, 0), (6, 1), (20, 0)]
+        assert self.changes(s, stimuli) == [(16, 1), (30, 0)]
+
+    def testTransport(self):
+        """ All pulses propagate """
+        s = Signal(0, delay=10, transport=True)
+        assert s.transport
+        stimuli = [(0, 1), (3, 0), (6, 1), (20, 0)]
+        assert self.changes(s, stimuli) == \
+            [(10, 1), (13, 0), (16, 1), (30, 0)]
+
+    def testTransportShorterDelay(self):
+        """ A change replaces the changes projected after it """
+        s = Signal(0, delay=10, transport=True)
+
+        def stimulus():
+            s.next = 1
+            yield delay(2)
+            s.delay = 5
+            s.next = 2
+            yield delay(1)
+            s.next = 3
+
+        def check():
+            yield delay(20)
+            assert s.val == 3
+            raise StopSimulation
+
+        values = []
+
+        def monitor():
+            while 1:
+                yield s
+                values.append((now(), int(s.val)))
+
+        Simulation(stimulus(), check(), monitor()).run(quiet=QUIET)
+        assert values == [(7, 2), (8, 3)]
+
+    def testIntbvValues(self):
+        """ Each projected change keeps its own value """
+        s = Signal(intbv(0)[8:], delay=5, transport=True)
+        stimuli = [(0, 1), (1, 2), (2, 3)]
+        assert self.changes(s, stimuli) == [(5, 1), (6, 2), (7, 3)]
+
+    def testQueue(self):
+        """ Only the first projected change is a future event """
+        s = Signal(0, delay=100, transport=True)
+
+        def stimulus():
+            for i in range(1, 6):
+                s.next = i
+                yield delay(1)
+            assert len(s._queue) == 5
+            assert len(_simulator._futureEvents) == 1
+            raise StopSimulation
+
+        Simulation(stimulus()).run(quiet=QUIET)
+
+    def testTransportNeedsDelay(self):
+        with self.assertRaises(TypeError):
+            Signal(0, transport=True)
+
+
 class TimeZeroEvents(TestCase):
 
     """ Check events at time 0 """
@@ -907,3 +1027,332 @@ class TimeZeroEvents(TestCase):
         s = Signal(1)
         testBench = self.bench(sig=s, nextval=0, clause=s.negedge)
         Simulation(testBench).run(quiet=QUIET)
+
+
+class FutureEvents(TestCase):
+
+    """ Check ordering of the future event queue """
+
+    def testQueueOrder(self):
+        """ Events are popped in time order, stable within a time point """
+        q = _EventQueue()
+        events = [(randrange(0, 20), i) for i in range(500)]
+        for t, i in events:
+            q.schedule(t, i)
+        for t in sorted(set(t for t, i in events)):
+            assert q.nextTime() == t
+            assert q.pop(t) == [i for tt, i in events if tt == t]
+        assert len(q) == 0
+
+    def testDelayOrder(self):
+        """ Many pending delays resume at the right time """
+        delays = [randrange(1, 1000) for __ in range(500)]
+        seen = []
+
+        def waiter(d):
+            yield delay(d)
+            seen.append((now(), d))
+
+        Simulation([waiter(d) for d in delays]).run(quiet=QUIET)
+        assert len(seen) == len(delays)
+        for t, d in seen:
+            assert t == d
+        assert [t for t, __ in seen] == sorted(delays)
+
+    def testWheelOrder(self):
+        """ The timing wheel pops events like the heap queue """
+        q = _EventQueue()
+        w = _TimingWheel(size=16)
+        t = 0
+        for __ in range(200):
+            for i in range(randrange(0, 5)):
+                # mix near events and far events that go to the overflow
+                nt = t + randrange(0, 4) * randrange(0, 10)
+                q.schedule(nt, i)
+                w.schedule(nt, i)
+            if not len(q):
+                continue
+            assert len(w) == len(q)
+            t = q.nextTime()
+            assert w.nextTime() == t
+            assert w.pop(t) == q.pop(t)
+
+    def testWheelSparse(self):
+        """ The timing wheel only tracks its occupied slots """
+        w = _TimingWheel(size=1024)
+        for t in (1000, 3, 1000, 500):
+            w.schedule(t, t)
+        assert len(w._times) == 3
+        for t, events in ((3, [3]), (500, [500]), (1000, [1000, 1000])):
+            assert w.nextTime() == t
+            assert w.pop(t) == events
+        assert not w._times
+
+    def testWheelSim(self):
+        """ Many pending delays resume at the right time with the wheel """
+        delays = [randrange(1, 5000) for __ in range(500)]
+        seen = []
+
+        def waiter(d):
+            yield delay(d)
+            seen.append((now(), d))
+
+        Simulation([waiter(d) for d in delays],
+                   scheduler='wheel').run(quiet=QUIET)
+        assert [t for t, __ in seen] == sorted(delays)
+        for t, d in seen:
+            assert t == d
+
+    def testUnknownScheduler(self):
+        def g():
+            yield delay(10)
+
+        with raises_kind(SimulationError, _error.Scheduler):
+            Simulation(g(), scheduler='calendar')
+
+
+def counter(log, period, n):
+    """ A clock and a counter that logs its value on each clock edge """
+    clk = Signal(bool(0))
+    count = Signal(0)
+
+    def clkgen():
+        while 1:
+            yield delay(period)
+            clk.next = not clk
+
+    def logic():
+        while 1:
+            yield clk.posedge
+            count.next = count + 1
+            log.append((now(), int(count)))
+            if count == n:
+                raise StopSimulation()
+
+    return clkgen(), logic()
+
+
+class Contexts(TestCase):
+
+    """ Independent simulations in separate contexts """
+
+    def testMultipleSim(self):
+        sim = Simulation(counter([], 5, 10))
+        try:
+            with raises_kind(SimulationError, _error.MultipleSim):
+                Simulation(counter([], 5, 10))
+        finally:
+            sim.quit()
+
+    def testSuspendedContext(self):
+        """ A suspended simulation is kept while another one runs """
+        logA = []
+        logB = []
+        context = SimulationContext()
+        with context:
+            simA = Simulation(counter(logA, 5, 20))
+            simA.run(100, quiet=QUIET)
+            assert now() == 100
+        simB = Simulation(counter(logB, 3, 50))
+        simB.run(quiet=QUIET)
+        assert now() == 303
+        simA.run(quiet=QUIET)
+        with context:
+            assert now() == 205
+        assert logA == [(10 * i + 5, i) for i in range(21)]
+        assert logB == [(6 * i + 3, i) for i in range(51)]
+
+    def testThreads(self):
+        """ Simulations run concurrently in threads """
+        logs = {}
+
+        def worker(period):
+            log = logs[period] = []
+            Simulation(counter(log, period, 200)).run(quiet=QUIET)
+
+        threads = [threading.Thread(target=worker, args=(period,))
+                   for period in (2, 3, 5, 7)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for period, log in logs.items():
+            assert log == [(2 * period * i + period, i) for i in range(201)]
+
+
+class Checkpoints(TestCase):
+
+    """ Branches from a simulation checkpoint """
+
+    def setUp(self):
+        self.a = Signal(0)
+        self.b = Signal(0)
+        a, b = self.a, self.b
+
+        def adder():
+            while 1:
+                yield a
+                b.next = a + 1
+
+        def ticker():
+            while 1:
+                yield delay(5)
+
+        self.sim = Simulation(adder(), ticker())
+        self.sim.run(100, quiet=QUIET)
+
+    def tearDown(self):
+        if not self.sim._finished:
+            self.sim.quit()
+
+    def drive(self, sim, v):
+        self.a.next = v
+        sim.run(10, quiet=QUIET)
+        return now(), int(self.b)
+
+    def testBranch(self):
+        cp = self.sim.checkpoint()
+        self.assertEqual(cp.time, 100)
+        for v in (3, 7, 42):
+            self.assertEqual(self.sim.branch(cp, self.drive, v), (110, v + 1))
+        # the parent simulation is not affected
+        self.assertEqual(now(), 100)
+        self.assertEqual(self.b, 0)
+        self.assertEqual(self.drive(self.sim, 5), (110, 6))
+
+    def testException(self):
+
+        def fail(sim):
+            raise ValueError("branch")
+
+        cp = self.sim.checkpoint()
+        with self.assertRaises(ValueError):
+            self.sim.branch(cp, fail)
+        self.assertEqual(self.sim.branch(cp, self.drive, 1), (110, 2))
+
+    def testOutput(self):
+        # piped output is block buffered, and must survive the exit of the
+        # forked child
+        script = (
+            "from myhdl import Signal, Simulation, delay\n"
+            "def ticker():\n"
+            "    while 1:\n"
+            "        yield delay(5)\n"
+            "def report(sim):\n"
+            "    print('branch output')\n"
+            "sim = Simulation(ticker())\n"
+            "sim.run(10, quiet=1)\n"
+            "sim.branch(sim.checkpoint(), report)\n")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        env.pop('PYTHONUNBUFFERED', None)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'branch.py')
+            with open(path, 'w') as f:
+                f.write(script)
+            result = subprocess.run([sys.executable, path], env=env,
+                                    stdout=subprocess.PIPE, check=True)
+        self.assertEqual(result.stdout.decode().split(), ['branch', 'output'])
+
+    def testStale(self):
+        cp = self.sim.checkpoint()
+        self.sim.run(10, quiet=QUIET)
+        with raises_kind(SimulationError, _error.CheckpointStale):
+            self.sim.branch(cp, self.drive, 1)
+
+
+class Hooks(TestCase):
+
+    """ Kernel event hooks """
+
+    def setUp(self):
+        self.a = Signal(0)
+        self.b = Signal(0)
+        a, b = self.a, self.b
+
+        def stimulus():
+            for v in (1, 1, 2):
+                yield delay(10)
+                a.next = v
+
+        def follow():
+            while 1:
+                yield a
+                b.next = a + 1
+
+        self.sim = Simulation(stimulus(), follow())
+
+    def tearDown(self):
+        if not self.sim._finished:
+            self.sim.quit()
+
+    def testTimestep(self):
+        times = []
+        self.sim.add_hooks(on_timestep=times.append)
+        self.sim.run(quiet=QUIET)
+        self.assertEqual(times, [10, 20, 30])
+
+    def testDelta(self):
+        deltas = []
+        self.sim.add_hooks(on_delta=lambda n: deltas.append((now(), n)))
+        self.sim.run(quiet=QUIET)
+        # the change of a wakes up follow, that changes b
+        self.assertEqual([d for d in deltas if d[0] == 10],
+                         [(10, 0), (10, 1), (10, 2)])
+        self.assertEqual([d for d in deltas if d[0] == 20],
+                         [(20, 0), (20, 1)])
+
+    def testCommit(self):
+        commits = []
+        self.sim.add_hooks(
+            on_commit=lambda sigs: commits.append(
+                (now(), [self.a is s for s in sigs])))
+        self.sim.run(quiet=QUIET)
+        # the assignment at time 20 does not change a
+        self.assertEqual(commits, [(10, [True]), (10, [False]),
+                                   (30, [True]), (30, [False])])
+
+    def testCommitKinds(self):
+        self.sim.quit()
+        bus = TristateSignal(intbv(0)[4:])
+        drv = bus.driver()
+        d = Signal(0, delay=3)
+        clk = Signal(bool(0))
+        clock = Clock(clk, period=10)
+
+        def stimulus():
+            yield delay(2)
+            drv.next = 5
+            d.next = 1
+
+        commits = []
+        names = {id(bus): 'bus', id(drv): 'drv', id(d): 'd', id(clk): 'clk'}
+        sim = Simulation(stimulus(), clock)
+        sim.add_hooks(on_commit=lambda sigs: commits.append(
+            (now(), sorted(names[id(s)] for s in sigs))))
+        sim.run(6, quiet=QUIET)
+        sim.quit()
+        # the bus resolves in the delta cycle of its driver, and the clock
+        # edge and the delayed change are future events
+        self.assertEqual(commits, [(2, ['bus', 'drv']), (5, ['clk', 'd'])])
+
+    def testSuspend(self):
+        log = []
+        self.sim.add_hooks(on_suspend=lambda: log.append(now()))
+        self.sim.run(15, quiet=QUIET)
+        self.sim.run(10, quiet=QUIET)
+        self.assertEqual(log, [15, 25])
+
+    def testSeveral(self):
+        log1 = []
+        log2 = []
+        self.sim.add_hooks(on_timestep=log1.append)
+        self.sim.add_hooks(on_timestep=log2.append)
+        self.sim.run(15, quiet=QUIET)
+        self.sim.remove_hooks(on_timestep=log1.append)
+        self.sim.run(quiet=QUIET)
+        self.assertEqual(log1, [10, 15])
+        self.assertEqual(log2, [10, 15, 20, 30])
+
+    def testUnknown(self):
+        with raises_kind(SimulationError, _error.Hook):
+            self.sim.add_hooks(on_event=print)
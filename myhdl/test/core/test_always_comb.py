@@ -21,9 +21,10 @@
 import random
 from random import randrange
 
-from myhdl import (AlwaysCombError, Signal, Simulation, StopSimulation, delay,
-                   instances, intbv)
+from myhdl import (AlwaysCombError, Signal, Simulation, StopSimulation, always,
+                   delay, instance, instances, intbv, now)
 from myhdl._always_comb import _error, always_comb
+from myhdl._levelize import _levelize
 from myhdl._Waiter import _SignalTupleWaiter, _SignalWaiter, _Waiter
 from helpers import raises_kind
 # random.seed(3) # random, but deterministic
@@ -188,6 +189,52 @@ class TestAlwaysCombCompilation:
         expected = set(['a', 'b', 'd', 'x'])
         assert i.inputs == expected
 
+    def testInferSameCode(self):
+        # the analysis is shared between instances of the same function,
+        # but follows what the names refer to in each instance
+
+        class Intf(object):
+            pass
+
+        def comb(a, b, c):
+
+            def h():
+                c.next = a + b.v
+
+            return always_comb(h)
+
+        intf = Intf()
+        intf.v = Signal(0)
+        a, c = Signal(0), Signal(0)
+        i = comb(a, intf, c)
+        assert i.inputs == set(['a', 'b_v'])
+        assert i.outputs == set(['c'])
+        assert i.sigdict == {'a': a, 'b_v': intf.v, 'c': c}
+        intf.v = 1
+        i = comb(a, intf, c)
+        assert i.inputs == set(['a'])
+        assert i.senslist == (a,)
+
+        def plain(a, b, c):
+
+            def h():
+                c.next = a + b
+
+            return always_comb(h)
+
+        b = Signal(0)
+        i = plain(a, b, c)
+        assert i.inputs == set(['a', 'b'])
+        assert i.senslist in ((a, b), (b, a))
+        i = plain(a, 1, c)
+        assert i.inputs == set(['a'])
+        assert i.sigdict == {'a': a, 'c': c}
+        a = [Signal(0) for __ in range(3)]
+        i = plain(a, b, c)
+        assert i.inputs == set(['a', 'b'])
+        assert i.sigdict == {'b': b, 'c': c}
+        assert i.losdict == {'a': a}
+
     def testEmbeddedFunction(self):
         a, b, c, d = [Signal(0) for __ in range(4)]
         u = 1
@@ -425,3 +472,126 @@ class TestInferWaiter:
     def testSignalTuple1(self):
         sim = Simulation(self.bench(SignalTupleGen1, _SignalTupleWaiter))
         sim.run()
+
+
+class TestAlwaysCombLevelized:
+
+    def bench(self, counts):
+
+        a = Signal(intbv(0)[8:])
+        b = Signal(intbv(0)[8:])
+        s1 = Signal(intbv(0)[9:])
+        s2 = Signal(intbv(0)[10:])
+        s3 = Signal(intbv(0)[11:])
+        z = Signal(intbv(0)[11:])
+        vectors = [(randrange(256), randrange(256)) for __ in range(100)]
+
+        def add():
+            counts['add'] += 1
+            s1.next = a + b
+
+        def double():
+            counts['double'] += 1
+            s2.next = s1 * 2
+
+        def merge():
+            counts['merge'] += 1
+            s3.next = s1 + s2
+
+        def mix():
+            counts['mix'] += 1
+            z.next = s3 ^ b
+
+        combs = [always_comb(add), always_comb(double),
+                 always_comb(merge), always_comb(mix)]
+
+        def stimulus():
+            for va, vb in vectors:
+                a.next = va
+                b.next = vb
+                yield delay(10)
+                assert z == (3 * (va + vb)) ^ vb
+            raise StopSimulation("levelized simulation test")
+
+        return combs, stimulus()
+
+    def run(self, levelize):
+        counts = dict.fromkeys(('add', 'double', 'merge', 'mix'), 0)
+        Simulation(self.bench(counts), levelize=levelize).run(quiet=QUIET)
+        return counts
+
+    def testResult(self):
+        self.run(levelize=True)
+
+    def testEvaluations(self):
+        random.seed(1)
+        event = self.run(levelize=False)
+        random.seed(1)
+        levelized = self.run(levelize=True)
+        # once per stimulus, plus the initial evaluation
+        assert levelized['merge'] <= 101
+        assert levelized['mix'] <= 101
+        assert event['merge'] > levelized['merge']
+        assert event['mix'] > levelized['mix']
+
+    def testNetwork(self):
+        counts = dict.fromkeys(('add', 'double', 'merge', 'mix'), 0)
+        combs, stimulus = self.bench(counts)
+        networks = _levelize(combs)
+        assert len(networks) == 1
+        funcs = [b.func.__name__ for b in networks[0].blocks]
+        assert funcs.index('add') < funcs.index('double') < \
+            funcs.index('merge') < funcs.index('mix')
+
+    def testLoop(self):
+        a = Signal(0)
+        b = Signal(0)
+        c = Signal(0)
+
+        def f():
+            b.next = a + c
+
+        def g():
+            c.next = b
+
+        assert _levelize([always_comb(f), always_comb(g)]) == []
+
+    def testDeltaCycles(self):
+        # readers of network outputs run in a later delta cycle, after the
+        # signals assigned with the network inputs have been updated
+        def run(levelize):
+            a, x, y, z = [Signal(0) for __ in range(4)]
+            seen = []
+
+            def copyA():
+                y.next = a
+
+            def copyY():
+                z.next = y
+
+            @always(a)
+            def follow():
+                x.next = a
+
+            @instance
+            def reader():
+                while 1:
+                    yield z
+                    seen.append((now(), int(x)))
+
+            @instance
+            def stimulus():
+                yield delay(10)
+                a.next = 1
+                yield delay(10)
+                a.next = 2
+
+            combs = [always_comb(copyA), always_comb(copyY)]
+            sim = Simulation(combs, follow, reader, stimulus,
+                             levelize=levelize)
+            sim.run(quiet=QUIET)
+            return seen
+
+        assert run(levelize=False) == [(10, 1), (20, 2)]
+        assert run(levelize=True) == [(10, 1), (20, 2)]
+
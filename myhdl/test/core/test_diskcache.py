@@ -0,0 +1,125 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for the on-disk elaboration cache """
+import os
+import pickle
+
+import pytest
+
+from myhdl import (Signal, ResetSignal, Simulation, block, instance,
+                   always_seq, always_comb, delay, intbv)
+from myhdl import _diskcache, _instance, _util, _Waiter
+
+
+@block
+def cell(clk, rst, d, q):
+
+    @instance
+    def sample():
+        while 1:
+            yield clk.posedge, delay(10)
+            q.next = d
+
+    @always_seq(clk.posedge, reset=rst)
+    def count():
+        d.next = d + 1
+
+    @always_comb
+    def comb():
+        q.next = d
+
+    return sample, count, comb
+
+
+def elaborate():
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    d, q = [Signal(intbv(0)[8:]) for __ in range(2)]
+    inst = cell(clk, rst, d, q)
+    sim = Simulation(inst)
+    sim.quit()
+    return [(type(w).__name__, sorted(w.inputs)) for w in inst.subs]
+
+
+@pytest.fixture
+def cachedir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_diskcache, '_dir', str(tmp_path))
+    monkeypatch.setattr(_diskcache, '_files', {})
+    for mod, name in ((_util, '_sourceInfo'), (_Waiter, '_yieldInfo'),
+                      (_instance, '_nameInfo')):
+        monkeypatch.setattr(mod, name, {})
+    return tmp_path
+
+
+def clearProcess():
+    _diskcache._files.clear()
+    _util._sourceInfo.clear()
+    _Waiter._yieldInfo.clear()
+    _instance._nameInfo.clear()
+
+
+class TestDiskCache:
+
+    def testDisabled(self, monkeypatch):
+        monkeypatch.setenv('MYHDL_CACHE', '0')
+        assert _diskcache._cacheDir() is None
+        monkeypatch.setenv('MYHDL_CACHE', '1')
+        monkeypatch.setenv('XDG_CACHE_HOME', '/xdg')
+        assert _diskcache._cacheDir() == os.path.join('/xdg', 'myhdl')
+
+    def testWarmStart(self, cachedir, monkeypatch):
+        cold = elaborate()
+        _diskcache._save()
+        assert len(os.listdir(str(cachedir))) == 1
+        # a warm start doesn't need the source
+        clearProcess()
+
+        def getSourceInfo(code):
+            raise AssertionError("source parsed on a warm start")
+
+        monkeypatch.setattr(_util, '_getSourceInfo', getSourceInfo)
+        warm = elaborate()
+        assert warm == cold
+
+    def testStale(self, cachedir):
+        elaborate()
+        _diskcache._save()
+        name, = os.listdir(str(cachedir))
+        with open(os.path.join(str(cachedir), name), 'wb') as f:
+            f.write(b'garbage')
+        clearProcess()
+        cold = elaborate()
+        _diskcache._save()
+        # the stale file was replaced
+        with open(os.path.join(str(cachedir), name), 'rb') as f:
+            assert pickle.loads(f.read())
+        clearProcess()
+        warm = elaborate()
+        assert warm == cold
+
+    def testEvict(self, cachedir, monkeypatch):
+        for i in range(4):
+            path = os.path.join(str(cachedir), '%d.pickle' % i)
+            with open(path, 'wb') as f:
+                f.write(b'x' * 100)
+            os.utime(path, (i, i))
+        monkeypatch.setattr(_diskcache, '_maxsize', 250)
+        _diskcache._evict()
+        assert sorted(os.listdir(str(cachedir))) == ['2.pickle', '3.pickle']
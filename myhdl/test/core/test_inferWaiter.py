@@ -28,6 +28,7 @@ from myhdl._Simulation import Simulation
 from myhdl._Waiter import (_DelayWaiter, _EdgeTupleWaiter, _EdgeWaiter,
                            _inferWaiter, _SignalTupleWaiter, _SignalWaiter,
                            _Waiter)
+from myhdl._util import _CodeCache
 
 random.seed(1)  # random, but deterministic
 
@@ -226,3 +227,41 @@ class TestInferWaiter:
     def testGeneral(self):
         sim = Simulation(self.bench(GeneralFunc, _Waiter))
         sim.run()
+
+    def testSameCodeOtherBindings(self):
+        # the inferred kind is cached per code object, but must follow
+        # what the names refer to in each generator instance
+        def gen(a):
+            while 1:
+                yield a
+
+        sig = Signal(bool(0))
+        assert type(_inferWaiter(gen(sig))) == _SignalWaiter
+        assert type(_inferWaiter(gen(delay(3)))) == _Waiter
+        assert type(_inferWaiter(gen(Signal(intbv(0))))) == _SignalWaiter
+        assert type(_inferWaiter(gen(5))) == _Waiter
+
+    def testCacheBound(self):
+        codes = [compile(str(i), '<test>', 'eval') for i in range(3)]
+        cache = _CodeCache(maxsize=2)
+        cache[codes[0]] = 0
+        cache[codes[1]] = 1
+        # a lookup makes an entry the most recently used one
+        assert cache.get(codes[0]) == 0
+        cache[codes[2]] = 2
+        assert len(cache) == 2
+        assert cache.get(codes[1]) is None
+        assert cache.get(codes[0]) == 0
+        assert cache.get(codes[2]) == 2
+
+    def testCacheFiles(self):
+        code = compile('0', 'a.py', 'eval')
+        other = code.replace(co_filename='b.py')
+        # equal code objects from different files have their own entries
+        assert other == code
+        cache = _CodeCache()
+        cache[code] = 'a'
+        cache[other] = 'b'
+        assert cache.get(code) == 'a'
+        assert cache.get(other) == 'b'
+
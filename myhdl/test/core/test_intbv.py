@@ -37,6 +37,18 @@ class TestIntbvInit:
     def testDefaultValue(self):
         assert intbv() == 0
 
+    def testCopy(self):
+        class tagged(intbv):
+            def __init__(self, val=0, tag='t'):
+                intbv.__init__(self, val)
+                self.tag = tag
+
+        for a in (intbv(5, min=-8, max=8), intbv(3)[4:], tagged(9)):
+            for b in (copy(a), deepcopy(a)):
+                assert b == a and b is not a and type(b) is type(a)
+                assert (b.min, b.max, len(b)) == (a.min, a.max, len(a))
+        assert deepcopy(tagged(9)).tag == 't'
+
 
 def getItem(s, i):
     ext = '0' * (i - len(s) + 1)
@@ -132,6 +144,7 @@ class TestIntBvIndexing:
                     ref = int(getSlice(s, i, j), 2)
                     assert res == ref
                     assert type(res) == intbv
+                    assert (res.min, res.max, len(res)) == (0, 2 ** (i - j), i - j)
                     mask = (2 ** (i - j)) - 1
                     assert resi == ref ^ mask
                     assert type(resi) == intbv
@@ -60,6 +60,15 @@ class TestModbvWrap:
         # Arbitrary boundraries support (no exception)
         modbv(5, min=-3, max=8)
 
+    def testWrapKinds(self):
+        # power of two ranges wrap with a mask, others with a modulo
+        for lo, hi in ((0, 16), (-8, 8), (-3, 8), (2, 10), (4, 20)):
+            for v in range(-70, 70):
+                x = modbv(lo, min=lo, max=hi)
+                x += v - lo
+                assert x == (v - lo) % (hi - lo) + lo
+                assert x.min == lo and x.max == hi
+
     def testNoWrap(self):
         # Validate the base class fails for the wraps
         x = intbv(0, min=-8, max=8)
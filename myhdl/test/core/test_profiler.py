@@ -0,0 +1,157 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for the simulation profiler """
+import json
+
+from myhdl import (Signal, Simulation, always, always_comb, block, delay,
+                   instance, intbv)
+
+QUIET = 1
+
+
+@block
+def counter(clk, q, z):
+
+    @always(clk.posedge)
+    def count():
+        q.next = (q + 1) % 16
+
+    @always_comb
+    def double():
+        z.next = 2 * q
+
+    return count, double
+
+
+@block
+def bench():
+    clk = Signal(bool(0))
+    q = Signal(intbv(0)[4:])
+    z = Signal(intbv(0)[5:])
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    def pause():
+        yield delay(1)
+
+    @instance
+    def stimulus():
+        for __ in range(3):
+            yield pause()
+            yield delay(20)
+
+    return counter(clk, q, z), clkgen, stimulus
+
+
+def processes(profile, prefix):
+    """ Return the statistics of the processes under a name prefix """
+    return dict((s['name'][len(prefix):], s)
+                for s in profile.asdict()['processes']
+                if s['name'].startswith(prefix))
+
+
+class TestProfiler:
+
+    def testDisabled(self):
+        top = bench()
+        top.run_sim(100, quiet=QUIET)
+        assert top.sim.profile is None
+        top.quit_sim()
+
+    def testCounts(self):
+        top = bench()
+        top.config_sim(profile=True)
+        top.run_sim(200, quiet=QUIET)
+        top.quit_sim()
+        p = processes(top.sim.profile, top.name + '.')
+        c = top.subs[0].name
+        assert sorted(p) == ['clkgen', c + '.count',
+                             c + '.double', 'stimulus',
+                             'stimulus/bench.<locals>.pause']
+        assert p['clkgen']['resumes'] == 41
+        assert p['clkgen']['writes'] == 40
+        # initial run, then one resume per rising clock edge
+        assert p[c + '.count']['resumes'] == 21
+        assert p[c + '.count']['writes'] == 20
+        assert p[c + '.double']['resumes'] == 21
+        assert p['stimulus']['resumes'] == 7
+        assert p['stimulus/bench.<locals>.pause']['resumes'] == 6
+        assert all(s['time'] >= 0 for s in p.values())
+
+    def testDeltas(self):
+        top = bench()
+        top.config_sim(profile=True)
+        top.run_sim(200, quiet=QUIET)
+        top.quit_sim()
+        profile = top.sim.profile
+        assert sum(profile.deltahist.values()) == profile.timesteps
+        assert sum(n * c for n, c in profile.deltahist.items()) == \
+            profile.deltas
+        # clock edge, counter update and combinational update
+        assert max(profile.deltahist) == 4
+
+    def testLastTimestep(self):
+        sig = Signal(0)
+
+        def gen():
+            sig.next = 1
+            yield delay(10)
+            sig.next = 2
+
+        sim = Simulation(gen(), profile=True)
+        sim.run(5, quiet=QUIET)
+        profile = sim.profile
+        # time 0 with the update of sig, and the open step at time 5
+        assert profile.timesteps == 2
+        assert profile.deltahist == {2: 1, 1: 1}
+        sim.run(quiet=QUIET)
+        assert profile.timesteps == 3
+        assert profile.deltahist == {2: 2, 1: 1}
+        assert sum(n * c for n, c in profile.deltahist.items()) == \
+            profile.deltas
+
+    def testReport(self):
+        top = bench()
+        top.config_sim(profile=True)
+        top.run_sim(100, quiet=QUIET)
+        top.quit_sim()
+        profile = top.sim.profile
+        table = profile.report()
+        assert table.splitlines()[0].split() == \
+            ['process', 'resumes', 'time(s)', '%time', 'writes']
+        assert '%s.%s.count' % (top.name, top.subs[0].name) in table
+        data = json.loads(profile.json())
+        assert data['timesteps'] == profile.timesteps
+        assert len(data['processes']) == len(profile.stats())
+
+    def testGenerators(self):
+        def gen(sig):
+            for i in range(5):
+                yield delay(10)
+                sig.next = i
+
+        sim = Simulation(gen(Signal(0)), gen(Signal(0)), profile=True)
+        sim.run(quiet=QUIET)
+        p = processes(sim.profile, gen.__qualname__)
+        assert sorted(p) == ['', '#2']
+        assert p['']['resumes'] == 6
+        assert p['']['writes'] == 5
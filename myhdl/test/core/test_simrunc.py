@@ -0,0 +1,269 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run parity tests for the compiled simulation kernel
+
+The same benches run on the pure Python kernel and on the compiled
+kernel, and should behave identically.
+"""
+import os
+import random
+
+import pytest
+
+from myhdl import (Signal, Simulation, StopSimulation, delay, intbv, join,
+                   now)
+from myhdl import _Simulation
+from myhdl._Cosimulation import Cosimulation
+
+simrunc = pytest.importorskip('myhdl._simrunc')
+
+QUIET = 1
+
+
+class Error(Exception):
+    pass
+
+
+def bench(log, seed):
+    """ Random activity with all kinds of yield clauses """
+    rnd = random.Random(seed)
+    clk = Signal(bool(0))
+    a = Signal(intbv(0)[8:])
+    b = Signal(0, delay=3)
+    c = Signal(0)
+
+    def clkgen():
+        while 1:
+            yield delay(5)
+            clk.next = not clk
+
+    def stimulus():
+        for __ in range(200):
+            yield delay(rnd.randrange(0, 7))
+            a.next = rnd.randrange(256)
+            b.next = rnd.randrange(4)
+        raise StopSimulation("done")
+
+    def edges():
+        while 1:
+            yield clk.posedge, a.negedge
+            log.append(('edges', now(), int(a), bool(clk)))
+
+    def events():
+        while 1:
+            yield a, b
+            log.append(('events', now(), int(a), b.val))
+            c.next = a + b
+
+    def delayed():
+        while 1:
+            yield b
+            log.append(('delayed', now(), b.val))
+
+    def task(n):
+        for __ in range(n):
+            yield clk.negedge
+        log.append(('task', now(), n))
+
+    def nested():
+        while 1:
+            yield task(rnd.randrange(1, 4))
+            yield join(c, delay(rnd.randrange(1, 20)))
+            log.append(('join', now(), c.val))
+            yield None
+            log.append(('none', now()))
+
+    return [clkgen(), stimulus(), edges(), events(), delayed(), nested()]
+
+
+def record(kernel, monkeypatch, run, *args):
+    monkeypatch.setattr(_Simulation, '_kernel', kernel)
+    log = []
+    res = run(log, *args)
+    return log, res
+
+
+def compare(monkeypatch, run, *args):
+    ref = record(_Simulation._run, monkeypatch, run, *args)
+    res = record(simrunc.run, monkeypatch, run, *args)
+    assert ref[0]
+    assert res == ref
+
+
+def runForever(log, seed):
+    sim = Simulation(bench(log, seed))
+    return sim.run(quiet=QUIET), now()
+
+
+def runDurations(log, seed):
+    rnd = random.Random(seed)
+    sim = Simulation(bench(log, seed))
+    ret = []
+    while 1:
+        r = sim.run(rnd.randrange(1, 50), quiet=QUIET)
+        ret.append((r, now()))
+        if not r:
+            return ret
+
+
+def runYieldError(log, seed):
+    clk = Signal(bool(0))
+
+    def clkgen():
+        for __ in range(20):
+            yield delay(10)
+            clk.next = not clk
+
+    def stimulus():
+        for i in range(5):
+            yield clk.posedge
+            log.append(('stimulus', now()))
+            yield Error(i)
+
+    sim = Simulation(clkgen(), stimulus())
+    caught = []
+    while 1:
+        try:
+            r = sim.run(quiet=QUIET)
+        except Error as e:
+            caught.append((e.args, now()))
+        else:
+            return caught, r
+
+
+def runError(log, seed):
+
+    def stimulus():
+        yield delay(10)
+        log.append(('stimulus', now()))
+        raise Error()
+
+    sim = Simulation(stimulus())
+    with pytest.raises(Error):
+        sim.run(quiet=QUIET)
+    return sim._context._simulation
+
+
+class FakeCosim(Cosimulation):
+    """ Cosimulation stand-in that echoes its inputs back """
+
+    class _Child(object):
+
+        def wait(self):
+            pass
+
+    def __init__(self, log, a, b):
+        self._rt, self._wf = os.pipe()
+        self._child = self._Child()
+        self._fromSigs = [a]
+        self._toSigs = [b]
+        self._hasChange = 0
+        self._getMode = 1
+        self._log = log
+
+    def _get(self):
+        if not self._getMode:
+            return
+        a, b = self._fromSigs[0], self._toSigs[0]
+        self._log.append(('get', now(), a.val))
+        # like a real cosimulation, only report changes
+        if b.val != a.val:
+            b.next = a.val
+        self._getMode = 0
+
+    def _put(self, time):
+        self._log.append(('put', time, self._hasChange))
+        self._hasChange = 0
+        self._getMode = 1
+
+
+def runCosim(log, seed):
+    rnd = random.Random(seed)
+    a = Signal(0)
+    b = Signal(0)
+    cosim = FakeCosim(log, a, b)
+
+    def stimulus():
+        for __ in range(50):
+            yield delay(rnd.randrange(1, 10))
+            a.next = rnd.randrange(8)
+
+    def response():
+        while 1:
+            yield b
+            log.append(('response', now(), b.val))
+
+    return Simulation(cosim, stimulus(), response()).run(quiet=QUIET)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def testRunForever(monkeypatch, seed):
+    compare(monkeypatch, runForever, seed)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def testRunDurations(monkeypatch, seed):
+    compare(monkeypatch, runDurations, seed)
+
+
+def testYieldError(monkeypatch):
+    compare(monkeypatch, runYieldError, 0)
+
+
+def testError(monkeypatch):
+    compare(monkeypatch, runError, 0)
+
+
+def testCosim(monkeypatch):
+    compare(monkeypatch, runCosim, 0)
+
+
+def testTrace(monkeypatch, tmpdir):
+    from myhdl import block, instance, traceSignals
+
+    @block
+    def top():
+        clk = Signal(bool(0))
+        count = Signal(intbv(0)[4:])
+
+        @instance
+        def logic():
+            while 1:
+                yield delay(3)
+                clk.next = not clk
+                if clk:
+                    count.next = (count + 1) % 16
+
+        return logic
+
+    def runTrace(log):
+        sim = Simulation(traceSignals(top()))
+        sim.run(200, quiet=QUIET)
+        sim.quit()
+        with open('top.vcd') as f:
+            lines = f.read().splitlines()
+        # skip the date
+        log.extend(lines[3:])
+        return None
+
+    with tmpdir.as_cwd():
+        ref = record(_Simulation._run, monkeypatch, runTrace)
+        res = record(simrunc.run, monkeypatch, runTrace)
+    assert res == ref
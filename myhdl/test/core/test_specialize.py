@@ -0,0 +1,239 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for the specialization of always blocks """
+import pytest
+
+from myhdl import (Signal, ResetSignal, Simulation, SimulationContext,
+                   StopSimulation, always, always_comb, always_seq, delay,
+                   instance, intbv, modbv)
+from myhdl import _simulator
+from myhdl._Simulation import _specializeBlocks
+from myhdl._specialize import _specialize
+
+QUIET = 1
+
+
+def bench(trace):
+    clk = Signal(bool(0))
+    rst = ResetSignal(1, active=1, isasync=False)
+    count = Signal(modbv(0)[4:])
+    level = Signal(intbv(0, min=-4, max=20))
+    toggle = Signal(bool(0))
+    total = Signal(0)
+    sum_ = Signal(intbv(0)[6:])
+    msb = Signal(bool(0))
+
+    @always_seq(clk.posedge, reset=rst)
+    def seq():
+        count.next = count + 1
+        if toggle and level < 19:
+            level.next = level + 1
+        elif level > -3:
+            level.next = level - 2
+        toggle.next = not toggle
+        total.next = total - count
+
+    @always_comb
+    def comb():
+        sum_.next = count + level[3:]
+        msb.next = count[3]
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @instance
+    def stimulus():
+        yield clk.negedge
+        rst.next = 0
+        for i in range(60):
+            yield clk.negedge
+            trace.append((int(count), int(level), bool(toggle), total.val,
+                          int(sum_), bool(msb)))
+        raise StopSimulation
+
+    return seq, comb, clkgen, stimulus
+
+
+def run(**kwargs):
+    trace = []
+    Simulation(bench(trace), **kwargs).run(quiet=QUIET)
+    return trace
+
+
+def specialized(func):
+    return _specialize(func)
+
+
+class TestSpecialize:
+
+    @pytest.mark.parametrize('levelize', [False, True])
+    def testTrace(self, levelize):
+        expected = run(levelize=levelize)
+        assert run(levelize=levelize, specialize=True) == expected
+
+    def testSpecialized(self):
+        trace = []
+        insts = bench(trace)
+        seq, comb, clkgen, stimulus = insts
+        simfuncs = _specializeBlocks(insts)
+        assert sorted(simfuncs) == sorted(id(b) for b in (seq, comb, clkgen))
+        for inst in (seq, comb, clkgen):
+            func = simfuncs[id(inst)]
+            assert func is not inst.func
+            assert func.__qualname__ == inst.func.__qualname__
+
+    def testSimulationOnly(self):
+        # the specialized functions only run in the simulation they are
+        # made for, and write to the siglist of the current context
+        def counter():
+            clk = Signal(bool(0))
+            q = Signal(intbv(0)[8:])
+
+            @always(clk.posedge)
+            def count():
+                q.next = q + 1
+
+            @always(delay(5))
+            def clkgen():
+                clk.next = not clk
+
+            return q, (count, clkgen)
+
+        q, insts = counter()
+        for specialize in (True, False, True):
+            with SimulationContext():
+                start = int(q)
+                sim = Simulation(insts, specialize=specialize)
+                sim.run(60, quiet=QUIET)
+                assert q == start + 6
+                sim.quit()
+
+    def testBounds(self):
+        a = Signal(intbv(0)[4:])
+
+        def f():
+            a.next = a + 16
+
+        g = specialized(f)
+        with pytest.raises(ValueError) as expected:
+            f()
+        with pytest.raises(ValueError) as actual:
+            g()
+        assert str(actual.value) == str(expected.value)
+
+    def testHalfBounded(self):
+        a = Signal(intbv(0, max=8))
+        b = Signal(intbv(0, min=-2))
+
+        def f():
+            a.next = a + 7
+
+        def g():
+            b.next = b - 2
+
+        specialized(f)()
+        specialized(g)()
+        assert a._next == 7 and b._next == -2
+        a._val._val = -20
+        specialized(f)()
+        assert a._next == -13
+        # values just out of bounds
+        for func, sig, v in ((f, a, 1), (g, b, -1)):
+            sig._val._val = v
+            with pytest.raises(ValueError) as expected:
+                func()
+            with pytest.raises(ValueError) as actual:
+                specialized(func)()
+            assert str(actual.value) == str(expected.value)
+        a._pending = b._pending = False
+        del _simulator._state.siglist[:]
+
+    def testModbv(self):
+        a = Signal(modbv(15)[4:])
+
+        def f():
+            a.next = a + 3
+
+        specialized(f)()
+        assert a._next == 2
+
+    def testTypes(self):
+        b = Signal(bool(0))
+        i = Signal(0)
+        # values that take the regular path
+        vb, vi = 1, intbv(5)
+
+        def f():
+            b.next = vb
+            i.next = vi
+
+        specialized(f)()
+        assert b._next == 1
+        assert i._next == 5 and type(i._next) is int
+
+    def testRegister(self):
+        a = Signal(intbv(0)[8:])
+        b = Signal(intbv(0)[8:])
+
+        def f():
+            a.next = 1
+            b.next = 2
+            a.next = 3
+
+        g = specialized(f)
+        with SimulationContext() as context:
+            g()
+        assert context._siglist == [a, b]
+        assert a._pending and b._pending
+        assert a._next == 3 and b._next == 2
+        a._pending = b._pending = False
+
+    def testFallback(self):
+        a = Signal(intbv(0)[8:])
+        b = Signal(intbv(0)[8:])
+
+        def rebind():
+            nonlocal a
+            a = b
+
+        def f():
+            a.next = 5
+
+        g = specialized(f)
+        rebind()
+        g()
+        assert b._next == 5
+        assert b._pending
+        b._pending = False
+
+    def testNotSpecialized(self):
+        a = Signal(0)
+        n = 0
+
+        def noSignals():
+            return n + 1
+
+        def usesGlobal():
+            global QUIET
+            a.next = QUIET
+
+        assert specialized(noSignals) is None
+        assert specialized(usesGlobal) is None
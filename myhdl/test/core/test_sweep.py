@@ -0,0 +1,90 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Run the unit tests for sweep """
+import random
+
+from myhdl import (Signal, StopSimulation, always, block, delay, instance,
+                   intbv, sweep)
+from myhdl._sweep import _points
+
+
+class Error(Exception):
+    pass
+
+
+@block
+def counter(width, period, seed, n=20):
+    """ Count n clock cycles, and fail if the counter overflows """
+    rnd = random.Random(seed)
+    clk = Signal(bool(0))
+    count = Signal(intbv(0, min=0, max=2**width))
+
+    @always(delay(period))
+    def clkgen():
+        clk.next = not clk
+
+    @instance
+    def check():
+        for __ in range(n):
+            yield clk.posedge
+            step = rnd.randrange(1, 3)
+            if count + step >= count.max:
+                raise Error(width)
+            count.next = count + step
+        raise StopSimulation()
+
+    return clkgen, check
+
+
+class TestSweep:
+
+    def testPoints(self):
+        assert _points({'a': [1, 2], 'b': 'xy'}) == \
+            [{'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'},
+             {'a': 2, 'b': 'x'}, {'a': 2, 'b': 'y'}]
+        assert _points([{'a': 1}, {'a': 2}]) == [{'a': 1}, {'a': 2}]
+
+    def testSweep(self):
+        grid = {'width': [8, 16], 'period': [1, 5], 'seed': range(3)}
+        results = list(sweep(counter, grid, workers=2))
+        assert len(results) == 12
+        assert sorted(tuple(sorted(r.params.items())) for r in results) == \
+            sorted(tuple(sorted(p.items())) for p in _points(grid))
+        for r in results:
+            assert r.exception is None, r.traceback
+            assert r.value == 0
+            # stopped at the 20th rising edge
+            assert r.time == 39 * r.params['period']
+            assert r.walltime > 0
+
+    def testExceptions(self):
+        results = list(sweep(counter, {'width': [2, 16], 'period': [5],
+                                       'seed': [0]}, workers=2))
+        failed = [r for r in results if r.exception is not None]
+        assert len(failed) == 1
+        assert isinstance(failed[0].exception, Error)
+        assert failed[0].params['width'] == 2
+        assert 'Error' in failed[0].traceback
+
+    def testDuration(self):
+        points = [{'width': 16, 'period': 5, 'seed': 0, 'n': 1000}]
+        results = list(sweep(counter, points, duration=100))
+        assert results[0].value == 1
+        assert results[0].time == 100
@@ -0,0 +1,53 @@
+-- File: mytest_bench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity mytest_bench is
+end entity mytest_bench;
+
+
+architecture MyHDL of mytest_bench is
+
+
+
+signal MyTest10_test0_clock: std_logic := '0';
+signal MyTest20_test0_clock: std_logic := '1';
+
+begin
+
+
+
+
+mytest10_test0_func: process is
+    variable i: integer;
+begin
+    i := 0;
+    while (i <= 100) loop
+        wait for 10 * 1 ns;
+        MyTest10_test0_clock <= stdl((not bool(MyTest10_test0_clock)));
+        i := (i + 1);
+    end loop;
+    wait;
+end process mytest10_test0_func;
+
+mytest20_test0_func: process is
+    variable i: integer;
+begin
+    i := 0;
+    while (i <= 100) loop
+        wait for 10 * 1 ns;
+        MyTest20_test0_clock <= stdl((not bool(MyTest20_test0_clock)));
+        i := (i + 1);
+    end loop;
+    wait;
+end process mytest20_test0_func;
+
+end architecture MyHDL;
@@ -0,0 +1,50 @@
+-- File: name_conflict_after_replace.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity name_conflict_after_replace is
+    port (
+        clock: in std_logic;
+        reset: in std_logic;
+        a_x: out signed (11 downto 0);
+        a_x: out signed (11 downto 0);
+        a_y: in signed (12 downto 0);
+        a_z: in signed (12 downto 0)
+    );
+end entity name_conflict_after_replace;
+
+
+architecture MyHDL of name_conflict_after_replace is
+
+
+
+type t_array_a_x_0 is array(0 to 8-1) of unsigned(11 downto 0);
+signal a_x_0: t_array_a_x_0 := (others => 12X"000");
+
+begin
+
+
+
+
+comb: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '0') then
+            a_x <= to_signed(1, 12);
+            a_x <= to_unsigned(0, 12);
+        else
+            a_x <= signed(a_x);
+            a_x <= a_x_0(1);
+        end if;
+    end if;
+end process comb;
+
+end architecture MyHDL;
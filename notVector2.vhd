@@ -0,0 +1,34 @@
+-- File: notVector2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity notVector2 is
+    port (
+        a: in unsigned(7 downto 0);
+        z: out unsigned(7 downto 0)
+    );
+end entity notVector2;
+
+
+architecture MyHDL of notVector2 is
+
+
+
+
+begin
+
+
+
+
+
+z <= (a and ((to_unsigned(254, 8))));
+
+end architecture MyHDL;
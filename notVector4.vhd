@@ -0,0 +1,34 @@
+-- File: notVector4.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity notVector4 is
+    port (
+        a: in unsigned(7 downto 0);
+        z: out unsigned(7 downto 0)
+    );
+end entity notVector4;
+
+
+architecture MyHDL of notVector4 is
+
+
+
+
+begin
+
+
+
+
+
+z <= (a and to_unsigned(-2, 8));
+
+end architecture MyHDL;
@@ -0,0 +1,33 @@
+-- File: notVectorBench0.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity notVectorBench0 is
+end entity notVectorBench0;
+
+
+architecture MyHDL of notVectorBench0 is
+
+
+
+signal a: unsigned(7 downto 0);
+signal z: unsigned(7 downto 0) := 8X"00";
+
+begin
+
+
+a <= to_unsigned(0, 8);
+
+
+
+z <= (a and to_unsigned(-2, 8));
+
+end architecture MyHDL;
@@ -0,0 +1,46 @@
+-- File: one_level.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity one_level is
+    port (
+        clock: in std_logic;
+        reset: in std_logic;
+        ia_x: out unsigned(3 downto 0);
+        ia_y: out unsigned(4 downto 0);
+        ib_x: in unsigned(3 downto 0);
+        ib_y: in unsigned(4 downto 0)
+    );
+end entity one_level;
+
+
+architecture MyHDL of one_level is
+
+
+
+
+begin
+
+
+
+
+rtl: process (clock, reset) is
+begin
+    if (reset = '0') then
+        ia_y <= to_unsigned(3, 5);
+        ia_x <= to_unsigned(2, 4);
+    elsif rising_edge(clock) then
+        ia_x <= (ib_x + 1);
+        ia_y <= (ib_y + 1);
+    end if;
+end process rtl;
+
+end architecture MyHDL;
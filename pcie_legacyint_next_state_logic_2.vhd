@@ -0,0 +1,67 @@
+-- File: pcie_legacyint_next_state_logic_2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:21 2026 UTC
+
+
+
+package pck_pcie_legacyint_next_state_logic_2 is
+
+attribute enum_encoding: string;
+
+type t_enum_t_state_1 is (
+	WAIT_POSEDGE,
+	WAIT_NEGEDGE
+	);
+attribute enum_encoding of t_enum_t_state_1: type is "01 10";
+
+end package pck_pcie_legacyint_next_state_logic_2;
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+use work.pck_pcie_legacyint_next_state_logic_2.all;
+
+entity pcie_legacyint_next_state_logic_2 is
+    port (
+        state_i: in t_enum_t_state_1;
+        next_state_o: out t_enum_t_state_1;
+        next_state_en_o: out std_logic;
+        interrupt_pending_i: in std_logic;
+        interrupt_assert_o: out std_logic
+    );
+end entity pcie_legacyint_next_state_logic_2;
+
+
+architecture MyHDL of pcie_legacyint_next_state_logic_2 is
+
+
+
+
+begin
+
+
+
+
+sm_output: process (interrupt_pending_i, state_i) is
+begin
+    case state_i is
+        when WAIT_POSEDGE =>
+            interrupt_assert_o <= '0';
+            next_state_en_o <= interrupt_pending_i;
+            next_state_o <= WAIT_NEGEDGE;
+        when WAIT_NEGEDGE =>
+            interrupt_assert_o <= '1';
+            next_state_en_o <= stdl((not bool(interrupt_pending_i)));
+            next_state_o <= WAIT_POSEDGE;
+        when others =>
+            interrupt_assert_o <= '0';
+            next_state_en_o <= '1';
+            next_state_o <= WAIT_POSEDGE;
+    end case;
+end process sm_output;
+
+end architecture MyHDL;
@@ -0,0 +1,28 @@
+// File: permute.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:05 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module permute (
+    x,
+    a
+);
+
+
+output [2:0] x;
+wire [2:0] x;
+input [2:0] a;
+
+wire [2:0] q;
+
+assign q[2] = a[0];
+assign q[1] = a[2];
+assign q[0] = a[1];
+
+
+
+assign x = q;
+
+endmodule
@@ -0,0 +1,38 @@
+-- File: permute.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:05 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity permute is
+    port (
+        x: out unsigned(2 downto 0);
+        a: in unsigned(2 downto 0)
+    );
+end entity permute;
+
+
+architecture MyHDL of permute is
+
+
+
+signal q: unsigned(2 downto 0);
+
+begin
+
+
+
+q(2) <= a(0);
+q(1) <= a(2);
+q(0) <= a(1);
+
+
+x <= q;
+
+end architecture MyHDL;
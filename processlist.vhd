@@ -0,0 +1,154 @@
+-- File: processlist.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity processlist is
+end entity processlist;
+-- Extract list from intbv, do some processing, reassemble.
+
+architecture MyHDL of processlist is
+
+
+
+signal a: unsigned(7 downto 0) := 8X"01";
+signal z: unsigned(7 downto 0) := 8X"00";
+type t_array_case40_b is array(0 to 8-1) of std_logic;
+signal case40_b: t_array_case40_b := (others => '1');
+type t_array_case40_c is array(0 to 8-1) of std_logic;
+signal case40_c: t_array_case40_c := (others => '0');
+
+begin
+
+
+
+
+case40_extract: process is
+begin
+    while True loop
+        wait on a;
+        wait for 1 * 1 ns;
+        for i in 0 to 8-1 loop
+            case40_b(i) <= a(i);
+        end loop;
+    end loop;
+    wait;
+end process case40_extract;
+
+case40_inv40_comb: process is
+begin
+    while True loop
+        wait on case40_b(0);
+        wait for 1 * 1 ns;
+        case40_c(0) <= stdl((not bool(case40_b(0))));
+    end loop;
+    wait;
+end process case40_inv40_comb;
+
+case40_inv41_comb: process is
+begin
+    while True loop
+        wait on case40_b(1);
+        wait for 1 * 1 ns;
+        case40_c(1) <= stdl((not bool(case40_b(1))));
+    end loop;
+    wait;
+end process case40_inv41_comb;
+
+case40_inv42_comb: process is
+begin
+    while True loop
+        wait on case40_b(2);
+        wait for 1 * 1 ns;
+        case40_c(2) <= stdl((not bool(case40_b(2))));
+    end loop;
+    wait;
+end process case40_inv42_comb;
+
+case40_inv43_comb: process is
+begin
+    while True loop
+        wait on case40_b(3);
+        wait for 1 * 1 ns;
+        case40_c(3) <= stdl((not bool(case40_b(3))));
+    end loop;
+    wait;
+end process case40_inv43_comb;
+
+case40_inv44_comb: process is
+begin
+    while True loop
+        wait on case40_b(4);
+        wait for 1 * 1 ns;
+        case40_c(4) <= stdl((not bool(case40_b(4))));
+    end loop;
+    wait;
+end process case40_inv44_comb;
+
+case40_inv45_comb: process is
+begin
+    while True loop
+        wait on case40_b(5);
+        wait for 1 * 1 ns;
+        case40_c(5) <= stdl((not bool(case40_b(5))));
+    end loop;
+    wait;
+end process case40_inv45_comb;
+
+case40_inv46_comb: process is
+begin
+    while True loop
+        wait on case40_b(6);
+        wait for 1 * 1 ns;
+        case40_c(6) <= stdl((not bool(case40_b(6))));
+    end loop;
+    wait;
+end process case40_inv46_comb;
+
+case40_inv47_comb: process is
+begin
+    while True loop
+        wait on case40_b(7);
+        wait for 1 * 1 ns;
+        case40_c(7) <= stdl((not bool(case40_b(7))));
+    end loop;
+    wait;
+end process case40_inv47_comb;
+
+case40_assemble: process is
+begin
+    while True loop
+        wait on case40_c;
+        wait for 1 * 1 ns;
+        for i in 0 to 8-1 loop
+            z(i) <= case40_c(i);
+        end loop;
+    end loop;
+    wait;
+end process case40_assemble;
+
+stimulus: process is
+    variable L: line;
+begin
+    for i in 0 to 256-1 loop
+        wait for 10 * 1 ns;
+        a <= to_unsigned(i, 8);
+        wait for 10 * 1 ns;
+        assert (z = (not a))
+            report "*** AssertionError ***"
+            severity error;
+        write(L, to_hstring(z));
+        writeline(output, L);
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
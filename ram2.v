@@ -0,0 +1,39 @@
+// File: ram2.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:16 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ram2 (
+    dout,
+    din,
+    addr,
+    we,
+    clk
+);
+
+
+output [7:0] dout;
+reg [7:0] dout;
+input [7:0] din;
+input [6:0] addr;
+input we;
+input clk;
+
+reg [7:0] memL [0:128-1];
+
+
+
+always @(posedge clk) begin: wrlogic
+    if (we) begin
+        memL[addr] <= din;
+    end
+end
+
+
+always @(posedge clk) begin: rdlogic
+    dout <= memL[addr];
+end
+
+endmodule
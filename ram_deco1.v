@@ -0,0 +1,38 @@
+// File: ram_deco1.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:16 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module ram_deco1 (
+    dout,
+    din,
+    addr,
+    we,
+    clk
+);
+// Ram model 
+
+output [7:0] dout;
+wire [7:0] dout;
+input [7:0] din;
+input [6:0] addr;
+input we;
+input clk;
+
+reg [7:0] mem [0:128-1];
+
+
+
+always @(posedge clk) begin: write
+    if (we) begin
+        mem[addr] <= din;
+    end
+end
+
+
+
+assign dout = mem[addr];
+
+endmodule
@@ -0,0 +1,597 @@
+-- File: randscramblerBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity randscramblerBench is
+end entity randscramblerBench;
+
+
+architecture MyHDL of randscramblerBench is
+
+
+
+signal o7: std_logic := '0';
+signal o6: std_logic := '0';
+signal o5: std_logic := '0';
+signal o4: std_logic := '0';
+signal o3: std_logic := '0';
+signal o2: std_logic := '0';
+signal o1: std_logic := '0';
+signal o0: std_logic := '0';
+signal i7: std_logic := '0';
+signal i6: std_logic := '0';
+signal i5: std_logic := '0';
+signal i4: std_logic := '0';
+signal i3: std_logic := '0';
+signal i2: std_logic := '0';
+signal i1: std_logic := '0';
+signal i0: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor0_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor1_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor2_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor3_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor4_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor5_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor6_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor7_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor80_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor80_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor80_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor81_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor81_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor81_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor82_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_xor83_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor8_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor9_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor10_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor11_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor12_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor13_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor14_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor15_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor72_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor72_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor72_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor73_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor73_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor74_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor74_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_xor77_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor30_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor32_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor37_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor53_a: std_logic := '0';
+signal randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_c: std_logic := '0';
+
+begin
+
+
+
+
+randscrambler_top0_randscrambler0_xor0_comb: process (i7, i0, i5) is
+begin
+    randscrambler_top0_randscrambler0_xor0_z <= ((i7 xor i0) xor i5);
+end process randscrambler_top0_randscrambler0_xor0_comb;
+
+randscrambler_top0_randscrambler0_xor1_comb: process (i6, i3, i2) is
+begin
+    randscrambler_top0_randscrambler0_xor1_z <= ((i6 xor i3) xor i2);
+end process randscrambler_top0_randscrambler0_xor1_comb;
+
+randscrambler_top0_randscrambler0_xor2_comb: process (i5, i4, i2) is
+begin
+    randscrambler_top0_randscrambler0_xor2_z <= ((i5 xor i4) xor i2);
+end process randscrambler_top0_randscrambler0_xor2_comb;
+
+randscrambler_top0_randscrambler0_xor3_comb: process (i4, i0, i5) is
+begin
+    randscrambler_top0_randscrambler0_xor3_z <= ((i4 xor i0) xor i5);
+end process randscrambler_top0_randscrambler0_xor3_comb;
+
+randscrambler_top0_randscrambler0_xor4_comb: process (i3, i7, i4) is
+begin
+    randscrambler_top0_randscrambler0_xor4_z <= ((i3 xor i7) xor i4);
+end process randscrambler_top0_randscrambler0_xor4_comb;
+
+randscrambler_top0_randscrambler0_xor5_comb: process (i2, i1, i7) is
+begin
+    randscrambler_top0_randscrambler0_xor5_z <= ((i2 xor i1) xor i7);
+end process randscrambler_top0_randscrambler0_xor5_comb;
+
+randscrambler_top0_randscrambler0_xor6_comb: process (i1, i7, i4) is
+begin
+    randscrambler_top0_randscrambler0_xor6_z <= ((i1 xor i7) xor i4);
+end process randscrambler_top0_randscrambler0_xor6_comb;
+
+randscrambler_top0_randscrambler0_xor7_comb: process (i0, i1, i4) is
+begin
+    randscrambler_top0_randscrambler0_xor7_z <= ((i0 xor i1) xor i4);
+end process randscrambler_top0_randscrambler0_xor7_comb;
+
+randscrambler_top0_randscrambler0_xor80_comb: process (randscrambler_top0_randscrambler0_xor80_a, randscrambler_top0_randscrambler0_xor80_b, randscrambler_top0_randscrambler0_xor80_c) is
+begin
+    o7 <= ((randscrambler_top0_randscrambler0_xor80_a xor randscrambler_top0_randscrambler0_xor80_b) xor randscrambler_top0_randscrambler0_xor80_c);
+end process randscrambler_top0_randscrambler0_xor80_comb;
+
+randscrambler_top0_randscrambler0_xor81_comb: process (randscrambler_top0_randscrambler0_xor81_a, randscrambler_top0_randscrambler0_xor81_b, randscrambler_top0_randscrambler0_xor81_c) is
+begin
+    o6 <= ((randscrambler_top0_randscrambler0_xor81_a xor randscrambler_top0_randscrambler0_xor81_b) xor randscrambler_top0_randscrambler0_xor81_c);
+end process randscrambler_top0_randscrambler0_xor81_comb;
+
+randscrambler_top0_randscrambler0_xor82_comb: process (randscrambler_top0_randscrambler0_xor80_b, randscrambler_top0_randscrambler0_xor81_b, randscrambler_top0_randscrambler0_xor82_c) is
+begin
+    o5 <= ((randscrambler_top0_randscrambler0_xor80_b xor randscrambler_top0_randscrambler0_xor81_b) xor randscrambler_top0_randscrambler0_xor82_c);
+end process randscrambler_top0_randscrambler0_xor82_comb;
+
+randscrambler_top0_randscrambler0_xor83_comb: process (randscrambler_top0_randscrambler0_xor81_c, randscrambler_top0_randscrambler0_xor83_b, randscrambler_top0_randscrambler0_xor80_c) is
+begin
+    o4 <= ((randscrambler_top0_randscrambler0_xor81_c xor randscrambler_top0_randscrambler0_xor83_b) xor randscrambler_top0_randscrambler0_xor80_c);
+end process randscrambler_top0_randscrambler0_xor83_comb;
+
+randscrambler_top0_randscrambler0_xor84_comb: process (randscrambler_top0_randscrambler0_xor83_b, randscrambler_top0_randscrambler0_xor80_a, randscrambler_top0_randscrambler0_xor80_c) is
+begin
+    o3 <= ((randscrambler_top0_randscrambler0_xor83_b xor randscrambler_top0_randscrambler0_xor80_a) xor randscrambler_top0_randscrambler0_xor80_c);
+end process randscrambler_top0_randscrambler0_xor84_comb;
+
+randscrambler_top0_randscrambler0_xor85_comb: process (randscrambler_top0_randscrambler0_xor81_b, randscrambler_top0_randscrambler0_xor82_c, randscrambler_top0_randscrambler0_xor80_c) is
+begin
+    o2 <= ((randscrambler_top0_randscrambler0_xor81_b xor randscrambler_top0_randscrambler0_xor82_c) xor randscrambler_top0_randscrambler0_xor80_c);
+end process randscrambler_top0_randscrambler0_xor85_comb;
+
+randscrambler_top0_randscrambler0_xor86_comb: process (randscrambler_top0_randscrambler0_xor82_c, randscrambler_top0_randscrambler0_xor80_c, randscrambler_top0_randscrambler0_xor80_b) is
+begin
+    o1 <= ((randscrambler_top0_randscrambler0_xor82_c xor randscrambler_top0_randscrambler0_xor80_c) xor randscrambler_top0_randscrambler0_xor80_b);
+end process randscrambler_top0_randscrambler0_xor86_comb;
+
+randscrambler_top0_randscrambler0_xor87_comb: process (randscrambler_top0_randscrambler0_xor80_c, randscrambler_top0_randscrambler0_xor80_a, randscrambler_top0_randscrambler0_xor81_a) is
+begin
+    o0 <= ((randscrambler_top0_randscrambler0_xor80_c xor randscrambler_top0_randscrambler0_xor80_a) xor randscrambler_top0_randscrambler0_xor81_a);
+end process randscrambler_top0_randscrambler0_xor87_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor8_comb: process (randscrambler_top0_randscrambler0_xor0_z, randscrambler_top0_randscrambler0_xor1_z, randscrambler_top0_randscrambler0_xor3_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor8_z <= ((randscrambler_top0_randscrambler0_xor0_z xor randscrambler_top0_randscrambler0_xor1_z) xor randscrambler_top0_randscrambler0_xor3_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor8_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor9_comb: process (randscrambler_top0_randscrambler0_xor1_z, randscrambler_top0_randscrambler0_xor0_z, randscrambler_top0_randscrambler0_xor6_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor9_z <= ((randscrambler_top0_randscrambler0_xor1_z xor randscrambler_top0_randscrambler0_xor0_z) xor randscrambler_top0_randscrambler0_xor6_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor9_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor10_comb: process (randscrambler_top0_randscrambler0_xor2_z, randscrambler_top0_randscrambler0_xor6_z, randscrambler_top0_randscrambler0_xor7_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor10_z <= ((randscrambler_top0_randscrambler0_xor2_z xor randscrambler_top0_randscrambler0_xor6_z) xor randscrambler_top0_randscrambler0_xor7_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor10_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor11_comb: process (randscrambler_top0_randscrambler0_xor3_z, randscrambler_top0_randscrambler0_xor5_z, randscrambler_top0_randscrambler0_xor6_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor11_z <= ((randscrambler_top0_randscrambler0_xor3_z xor randscrambler_top0_randscrambler0_xor5_z) xor randscrambler_top0_randscrambler0_xor6_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor11_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor12_comb: process (randscrambler_top0_randscrambler0_xor4_z, randscrambler_top0_randscrambler0_xor0_z, randscrambler_top0_randscrambler0_xor5_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor12_z <= ((randscrambler_top0_randscrambler0_xor4_z xor randscrambler_top0_randscrambler0_xor0_z) xor randscrambler_top0_randscrambler0_xor5_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor12_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor13_comb: process (randscrambler_top0_randscrambler0_xor5_z, randscrambler_top0_randscrambler0_xor2_z, randscrambler_top0_randscrambler0_xor3_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor13_z <= ((randscrambler_top0_randscrambler0_xor5_z xor randscrambler_top0_randscrambler0_xor2_z) xor randscrambler_top0_randscrambler0_xor3_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor13_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor14_comb: process (randscrambler_top0_randscrambler0_xor6_z, randscrambler_top0_randscrambler0_xor2_z, randscrambler_top0_randscrambler0_xor1_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor14_z <= ((randscrambler_top0_randscrambler0_xor6_z xor randscrambler_top0_randscrambler0_xor2_z) xor randscrambler_top0_randscrambler0_xor1_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor14_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor15_comb: process (randscrambler_top0_randscrambler0_xor7_z, randscrambler_top0_randscrambler0_xor3_z, randscrambler_top0_randscrambler0_xor6_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor15_z <= ((randscrambler_top0_randscrambler0_xor7_z xor randscrambler_top0_randscrambler0_xor3_z) xor randscrambler_top0_randscrambler0_xor6_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor15_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor72_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor72_a, randscrambler_top0_randscrambler0_randscrambler1_xor72_b, randscrambler_top0_randscrambler0_randscrambler1_xor72_c) is
+begin
+    randscrambler_top0_randscrambler0_xor80_a <= ((randscrambler_top0_randscrambler0_randscrambler1_xor72_a xor randscrambler_top0_randscrambler0_randscrambler1_xor72_b) xor randscrambler_top0_randscrambler0_randscrambler1_xor72_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor72_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor73_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor73_a, randscrambler_top0_randscrambler0_randscrambler1_xor73_b, randscrambler_top0_randscrambler0_randscrambler1_xor72_c) is
+begin
+    randscrambler_top0_randscrambler0_xor81_a <= ((randscrambler_top0_randscrambler0_randscrambler1_xor73_a xor randscrambler_top0_randscrambler0_randscrambler1_xor73_b) xor randscrambler_top0_randscrambler0_randscrambler1_xor72_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor73_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor74_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor74_a, randscrambler_top0_randscrambler0_randscrambler1_xor72_b, randscrambler_top0_randscrambler0_randscrambler1_xor74_c) is
+begin
+    randscrambler_top0_randscrambler0_xor80_b <= ((randscrambler_top0_randscrambler0_randscrambler1_xor74_a xor randscrambler_top0_randscrambler0_randscrambler1_xor72_b) xor randscrambler_top0_randscrambler0_randscrambler1_xor74_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor74_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor75_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor74_c, randscrambler_top0_randscrambler0_randscrambler1_xor73_a, randscrambler_top0_randscrambler0_randscrambler1_xor72_b) is
+begin
+    randscrambler_top0_randscrambler0_xor81_c <= ((randscrambler_top0_randscrambler0_randscrambler1_xor74_c xor randscrambler_top0_randscrambler0_randscrambler1_xor73_a) xor randscrambler_top0_randscrambler0_randscrambler1_xor72_b);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor75_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor76_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor73_b, randscrambler_top0_randscrambler0_randscrambler1_xor72_a, randscrambler_top0_randscrambler0_randscrambler1_xor74_c) is
+begin
+    randscrambler_top0_randscrambler0_xor83_b <= ((randscrambler_top0_randscrambler0_randscrambler1_xor73_b xor randscrambler_top0_randscrambler0_randscrambler1_xor72_a) xor randscrambler_top0_randscrambler0_randscrambler1_xor74_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor76_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor77_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor77_a, randscrambler_top0_randscrambler0_randscrambler1_xor74_c, randscrambler_top0_randscrambler0_randscrambler1_xor73_a) is
+begin
+    randscrambler_top0_randscrambler0_xor81_b <= ((randscrambler_top0_randscrambler0_randscrambler1_xor77_a xor randscrambler_top0_randscrambler0_randscrambler1_xor74_c) xor randscrambler_top0_randscrambler0_randscrambler1_xor73_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor77_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor78_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor72_b, randscrambler_top0_randscrambler0_randscrambler1_xor72_c, randscrambler_top0_randscrambler0_randscrambler1_xor73_a) is
+begin
+    randscrambler_top0_randscrambler0_xor82_c <= ((randscrambler_top0_randscrambler0_randscrambler1_xor72_b xor randscrambler_top0_randscrambler0_randscrambler1_xor72_c) xor randscrambler_top0_randscrambler0_randscrambler1_xor73_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor78_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_xor79_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor72_c, randscrambler_top0_randscrambler0_randscrambler1_xor73_a, randscrambler_top0_randscrambler0_randscrambler1_xor74_a) is
+begin
+    randscrambler_top0_randscrambler0_xor80_c <= ((randscrambler_top0_randscrambler0_randscrambler1_xor72_c xor randscrambler_top0_randscrambler0_randscrambler1_xor73_a) xor randscrambler_top0_randscrambler0_randscrambler1_xor74_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_xor79_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor8_z, randscrambler_top0_randscrambler0_randscrambler1_xor13_z, randscrambler_top0_randscrambler0_randscrambler1_xor10_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor8_z xor randscrambler_top0_randscrambler0_randscrambler1_xor13_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor10_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor9_z, randscrambler_top0_randscrambler0_randscrambler1_xor10_z, randscrambler_top0_randscrambler0_randscrambler1_xor15_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor9_z xor randscrambler_top0_randscrambler0_randscrambler1_xor10_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor15_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor10_z, randscrambler_top0_randscrambler0_randscrambler1_xor14_z, randscrambler_top0_randscrambler0_randscrambler1_xor13_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor10_z xor randscrambler_top0_randscrambler0_randscrambler1_xor14_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor13_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor11_z, randscrambler_top0_randscrambler0_randscrambler1_xor13_z, randscrambler_top0_randscrambler0_randscrambler1_xor8_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor11_z xor randscrambler_top0_randscrambler0_randscrambler1_xor13_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor8_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor12_z, randscrambler_top0_randscrambler0_randscrambler1_xor10_z, randscrambler_top0_randscrambler0_randscrambler1_xor8_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor12_z xor randscrambler_top0_randscrambler0_randscrambler1_xor10_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor8_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor13_z, randscrambler_top0_randscrambler0_randscrambler1_xor10_z, randscrambler_top0_randscrambler0_randscrambler1_xor9_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor13_z xor randscrambler_top0_randscrambler0_randscrambler1_xor10_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor9_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor14_z, randscrambler_top0_randscrambler0_randscrambler1_xor8_z, randscrambler_top0_randscrambler0_randscrambler1_xor13_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor14_z xor randscrambler_top0_randscrambler0_randscrambler1_xor8_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor13_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_comb: process (randscrambler_top0_randscrambler0_randscrambler1_xor15_z, randscrambler_top0_randscrambler0_randscrambler1_xor12_z, randscrambler_top0_randscrambler0_randscrambler1_xor8_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_z <= ((randscrambler_top0_randscrambler0_randscrambler1_xor15_z xor randscrambler_top0_randscrambler0_randscrambler1_xor12_z) xor randscrambler_top0_randscrambler0_randscrambler1_xor8_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor72_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor73_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor74_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor74_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor68_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor73_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_a) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor68_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor69_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor77_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor69_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor70_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor72_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor70_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor71_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_xor72_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor71_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor20_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor16_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor19_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor30_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor30_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor22_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor17_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor30_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor23_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor18_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor21_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor66_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor67_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor60_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_b xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor60_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor65_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor62_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor62_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor63_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_xor64_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor63_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor32_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor32_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor32_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor27_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor37_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor37_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor25_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor37_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor30_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor30_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor26_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor29_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor31_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor28_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor24_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor50_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_a) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor50_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor59_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor52_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor57_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor52_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor53_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor53_a, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor61_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor53_a xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor53_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_c) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor58_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_c);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor55_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_xor56_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_c xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor55_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor40_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor32_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor32_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor40_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor41_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor41_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor42_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor42_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor43_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor48_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor35_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor43_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor44_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor51_b <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor44_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor45_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor37_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor53_a <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor37_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor45_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor46_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor49_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor36_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor34_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor46_comb;
+
+randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor47_comb: process (randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z, randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z) is
+begin
+    randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor54_c <= ((randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor39_z xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor33_z) xor randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_xor38_z);
+end process randscrambler_top0_randscrambler0_randscrambler1_randscrambler2_randscrambler3_randscrambler4_randscrambler5_xor47_comb;
+
+stimulus: process is
+    variable L: line;
+    variable a: unsigned(7 downto 0);
+    variable z: unsigned(7 downto 0);
+begin
+    a := to_unsigned(0, 8);
+    z := to_unsigned(0, 8);
+    for i in 0 to 100-1 loop
+        a := (a + 97);
+        i7 <= a(7);
+        i6 <= a(6);
+        i5 <= a(5);
+        i4 <= a(4);
+        i3 <= a(3);
+        i2 <= a(2);
+        i1 <= a(1);
+        i0 <= a(0);
+        wait for 10 * 1 ns;
+        z(7) := o7;
+        z(6) := o6;
+        z(5) := o5;
+        z(4) := o4;
+        z(3) := o3;
+        z(2) := o2;
+        z(1) := o1;
+        z(0) := o0;
+        write(L, to_hstring(a));
+        writeline(output, L);
+        write(L, to_hstring(z));
+        writeline(output, L);
+    end loop;
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,284 @@
+// File: rom1.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:16 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module rom1 (
+    dout,
+    addr,
+    clk
+);
+
+
+output [7:0] dout;
+reg [7:0] dout;
+input [7:0] addr;
+input clk;
+
+
+
+
+always @(posedge clk) begin: rdlogic
+    case (addr)
+        0: dout <= 28;
+        1: dout <= 46;
+        2: dout <= 43;
+        3: dout <= 184;
+        4: dout <= 86;
+        5: dout <= 157;
+        6: dout <= 128;
+        7: dout <= 108;
+        8: dout <= 18;
+        9: dout <= 81;
+        10: dout <= 220;
+        11: dout <= 201;
+        12: dout <= 190;
+        13: dout <= 227;
+        14: dout <= 137;
+        15: dout <= 18;
+        16: dout <= 14;
+        17: dout <= 186;
+        18: dout <= 238;
+        19: dout <= 163;
+        20: dout <= 194;
+        21: dout <= 216;
+        22: dout <= 84;
+        23: dout <= 90;
+        24: dout <= 120;
+        25: dout <= 118;
+        26: dout <= 12;
+        27: dout <= 90;
+        28: dout <= 166;
+        29: dout <= 88;
+        30: dout <= 69;
+        31: dout <= 184;
+        32: dout <= 93;
+        33: dout <= 228;
+        34: dout <= 212;
+        35: dout <= 186;
+        36: dout <= 181;
+        37: dout <= 185;
+        38: dout <= 228;
+        39: dout <= 82;
+        40: dout <= 204;
+        41: dout <= 236;
+        42: dout <= 127;
+        43: dout <= 250;
+        44: dout <= 142;
+        45: dout <= 255;
+        46: dout <= 181;
+        47: dout <= 232;
+        48: dout <= 236;
+        49: dout <= 179;
+        50: dout <= 233;
+        51: dout <= 249;
+        52: dout <= 113;
+        53: dout <= 166;
+        54: dout <= 85;
+        55: dout <= 137;
+        56: dout <= 245;
+        57: dout <= 158;
+        58: dout <= 155;
+        59: dout <= 208;
+        60: dout <= 159;
+        61: dout <= 106;
+        62: dout <= 250;
+        63: dout <= 187;
+        64: dout <= 38;
+        65: dout <= 174;
+        66: dout <= 4;
+        67: dout <= 97;
+        68: dout <= 54;
+        69: dout <= 30;
+        70: dout <= 25;
+        71: dout <= 139;
+        72: dout <= 116;
+        73: dout <= 54;
+        74: dout <= 69;
+        75: dout <= 136;
+        76: dout <= 125;
+        77: dout <= 107;
+        78: dout <= 30;
+        79: dout <= 216;
+        80: dout <= 16;
+        81: dout <= 29;
+        82: dout <= 185;
+        83: dout <= 184;
+        84: dout <= 88;
+        85: dout <= 127;
+        86: dout <= 12;
+        87: dout <= 42;
+        88: dout <= 58;
+        89: dout <= 34;
+        90: dout <= 12;
+        91: dout <= 20;
+        92: dout <= 10;
+        93: dout <= 191;
+        94: dout <= 130;
+        95: dout <= 65;
+        96: dout <= 80;
+        97: dout <= 94;
+        98: dout <= 0;
+        99: dout <= 197;
+        100: dout <= 22;
+        101: dout <= 126;
+        102: dout <= 77;
+        103: dout <= 18;
+        104: dout <= 2;
+        105: dout <= 176;
+        106: dout <= 57;
+        107: dout <= 146;
+        108: dout <= 172;
+        109: dout <= 250;
+        110: dout <= 15;
+        111: dout <= 157;
+        112: dout <= 229;
+        113: dout <= 23;
+        114: dout <= 135;
+        115: dout <= 205;
+        116: dout <= 78;
+        117: dout <= 242;
+        118: dout <= 115;
+        119: dout <= 47;
+        120: dout <= 161;
+        121: dout <= 52;
+        122: dout <= 12;
+        123: dout <= 229;
+        124: dout <= 65;
+        125: dout <= 201;
+        126: dout <= 249;
+        127: dout <= 167;
+        128: dout <= 73;
+        129: dout <= 174;
+        130: dout <= 132;
+        131: dout <= 134;
+        132: dout <= 214;
+        133: dout <= 9;
+        134: dout <= 71;
+        135: dout <= 29;
+        136: dout <= 129;
+        137: dout <= 17;
+        138: dout <= 67;
+        139: dout <= 82;
+        140: dout <= 87;
+        141: dout <= 49;
+        142: dout <= 232;
+        143: dout <= 118;
+        144: dout <= 16;
+        145: dout <= 126;
+        146: dout <= 119;
+        147: dout <= 227;
+        148: dout <= 37;
+        149: dout <= 128;
+        150: dout <= 41;
+        151: dout <= 116;
+        152: dout <= 184;
+        153: dout <= 131;
+        154: dout <= 216;
+        155: dout <= 142;
+        156: dout <= 2;
+        157: dout <= 77;
+        158: dout <= 18;
+        159: dout <= 196;
+        160: dout <= 209;
+        161: dout <= 82;
+        162: dout <= 56;
+        163: dout <= 44;
+        164: dout <= 123;
+        165: dout <= 52;
+        166: dout <= 51;
+        167: dout <= 10;
+        168: dout <= 93;
+        169: dout <= 118;
+        170: dout <= 53;
+        171: dout <= 111;
+        172: dout <= 12;
+        173: dout <= 237;
+        174: dout <= 232;
+        175: dout <= 158;
+        176: dout <= 194;
+        177: dout <= 108;
+        178: dout <= 107;
+        179: dout <= 222;
+        180: dout <= 217;
+        181: dout <= 10;
+        182: dout <= 26;
+        183: dout <= 214;
+        184: dout <= 92;
+        185: dout <= 48;
+        186: dout <= 245;
+        187: dout <= 187;
+        188: dout <= 9;
+        189: dout <= 60;
+        190: dout <= 187;
+        191: dout <= 148;
+        192: dout <= 190;
+        193: dout <= 157;
+        194: dout <= 9;
+        195: dout <= 211;
+        196: dout <= 51;
+        197: dout <= 53;
+        198: dout <= 156;
+        199: dout <= 101;
+        200: dout <= 8;
+        201: dout <= 231;
+        202: dout <= 30;
+        203: dout <= 210;
+        204: dout <= 248;
+        205: dout <= 237;
+        206: dout <= 106;
+        207: dout <= 37;
+        208: dout <= 2;
+        209: dout <= 145;
+        210: dout <= 12;
+        211: dout <= 190;
+        212: dout <= 156;
+        213: dout <= 39;
+        214: dout <= 112;
+        215: dout <= 251;
+        216: dout <= 98;
+        217: dout <= 59;
+        218: dout <= 191;
+        219: dout <= 200;
+        220: dout <= 237;
+        221: dout <= 71;
+        222: dout <= 176;
+        223: dout <= 202;
+        224: dout <= 62;
+        225: dout <= 130;
+        226: dout <= 62;
+        227: dout <= 62;
+        228: dout <= 41;
+        229: dout <= 171;
+        230: dout <= 200;
+        231: dout <= 108;
+        232: dout <= 53;
+        233: dout <= 12;
+        234: dout <= 240;
+        235: dout <= 22;
+        236: dout <= 254;
+        237: dout <= 148;
+        238: dout <= 183;
+        239: dout <= 234;
+        240: dout <= 72;
+        241: dout <= 191;
+        242: dout <= 137;
+        243: dout <= 247;
+        244: dout <= 244;
+        245: dout <= 214;
+        246: dout <= 251;
+        247: dout <= 151;
+        248: dout <= 202;
+        249: dout <= 118;
+        250: dout <= 80;
+        251: dout <= 250;
+        252: dout <= 132;
+        253: dout <= 218;
+        254: dout <= 43;
+        default: dout <= 49;
+    endcase
+end
+
+endmodule
@@ -0,0 +1,286 @@
+// File: rom3.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module rom3 (
+    dout,
+    addr,
+    clk
+);
+
+
+output [7:0] dout;
+reg [7:0] dout;
+input [7:0] addr;
+input clk;
+
+
+
+
+always @(addr) begin: rdlogic
+    reg [8-1:0] tmp;
+    case (addr)
+        0: tmp = 28;
+        1: tmp = 46;
+        2: tmp = 43;
+        3: tmp = 184;
+        4: tmp = 86;
+        5: tmp = 157;
+        6: tmp = 128;
+        7: tmp = 108;
+        8: tmp = 18;
+        9: tmp = 81;
+        10: tmp = 220;
+        11: tmp = 201;
+        12: tmp = 190;
+        13: tmp = 227;
+        14: tmp = 137;
+        15: tmp = 18;
+        16: tmp = 14;
+        17: tmp = 186;
+        18: tmp = 238;
+        19: tmp = 163;
+        20: tmp = 194;
+        21: tmp = 216;
+        22: tmp = 84;
+        23: tmp = 90;
+        24: tmp = 120;
+        25: tmp = 118;
+        26: tmp = 12;
+        27: tmp = 90;
+        28: tmp = 166;
+        29: tmp = 88;
+        30: tmp = 69;
+        31: tmp = 184;
+        32: tmp = 93;
+        33: tmp = 228;
+        34: tmp = 212;
+        35: tmp = 186;
+        36: tmp = 181;
+        37: tmp = 185;
+        38: tmp = 228;
+        39: tmp = 82;
+        40: tmp = 204;
+        41: tmp = 236;
+        42: tmp = 127;
+        43: tmp = 250;
+        44: tmp = 142;
+        45: tmp = 255;
+        46: tmp = 181;
+        47: tmp = 232;
+        48: tmp = 236;
+        49: tmp = 179;
+        50: tmp = 233;
+        51: tmp = 249;
+        52: tmp = 113;
+        53: tmp = 166;
+        54: tmp = 85;
+        55: tmp = 137;
+        56: tmp = 245;
+        57: tmp = 158;
+        58: tmp = 155;
+        59: tmp = 208;
+        60: tmp = 159;
+        61: tmp = 106;
+        62: tmp = 250;
+        63: tmp = 187;
+        64: tmp = 38;
+        65: tmp = 174;
+        66: tmp = 4;
+        67: tmp = 97;
+        68: tmp = 54;
+        69: tmp = 30;
+        70: tmp = 25;
+        71: tmp = 139;
+        72: tmp = 116;
+        73: tmp = 54;
+        74: tmp = 69;
+        75: tmp = 136;
+        76: tmp = 125;
+        77: tmp = 107;
+        78: tmp = 30;
+        79: tmp = 216;
+        80: tmp = 16;
+        81: tmp = 29;
+        82: tmp = 185;
+        83: tmp = 184;
+        84: tmp = 88;
+        85: tmp = 127;
+        86: tmp = 12;
+        87: tmp = 42;
+        88: tmp = 58;
+        89: tmp = 34;
+        90: tmp = 12;
+        91: tmp = 20;
+        92: tmp = 10;
+        93: tmp = 191;
+        94: tmp = 130;
+        95: tmp = 65;
+        96: tmp = 80;
+        97: tmp = 94;
+        98: tmp = 0;
+        99: tmp = 197;
+        100: tmp = 22;
+        101: tmp = 126;
+        102: tmp = 77;
+        103: tmp = 18;
+        104: tmp = 2;
+        105: tmp = 176;
+        106: tmp = 57;
+        107: tmp = 146;
+        108: tmp = 172;
+        109: tmp = 250;
+        110: tmp = 15;
+        111: tmp = 157;
+        112: tmp = 229;
+        113: tmp = 23;
+        114: tmp = 135;
+        115: tmp = 205;
+        116: tmp = 78;
+        117: tmp = 242;
+        118: tmp = 115;
+        119: tmp = 47;
+        120: tmp = 161;
+        121: tmp = 52;
+        122: tmp = 12;
+        123: tmp = 229;
+        124: tmp = 65;
+        125: tmp = 201;
+        126: tmp = 249;
+        127: tmp = 167;
+        128: tmp = 73;
+        129: tmp = 174;
+        130: tmp = 132;
+        131: tmp = 134;
+        132: tmp = 214;
+        133: tmp = 9;
+        134: tmp = 71;
+        135: tmp = 29;
+        136: tmp = 129;
+        137: tmp = 17;
+        138: tmp = 67;
+        139: tmp = 82;
+        140: tmp = 87;
+        141: tmp = 49;
+        142: tmp = 232;
+        143: tmp = 118;
+        144: tmp = 16;
+        145: tmp = 126;
+        146: tmp = 119;
+        147: tmp = 227;
+        148: tmp = 37;
+        149: tmp = 128;
+        150: tmp = 41;
+        151: tmp = 116;
+        152: tmp = 184;
+        153: tmp = 131;
+        154: tmp = 216;
+        155: tmp = 142;
+        156: tmp = 2;
+        157: tmp = 77;
+        158: tmp = 18;
+        159: tmp = 196;
+        160: tmp = 209;
+        161: tmp = 82;
+        162: tmp = 56;
+        163: tmp = 44;
+        164: tmp = 123;
+        165: tmp = 52;
+        166: tmp = 51;
+        167: tmp = 10;
+        168: tmp = 93;
+        169: tmp = 118;
+        170: tmp = 53;
+        171: tmp = 111;
+        172: tmp = 12;
+        173: tmp = 237;
+        174: tmp = 232;
+        175: tmp = 158;
+        176: tmp = 194;
+        177: tmp = 108;
+        178: tmp = 107;
+        179: tmp = 222;
+        180: tmp = 217;
+        181: tmp = 10;
+        182: tmp = 26;
+        183: tmp = 214;
+        184: tmp = 92;
+        185: tmp = 48;
+        186: tmp = 245;
+        187: tmp = 187;
+        188: tmp = 9;
+        189: tmp = 60;
+        190: tmp = 187;
+        191: tmp = 148;
+        192: tmp = 190;
+        193: tmp = 157;
+        194: tmp = 9;
+        195: tmp = 211;
+        196: tmp = 51;
+        197: tmp = 53;
+        198: tmp = 156;
+        199: tmp = 101;
+        200: tmp = 8;
+        201: tmp = 231;
+        202: tmp = 30;
+        203: tmp = 210;
+        204: tmp = 248;
+        205: tmp = 237;
+        206: tmp = 106;
+        207: tmp = 37;
+        208: tmp = 2;
+        209: tmp = 145;
+        210: tmp = 12;
+        211: tmp = 190;
+        212: tmp = 156;
+        213: tmp = 39;
+        214: tmp = 112;
+        215: tmp = 251;
+        216: tmp = 98;
+        217: tmp = 59;
+        218: tmp = 191;
+        219: tmp = 200;
+        220: tmp = 237;
+        221: tmp = 71;
+        222: tmp = 176;
+        223: tmp = 202;
+        224: tmp = 62;
+        225: tmp = 130;
+        226: tmp = 62;
+        227: tmp = 62;
+        228: tmp = 41;
+        229: tmp = 171;
+        230: tmp = 200;
+        231: tmp = 108;
+        232: tmp = 53;
+        233: tmp = 12;
+        234: tmp = 240;
+        235: tmp = 22;
+        236: tmp = 254;
+        237: tmp = 148;
+        238: tmp = 183;
+        239: tmp = 234;
+        240: tmp = 72;
+        241: tmp = 191;
+        242: tmp = 137;
+        243: tmp = 247;
+        244: tmp = 244;
+        245: tmp = 214;
+        246: tmp = 251;
+        247: tmp = 151;
+        248: tmp = 202;
+        249: tmp = 118;
+        250: tmp = 80;
+        251: tmp = 250;
+        252: tmp = 132;
+        253: tmp = 218;
+        254: tmp = 43;
+        default: tmp = 49;
+    endcase
+    dout <= tmp;
+end
+
+endmodule
@@ -0,0 +1,75 @@
+""" Compare batch simulation with simulating the lanes one at a time.
+
+Each lane runs the same datapath, fed by an LFSR with a seed of its
+own. The lanes take different branches of the logic.
+"""
+import time
+
+from myhdl import (BatchSimulation, Signal, always_comb, always_seq, block,
+                   concat, intbv, modbv)
+
+LANES = 1000
+CYCLES = 1000
+SINGLE = 20
+
+
+@block
+def datapath(clk, lfsr, acc):
+    x = Signal(intbv(0)[8:])
+
+    @always_seq(clk.posedge, reset=None)
+    def shift():
+        lfsr.next = concat(lfsr[15:0], lfsr[15] ^ lfsr[13] ^ lfsr[12] ^ lfsr[10])
+
+    @always_comb
+    def logic():
+        if lfsr[0]:
+            x.next = lfsr[8:0] // 2 + 3
+        else:
+            x.next = lfsr[16:8] ^ 0x5a
+
+    @always_seq(clk.posedge, reset=None)
+    def accumulate():
+        if x > 128:
+            acc.next = acc + x
+        elif x[0]:
+            acc.next = acc - 1
+        else:
+            acc.next = acc ^ (x << 4)
+
+    return shift, logic, accumulate
+
+
+def seeds():
+    return [(i * 7919) % 65535 + 1 for i in range(LANES)]
+
+
+def single():
+    results = []
+    for seed in seeds()[:SINGLE]:
+        acc = Signal(modbv(0)[16:])
+        top = datapath(Signal(bool(0)), Signal(intbv(seed)[16:]), acc)
+        top.run_sim(cycles=CYCLES, quiet=1, mode='cycle')
+        results.append(int(acc))
+        top.quit_sim()
+    return results
+
+
+def batch():
+    clk, lfsr, acc = Signal(bool(0)), Signal(intbv(0)[16:]), Signal(modbv(0)[16:])
+    sim = BatchSimulation(datapath(clk, lfsr, acc), lanes=LANES)
+    sim[lfsr] = seeds()
+    sim.run(CYCLES)
+    return sim[acc].tolist()
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    expected = single()
+    elapsed = time.perf_counter() - start
+    print("one lane at a time: %.0f lane cycles/s" % (SINGLE * CYCLES / elapsed))
+    start = time.perf_counter()
+    results = batch()
+    elapsed = time.perf_counter() - start
+    print("batch of %d lanes: %.0f lane cycles/s" % (LANES, LANES * CYCLES / elapsed))
+    assert results[:SINGLE] == expected
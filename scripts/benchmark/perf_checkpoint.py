@@ -0,0 +1,67 @@
+""" Compare replaying a warm-up prefix for each test with branching from
+a checkpoint after the warm-up.
+
+The design is a 24 bit LFSR; each test loads a value and runs a few cycles.
+"""
+import time
+
+from myhdl import Signal, Simulation, always, concat, delay, intbv
+
+WARMUP = 200000
+TESTLEN = 100
+NRTESTS = 16
+
+
+def design(q, load, value):
+    clk = Signal(bool(0))
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @always(clk.posedge)
+    def shift():
+        if load:
+            q.next = value
+        else:
+            q.next = concat(q[23:0], q[23] ^ q[22] ^ q[21] ^ q[16])
+
+    return clkgen, shift
+
+
+def test(sim, q, load, value, v):
+    load.next = 1
+    value.next = v
+    sim.run(10, quiet=1)
+    load.next = 0
+    sim.run(TESTLEN, quiet=1)
+    return int(q)
+
+
+def setup():
+    q = Signal(intbv(1)[24:])
+    load = Signal(bool(0))
+    value = Signal(intbv(0)[24:])
+    sim = Simulation(design(q, load, value))
+    sim.run(WARMUP, quiet=1)
+    return sim, q, load, value
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    ref = []
+    for v in range(1, NRTESTS + 1):
+        sim, q, load, value = setup()
+        ref.append(test(sim, q, load, value, v))
+        sim.quit()
+    replay = time.perf_counter() - start
+    start = time.perf_counter()
+    sim, q, load, value = setup()
+    cp = sim.checkpoint()
+    res = [sim.branch(cp, test, q, load, value, v)
+           for v in range(1, NRTESTS + 1)]
+    sim.quit()
+    branch = time.perf_counter() - start
+    assert res == ref
+    print("%10s %10s %8s" % ("replay", "branch", "speedup"))
+    print("%10.3f %10.3f %8.2f" % (replay, branch, replay / branch))
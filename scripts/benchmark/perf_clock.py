@@ -0,0 +1,47 @@
+""" Compare clock generators with Clock primitives.
+
+A number of clock domains with different periods, each clocking a
+small counter, run for a fixed duration.
+"""
+import time
+
+from myhdl import (Clock, Signal, Simulation, always, always_seq, delay,
+                   intbv)
+
+DURATION = 200000
+DOMAINS = 8
+
+
+def domain(period, useClock):
+    clk = Signal(bool(0))
+    count = Signal(intbv(0)[16:])
+
+    if useClock:
+        clkgen = Clock(clk, period)
+    else:
+        @always(delay(period // 2))
+        def clkgen():
+            clk.next = not clk
+
+    @always_seq(clk.posedge, reset=None)
+    def counter():
+        count.next = (count + 1) % 2**16
+
+    return clkgen, counter
+
+
+def run(useClock):
+    domains = [domain(10 + 2 * i, useClock) for i in range(DOMAINS)]
+    sim = Simulation(domains)
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+if __name__ == '__main__':
+    generator = run(False)
+    clock = run(True)
+    print("%10s %10s %8s" % ("generator", "Clock", "speedup"))
+    print("%10.3f %10.3f %8.2f" % (generator, clock, generator / clock))
@@ -0,0 +1,92 @@
+""" Measure the signal commit path on a wide register bank.
+
+An always_seq block updates a bank of registers on each clock with a
+default assignment that a later assignment may override, and sets the
+top bits with a slice assignment. An always_comb block reads all of the
+registers, so that every register has a waiter.
+
+Reported per clock: the wall time, the number of signal updates in the
+commit phase, and the number of new lists that the updates return.
+"""
+import time
+
+from myhdl import (ResetSignal, Signal, Simulation, always, always_comb,
+                   always_seq, delay, intbv)
+from myhdl._Signal import _Signal
+
+WIDTH = 512
+CYCLES = 4000
+
+
+def bank(clk, rst, count, q, parity):
+
+    @always_seq(clk.posedge, reset=rst)
+    def regs():
+        c = int(count)
+        for i in range(WIDTH):
+            q[i].next = q[i]
+            if (c + i) & 1:
+                q[i].next = (c + i) & 0xfff
+            q[i].next[16:12] = c & 0xf
+        count.next = (c + 1) & 0xffff
+
+    @always_comb
+    def reduce():
+        p = 0
+        for s in q:
+            p ^= int(s)
+        parity.next = p
+
+    return regs, reduce
+
+
+def bench():
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    count = Signal(intbv(0)[16:])
+    q = [Signal(intbv(0)[16:]) for __ in range(WIDTH)]
+    parity = Signal(intbv(0)[16:])
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    return clkgen, bank(clk, rst, count, q, parity)
+
+
+def run(cycles):
+    sim = Simulation(bench())
+    start = time.perf_counter()
+    sim.run(10 * cycles, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+def count(cycles):
+    """ Count the updates and the new lists they return """
+    update = _Signal._update
+    counts = [0, 0]
+
+    def countingUpdate(self):
+        waiters = update(self)
+        counts[0] += 1
+        # a list that the signal keeps for reuse is not new
+        if isinstance(waiters, list) and \
+                waiters is not getattr(self, '_spareWaiters', None):
+            counts[1] += 1
+        return waiters
+
+    _Signal._update = countingUpdate
+    try:
+        run(cycles)
+    finally:
+        _Signal._update = update
+    return counts[0] / cycles, counts[1] / cycles
+
+
+if __name__ == '__main__':
+    elapsed = run(CYCLES)
+    updates, lists = count(CYCLES // 10)
+    print("%10s %14s %16s" % ("us/clock", "updates/clock", "new lists/clock"))
+    print("%10.1f %14.1f %16.1f" % (elapsed / CYCLES * 1e6, updates, lists))
@@ -0,0 +1,79 @@
+""" Compare event-driven and cycle-based simulation.
+
+The design is a pipeline of registers with combinational logic between
+the stages, all on one clock.
+"""
+import time
+
+from myhdl import (ResetSignal, Signal, always, always_comb, always_seq,
+                   block, delay, intbv)
+
+CYCLES = 20000
+
+
+@block
+def stage(clk, rst, d, q):
+    x = Signal(intbv(0)[8:])
+    y = Signal(intbv(0)[8:])
+
+    @always_comb
+    def logic1():
+        x.next = (d * 5 + 1) % 256
+
+    @always_comb
+    def logic2():
+        y.next = x ^ (d >> 1)
+
+    @always_seq(clk.posedge, reset=rst)
+    def reg():
+        q.next = y
+
+    return logic1, logic2, reg
+
+
+@block
+def pipeline(clk, depth=16):
+    rst = ResetSignal(0, active=1, isasync=False)
+    sigs = [Signal(intbv(0)[8:]) for __ in range(depth + 1)]
+    stages = [stage(clk, rst, sigs[i], sigs[i + 1]) for i in range(depth)]
+
+    @always(clk.posedge)
+    def source():
+        sigs[0].next = (sigs[0] + 7) % 256
+
+    return stages, source
+
+
+@block
+def eventBench():
+    clk = Signal(bool(0))
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    return pipeline(clk), clkgen
+
+
+@block
+def cycleBench():
+    return pipeline(Signal(bool(0)))
+
+
+def run(bench, levelize=False, **kwargs):
+    top = bench()
+    top.config_sim(levelize=levelize)
+    start = time.perf_counter()
+    top.run_sim(quiet=1, **kwargs)
+    elapsed = time.perf_counter() - start
+    top.quit_sim()
+    return elapsed
+
+
+if __name__ == '__main__':
+    event = run(eventBench, duration=CYCLES * 10)
+    levelized = run(eventBench, levelize=True, duration=CYCLES * 10)
+    cycle = run(cycleBench, cycles=CYCLES, mode='cycle')
+    print("%10s %10s %10s %8s" % ("event", "levelized", "cycle", "speedup"))
+    print("%10.3f %10.3f %10.3f %8.2f" %
+          (event, levelized, cycle, event / cycle))
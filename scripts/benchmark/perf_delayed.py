@@ -0,0 +1,52 @@
+""" Time a chain of delayed signals.
+
+A fast clock drives a chain of delayed nets whose delay spans many clock
+periods, so that each net has many changes in flight. Transport delay
+keeps all of them; inertial delay keeps only the last one.
+"""
+import time
+
+from myhdl import Signal, Simulation, always, delay, instance
+from myhdl import _simulator
+
+DURATION = 100000
+NETS = 32
+DELAY = 100
+
+
+def bench(transport):
+    clk = Signal(bool(0))
+    nets = [Signal(bool(0), delay=DELAY, transport=transport)
+            for __ in range(NETS)]
+    size = [0]
+
+    @always(delay(5))
+    def toggle():
+        clk.next = not clk
+
+    def stage(a, b):
+        @always(a)
+        def logic():
+            b.next = a
+        return logic
+
+    @instance
+    def monitor():
+        while 1:
+            yield delay(1000)
+            size[0] = max(size[0], len(_simulator._futureEvents))
+
+    stages = [stage(a, b) for a, b in zip([clk] + nets[:-1], nets)]
+    return [toggle, monitor] + stages, size
+
+
+if __name__ == '__main__':
+    for transport in (False, True):
+        gens, size = bench(transport)
+        sim = Simulation(gens)
+        start = time.perf_counter()
+        sim.run(DURATION, quiet=1)
+        elapsed = time.perf_counter() - start
+        sim.quit()
+        print("%s: %.3f s, future events %d" % (
+            "transport" if transport else "inertial", elapsed, size[0]))
@@ -0,0 +1,88 @@
+""" Measure elaboration with the on-disk cache, cold versus warm.
+
+Generates a library of COUNT distinct blocks in a temporary directory,
+and elaborates a design that instantiates each of them once, in a fresh
+Python process: without the cache, with an empty cache, and with the
+cache filled by the previous run.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+COUNT = 300
+
+BLOCK = '''
+@block
+def cell{i}(clk, rst, d, q):
+
+    @instance
+    def sample():
+        while 1:
+            yield clk.posedge
+            q.next = d + {i}
+
+    @always_seq(clk.posedge, reset=rst)
+    def count():
+        if d < {i}:
+            d.next = d + 1
+        else:
+            d.next = 0
+
+    @always_comb
+    def comb():
+        q.next = d ^ {i}
+
+    return sample, count, comb
+'''
+
+TOP = '''
+@block
+def top():
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    insts = []
+    for cell in CELLS:
+        d = Signal(intbv(0)[16:])
+        q = Signal(intbv(0)[16:])
+        insts.append(cell(clk, rst, d, q))
+    return insts
+'''
+
+RUN = '''
+import time
+start = time.perf_counter()
+import library
+from myhdl import Simulation
+sim = Simulation(library.top())
+print(time.perf_counter() - start)
+sim.quit()
+'''
+
+
+def run(libdir, cache):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([libdir, env.get('PYTHONPATH', '')])
+    env['MYHDL_CACHE'] = cache
+    out = subprocess.check_output([sys.executable, '-c', RUN], env=env)
+    return float(out)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    with tempfile.TemporaryDirectory() as tmp:
+        libdir = os.path.join(tmp, 'lib')
+        cachedir = os.path.join(tmp, 'cache')
+        os.mkdir(libdir)
+        with open(os.path.join(libdir, 'library.py'), 'w') as f:
+            f.write("from myhdl import *\n")
+            for i in range(count):
+                f.write(BLOCK.format(i=i))
+            f.write("\nCELLS = [%s]\n" % ", ".join(
+                "cell%d" % i for i in range(count)))
+            f.write(TOP)
+        print("%d blocks" % count)
+        print("%-12s %10s" % ("cache", "time(s)"))
+        print("%-12s %10.2f" % ("disabled", run(libdir, '0')))
+        print("%-12s %10.2f" % ("cold", run(libdir, cachedir)))
+        print("%-12s %10.2f" % ("warm", run(libdir, cachedir)))
@@ -0,0 +1,78 @@
+""" Measure elaboration time for wide and deep block hierarchies.
+
+Builds COUNT instances of a small block with an @instance generator and
+an @always_seq process, and times the construction of the hierarchy and
+of the Simulation object, which infers a waiter for every generator.
+Then builds chains of nested blocks of increasing DEPTHS, to show how
+the elaboration time per block scales with the depth of the hierarchy.
+"""
+import sys
+import time
+
+from myhdl import (Signal, Simulation, block, instance, always_seq,
+                   ResetSignal, intbv)
+
+COUNT = 2000
+DEPTHS = (10, 25, 50, 100)
+
+
+@block
+def cell(clk, rst, d, q):
+
+    @instance
+    def sample():
+        while 1:
+            yield clk.posedge
+            q.next = d
+
+    @always_seq(clk.posedge, reset=rst)
+    def count():
+        d.next = d + 1
+
+    return sample, count
+
+
+@block
+def top(count):
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    cells = []
+    for __ in range(count):
+        d = Signal(intbv(0)[8:])
+        q = Signal(intbv(0)[8:])
+        cells.append(cell(clk, rst, d, q))
+    return cells
+
+
+@block
+def chain(clk, rst, d, q, depth):
+    inst = cell(clk, rst, d, q)
+    if depth > 1:
+        return inst, chain(clk, rst, d, q, depth - 1)
+    return inst
+
+
+def elaborate_chain(depth):
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    d = Signal(intbv(0)[8:])
+    q = Signal(intbv(0)[8:])
+    return chain(clk, rst, d, q, depth)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    start = time.perf_counter()
+    inst = top(count)
+    built = time.perf_counter()
+    sim = Simulation(inst)
+    done = time.perf_counter()
+    sim.quit()
+    print("%d cells: hierarchy %.2f s, Simulation() %.2f s"
+          % (count, built - start, done - built))
+    print("%6s %14s" % ("depth", "us/block"))
+    for depth in DEPTHS:
+        start = time.perf_counter()
+        elaborate_chain(depth)
+        elapsed = time.perf_counter() - start
+        print("%6d %14.1f" % (depth, elapsed / depth * 1e6))
@@ -0,0 +1,37 @@
+""" Measure the memory footprint of signals.
+
+Creates COUNT Signal(intbv()[32:]) objects and reports the memory that
+they take per signal, together with the time to create them. The
+signals are created in a fresh simulation context, so that the context
+holds the only other references to them.
+"""
+import sys
+import time
+import tracemalloc
+
+from myhdl import Signal, SimulationContext, intbv
+
+COUNT = 1000000
+
+
+def measure(count, factory):
+    with SimulationContext():
+        tracemalloc.start()
+        start = time.perf_counter()
+        sigs = [factory() for __ in range(count)]
+        elapsed = time.perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del sigs
+    return size / count, elapsed
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    print("%-22s %12s %10s" % ("signal", "bytes/signal", "time(s)"))
+    for name, factory in (
+            ("Signal(intbv()[32:])", lambda: Signal(intbv()[32:])),
+            ("Signal(bool(0))", lambda: Signal(bool(0))),
+    ):
+        size, elapsed = measure(count, factory)
+        print("%-22s %12.1f %10.2f" % (name, size, elapsed))
@@ -0,0 +1,38 @@
+""" Measure future event throughput as the number of pending events grows.
+
+Each waiter keeps one delay pending at all times, so the number of
+waiters is the size of the future event queue during the run.
+"""
+import random
+import time
+from random import randrange
+
+from myhdl import Simulation, StopSimulation, delay
+
+random.seed(1)  # random, but deterministic
+
+NREVENTS = 200000
+
+
+def bench(nrwaiters):
+
+    count = [0]
+
+    def waiter():
+        while 1:
+            yield delay(randrange(1, 100))
+            count[0] += 1
+            if count[0] == NREVENTS:
+                raise StopSimulation()
+
+    return [waiter() for __ in range(nrwaiters)]
+
+
+if __name__ == '__main__':
+    print("%10s %12s %14s" % ("pending", "seconds", "events/s"))
+    for nrwaiters in (10, 100, 1000, 10000):
+        sim = Simulation(bench(nrwaiters))
+        start = time.perf_counter()
+        sim.run(quiet=1)
+        elapsed = time.perf_counter() - start
+        print("%10d %12.3f %14.0f" % (nrwaiters, elapsed, NREVENTS / elapsed))
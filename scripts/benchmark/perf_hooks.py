@@ -0,0 +1,49 @@
+""" Measure the cost of kernel event hooks.
+
+The design is a 24 bit LFSR; the hooks count time steps, delta cycles and
+committed signals.
+"""
+import time
+
+from myhdl import Signal, Simulation, always, concat, delay, intbv
+
+DURATION = 200000
+
+
+def lfsr():
+    clk = Signal(bool(0))
+    q = Signal(intbv(1)[24:])
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @always(clk.posedge)
+    def shift():
+        q.next = concat(q[23:0], q[23] ^ q[22] ^ q[21] ^ q[16])
+
+    return clkgen, shift
+
+
+def bench(**hooks):
+    sim = Simulation(lfsr())
+    if hooks:
+        sim.add_hooks(**hooks)
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+if __name__ == '__main__':
+    counts = [0]
+
+    def count(arg):
+        counts[0] += 1
+
+    print("%-12s %10s" % ("hooks", "time"))
+    print("%-12s %10.3f" % ("none", bench()))
+    print("%-12s %10.3f" % ("on_timestep", bench(on_timestep=count)))
+    print("%-12s %10.3f" % ("on_delta", bench(on_delta=count)))
+    print("%-12s %10.3f" % ("on_commit", bench(on_commit=count)))
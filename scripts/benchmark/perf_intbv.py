@@ -0,0 +1,48 @@
+""" Microbenchmarks of intbv and modbv operations.
+
+Reports the time per operation for construction by slicing, slice and
+bit reads and writes, in-place arithmetic with bound checks, modbv
+wrap-around, and copying.
+"""
+import copy
+import timeit
+
+from myhdl import intbv, modbv
+
+NUMBER = 200000
+
+SETUP = """
+from myhdl import intbv, modbv
+import copy
+u = intbv(0)[32:]
+s = intbv(0, min=-2**15, max=2**15)
+r = intbv(0, min=0, max=1000)
+n = intbv(0)
+m = modbv(0)[8:]
+ms = modbv(0, min=-128, max=128)
+mr = modbv(0, min=3, max=1000)
+"""
+
+CASES = [
+    ("declare intbv(0)[32:]", "intbv(0)[32:]"),
+    ("declare modbv(0)[8:]", "modbv(0)[8:]"),
+    ("read slice u[16:8]", "u[16:8]"),
+    ("read bit u[5]", "u[5]"),
+    ("write slice u[16:8] = 3", "u[16:8] = 3"),
+    ("write bit u[5] = 1", "u[5] = 1"),
+    ("unsigned u += 1; u -= 1", "u += 1; u -= 1"),
+    ("signed s += 1; s -= 1", "s += 1; s -= 1"),
+    ("ranged r += 1; r -= 1", "r += 1; r -= 1"),
+    ("unbounded n += 1; n -= 1", "n += 1; n -= 1"),
+    ("modbv m += 255", "m += 255"),
+    ("signed modbv ms += 200", "ms += 200"),
+    ("ranged modbv mr += 900", "mr += 900"),
+    ("copy.deepcopy(u)", "copy.deepcopy(u)"),
+]
+
+
+if __name__ == '__main__':
+    print("%-28s %10s" % ("operation", "ns/op"))
+    for name, stmt in CASES:
+        t = min(timeit.repeat(stmt, SETUP, number=NUMBER, repeat=5))
+        print("%-28s %10.1f" % (name, t / NUMBER * 1e9))
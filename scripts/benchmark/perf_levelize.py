@@ -0,0 +1,53 @@
+""" Compare event-driven and levelized evaluation of always_comb networks.
+
+A register feeds a datapath of always_comb blocks in which every level
+reads the two previous levels, so that a change reaches most blocks
+along several paths.
+"""
+import time
+
+from myhdl import Signal, Simulation, always, always_comb, delay, intbv
+
+DURATION = 100000
+
+
+def level(x, y, z):
+
+    @always_comb
+    def logic():
+        z.next = (x + y) % 256
+
+    return logic
+
+
+def datapath(depth=32):
+    clk = Signal(bool(0))
+    sigs = [Signal(intbv(0)[8:]) for __ in range(depth + 2)]
+    blocks = [level(sigs[i], sigs[i + 1], sigs[i + 2]) for i in range(depth)]
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @always(clk.posedge)
+    def reg():
+        sigs[0].next = (sigs[0] + 1) % 256
+        sigs[1].next = (sigs[1] + 3) % 256
+
+    return clkgen, reg, blocks
+
+
+def run(levelize):
+    sim = Simulation(datapath(), levelize=levelize)
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+if __name__ == '__main__':
+    event = run(False)
+    levelized = run(True)
+    print("%10s %10s %8s" % ("event", "levelized", "speedup"))
+    print("%10.3f %10.3f %8.2f" % (event, levelized, event / levelized))
@@ -0,0 +1,54 @@
+""" Compare the future event schedulers on the benchmark designs.
+
+Each design is simulated for a fixed duration with the default heap
+scheduler and with the timing wheel scheduler.
+"""
+import time
+
+from myhdl import Signal, Simulation, delay
+
+from timer import timer_sig, timer_var
+from test_timer import test_timer
+from test_lfsr24 import test_lfsr24
+from test_longdiv import test_longdiv
+from test_findmax import test_findmax
+
+DURATION = 1000000
+
+
+def clocks(nrclocks=500):
+    """ Many free running clocks, as in a design with many clock domains """
+
+    def clkgen(clk, halfperiod):
+        while 1:
+            yield delay(halfperiod)
+            clk.next = not clk
+
+    return [clkgen(Signal(bool(0)), 5 + i % 50) for i in range(nrclocks)]
+
+
+designs = [
+    ('timer_sig', lambda: test_timer(timer_sig)),
+    ('timer_var', lambda: test_timer(timer_var)),
+    ('lfsr24', test_lfsr24),
+    ('longdiv', test_longdiv),
+    ('findmax', test_findmax),
+    ('clocks', clocks),
+]
+
+
+def run(design, scheduler):
+    sim = Simulation(design(), scheduler=scheduler)
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+if __name__ == '__main__':
+    print("%10s %10s %10s %8s" % ("design", "heap", "wheel", "speedup"))
+    for name, design in designs:
+        heap = run(design, 'heap')
+        wheel = run(design, 'wheel')
+        print("%10s %10.3f %10.3f %8.2f" % (name, heap, wheel, heap / wheel))
@@ -0,0 +1,53 @@
+""" Time simulation of a design with many slice and concat signals.
+
+Counters drive wide buses that are split into bit and nibble slices,
+and each bus is rebuilt from its slices with a ConcatSignal that a
+checker reads.
+"""
+import time
+
+from myhdl import (ConcatSignal, Signal, Simulation, always, delay, intbv,
+                   modbv)
+
+DURATION = 20000
+BUSES = 8
+WIDTH = 64
+
+
+def bus(clk, i):
+    data = Signal(modbv(0)[WIDTH:])
+    bits = [data(j) for j in range(WIDTH)]
+    nibbles = [data(j + 4, j) for j in range(0, WIDTH, 4)]
+    copy = ConcatSignal(*reversed(nibbles))
+    errors = Signal(intbv(0)[16:])
+
+    @always(clk.posedge)
+    def count():
+        data.next = data + 0x0123456789abcdef + i
+
+    @always(copy)
+    def check():
+        if copy != data or bits[0] != data[0]:
+            errors.next = errors + 1
+
+    return count, check
+
+
+def bench():
+    clk = Signal(bool(0))
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    return clkgen, [bus(clk, i) for i in range(BUSES)]
+
+
+if __name__ == '__main__':
+    sim = Simulation(bench())
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    print("%d buses of %d bits, %d slices each: %.3f s" %
+          (BUSES, WIDTH, WIDTH + WIDTH // 4, elapsed))
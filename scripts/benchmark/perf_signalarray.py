@@ -0,0 +1,68 @@
+""" Compare a list of Signals with a SignalArray as a large memory.
+
+A memory of DEPTH words is built both ways, and a write process then
+stores a word at a pseudo-random address on each clock while a read
+process follows the written address.
+
+Reported per memory: the time and the memory taken to build it, and the
+wall time per clock of the simulation.
+"""
+import time
+import tracemalloc
+
+from myhdl import (Signal, SignalArray, Simulation, always, always_comb,
+                   delay, intbv)
+
+DEPTH = 65536
+CYCLES = 5000
+
+
+def build(kind):
+    if kind == 'list':
+        return [Signal(intbv(0)[16:]) for __ in range(DEPTH)]
+    return SignalArray(intbv(0)[16:], DEPTH)
+
+
+def bench(mem):
+    clk = Signal(bool(0))
+    addr = Signal(intbv(0, min=0, max=DEPTH))
+    dout = Signal(intbv(0)[16:])
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @always(clk.posedge)
+    def write():
+        a = int(addr)
+        mem[a].next = a & 0xffff
+        addr.next = (a * 75 + 74) % DEPTH
+
+    @always_comb
+    def read():
+        dout.next = mem[addr]
+
+    return clkgen, write, read
+
+
+def measure(kind):
+    tracemalloc.start()
+    start = time.perf_counter()
+    mem = build(kind)
+    buildtime = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    sim = Simulation(bench(mem))
+    start = time.perf_counter()
+    sim.run(10 * CYCLES, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return buildtime, size, elapsed
+
+
+if __name__ == '__main__':
+    print("%-12s %10s %10s %10s" % ("memory", "build(s)", "MB", "us/clock"))
+    for kind in ('list', 'SignalArray'):
+        buildtime, size, elapsed = measure(kind)
+        print("%-12s %10.3f %10.1f %10.1f" %
+              (kind, buildtime, size / 2 ** 20, elapsed / CYCLES * 1e6))
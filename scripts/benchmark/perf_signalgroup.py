@@ -0,0 +1,60 @@
+""" Compare bulk signal access with access one signal at a time.
+
+A scoreboard samples 256 signals every clock, and a driver sets them
+from an array of stimulus values.
+"""
+import time
+
+import numpy
+
+from myhdl import (Signal, SignalGroup, Simulation, always, delay, instance,
+                   intbv)
+
+CYCLES = 5000
+SIGNALS = 256
+
+
+def bench(bulk):
+    clk = Signal(bool(0))
+    sigs = [Signal(intbv(0)[16:]) for __ in range(SIGNALS)]
+    group = SignalGroup(sigs)
+    stimuli = numpy.random.default_rng(1).integers(
+        0, 1 << 16, (CYCLES, SIGNALS))
+    total = numpy.zeros(SIGNALS, dtype=numpy.int64)
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @instance
+    def driver():
+        for t in range(CYCLES):
+            yield clk.negedge
+            if bulk:
+                group.drive(stimuli[t])
+            else:
+                for s, v in zip(sigs, stimuli[t].tolist()):
+                    s.next = v
+
+    @instance
+    def scoreboard():
+        while 1:
+            yield clk.posedge
+            if bulk:
+                total[:] += group.sample()
+            else:
+                total[:] += numpy.array([int(s.val) for s in sigs])
+
+    return [clkgen, driver, scoreboard], total
+
+
+if __name__ == '__main__':
+    for bulk in (False, True):
+        gens, total = bench(bulk)
+        sim = Simulation(gens)
+        start = time.perf_counter()
+        sim.run(CYCLES * 10, quiet=1)
+        elapsed = time.perf_counter() - start
+        sim.quit()
+        print("%s: %.3f s (checksum %d)" % (
+            "bulk" if bulk else "one at a time", elapsed, total.sum()))
@@ -0,0 +1,44 @@
+""" Compare the Python and the compiled simulation kernel.
+
+The compiled kernel is built with "python setup.py build_ext --inplace".
+Each design is simulated for a fixed duration with both kernels.
+"""
+import time
+
+from myhdl import Simulation
+from myhdl import _Simulation
+from myhdl._simrunc import run as crun
+
+from timer import timer_sig, timer_var
+from test_timer import test_timer
+from test_lfsr24 import test_lfsr24
+from test_longdiv import test_longdiv
+from test_findmax import test_findmax
+
+DURATION = 1000000
+
+designs = [
+    ('timer_sig', lambda: test_timer(timer_sig)),
+    ('timer_var', lambda: test_timer(timer_var)),
+    ('lfsr24', test_lfsr24),
+    ('longdiv', test_longdiv),
+    ('findmax', test_findmax),
+]
+
+
+def run(design, kernel):
+    _Simulation._kernel = kernel
+    sim = Simulation(design())
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+if __name__ == '__main__':
+    print("%10s %10s %10s %8s" % ("design", "python", "c", "speedup"))
+    for name, design in designs:
+        py = run(design, _Simulation._run)
+        c = run(design, crun)
+        print("%10s %10.3f %10.3f %8.2f" % (name, py, c, py / c))
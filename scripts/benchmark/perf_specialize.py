@@ -0,0 +1,70 @@
+""" Compare simulation with and without specialized always blocks.
+
+A bank of counters with enables and saturation, and an always_comb
+checksum over pairs of them, clocked for a fixed duration.
+"""
+import time
+
+from myhdl import (Signal, ResetSignal, Simulation, always, always_comb,
+                   always_seq, delay, intbv, modbv)
+
+DURATION = 20000
+COUNT = 50
+
+
+def counter(clk, rst, en, count, level):
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        count.next = count + 1
+        if en and level < 200:
+            level.next = level + 3
+        elif level > 10:
+            level.next = level - 1
+        en.next = not en
+
+    return logic
+
+
+def checksum(a, b, z):
+
+    @always_comb
+    def logic():
+        z.next = (a ^ b) + a[4:]
+
+    return logic
+
+
+def bench():
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    ens = [Signal(bool(0)) for __ in range(COUNT)]
+    counts = [Signal(modbv(0)[8:]) for __ in range(COUNT)]
+    levels = [Signal(intbv(0, min=0, max=256)) for __ in range(COUNT)]
+    sums = [Signal(intbv(0)[9:]) for __ in range(COUNT)]
+    counters = [counter(clk, rst, ens[i], counts[i], levels[i])
+                for i in range(COUNT)]
+    checksums = [checksum(counts[i], counts[i - 1], sums[i])
+                 for i in range(COUNT)]
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    return clkgen, counters, checksums
+
+
+def run(specialize):
+    sim = Simulation(bench(), specialize=specialize)
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    return elapsed
+
+
+if __name__ == '__main__':
+    plain = run(False)
+    specialized = run(True)
+    print("%10s %12s %8s" % ("plain", "specialized", "speedup"))
+    print("%10.3f %12.3f %8.2f" % (plain, specialized, plain / specialized))
@@ -0,0 +1,41 @@
+""" Compare running testbench points one after another and with sweep.
+
+Each point simulates a 24 bit LFSR with a different seed.
+"""
+import time
+
+from myhdl import Signal, always, block, concat, delay, intbv, sweep
+
+DURATION = 200000
+NRPOINTS = 16
+
+
+@block
+def lfsr(seed):
+    clk = Signal(bool(0))
+    q = Signal(intbv(seed + 1)[24:])
+
+    @always(delay(5))
+    def clkgen():
+        clk.next = not clk
+
+    @always(clk.posedge)
+    def shift():
+        q.next = concat(q[23:0], q[23] ^ q[22] ^ q[21] ^ q[16])
+
+    return clkgen, shift
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    for seed in range(NRPOINTS):
+        top = lfsr(seed)
+        top.run_sim(DURATION, quiet=1)
+        top.quit_sim()
+    serial = time.perf_counter() - start
+    start = time.perf_counter()
+    for r in sweep(lfsr, {'seed': range(NRPOINTS)}, duration=DURATION):
+        assert r.exception is None, r.traceback
+    parallel = time.perf_counter() - start
+    print("%10s %10s %8s" % ("serial", "sweep", "speedup"))
+    print("%10.3f %10.3f %8.2f" % (serial, parallel, serial / parallel))
@@ -0,0 +1,45 @@
+""" Time a shared tristate bus with many drivers.
+
+The drivers of a 64-driver bus take turns: each transaction releases
+the bus from one driver and drives it from the next, and a monitor
+checks the resolved value.
+"""
+import time
+
+from myhdl import Signal, Simulation, TristateSignal, delay, instance, intbv
+
+DURATION = 200000
+DRIVERS = 64
+
+
+def bench():
+    bus = TristateSignal(intbv(0)[8:])
+    drivers = [bus.driver() for __ in range(DRIVERS)]
+    errors = Signal(0)
+
+    @instance
+    def rotate():
+        i = 0
+        while 1:
+            drivers[i].next = None
+            i = (i + 1) % DRIVERS
+            drivers[i].next = i
+            yield delay(10)
+
+    @instance
+    def monitor():
+        while 1:
+            yield bus
+            if bus.val is None:
+                errors.next = errors + 1
+
+    return rotate, monitor
+
+
+if __name__ == '__main__':
+    sim = Simulation(bench())
+    start = time.perf_counter()
+    sim.run(DURATION, quiet=1)
+    elapsed = time.perf_counter() - start
+    sim.quit()
+    print("%d drivers: %.3f s" % (DRIVERS, elapsed))
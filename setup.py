@@ -14,9 +14,9 @@ if sys.version_info < (3, 7):
 
 # Prefer setuptools over distutils
 try:
-    from setuptools import setup
+    from setuptools import setup, Extension
 except ImportError:
-    from distutils.core import setup
+    from distutils.core import setup, Extension
 
 
 _version_re = re.compile(r'__version__\s+=\s+(.*)')
@@ -33,6 +33,11 @@ for base, dir, files in os.walk('cosimulation'):
         if good:
             cosim_data[base].extend(os.path.join(base, f) for f in good)
 
+# the compiled simulation kernel is optional: the pure Python kernel is
+# used when it cannot be built
+simrunc = Extension('myhdl._simrunc', sources=['myhdl/_simrunc.c'],
+                    optional=True)
+
 def read(fname):
     return open(os.path.join(os.path.dirname(__file__), fname)).read()
 
@@ -47,6 +52,8 @@ setup(
     author_email="jan@jandecaluwe.com",
     url="http://www.myhdl.org",
     packages=['myhdl', 'myhdl.conversion'],
+    ext_modules=[simrunc],
+    extras_require={'numpy': ['numpy']},
     data_files=[(os.path.join(data_root, k), v) for k, v in cosim_data.items()],
     license="LGPL",
     platforms='any',
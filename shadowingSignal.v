@@ -0,0 +1,15 @@
+// File: shadowingSignal.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:10 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module shadowingSignal (
+    count,
+    enable,
+    clock,
+    reset
+);
+
+
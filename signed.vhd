@@ -0,0 +1,44 @@
+-- File: signed.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity signed is
+end entity signed;
+
+
+architecture MyHDL of signed is
+
+
+
+signal z: signed (6 downto 0) := 7X"00";
+type t_array_a is array(0 to 3-1) of signed (5 downto 0);
+signal a: t_array_a := (others => 6X"00");
+
+begin
+
+
+
+
+
+z <= (resize(a(1), 7) + resize(a(2), 7));
+
+stimulus: process is
+    variable L: line;
+begin
+    a(0) <= to_signed(2, 6);
+    a(1) <= to_signed(-5, 6);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(unsigned(z)));
+    writeline(output, L);
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
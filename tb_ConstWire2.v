@@ -0,0 +1,20 @@
+module tb_ConstWire2;
+
+reg p;
+wire q;
+
+initial begin
+    $from_myhdl(
+        p
+    );
+    $to_myhdl(
+        q
+    );
+end
+
+ConstWire2 dut(
+    p,
+    q
+);
+
+endmodule
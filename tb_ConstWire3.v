@@ -0,0 +1,20 @@
+module tb_ConstWire3;
+
+reg [7:0] p;
+wire [7:0] q;
+
+initial begin
+    $from_myhdl(
+        p
+    );
+    $to_myhdl(
+        q
+    );
+end
+
+ConstWire3 dut(
+    p,
+    q
+);
+
+endmodule
@@ -0,0 +1,32 @@
+module tb_DUT_Verilog_001;
+
+wire [7:0] x;
+reg [7:0] a;
+reg [7:0] b;
+reg [7:0] c;
+reg [7:0] d;
+reg [7:0] e;
+
+initial begin
+    $from_myhdl(
+        a,
+        b,
+        c,
+        d,
+        e
+    );
+    $to_myhdl(
+        x
+    );
+end
+
+DUT_Verilog_001 dut(
+    x,
+    a,
+    b,
+    c,
+    d,
+    e
+);
+
+endmodule
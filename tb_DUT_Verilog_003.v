@@ -0,0 +1,23 @@
+module tb_DUT_Verilog_003;
+
+wire SOF;
+reg clk;
+reg reset_n;
+
+initial begin
+    $from_myhdl(
+        clk,
+        reset_n
+    );
+    $to_myhdl(
+        SOF
+    );
+end
+
+DUT_Verilog_003 dut(
+    SOF,
+    clk,
+    reset_n
+);
+
+endmodule
@@ -0,0 +1,29 @@
+module tb_FramerCtrl_alt;
+
+wire SOF;
+wire [1:0] state;
+reg syncFlag;
+reg clk;
+reg reset_n;
+
+initial begin
+    $from_myhdl(
+        syncFlag,
+        clk,
+        reset_n
+    );
+    $to_myhdl(
+        SOF,
+        state
+    );
+end
+
+FramerCtrl_alt dut(
+    SOF,
+    state,
+    syncFlag,
+    clk,
+    reset_n
+);
+
+endmodule
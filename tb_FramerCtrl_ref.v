@@ -0,0 +1,29 @@
+module tb_FramerCtrl_ref;
+
+wire SOF;
+wire [1:0] state;
+reg syncFlag;
+reg clk;
+reg reset_n;
+
+initial begin
+    $from_myhdl(
+        syncFlag,
+        clk,
+        reset_n
+    );
+    $to_myhdl(
+        SOF,
+        state
+    );
+end
+
+FramerCtrl_ref dut(
+    SOF,
+    state,
+    syncFlag,
+    clk,
+    reset_n
+);
+
+endmodule
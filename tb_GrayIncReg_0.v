@@ -0,0 +1,26 @@
+module tb_GrayIncReg_0;
+
+wire [7:0] graycnt;
+reg enable;
+reg clock;
+reg reset;
+
+initial begin
+    $from_myhdl(
+        enable,
+        clock,
+        reset
+    );
+    $to_myhdl(
+        graycnt
+    );
+end
+
+GrayIncReg_0 dut(
+    graycnt,
+    enable,
+    clock,
+    reset
+);
+
+endmodule
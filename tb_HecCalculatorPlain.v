@@ -0,0 +1,20 @@
+module tb_HecCalculatorPlain;
+
+wire [7:0] hec;
+reg [31:0] header;
+
+initial begin
+    $from_myhdl(
+        header
+    );
+    $to_myhdl(
+        hec
+    );
+end
+
+HecCalculatorPlain dut(
+    hec,
+    header
+);
+
+endmodule
@@ -0,0 +1,20 @@
+module tb_HecCalculatorTask;
+
+wire [7:0] hec;
+reg [31:0] header;
+
+initial begin
+    $from_myhdl(
+        header
+    );
+    $to_myhdl(
+        hec
+    );
+end
+
+HecCalculatorTask dut(
+    hec,
+    header
+);
+
+endmodule
@@ -0,0 +1,20 @@
+module tb_HecCalculatorTask2;
+
+wire [7:0] hec;
+reg [31:0] header;
+
+initial begin
+    $from_myhdl(
+        header
+    );
+    $to_myhdl(
+        hec
+    );
+end
+
+HecCalculatorTask2 dut(
+    hec,
+    header
+);
+
+endmodule
@@ -0,0 +1,20 @@
+module tb_NestedForLoop2;
+
+reg [15:0] a;
+wire [15:0] out;
+
+initial begin
+    $from_myhdl(
+        a
+    );
+    $to_myhdl(
+        out
+    );
+end
+
+NestedForLoop2 dut(
+    a,
+    out
+);
+
+endmodule
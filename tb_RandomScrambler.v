@@ -0,0 +1,62 @@
+module tb_RandomScrambler;
+
+wire o7;
+wire o6;
+wire o5;
+wire o4;
+wire o3;
+wire o2;
+wire o1;
+wire o0;
+reg i7;
+reg i6;
+reg i5;
+reg i4;
+reg i3;
+reg i2;
+reg i1;
+reg i0;
+
+initial begin
+    $from_myhdl(
+        i7,
+        i6,
+        i5,
+        i4,
+        i3,
+        i2,
+        i1,
+        i0
+    );
+    $to_myhdl(
+        o7,
+        o6,
+        o5,
+        o4,
+        o3,
+        o2,
+        o1,
+        o0
+    );
+end
+
+RandomScrambler dut(
+    o7,
+    o6,
+    o5,
+    o4,
+    o3,
+    o2,
+    o1,
+    o0,
+    i7,
+    i6,
+    i5,
+    i4,
+    i3,
+    i2,
+    i1,
+    i0
+);
+
+endmodule
@@ -0,0 +1,20 @@
+module tb_adapter;
+
+wire [3:0] o_err;
+reg [5:0] i_err;
+
+initial begin
+    $from_myhdl(
+        i_err
+    );
+    $to_myhdl(
+        o_err
+    );
+end
+
+adapter dut(
+    o_err,
+    i_err
+);
+
+endmodule
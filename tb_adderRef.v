@@ -0,0 +1,23 @@
+module tb_adderRef;
+
+reg [7:0] a;
+reg [7:0] b;
+wire [8:0] c;
+
+initial begin
+    $from_myhdl(
+        a,
+        b
+    );
+    $to_myhdl(
+        c
+    );
+end
+
+adderRef dut(
+    a,
+    b,
+    c
+);
+
+endmodule
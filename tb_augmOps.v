@@ -0,0 +1,35 @@
+module tb_augmOps;
+
+wire [64:0] LeftShift;
+wire [17:0] Mul;
+wire [17:0] RightShift;
+wire [17:0] Sub;
+wire [17:0] Sum;
+reg [8:0] left;
+reg [1:0] right;
+
+initial begin
+    $from_myhdl(
+        left,
+        right
+    );
+    $to_myhdl(
+        LeftShift,
+        Mul,
+        RightShift,
+        Sub,
+        Sum
+    );
+end
+
+augmOps dut(
+    LeftShift,
+    Mul,
+    RightShift,
+    Sub,
+    Sum,
+    left,
+    right
+);
+
+endmodule
@@ -0,0 +1,26 @@
+module tb_behRef;
+
+wire [7:0] count;
+reg enable;
+reg clock;
+reg reset;
+
+initial begin
+    $from_myhdl(
+        enable,
+        clock,
+        reset
+    );
+    $to_myhdl(
+        count
+    );
+end
+
+behRef dut(
+    count,
+    enable,
+    clock,
+    reset
+);
+
+endmodule
@@ -0,0 +1,20 @@
+module tb_bin2gray_depr;
+
+wire [0:0] G;
+reg [0:0] width;
+
+initial begin
+    $from_myhdl(
+        width
+    );
+    $to_myhdl(
+        G
+    );
+end
+
+bin2gray_depr dut(
+    G,
+    width
+);
+
+endmodule
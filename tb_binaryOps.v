@@ -0,0 +1,71 @@
+module tb_binaryOps;
+
+wire [64:0] LeftShift;
+wire [17:0] Mul;
+wire [14:0] RightShift;
+wire [14:0] Sub;
+wire [14:0] Sum;
+wire [14:0] Sum1;
+wire [14:0] Sum2;
+wire [14:0] Sum3;
+wire EQ;
+wire NE;
+wire LT;
+wire GT;
+wire LE;
+wire GE;
+wire And;
+wire Or;
+reg [8:0] left;
+reg [1:0] right;
+reg bit;
+
+initial begin
+    $from_myhdl(
+        left,
+        right,
+        bit
+    );
+    $to_myhdl(
+        LeftShift,
+        Mul,
+        RightShift,
+        Sub,
+        Sum,
+        Sum1,
+        Sum2,
+        Sum3,
+        EQ,
+        NE,
+        LT,
+        GT,
+        LE,
+        GE,
+        And,
+        Or
+    );
+end
+
+binaryOps dut(
+    LeftShift,
+    Mul,
+    RightShift,
+    Sub,
+    Sum,
+    Sum1,
+    Sum2,
+    Sum3,
+    EQ,
+    NE,
+    LT,
+    GT,
+    LE,
+    GE,
+    And,
+    Or,
+    left,
+    right,
+    bit
+);
+
+endmodule
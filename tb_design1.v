@@ -0,0 +1,35 @@
+module tb_design1;
+
+reg a;
+reg b;
+reg c;
+reg d;
+wire p;
+reg [7:0] q;
+reg r;
+
+initial begin
+    $from_myhdl(
+        a,
+        b,
+        c,
+        d,
+        q,
+        r
+    );
+    $to_myhdl(
+        p
+    );
+end
+
+design1 dut(
+    a,
+    b,
+    c,
+    d,
+    p,
+    q,
+    r
+);
+
+endmodule
@@ -0,0 +1,35 @@
+module tb_design4;
+
+reg a;
+reg b;
+reg c;
+reg d;
+wire p;
+wire [7:0] q;
+wire r;
+
+initial begin
+    $from_myhdl(
+        a,
+        b,
+        c,
+        d
+    );
+    $to_myhdl(
+        p,
+        q,
+        r
+    );
+end
+
+design4 dut(
+    a,
+    b,
+    c,
+    d,
+    p,
+    q,
+    r
+);
+
+endmodule
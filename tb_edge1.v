@@ -0,0 +1,23 @@
+module tb_edge1;
+
+wire flag;
+reg sig;
+reg clock;
+
+initial begin
+    $from_myhdl(
+        sig,
+        clock
+    );
+    $to_myhdl(
+        flag
+    );
+end
+
+edge1 dut(
+    flag,
+    sig,
+    clock
+);
+
+endmodule
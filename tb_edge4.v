@@ -0,0 +1,23 @@
+module tb_edge4;
+
+wire flag;
+reg sig;
+reg clock;
+
+initial begin
+    $from_myhdl(
+        sig,
+        clock
+    );
+    $to_myhdl(
+        flag
+    );
+end
+
+edge4 dut(
+    flag,
+    sig,
+    clock
+);
+
+endmodule
@@ -0,0 +1,23 @@
+module tb_expressions;
+
+wire [6:0] a;
+wire [5:0] b;
+reg clk;
+
+initial begin
+    $from_myhdl(
+        clk
+    );
+    $to_myhdl(
+        a,
+        b
+    );
+end
+
+expressions dut(
+    a,
+    b,
+    clk
+);
+
+endmodule
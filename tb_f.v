@@ -0,0 +1,18 @@
+module tb_f;
+
+reg a;
+reg b;
+
+initial begin
+    $from_myhdl(
+        a,
+        b
+    );
+end
+
+f dut(
+    a,
+    b
+);
+
+endmodule
@@ -0,0 +1,26 @@
+module tb_inc2;
+
+wire [7:0] count;
+reg enable;
+reg clock;
+reg reset;
+
+initial begin
+    $from_myhdl(
+        enable,
+        clock,
+        reset
+    );
+    $to_myhdl(
+        count
+    );
+end
+
+inc2 dut(
+    count,
+    enable,
+    clock,
+    reset
+);
+
+endmodule
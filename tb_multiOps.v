@@ -0,0 +1,38 @@
+module tb_multiOps;
+
+wire [3:0] Bitand;
+wire [3:0] Bitor;
+wire [3:0] Bitxor;
+wire And;
+wire Or;
+reg [3:0] argm;
+reg [3:0] argn;
+reg [3:0] argp;
+
+initial begin
+    $from_myhdl(
+        argm,
+        argn,
+        argp
+    );
+    $to_myhdl(
+        Bitand,
+        Bitor,
+        Bitxor,
+        And,
+        Or
+    );
+end
+
+multiOps dut(
+    Bitand,
+    Bitor,
+    Bitxor,
+    And,
+    Or,
+    argm,
+    argn,
+    argp
+);
+
+endmodule
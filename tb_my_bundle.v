@@ -0,0 +1,20 @@
+module tb_my_bundle;
+
+reg p;
+wire q;
+
+initial begin
+    $from_myhdl(
+        p
+    );
+    $to_myhdl(
+        q
+    );
+end
+
+my_bundle dut(
+    p,
+    q
+);
+
+endmodule
@@ -0,0 +1,20 @@
+module tb_permute;
+
+wire [2:0] x;
+reg [2:0] a;
+
+initial begin
+    $from_myhdl(
+        a
+    );
+    $to_myhdl(
+        x
+    );
+end
+
+permute dut(
+    x,
+    a
+);
+
+endmodule
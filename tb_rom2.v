@@ -0,0 +1,23 @@
+module tb_rom2;
+
+wire [7:0] dout;
+reg [7:0] addr;
+reg clk;
+
+initial begin
+    $from_myhdl(
+        addr,
+        clk
+    );
+    $to_myhdl(
+        dout
+    );
+end
+
+rom2 dut(
+    dout,
+    addr,
+    clk
+);
+
+endmodule
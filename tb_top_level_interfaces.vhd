@@ -0,0 +1,214 @@
+-- File: tb_top_level_interfaces.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity tb_top_level_interfaces is
+end entity tb_top_level_interfaces;
+
+
+architecture MyHDL of tb_top_level_interfaces is
+
+
+
+signal Clk: std_logic := '0';
+signal Reset: std_logic := '0';
+signal Table_x_up: std_logic := '0';
+signal Table_x_down: std_logic := '0';
+signal Table_y_up: std_logic := '0';
+signal Table_y_down: std_logic := '0';
+signal Position_x: signed (15 downto 0) := 16X"0000";
+signal Position_y: signed (15 downto 0) := 16X"0000";
+signal Table_x_zero: std_logic := '0';
+signal Table_y_zero: std_logic := '0';
+signal XYTable0_0_pos_x: signed (15 downto 0) := 16X"0000";
+signal XYTable0_0_pos_y: signed (15 downto 0) := 16X"0000";
+signal XYTable0_0_Table_X_lpos: signed (15 downto 0) := 16X"0000";
+signal XYTable0_0_Table_Y_lpos: signed (15 downto 0) := 16X"0000";
+
+begin
+
+
+
+
+xytable0_0_table_x_synch: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        if (Reset = '1') then
+            XYTable0_0_Table_X_lpos <= to_signed(0, 16);
+        else
+            if bool(Table_x_zero) then
+                XYTable0_0_Table_X_lpos <= to_signed(0, 16);
+            elsif (bool(Table_x_up) and (not bool(Table_x_down))) then
+                if (XYTable0_0_Table_X_lpos < (2 ** 15)) then
+                    XYTable0_0_Table_X_lpos <= (XYTable0_0_Table_X_lpos + 1);
+                end if;
+            elsif ((not bool(Table_x_up)) and bool(Table_x_down)) then
+                if (XYTable0_0_Table_X_lpos > (-(2 ** 15))) then
+                    XYTable0_0_Table_X_lpos <= (XYTable0_0_Table_X_lpos - 1);
+                end if;
+            end if;
+        end if;
+    end if;
+end process xytable0_0_table_x_synch;
+
+
+XYTable0_0_pos_x <= XYTable0_0_Table_X_lpos;
+
+xytable0_0_table_y_synch: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        if (Reset = '1') then
+            XYTable0_0_Table_Y_lpos <= to_signed(0, 16);
+        else
+            if bool(Table_y_zero) then
+                XYTable0_0_Table_Y_lpos <= to_signed(0, 16);
+            elsif (bool(Table_y_up) and (not bool(Table_y_down))) then
+                if (XYTable0_0_Table_Y_lpos < (2 ** 15)) then
+                    XYTable0_0_Table_Y_lpos <= (XYTable0_0_Table_Y_lpos + 1);
+                end if;
+            elsif ((not bool(Table_y_up)) and bool(Table_y_down)) then
+                if (XYTable0_0_Table_Y_lpos > (-(2 ** 15))) then
+                    XYTable0_0_Table_Y_lpos <= (XYTable0_0_Table_Y_lpos - 1);
+                end if;
+            end if;
+        end if;
+    end if;
+end process xytable0_0_table_y_synch;
+
+
+XYTable0_0_pos_y <= XYTable0_0_Table_Y_lpos;
+
+
+Position_x <= XYTable0_0_pos_x;
+Position_y <= XYTable0_0_pos_y;
+
+tb_clk: process is
+begin
+    Clk <= '0';
+    wait for (20 / 2) * 1 ns;
+    while True loop
+        Clk <= stdl((not bool(Clk)));
+        wait for (20 / 2) * 1 ns;
+    end loop;
+    wait;
+end process tb_clk;
+
+tb_stim: process is
+    variable L: line;
+begin
+    Table_x_up <= '0';
+    Table_x_down <= '0';
+    Table_y_up <= '0';
+    Table_y_down <= '0';
+    Reset <= '1';
+    wait for 70 * 1 ns;
+    Reset <= '0';
+    wait until falling_edge(Clk);
+    for i in 0 to 16-1 loop
+        wait until falling_edge(Clk);
+        case i is
+            when 0 => Table_x_up <= '0';
+            when 1 => Table_x_up <= '1';
+            when 2 => Table_x_up <= '0';
+            when 3 => Table_x_up <= '1';
+            when 4 => Table_x_up <= '0';
+            when 5 => Table_x_up <= '1';
+            when 6 => Table_x_up <= '0';
+            when 7 => Table_x_up <= '1';
+            when 8 => Table_x_up <= '0';
+            when 9 => Table_x_up <= '1';
+            when 10 => Table_x_up <= '0';
+            when 11 => Table_x_up <= '1';
+            when 12 => Table_x_up <= '0';
+            when 13 => Table_x_up <= '1';
+            when 14 => Table_x_up <= '0';
+            when others => Table_x_up <= '1';
+        end case;
+        case i is
+            when 0 => Table_x_down <= '0';
+            when 1 => Table_x_down <= '0';
+            when 2 => Table_x_down <= '1';
+            when 3 => Table_x_down <= '1';
+            when 4 => Table_x_down <= '0';
+            when 5 => Table_x_down <= '0';
+            when 6 => Table_x_down <= '1';
+            when 7 => Table_x_down <= '1';
+            when 8 => Table_x_down <= '0';
+            when 9 => Table_x_down <= '0';
+            when 10 => Table_x_down <= '1';
+            when 11 => Table_x_down <= '1';
+            when 12 => Table_x_down <= '0';
+            when 13 => Table_x_down <= '0';
+            when 14 => Table_x_down <= '1';
+            when others => Table_x_down <= '1';
+        end case;
+        case i is
+            when 0 => Table_y_up <= '0';
+            when 1 => Table_y_up <= '0';
+            when 2 => Table_y_up <= '0';
+            when 3 => Table_y_up <= '0';
+            when 4 => Table_y_up <= '1';
+            when 5 => Table_y_up <= '1';
+            when 6 => Table_y_up <= '1';
+            when 7 => Table_y_up <= '1';
+            when 8 => Table_y_up <= '0';
+            when 9 => Table_y_up <= '0';
+            when 10 => Table_y_up <= '0';
+            when 11 => Table_y_up <= '0';
+            when 12 => Table_y_up <= '1';
+            when 13 => Table_y_up <= '1';
+            when 14 => Table_y_up <= '1';
+            when others => Table_y_up <= '1';
+        end case;
+        case i is
+            when 0 => Table_y_down <= '0';
+            when 1 => Table_y_down <= '0';
+            when 2 => Table_y_down <= '0';
+            when 3 => Table_y_down <= '0';
+            when 4 => Table_y_down <= '0';
+            when 5 => Table_y_down <= '0';
+            when 6 => Table_y_down <= '0';
+            when 7 => Table_y_down <= '0';
+            when 8 => Table_y_down <= '0';
+            when 9 => Table_y_down <= '1';
+            when 10 => Table_y_down <= '1';
+            when 11 => Table_y_down <= '1';
+            when 12 => Table_y_down <= '1';
+            when 13 => Table_y_down <= '1';
+            when 14 => Table_y_down <= '1';
+            when others => Table_y_down <= '1';
+        end case;
+        wait until rising_edge(Clk);
+        write(L, to_string(i));
+        write(L, string'(": "));
+        write(L, to_string(to_integer(Position_x)));
+        write(L, string'(" "));
+        write(L, to_string(to_integer(Position_y)));
+        writeline(output, L);
+    end loop;
+    wait until rising_edge(Clk);
+    Table_x_zero <= '1';
+    Table_y_zero <= '1';
+    wait until rising_edge(Clk);
+    Table_x_zero <= '0';
+    Table_y_zero <= '0';
+    wait until rising_edge(Clk);
+    assert (Position_x = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert (Position_y = 0)
+        report "*** AssertionError ***"
+        severity error;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process tb_stim;
+
+end architecture MyHDL;
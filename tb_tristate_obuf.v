@@ -0,0 +1,23 @@
+module tb_tristate_obuf;
+
+reg A;
+wire Y;
+reg OE;
+
+initial begin
+    $from_myhdl(
+        A,
+        OE
+    );
+    $to_myhdl(
+        Y
+    );
+end
+
+tristate_obuf dut(
+    A,
+    Y,
+    OE
+);
+
+endmodule
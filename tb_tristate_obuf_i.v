@@ -0,0 +1,23 @@
+module tb_tristate_obuf_i;
+
+wire obuf_Y;
+reg obuf_A;
+reg obuf_OE;
+
+initial begin
+    $from_myhdl(
+        obuf_A,
+        obuf_OE
+    );
+    $to_myhdl(
+        obuf_Y
+    );
+end
+
+tristate_obuf_i dut(
+    obuf_Y,
+    obuf_A,
+    obuf_OE
+);
+
+endmodule
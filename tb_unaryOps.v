@@ -0,0 +1,29 @@
+module tb_unaryOps;
+
+wire Not;
+wire [4:0] Invert;
+wire [4:0] UnaryAdd;
+wire [4:0] UnarySub;
+reg [4:0] arg;
+
+initial begin
+    $from_myhdl(
+        arg
+    );
+    $to_myhdl(
+        Not,
+        Invert,
+        UnaryAdd,
+        UnarySub
+    );
+end
+
+unaryOps dut(
+    Not,
+    Invert,
+    UnaryAdd,
+    UnarySub,
+    arg
+);
+
+endmodule
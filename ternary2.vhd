@@ -0,0 +1,68 @@
+-- File: ternary2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:20 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity ternary2 is
+end entity ternary2;
+
+
+architecture MyHDL of ternary2 is
+
+
+
+signal clk: std_logic := '0';
+signal dout: unsigned(7 downto 0) := 8X"00";
+signal rst: std_logic := '0';
+signal ternary20_dout_d: unsigned(7 downto 0) := 8X"00";
+
+begin
+
+
+
+
+stimulus: process is
+    variable L: line;
+begin
+    rst <= '1';
+    clk <= '0';
+    wait for 10 * 1 ns;
+    rst <= '0';
+    wait for 10 * 1 ns;
+    rst <= '1';
+    wait for 10 * 1 ns;
+    for i in 0 to 1000-1 loop
+        clk <= '1';
+        wait for 10 * 1 ns;
+        assert (signed(resize(dout, 9)) = ((i + 1) mod 128))
+            report "*** AssertionError ***"
+            severity error;
+        write(L, to_hstring(dout));
+        writeline(output, L);
+        clk <= '0';
+        wait for 10 * 1 ns;
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+ternary20_synch: process (clk, rst) is
+begin
+    if (rst = '0') then
+        dout <= to_unsigned(0, 8);
+    elsif rising_edge(clk) then
+        dout <= ternary20_dout_d;
+    end if;
+end process ternary20_synch;
+
+
+ternary20_dout_d <= tern_op(cond => (dout < 127), if_true => (dout + 1), if_false => to_unsigned(0, 8));
+
+end architecture MyHDL;
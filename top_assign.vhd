@@ -0,0 +1,44 @@
+-- File: top_assign.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity top_assign is
+    port (
+        x: out signed (3 downto 0);
+        y: in signed (3 downto 0);
+        z: in signed (3 downto 0)
+    );
+end entity top_assign;
+-- This module does not test top-level interfaces,
+-- it only tests intermediate interfaces.
+
+architecture MyHDL of top_assign is
+
+
+
+signal assign0_x: signed (3 downto 0) := 4X"0";
+signal assign1_y: signed (3 downto 0) := 4X"0";
+
+begin
+
+
+
+
+
+x <= assign0_x;
+
+
+assign1_y <= y;
+
+
+assign0_x <= assign1_y;
+
+end architecture MyHDL;
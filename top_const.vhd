@@ -0,0 +1,47 @@
+-- File: top_const.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity top_const is
+    port (
+        clock: in std_logic;
+        reset: in std_logic;
+        x: out signed (13 downto 0);
+        y: out signed (8 downto 0)
+    );
+end entity top_const;
+
+
+architecture MyHDL of top_const is
+
+
+
+
+begin
+
+
+
+
+rtl1: process (clock, reset) is
+    variable v: integer;
+begin
+    if (reset = '0') then
+        x <= to_signed(3, 14);
+    elsif rising_edge(clock) then
+        v := ((9 ** 3) + (10 ** 3));
+        x <= to_signed(v - 1729, 14);
+    end if;
+end process rtl1;
+
+
+y <= resize(((x + 707) - (3 * 235)) - 2, 9);
+
+end architecture MyHDL;
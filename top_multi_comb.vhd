@@ -0,0 +1,41 @@
+-- File: top_multi_comb.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity top_multi_comb is
+    port (
+        x: out signed (3 downto 0);
+        y: in signed (3 downto 0);
+        z: in signed (3 downto 0)
+    );
+end entity top_multi_comb;
+-- This module does not test top-level interfaces,
+-- it only tests intermediate interfaces.
+
+architecture MyHDL of top_multi_comb is
+
+
+
+signal multi_comb0_x_x: signed (3 downto 0) := 4X"0";
+signal multi_comb0_y_y: signed (3 downto 0) := 4X"0";
+signal multi_comb0_z_z_z: signed (3 downto 0) := 4X"0";
+
+begin
+
+
+
+multi_comb0_y_y <= y;
+multi_comb0_z_z_z <= z;
+
+
+multi_comb0_x_x <= (multi_comb0_y_y + multi_comb0_z_z_z);
+
+end architecture MyHDL;
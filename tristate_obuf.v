@@ -0,0 +1,28 @@
+// File: tristate_obuf.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module tristate_obuf (
+    A,
+    Y,
+    OE
+);
+// three-state output buffer
+
+input A;
+inout Y;
+wire Y;
+input OE;
+
+wire Y_d;
+
+assign Y = Y_d;
+
+
+
+assign Y_d = OE ? A : 'bz;
+
+endmodule
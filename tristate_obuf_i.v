@@ -0,0 +1,28 @@
+// File: tristate_obuf_i.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module tristate_obuf_i (
+    obuf_Y,
+    obuf_A,
+    obuf_OE
+);
+// three-state output buffer, using interface
+
+inout obuf_Y;
+wire obuf_Y;
+input obuf_A;
+input obuf_OE;
+
+wire Y_d;
+
+assign obuf_Y = Y_d;
+
+
+
+assign Y_d = obuf_OE ? obuf_A : 'bz;
+
+endmodule
@@ -0,0 +1,63 @@
+-- File: two_level.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity two_level is
+    port (
+        clock: in std_logic;
+        reset: in std_logic;
+        ia_x: out unsigned(3 downto 0);
+        ia_y: out unsigned(4 downto 0);
+        ib_x: in unsigned(3 downto 0);
+        ib_y: in unsigned(4 downto 0)
+    );
+end entity two_level;
+
+
+architecture MyHDL of two_level is
+
+
+
+signal ic_x: unsigned(3 downto 0) := 4X"2";
+signal ic_y: unsigned(4 downto 0) := 5X"03";
+signal one_level0_0_1_2_ib_x: unsigned(3 downto 0);
+signal one_level0_0_1_2_ib_y: unsigned(4 downto 0);
+
+begin
+
+
+one_level0_0_1_2_ib_x <= to_unsigned(2, 4);
+one_level0_0_1_2_ib_y <= to_unsigned(3, 5);
+
+
+one_level0_0_1_2_rtl: process (clock, reset) is
+begin
+    if (reset = '0') then
+        ic_y <= to_unsigned(3, 5);
+        ic_x <= to_unsigned(2, 4);
+    elsif rising_edge(clock) then
+        ic_x <= (one_level0_0_1_2_ib_x + 1);
+        ic_y <= (one_level0_0_1_2_ib_y + 1);
+    end if;
+end process one_level0_0_1_2_rtl;
+
+rtl: process (clock, reset) is
+begin
+    if (reset = '0') then
+        ia_y <= to_unsigned(3, 5);
+        ia_x <= to_unsigned(2, 4);
+    elsif rising_edge(clock) then
+        ia_x <= (ib_x + ic_x);
+        ia_y <= (ib_y + ic_y);
+    end if;
+end process rtl;
+
+end architecture MyHDL;
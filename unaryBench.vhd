@@ -0,0 +1,93 @@
+-- File: unaryBench.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:07 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity unaryBench is
+end entity unaryBench;
+
+
+architecture MyHDL of unaryBench is
+
+
+
+signal Invert: signed (4 downto 0);
+signal UnarySub: signed (4 downto 0);
+signal arg: signed (4 downto 0);
+
+begin
+
+
+
+
+unaryops0_0_1_comb: process (arg) is
+begin
+    Invert <= (not arg);
+    UnarySub <= (-(-arg));
+end process unaryops0_0_1_comb;
+
+stimulus: process is
+begin
+    for i in 0 to 32-1 loop
+        case i is
+            when 0 => arg <= "10000";
+            when 1 => arg <= "10001";
+            when 2 => arg <= "10010";
+            when 3 => arg <= "10011";
+            when 4 => arg <= "10100";
+            when 5 => arg <= "10101";
+            when 6 => arg <= "10110";
+            when 7 => arg <= "10111";
+            when 8 => arg <= "11000";
+            when 9 => arg <= "11001";
+            when 10 => arg <= "11010";
+            when 11 => arg <= "11011";
+            when 12 => arg <= "11100";
+            when 13 => arg <= "11101";
+            when 14 => arg <= "11110";
+            when 15 => arg <= "11111";
+            when 16 => arg <= "00000";
+            when 17 => arg <= "00001";
+            when 18 => arg <= "00010";
+            when 19 => arg <= "00011";
+            when 20 => arg <= "00100";
+            when 21 => arg <= "00101";
+            when 22 => arg <= "00110";
+            when 23 => arg <= "00111";
+            when 24 => arg <= "01000";
+            when 25 => arg <= "01001";
+            when 26 => arg <= "01010";
+            when 27 => arg <= "01011";
+            when 28 => arg <= "01100";
+            when 29 => arg <= "01101";
+            when 30 => arg <= "01110";
+            when others => arg <= "01111";
+        end case;
+        wait for 10 * 1 ns;
+    end loop;
+    assert False report "End of Simulation" severity Failure;
+    wait;
+end process stimulus;
+
+check: process is
+    variable L: line;
+begin
+    while True loop
+        wait on arg;
+        wait for 1 * 1 ns;
+        write(L, to_hstring(unsigned(Invert)));
+        writeline(output, L);
+        write(L, to_hstring(unsigned(UnarySub)));
+        writeline(output, L);
+    end loop;
+    wait;
+end process check;
+
+end architecture MyHDL;
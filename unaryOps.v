@@ -0,0 +1,37 @@
+// File: unaryOps.v
+// Generated by MyHDL 0.11.51
+// Date:    Sun Oct 18 05:04:17 2026 UTC
+
+
+`timescale 1ns/10ps
+
+module unaryOps (
+    Not,
+    Invert,
+    UnaryAdd,
+    UnarySub,
+    arg
+);
+
+
+output Not;
+reg Not;
+output signed [4:0] Invert;
+reg signed [4:0] Invert;
+output signed [4:0] UnaryAdd;
+reg signed [4:0] UnaryAdd;
+output signed [4:0] UnarySub;
+reg signed [4:0] UnarySub;
+input signed [4:0] arg;
+
+
+
+
+always @(arg) begin: comb
+    Not <= (!arg);
+    Invert <= (~arg);
+    UnaryAdd <= (+arg);
+    UnarySub <= (-(-arg));
+end
+
+endmodule
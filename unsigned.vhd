@@ -0,0 +1,44 @@
+-- File: unsigned.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity unsigned is
+end entity unsigned;
+
+
+architecture MyHDL of unsigned is
+
+
+
+signal z: unsigned(7 downto 0) := 8X"00";
+type t_array_a is array(0 to 3-1) of unsigned(7 downto 0);
+signal a: t_array_a := (others => 8X"00");
+
+begin
+
+
+
+
+
+z <= (a(1) + a(2));
+
+stimulus: process is
+    variable L: line;
+begin
+    a(0) <= to_unsigned(2, 8);
+    a(1) <= to_unsigned(5, 8);
+    wait for 10 * 1 ns;
+    write(L, to_hstring(z));
+    writeline(output, L);
+    wait;
+end process stimulus;
+
+end architecture MyHDL;
@@ -0,0 +1,101 @@
+-- File: use_interfaces.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:19 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity use_interfaces is
+    port (
+        clock: in std_logic;
+        reset: in std_logic;
+        a_x: out signed (11 downto 0);
+        a_y: out signed (12 downto 0);
+        a_z: out signed (12 downto 0);
+        b_x: out signed (11 downto 0);
+        b_y: out signed (12 downto 0);
+        b_z: out signed (12 downto 0);
+        c_x: out signed (11 downto 0);
+        c_y: out signed (12 downto 0);
+        c_z: out signed (12 downto 0)
+    );
+end entity use_interfaces;
+
+
+architecture MyHDL of use_interfaces is
+
+
+
+signal intfa_x: signed (11 downto 0) := 12X"001";
+signal intfa_y: signed (12 downto 0) := 13X"0002";
+signal intfa_z: signed (12 downto 0) := 13X"0003";
+signal intfaa_x: signed (11 downto 0) := 12X"001";
+signal intfaa_y: signed (12 downto 0) := 13X"0002";
+signal intfaa_z: signed (12 downto 0) := 13X"0003";
+signal modify0_intfa_x: signed (11 downto 0) := 12X"001";
+signal modify0_intfa_y: signed (12 downto 0) := 13X"0002";
+signal modify0_intfa_z: signed (12 downto 0) := 13X"0003";
+
+begin
+
+
+
+
+modify0_rtl_inc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '0') then
+            modify0_intfa_y <= to_signed(2, 13);
+            modify0_intfa_x <= to_signed(1, 12);
+            modify0_intfa_z <= to_signed(3, 13);
+        else
+            modify0_intfa_x <= (modify0_intfa_x + 1);
+            modify0_intfa_y <= (modify0_intfa_y + 2);
+            modify0_intfa_z <= (modify0_intfa_z + 3);
+        end if;
+    end if;
+end process modify0_rtl_inc;
+
+
+intfaa_x <= (modify0_intfa_x + 1);
+intfaa_y <= (modify0_intfa_y + 2);
+intfaa_z <= (modify0_intfa_z + 3);
+
+rtl_inc: process (clock) is
+begin
+    if rising_edge(clock) then
+        if (reset = '0') then
+            intfa_y <= to_signed(2, 13);
+            c_z <= to_signed(3, 13);
+            b_z <= to_signed(3, 13);
+            b_x <= to_signed(1, 12);
+            c_x <= to_signed(1, 12);
+            c_y <= to_signed(2, 13);
+            intfa_z <= to_signed(3, 13);
+            intfa_x <= to_signed(1, 12);
+            b_y <= to_signed(2, 13);
+        else
+            intfa_x <= (intfa_x - 1);
+            intfa_y <= (intfa_y - 2);
+            intfa_z <= (intfa_z - 3);
+            b_x <= (b_x + 1);
+            b_y <= (b_y + 2);
+            b_z <= (b_z + 3);
+            c_x <= (c_x + 1);
+            c_y <= (c_y + 2);
+            c_z <= (c_z + 3);
+        end if;
+    end if;
+end process rtl_inc;
+
+
+a_x <= (intfaa_x + 1);
+a_y <= (intfaa_y + 2);
+a_z <= (intfaa_z + 3);
+
+end architecture MyHDL;
@@ -0,0 +1,34 @@
+-- File: valid.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:06 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity valid is
+    port (
+        input_sig: in std_logic;
+        output_sig: out std_logic
+    );
+end entity valid;
+
+
+architecture MyHDL of valid is
+
+
+
+
+begin
+
+
+
+
+
+output_sig <= input_sig;
+
+end architecture MyHDL;
@@ -0,0 +1,40 @@
+-- File: wrapper.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity wrapper is
+    port (
+        Clk: in std_logic;
+        D: in std_logic;
+        Q: out std_logic
+    );
+end entity wrapper;
+
+
+architecture MyHDL of wrapper is
+
+
+
+
+begin
+
+
+
+
+contrived_dff0_0_cdff: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        Q <= D;
+        -- OpenPort contrived_dff0_0_OE <= stdl(bool(Q) and bool(D));
+    end if;
+end process contrived_dff0_0_cdff;
+
+end architecture MyHDL;
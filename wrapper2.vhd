@@ -0,0 +1,42 @@
+-- File: wrapper2.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity wrapper2 is
+    port (
+        Clk: in std_logic;
+        D: in std_logic;
+        Q: out std_logic
+    );
+end entity wrapper2;
+
+
+architecture MyHDL of wrapper2 is
+
+
+
+
+begin
+
+
+
+
+contrived_dff20_sdff: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        Q <= D;
+    end if;
+end process contrived_dff20_sdff;
+
+
+-- OpenPort contrived_dff20_OE <= stdl(bool(Q) and bool(D));
+
+end architecture MyHDL;
@@ -0,0 +1,42 @@
+-- File: wrappercontrived4.vhd
+-- Generated by MyHDL 0.11.51
+-- Date:    Sun Oct 18 05:04:18 2026 UTC
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity wrappercontrived4 is
+    port (
+        Clk: in std_logic;
+        D: in std_logic;
+        Q: out std_logic
+    );
+end entity wrappercontrived4;
+
+
+architecture MyHDL of wrappercontrived4 is
+
+
+
+constant contrived40_0_CE: std_logic := '1';
+
+begin
+
+
+
+
+contrived40_0_dff: process (Clk) is
+begin
+    if rising_edge(Clk) then
+        if bool(contrived40_0_CE) then
+            Q <= D;
+        end if;
+    end if;
+end process contrived40_0_dff;
+
+end architecture MyHDL;